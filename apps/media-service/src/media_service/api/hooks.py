@@ -91,6 +91,10 @@ async def handle_ready_event(event: HookEvent, request: Request) -> JSONResponse
             segment_dir=segment_dir / stream_id,
             source_language=os.getenv("WORKER_SOURCE_LANGUAGE", "en"),
             target_language=os.getenv("WORKER_TARGET_LANGUAGE", "zh"),
+            sts_input_format=os.getenv("WORKER_STS_INPUT_FORMAT", "aac"),
+            sts_output_format=os.getenv("WORKER_STS_OUTPUT_FORMAT", "adts"),
+            video_transcode=os.getenv("WORKER_VIDEO_TRANSCODE", "false").lower() == "true",
+            video_delay_line=os.getenv("WORKER_VIDEO_DELAY_LINE", "false").lower() == "true",
         )
 
         # Start worker (idempotent - safe to call multiple times)
@@ -6,12 +6,16 @@ M4A files (AAC codec-copy) to disk.
 
 Components:
 - AudioSegmentWriter: Writes audio segments as M4A files
+- m4a_to_adts: In-memory M4A -> ADTS rewrap for dubbed audio output
 """
 
 from __future__ import annotations
 
+from media_service.audio.mp4_adts import Mp4ParseError, m4a_to_adts
 from media_service.audio.segment_writer import AudioSegmentWriter
 
 __all__ = [
     "AudioSegmentWriter",
+    "Mp4ParseError",
+    "m4a_to_adts",
 ]
@@ -0,0 +1,378 @@
+"""
+In-memory MP4/M4A to ADTS conversion.
+
+Dubbed audio from STS arrives as AAC in an M4A container, but the output
+pipeline's aacparse expects self-describing ADTS frames. Rewrapping only
+needs the AAC access units and the AudioSpecificConfig, so this walks the
+MP4 box tree directly instead of running a GStreamer demux pipeline:
+
+- moov/trak: first track whose mdia/hdlr handler is "soun"
+- stsd/mp4a/esds: AudioSpecificConfig (profile, sample rate, channels)
+- stsz + stsc + stco/co64: size and file offset of every sample in mdat
+
+Each access unit is emitted with a 7-byte ADTS header (no CRC).
+
+Fragmented MP4 (moof) and codecs other than AAC raise Mp4ParseError so the
+caller can fall back to GStreamer.
+
+adts_frame_table() indexes the resulting frames so the output pipeline can
+push them one access unit at a time.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+# ADTS sampling_frequency_index table (ISO/IEC 14496-3, 1.6.3.4)
+_SAMPLE_RATES = (
+    96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000, 7350,
+)
+
+# Audio object types carried as SBR/PS on an AAC-LC core (implicit signalling in ADTS)
+_SBR_OBJECT_TYPES = (5, 29)
+
+ADTS_HEADER_SIZE = 7
+_MAX_FRAME_LENGTH = (1 << 13) - 1  # 13-bit ADTS frame_length
+
+
+class Mp4ParseError(ValueError):
+    """Raised when MP4 data cannot be converted to ADTS."""
+
+
+@dataclass(frozen=True)
+class AacConfig:
+    """The AudioSpecificConfig fields an ADTS header carries.
+
+    Attributes:
+        object_type: MPEG-4 audio object type (2 = AAC-LC)
+        sampling_index: ADTS sampling_frequency_index
+        channel_config: MPEG-4 channel configuration (1 = mono, 2 = stereo)
+    """
+
+    object_type: int
+    sampling_index: int
+    channel_config: int
+
+
+def m4a_to_adts(data: bytes) -> bytes:
+    """Convert M4A/MP4 audio to raw ADTS AAC frames.
+
+    Args:
+        data: Complete MP4/M4A file contents
+
+    Returns:
+        Concatenated ADTS frames of the first audio track
+
+    Raises:
+        Mp4ParseError: If the data is not a complete, unfragmented MP4 with an
+            AAC audio track
+    """
+    try:
+        config, samples = _read_audio_track(memoryview(data))
+    except (struct.error, IndexError) as e:
+        raise Mp4ParseError(f"Truncated MP4 box: {e}") from e
+
+    out = bytearray()
+    view = memoryview(data)
+    for offset, size in samples:
+        out += adts_header(config, size)
+        out += view[offset : offset + size]
+    return bytes(out)
+
+
+def adts_header(config: AacConfig, payload_size: int) -> bytes:
+    """Build the 7-byte ADTS header (protection_absent=1) for one access unit.
+
+    Args:
+        config: AAC stream configuration
+        payload_size: Size of the raw AAC access unit in bytes
+
+    Returns:
+        ADTS header bytes
+
+    Raises:
+        Mp4ParseError: If the frame does not fit ADTS limits
+    """
+    frame_length = payload_size + ADTS_HEADER_SIZE
+    if frame_length > _MAX_FRAME_LENGTH:
+        raise Mp4ParseError(f"AAC access unit too large for ADTS: {payload_size} bytes")
+
+    profile = config.object_type - 1
+    return bytes(
+        (
+            0xFF,
+            0xF1,  # syncword, MPEG-4, layer 0, no CRC
+            (profile << 6) | (config.sampling_index << 2) | (config.channel_config >> 2),
+            ((config.channel_config & 0x3) << 6) | (frame_length >> 11),
+            (frame_length >> 3) & 0xFF,
+            ((frame_length & 0x7) << 5) | 0x1F,  # buffer fullness 0x7FF (VBR)
+            0xFC,  # one raw data block
+        )
+    )
+
+
+def adts_frame_table(data: bytes) -> list[tuple[int, int, int]]:
+    """Locate every ADTS frame in a run of concatenated frames.
+
+    Timing comes from the headers: each raw data block is 1024 samples at
+    the header's sampling rate. PTS are computed from the running sample
+    count, so they do not accumulate per-frame rounding.
+
+    Args:
+        data: Concatenated ADTS frames
+
+    Returns:
+        (byte offset, pts_ns relative to the first frame, duration_ns) per
+        frame, or an empty list unless data is entirely well-formed ADTS
+    """
+    frames = []
+    pos = samples = 0
+    while pos < len(data):
+        header = data[pos : pos + ADTS_HEADER_SIZE]
+        if len(header) < ADTS_HEADER_SIZE or header[0] != 0xFF or (header[1] & 0xF6) != 0xF0:
+            return []
+        sampling_index = (header[2] >> 2) & 0xF
+        frame_length = ((header[3] & 0x3) << 11) | (header[4] << 3) | (header[5] >> 5)
+        if sampling_index >= len(_SAMPLE_RATES) or frame_length < ADTS_HEADER_SIZE:
+            return []
+
+        rate = _SAMPLE_RATES[sampling_index]
+        frame_samples = 1024 * ((header[6] & 0x3) + 1)
+        pts_ns = samples * 1_000_000_000 // rate
+        end_ns = (samples + frame_samples) * 1_000_000_000 // rate
+        frames.append((pos, pts_ns, end_ns - pts_ns))
+
+        samples += frame_samples
+        pos += frame_length
+    return frames if pos == len(data) else []
+
+
+def parse_audio_specific_config(asc: bytes | memoryview) -> AacConfig:
+    """Parse the ADTS-relevant fields of an AudioSpecificConfig.
+
+    Args:
+        asc: AudioSpecificConfig bytes (from esds DecoderSpecificInfo)
+
+    Returns:
+        AacConfig for ADTS headers (SBR/PS streams map to their AAC-LC core)
+
+    Raises:
+        Mp4ParseError: If the object type or sample rate cannot be expressed in ADTS
+    """
+    if len(asc) < 2:
+        raise Mp4ParseError("AudioSpecificConfig too short")
+    bits = int.from_bytes(asc[:8], "big")
+    nbits = 8 * min(len(asc), 8)
+    pos = 0
+
+    def read(n: int) -> int:
+        nonlocal pos
+        if pos + n > nbits:
+            raise Mp4ParseError("AudioSpecificConfig too short")
+        value = (bits >> (nbits - pos - n)) & ((1 << n) - 1)
+        pos += n
+        return value
+
+    object_type = read(5)
+    if object_type == 31:
+        object_type = 32 + read(6)
+    sampling_index = read(4)
+    if sampling_index == 0xF:
+        rate = read(24)
+        if rate not in _SAMPLE_RATES:
+            raise Mp4ParseError(f"Sample rate {rate} Hz has no ADTS index")
+        sampling_index = _SAMPLE_RATES.index(rate)
+    channel_config = read(4)
+
+    if object_type in _SBR_OBJECT_TYPES:
+        # ADTS signals SBR/PS implicitly: describe the AAC-LC core
+        object_type = 2
+    if not 1 <= object_type <= 4:
+        raise Mp4ParseError(f"Audio object type {object_type} cannot be carried in ADTS")
+    if sampling_index >= len(_SAMPLE_RATES):
+        raise Mp4ParseError(f"Invalid sampling frequency index {sampling_index}")
+    if channel_config == 0 or channel_config > 7:
+        raise Mp4ParseError(f"Unsupported channel configuration {channel_config}")
+
+    return AacConfig(object_type, sampling_index, channel_config)
+
+
+def _iter_boxes(data: memoryview, start: int, end: int) -> list[tuple[bytes, int, int]]:
+    """List (type, payload start, box end) for the boxes between start and end."""
+    boxes = []
+    pos = start
+    while pos + 8 <= end:
+        size, name = struct.unpack_from(">I4s", data, pos)
+        header = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", data, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise Mp4ParseError(f"Box {name!r} at {pos} overruns its parent")
+        boxes.append((bytes(name), pos + header, pos + size))
+        pos += size
+    return boxes
+
+
+def _child(data: memoryview, start: int, end: int, name: bytes) -> tuple[int, int] | None:
+    """Payload range of the first child box called name, if any."""
+    for box_name, payload, box_end in _iter_boxes(data, start, end):
+        if box_name == name:
+            return payload, box_end
+    return None
+
+
+def _require(data: memoryview, start: int, end: int, name: bytes) -> tuple[int, int]:
+    box = _child(data, start, end, name)
+    if box is None:
+        raise Mp4ParseError(f"Missing {name.decode()} box")
+    return box
+
+
+def _read_audio_track(data: memoryview) -> tuple[AacConfig, list[tuple[int, int]]]:
+    """Find the first audio track and return its config and (offset, size) samples."""
+    top = _iter_boxes(data, 0, len(data))
+    names = {name for name, _, _ in top}
+    if b"moof" in names:
+        raise Mp4ParseError("Fragmented MP4 is not supported")
+    moov = next(((s, e) for n, s, e in top if n == b"moov"), None)
+    if moov is None:
+        raise Mp4ParseError("Missing moov box")
+
+    for name, trak_start, trak_end in _iter_boxes(data, *moov):
+        if name != b"trak":
+            continue
+        mdia = _require(data, trak_start, trak_end, b"mdia")
+        hdlr = _require(data, *mdia, b"hdlr")
+        # FullBox header (4) + pre_defined (4), then handler_type
+        if bytes(data[hdlr[0] + 8 : hdlr[0] + 12]) != b"soun":
+            continue
+        minf = _require(data, *mdia, b"minf")
+        stbl = _require(data, *minf, b"stbl")
+        config = _read_stsd(data, *_require(data, *stbl, b"stsd"))
+        return config, _sample_table(data, stbl)
+
+    raise Mp4ParseError("No audio track in MP4")
+
+
+def _read_stsd(data: memoryview, start: int, end: int) -> AacConfig:
+    """Read the AAC configuration from the first mp4a sample entry."""
+    # FullBox header (4) + entry_count (4)
+    entries = _iter_boxes(data, start + 8, end)
+    if not entries:
+        raise Mp4ParseError("Empty stsd box")
+    name, entry_start, entry_end = entries[0]
+    if name != b"mp4a":
+        raise Mp4ParseError(f"Audio track is {name!r}, not AAC")
+
+    # AudioSampleEntry: reserved (6) + data_reference_index (2), then the
+    # QuickTime sound description version selects the fixed field length
+    version = struct.unpack_from(">H", data, entry_start + 8)[0]
+    fixed = {0: 28, 1: 44, 2: 64}.get(version)
+    if fixed is None:
+        raise Mp4ParseError(f"Unknown mp4a sample entry version {version}")
+    children_start = entry_start + fixed
+
+    esds = _child(data, children_start, entry_end, b"esds")
+    if esds is None:
+        wave = _child(data, children_start, entry_end, b"wave")
+        if wave is not None:
+            esds = _child(data, *wave, b"esds")
+    if esds is None:
+        raise Mp4ParseError("mp4a sample entry has no esds box")
+
+    asc = _decoder_specific_info(data, esds[0] + 4, esds[1])
+    return parse_audio_specific_config(asc)
+
+
+def _decoder_specific_info(data: memoryview, start: int, end: int) -> memoryview:
+    """Walk ES_Descriptor -> DecoderConfigDescriptor -> DecoderSpecificInfo."""
+    pos = start
+    while pos < end:
+        tag = data[pos]
+        pos += 1
+        length = 0
+        for _ in range(4):
+            if pos >= end:
+                raise Mp4ParseError("Truncated esds descriptor")
+            byte = data[pos]
+            pos += 1
+            length = (length << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                break
+        body_end = pos + length
+        if body_end > end:
+            raise Mp4ParseError("esds descriptor overruns its box")
+
+        if tag == 0x03:  # ES_Descriptor: descend past its fixed fields
+            flags = data[pos + 2]
+            pos += 3
+            if flags & 0x80:  # streamDependenceFlag
+                pos += 2
+            if flags & 0x40:  # URL_Flag
+                pos += 1 + data[pos]
+            if flags & 0x20:  # OCRstreamFlag
+                pos += 2
+            end = body_end
+        elif tag == 0x04:  # DecoderConfigDescriptor: 13 fixed bytes, then children
+            pos += 13
+            end = body_end
+        elif tag == 0x05:  # DecoderSpecificInfo = AudioSpecificConfig
+            return data[pos:body_end]
+        else:
+            pos = body_end
+
+    raise Mp4ParseError("esds box has no AudioSpecificConfig")
+
+
+def _sample_table(data: memoryview, stbl: tuple[int, int]) -> list[tuple[int, int]]:
+    """Resolve (file offset, size) of every sample from stsz, stsc and stco/co64."""
+    stsz_start, _ = _require(data, *stbl, b"stsz")
+    uniform_size, sample_count = struct.unpack_from(">II", data, stsz_start + 4)
+    if uniform_size:
+        if uniform_size * sample_count > len(data):
+            raise Mp4ParseError("stsz describes more data than the file holds")
+        sizes = [uniform_size] * sample_count
+    else:
+        sizes = list(struct.unpack_from(f">{sample_count}I", data, stsz_start + 12))
+
+    stsc_start, _ = _require(data, *stbl, b"stsc")
+    (run_count,) = struct.unpack_from(">I", data, stsc_start + 4)
+    runs = [
+        struct.unpack_from(">II", data, stsc_start + 8 + 12 * i)  # first_chunk, samples_per_chunk
+        for i in range(run_count)
+    ]
+
+    stco = _child(data, *stbl, b"stco")
+    if stco is not None:
+        (chunk_count,) = struct.unpack_from(">I", data, stco[0] + 4)
+        chunk_offsets = struct.unpack_from(f">{chunk_count}I", data, stco[0] + 8)
+    else:
+        co64_start, _ = _require(data, *stbl, b"co64")
+        (chunk_count,) = struct.unpack_from(">I", data, co64_start + 4)
+        chunk_offsets = struct.unpack_from(f">{chunk_count}Q", data, co64_start + 8)
+
+    samples: list[tuple[int, int]] = []
+    index = 0
+    for run, (first_chunk, per_chunk) in enumerate(runs):
+        last_chunk = runs[run + 1][0] - 1 if run + 1 < len(runs) else chunk_count
+        if first_chunk < 1 or last_chunk < first_chunk or last_chunk > chunk_count:
+            raise Mp4ParseError("stsc chunk runs are out of order or outside stco")
+        for chunk in range(first_chunk - 1, last_chunk):
+            offset = chunk_offsets[chunk]
+            for _ in range(min(per_chunk, sample_count - index)):
+                size = sizes[index]
+                if offset + size > len(data):
+                    raise Mp4ParseError(f"Sample {index} lies outside the file")
+                samples.append((offset, size))
+                offset += size
+                index += 1
+            if index == sample_count:
+                break
+
+    if index != sample_count:
+        raise Mp4ParseError(f"Sample table maps {index} of {sample_count} samples")
+    return samples
@@ -9,15 +9,23 @@ Per spec 003:
 - Partial segments on EOS (minimum 1 second)
 - Auto-generated fragment_id (UUID)
 - Sequential batch_number increments
+
+With keyframe_aligned=True (video passthrough), video segments are cut on
+IDR boundaries instead of at the exact duration, and audio segments are cut
+at the same presentation times so batch N of both streams covers the same
+span. Audio that precedes the first IDR (whose video is dropped) is
+discarded too.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from media_service.models.segments import AudioSegment, VideoSegment
+from media_service.video.h264 import is_keyframe
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +39,54 @@ class BufferAccumulator:
         t0_ns: PTS of first buffer in segment
         duration_ns: Total accumulated duration
         buffer_count: Number of buffers accumulated
+        frames: (byte offset, pts_ns, duration_ns) of each accumulated buffer
     """
 
     data: bytearray = field(default_factory=bytearray)
     t0_ns: int = 0
     duration_ns: int = 0
     buffer_count: int = 0
+    frames: list[tuple[int, int, int]] = field(default_factory=list)
+
+    def append(self, buffer_data: bytes, pts_ns: int, duration_ns: int) -> None:
+        """Accumulate one buffer, capturing t0 from the first."""
+        if self.is_empty():
+            self.t0_ns = pts_ns
+        self.frames.append((len(self.data), pts_ns, duration_ns))
+        self.data.extend(buffer_data)
+        self.duration_ns += duration_ns
+        self.buffer_count += 1
+
+    def split_before(self, pts_ns: int) -> BufferAccumulator:
+        """Detach the buffers that start before pts_ns.
+
+        Args:
+            pts_ns: Presentation time of the cut
+
+        Returns:
+            New accumulator holding the buffers before the cut; this
+            accumulator keeps the rest
+        """
+        index = next(
+            (i for i, (_, pts, _) in enumerate(self.frames) if pts >= pts_ns), len(self.frames)
+        )
+        offset = self.frames[index][0] if index < len(self.frames) else len(self.data)
+        head_frames = self.frames[:index]
+
+        head = BufferAccumulator(
+            data=self.data[:offset],
+            t0_ns=self.t0_ns if head_frames else 0,
+            duration_ns=sum(duration for _, _, duration in head_frames),
+            buffer_count=index,
+            frames=head_frames,
+        )
+
+        self.frames = [(off - offset, pts, dur) for off, pts, dur in self.frames[index:]]
+        del self.data[:offset]
+        self.t0_ns = self.frames[0][1] if self.frames else 0
+        self.duration_ns -= head.duration_ns
+        self.buffer_count -= index
+        return head
 
     def reset(self) -> None:
         """Reset accumulator to initial state."""
@@ -44,6 +94,7 @@ class BufferAccumulator:
         self.t0_ns = 0
         self.duration_ns = 0
         self.buffer_count = 0
+        self.frames = []
 
     def is_empty(self) -> bool:
         """Check if accumulator has no data."""
@@ -60,8 +111,13 @@ class SegmentBuffer:
         stream_id: Stream identifier
         segment_duration_ns: Target segment duration in nanoseconds
         segment_dir: Directory for segment file storage
+        keyframe_aligned: Cut video on IDR frames and audio at the same times
         _video_batch_number: Current video batch number
         _audio_batch_number: Current audio batch number
+        _video_cut_points: PTS of video cuts not yet applied to audio
+        _video_started: Whether the first video IDR has been accepted
+        _audio_head_pending: The oldest cut point is the first IDR, so the
+            audio before it is dropped rather than emitted
     """
 
     # Default 6 seconds in nanoseconds
@@ -74,6 +130,7 @@ class SegmentBuffer:
         stream_id: str,
         segment_dir: Path,
         segment_duration_ns: int = DEFAULT_SEGMENT_DURATION_NS,
+        keyframe_aligned: bool = False,
     ) -> None:
         """Initialize segment buffer.
 
@@ -81,15 +138,22 @@ class SegmentBuffer:
             stream_id: Stream identifier for segment naming
             segment_dir: Base directory for segment storage
             segment_duration_ns: Target segment duration (default 6 seconds)
+            keyframe_aligned: Start every video segment on an IDR frame so it
+                can be remuxed without re-encoding (segments run until the
+                first IDR at or after segment_duration_ns)
         """
         self.stream_id = stream_id
         self.segment_dir = segment_dir
         self.segment_duration_ns = segment_duration_ns
+        self.keyframe_aligned = keyframe_aligned
 
         self._video_accumulator = BufferAccumulator()
         self._audio_accumulator = BufferAccumulator()
         self._video_batch_number = 0
         self._audio_batch_number = 0
+        self._video_cut_points: deque[int] = deque()
+        self._video_started = False
+        self._audio_head_pending = False
 
         # Ensure segment directory exists
         self.segment_dir.mkdir(parents=True, exist_ok=True)
@@ -98,7 +162,8 @@ class SegmentBuffer:
 
         logger.info(
             f"SegmentBuffer initialized: stream_id={stream_id}, "
-            f"segment_duration={segment_duration_ns / 1e9:.1f}s"
+            f"segment_duration={segment_duration_ns / 1e9:.1f}s, "
+            f"keyframe_aligned={keyframe_aligned}"
         )
 
     def push_video(
@@ -118,16 +183,11 @@ class SegmentBuffer:
             Tuple of (VideoSegment, accumulated_data) if segment ready,
             (None, empty bytes) otherwise
         """
-        acc = self._video_accumulator
-
-        # Capture t0 from first buffer
-        if acc.is_empty():
-            acc.t0_ns = pts_ns
+        if self.keyframe_aligned:
+            return self._push_video_aligned(buffer_data, pts_ns, duration_ns)
 
-        # Accumulate data
-        acc.data.extend(buffer_data)
-        acc.duration_ns += duration_ns
-        acc.buffer_count += 1
+        acc = self._video_accumulator
+        acc.append(buffer_data, pts_ns, duration_ns)
 
         # Check if segment is ready
         if acc.duration_ns >= self.segment_duration_ns:
@@ -135,6 +195,36 @@ class SegmentBuffer:
 
         return None, b""
 
+    def _push_video_aligned(
+        self,
+        buffer_data: bytes,
+        pts_ns: int,
+        duration_ns: int,
+    ) -> tuple[VideoSegment | None, bytes]:
+        """Push video buffer, cutting segments only before an IDR frame."""
+        acc = self._video_accumulator
+        keyframe = is_keyframe(buffer_data)
+
+        if acc.is_empty() and not keyframe:
+            # A passthrough segment must start decodable; wait for the next IDR
+            logger.debug(f"Dropping video buffer before first keyframe: pts={pts_ns / 1e9:.3f}s")
+            return None, b""
+
+        if not self._video_started:
+            # Audio before the first IDR has no video to pair with
+            self._video_started = True
+            self._audio_head_pending = True
+            self._video_cut_points.append(pts_ns)
+
+        segment: VideoSegment | None = None
+        data = b""
+        if keyframe and acc.duration_ns >= self.segment_duration_ns:
+            segment, data = self._emit_video_segment()
+            self._video_cut_points.append(pts_ns)
+
+        acc.append(buffer_data, pts_ns, duration_ns)
+        return segment, data
+
     def push_audio(
         self,
         buffer_data: bytes,
@@ -153,15 +243,10 @@ class SegmentBuffer:
             (None, empty bytes) otherwise
         """
         acc = self._audio_accumulator
+        acc.append(buffer_data, pts_ns, duration_ns)
 
-        # Capture t0 from first buffer
-        if acc.is_empty():
-            acc.t0_ns = pts_ns
-
-        # Accumulate data
-        acc.data.extend(buffer_data)
-        acc.duration_ns += duration_ns
-        acc.buffer_count += 1
+        if self.keyframe_aligned:
+            return self._cut_audio_at_video_boundary(pts_ns)
 
         # Check if segment is ready
         if acc.duration_ns >= self.segment_duration_ns:
@@ -169,6 +254,32 @@ class SegmentBuffer:
 
         return None, b""
 
+    def _cut_audio_at_video_boundary(self, pts_ns: int) -> tuple[AudioSegment | None, bytes]:
+        """Emit the audio before the oldest pending video cut once audio has passed it.
+
+        Args:
+            pts_ns: PTS of the audio buffer just accumulated
+
+        Returns:
+            Tuple of (AudioSegment, data) if a cut was applied,
+            (None, empty bytes) otherwise
+        """
+        while self._video_cut_points and pts_ns >= self._video_cut_points[0]:
+            head = self._audio_accumulator.split_before(self._video_cut_points.popleft())
+            if self._audio_head_pending:
+                self._audio_head_pending = False
+                if not head.is_empty():
+                    logger.debug(
+                        f"Dropping {head.duration_ns / 1e6:.0f}ms of audio before first keyframe"
+                    )
+                continue
+            if not head.is_empty():
+                return self._emit_audio_segment(head)
+            # No audio in this video segment's span: keep batch numbers paired
+            logger.warning(f"No audio for batch {self._audio_batch_number}, skipping")
+            self._audio_batch_number += 1
+        return None, b""
+
     def flush_video(self) -> tuple[VideoSegment | None, bytes]:
         """Flush remaining video data as partial segment.
 
@@ -235,6 +346,8 @@ class SegmentBuffer:
             duration_ns=acc.duration_ns,
             segment_dir=self.segment_dir,
         )
+        # Keep the access-unit boundaries so output can push frame by frame
+        segment.frames = acc.frames
 
         # [DEBUG-SOLVER] Check for SPS/PPS/IDR in ENTIRE segment data
         has_sps = b'\x00\x00\x00\x01\x67' in data or b'\x00\x00\x01\x67' in data
@@ -255,13 +368,20 @@ class SegmentBuffer:
 
         return segment, data
 
-    def _emit_audio_segment(self) -> tuple[AudioSegment, bytes]:
+    def _emit_audio_segment(
+        self, acc: BufferAccumulator | None = None
+    ) -> tuple[AudioSegment, bytes]:
         """Create and return audio segment from accumulated data.
 
+        Args:
+            acc: Accumulator split off at a video cut (default: the whole
+                audio accumulator, which is then reset)
+
         Returns:
             Tuple of (AudioSegment metadata, accumulated data bytes)
         """
-        acc = self._audio_accumulator
+        if acc is None:
+            acc = self._audio_accumulator
         data = bytes(acc.data)
 
         segment = AudioSegment.create(
@@ -288,6 +408,9 @@ class SegmentBuffer:
         self._audio_accumulator.reset()
         self._video_batch_number = 0
         self._audio_batch_number = 0
+        self._video_cut_points.clear()
+        self._video_started = False
+        self._audio_head_pending = False
         logger.info("SegmentBuffer reset")
 
     @property
@@ -10,7 +10,7 @@ Each segment represents ~6 seconds of media with preserved timestamps.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
 from uuid import uuid4
@@ -31,6 +31,9 @@ class VideoSegment:
         duration_ns: Duration of the segment in nanoseconds.
         file_path: Path to MP4 file on disk.
         file_size: Size of MP4 file in bytes.
+        frames: (byte offset, pts_ns, duration_ns) of each access unit in the
+            segment's H.264 data, as captured from the input pipeline (empty
+            if unknown).
 
     Invariants:
         - duration_ns should be ~6_000_000_000 (6 seconds) +/- 100ms
@@ -44,6 +47,7 @@ class VideoSegment:
     duration_ns: int
     file_path: Path
     file_size: int = 0
+    frames: list[tuple[int, int, int]] = field(default_factory=list, repr=False)
 
     # Constants
     DEFAULT_SEGMENT_DURATION_NS: ClassVar[int] = 6_000_000_000  # 6 seconds
@@ -7,11 +7,13 @@ for the stream worker, along with shared element builders.
 Components:
 - InputPipeline: RTSP input with video/audio appsinks
 - OutputPipeline: RTMP output with video/audio appsrcs
+- DelayLinePipeline: RTMP in/out with video delayed in GStreamer, audio tapped to Python
 - Element builders: Shared GStreamer element constructors
 """
 
 from __future__ import annotations
 
+from media_service.pipeline.delay_line import DelayLinePipeline
 from media_service.pipeline.elements import (
     build_aacparse_element,
     build_appsink_element,
@@ -29,6 +31,7 @@ from media_service.pipeline.input import InputPipeline
 from media_service.pipeline.output import OutputPipeline
 
 __all__ = [
+    "DelayLinePipeline",
     "InputPipeline",
     "OutputPipeline",
     "build_rtspsrc_element",
@@ -0,0 +1,324 @@
+"""
+Single-pipeline worker topology with a GStreamer-native video delay line.
+
+Video never leaves GStreamer: it is demuxed, parsed and held in a
+time-based queue for the A/V offset, then remuxed straight into the RTMP
+output. Only audio is tapped out to Python (for STS dubbing) and
+re-injected through an appsrc with its original timestamps:
+
+    rtmpsrc -> flvdemux -> video: h264parse -> queue (delay line) -> flvmux -> rtmpsink
+                        -> audio: aacparse -> queue -> appsink (to Python)
+    audio_appsrc (dubbed, from Python) -> aacparse -> queue ------^
+
+Input and output share one clock and timeline, so no PTS offset is applied:
+the delay queue holds video until its matching dubbed audio can arrive, and
+flvmux interleaves both by their original timestamps.
+
+flvdemux pushes video and audio from one streaming thread, so the delay
+queue must never block it: a full video queue would also stop the audio tap
+that produces the dubbed audio flvmux is waiting for. Once the delay plus
+headroom is queued, the oldest video is dropped instead.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from media_service.pipeline.input import BufferCallback, read_audio_sample
+from media_service.pipeline.output import OutputPipeline
+
+# GStreamer imports
+try:
+    import gi
+
+    gi.require_version("Gst", "1.0")
+    from gi.repository import Gst
+
+    GST_AVAILABLE = True
+except (ImportError, ValueError):
+    GST_AVAILABLE = False
+    Gst = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class DelayLinePipeline(OutputPipeline):
+    """RTMP in -> RTMP out pipeline that delays video in GStreamer.
+
+    Reuses OutputPipeline's audio appsrc, push_audio, M4A conversion and
+    lifecycle; push_video is not used since video never reaches Python.
+
+    Attributes:
+        _rtmp_input_url: RTMP source URL
+        _on_audio_buffer: Callback for tapped source audio buffers
+        _video_delay_ns: Time video is held before muxing
+        has_video_pad: Whether the flvdemux video pad has been linked
+        has_audio_pad: Whether the flvdemux audio pad has been linked
+        delay_overruns: Times the delay queue was full and dropped video
+    """
+
+    # Extra queue headroom beyond the delay before the delay queue drops video
+    QUEUE_HEADROOM_NS = 2_000_000_000
+
+    def __init__(
+        self,
+        rtmp_input_url: str,
+        rtmp_url: str,
+        on_audio_buffer: BufferCallback,
+        video_delay_ns: int,
+    ) -> None:
+        """Initialize delay-line pipeline.
+
+        Args:
+            rtmp_input_url: RTMP source URL (e.g., "rtmp://mediamtx:1935/live/stream/in")
+            rtmp_url: RTMP destination URL (e.g., "rtmp://mediamtx:1935/live/stream/out")
+            on_audio_buffer: Callback for source audio buffers (data, pts_ns, duration_ns)
+            video_delay_ns: How long video is held back, i.e. the A/V offset
+
+        Raises:
+            ValueError: If a URL is empty or invalid, or the delay is not positive
+        """
+        super().__init__(rtmp_url)
+
+        if not rtmp_input_url or not rtmp_input_url.startswith("rtmp://"):
+            raise ValueError(
+                f"Invalid RTMP input URL: must start with 'rtmp://' - got '{rtmp_input_url}'"
+            )
+        if video_delay_ns <= 0:
+            raise ValueError(f"video_delay_ns must be positive - got {video_delay_ns}")
+
+        self._rtmp_input_url = rtmp_input_url
+        self._on_audio_buffer = on_audio_buffer
+        self._video_delay_ns = video_delay_ns
+        self._h264parse: Gst.Element | None = None
+        self._aacparse_in: Gst.Element | None = None
+
+        self.has_video_pad = False
+        self.has_audio_pad = False
+        self.delay_overruns = 0
+
+    def build(self) -> None:
+        """Build the combined input/output pipeline.
+
+        flvdemux pads are dynamic; they are linked to the video delay line and
+        the audio tap in _on_pad_added.
+
+        Raises:
+            RuntimeError: If GStreamer not available or element creation fails
+        """
+        if not GST_AVAILABLE or Gst is None:
+            raise RuntimeError("GStreamer not available")
+
+        if not Gst.is_initialized():
+            Gst.init(None)
+
+        self._pipeline = Gst.Pipeline.new("delay_line_pipeline")
+        if self._pipeline is None:
+            raise RuntimeError("Failed to create GStreamer pipeline")
+
+        rtmpsrc = Gst.ElementFactory.make("rtmpsrc", "rtmpsrc")
+        flvdemux = Gst.ElementFactory.make("flvdemux", "flvdemux")
+
+        # Video: parse and delay, never decoded
+        h264parse = Gst.ElementFactory.make("h264parse", "h264parse")
+        delay_queue = Gst.ElementFactory.make("queue", "video_delay")
+
+        # Audio tap to Python
+        aacparse_in = Gst.ElementFactory.make("aacparse", "aacparse_in")
+        tap_queue = Gst.ElementFactory.make("queue", "audio_tap_queue")
+        audio_sink = Gst.ElementFactory.make("appsink", "audio_sink")
+
+        # Dubbed audio back from Python
+        self._audio_appsrc = Gst.ElementFactory.make("appsrc", "audio_src")
+        aacparse_out = Gst.ElementFactory.make("aacparse", "aacparse_out")
+        audio_queue = Gst.ElementFactory.make("queue", "audio_queue")
+
+        flvmux = Gst.ElementFactory.make("flvmux", "flvmux")
+        rtmpsink = Gst.ElementFactory.make("rtmpsink", "rtmpsink")
+
+        elements = [
+            ("rtmpsrc", rtmpsrc),
+            ("flvdemux", flvdemux),
+            ("h264parse", h264parse),
+            ("video_delay", delay_queue),
+            ("aacparse_in", aacparse_in),
+            ("audio_tap_queue", tap_queue),
+            ("audio_sink", audio_sink),
+            ("audio_src", self._audio_appsrc),
+            ("aacparse_out", aacparse_out),
+            ("audio_queue", audio_queue),
+            ("flvmux", flvmux),
+            ("rtmpsink", rtmpsink),
+        ]
+        for elem_name, elem in elements:
+            if elem is None:
+                raise RuntimeError(f"Failed to create {elem_name} element")
+
+        rtmpsrc.set_property("location", self._rtmp_input_url)
+        rtmpsrc.set_property("timeout", 30)  # 30 second timeout for network operations
+
+        # Insert SPS/PPS before each IDR so the output is joinable at any keyframe
+        h264parse.set_property("config-interval", -1)
+
+        # Delay line: release nothing until video_delay_ns is queued, then run
+        # as a fixed-latency FIFO. Only time bounds the queue, and a full queue
+        # drops its oldest video rather than blocking flvdemux (and with it
+        # the audio tap) while flvmux waits for late dubbed audio.
+        delay_queue.set_property("max-size-buffers", 0)
+        delay_queue.set_property("max-size-bytes", 0)
+        delay_queue.set_property("max-size-time", self._video_delay_ns + self.QUEUE_HEADROOM_NS)
+        delay_queue.set_property("min-threshold-time", self._video_delay_ns)
+        delay_queue.set_property("leaky", 2)
+        delay_queue.connect("overrun", self._on_delay_overrun)
+
+        tap_queue.set_property("max-size-buffers", 0)
+        tap_queue.set_property("max-size-bytes", 0)
+        tap_queue.set_property("max-size-time", 5 * Gst.SECOND)
+        tap_queue.set_property("leaky", 2)  # Never stall the video branch on Python
+
+        audio_sink.set_property("emit-signals", True)
+        audio_sink.set_property("sync", False)
+        audio_sink.set_property(
+            "caps", Gst.Caps.from_string("audio/mpeg,mpegversion=4,stream-format=adts")
+        )
+        audio_sink.connect("new-sample", self._on_audio_sample)
+
+        self._audio_appsrc.set_property(
+            "caps", Gst.Caps.from_string("audio/mpeg,mpegversion=4,stream-format=adts")
+        )
+        self._audio_appsrc.set_property("is-live", True)
+        self._audio_appsrc.set_property("format", 3)  # GST_FORMAT_TIME
+        self._audio_appsrc.set_property("do-timestamp", False)
+
+        # Dubbed audio for a span arrives after the span's video has been
+        # queued; let flvmux wait that long for it before muxing video alone
+        flvmux.set_property("streamable", True)
+        flvmux.set_property("latency", self._video_delay_ns)
+
+        rtmpsink.set_property("location", self._rtmp_url)
+
+        for _, elem in elements:
+            self._pipeline.add(elem)
+
+        links = [
+            (rtmpsrc, flvdemux),
+            (h264parse, delay_queue),
+            (aacparse_in, tap_queue),
+            (tap_queue, audio_sink),
+            (self._audio_appsrc, aacparse_out),
+            (aacparse_out, audio_queue),
+            (flvmux, rtmpsink),
+        ]
+        for src, sink in links:
+            if not src.link(sink):
+                raise RuntimeError(f"Failed to link {src.get_name()} -> {sink.get_name()}")
+
+        for queue, pad_name in ((delay_queue, "video"), (audio_queue, "audio")):
+            mux_pad = flvmux.get_request_pad(pad_name)
+            if queue.get_static_pad("src").link(mux_pad) != Gst.PadLinkReturn.OK:
+                raise RuntimeError(f"Failed to link {queue.get_name()} -> flvmux")
+
+        self._h264parse = h264parse
+        self._aacparse_in = aacparse_in
+        flvdemux.connect("pad-added", self._on_pad_added)
+
+        self._bus = self._pipeline.get_bus()
+
+        self._state = "READY"
+        logger.info(
+            f"🎬 Delay-line pipeline built: {self._rtmp_input_url} -> {self._rtmp_url}, "
+            f"video delay={self._video_delay_ns / 1e9:.1f}s"
+        )
+
+    def _on_pad_added(self, element: Gst.Element, pad: Gst.Pad) -> None:
+        """Link flvdemux pads to the video delay line or the audio tap.
+
+        Args:
+            element: Source element (flvdemux)
+            pad: Newly created pad
+        """
+        caps = pad.get_current_caps()
+        if caps is None:
+            caps = pad.query_caps(None)
+        if caps is None or caps.is_empty():
+            return
+
+        media_type = caps.get_structure(0).get_name()
+        if media_type.startswith("video/x-h264"):
+            target, flag = self._h264parse, "has_video_pad"
+        elif media_type.startswith("audio/mpeg"):
+            target, flag = self._aacparse_in, "has_audio_pad"
+        else:
+            return
+
+        sink_pad = target.get_static_pad("sink")
+        if sink_pad is None or sink_pad.is_linked():
+            return
+        result = pad.link(sink_pad)
+        if result == Gst.PadLinkReturn.OK:
+            setattr(self, flag, True)
+            logger.info(f"Linked flvdemux {media_type} pad to {target.get_name()}")
+        else:
+            logger.error(f"Failed to link {media_type} pad: {result}")
+
+    def _on_delay_overrun(self, queue: Gst.Element) -> None:
+        """Count and report video dropped because dubbed audio is too late.
+
+        Args:
+            queue: The video delay queue
+        """
+        self.delay_overruns += 1
+        if self.delay_overruns == 1 or self.delay_overruns % 100 == 0:
+            logger.warning(
+                f"Video delay queue full ({self.delay_overruns} overruns): dubbed audio is "
+                f"more than {(self._video_delay_ns + self.QUEUE_HEADROOM_NS) / 1e9:.1f}s "
+                "behind, dropping oldest video"
+            )
+
+    def _on_audio_sample(self, appsink: Gst.Element) -> Gst.FlowReturn:
+        """Hand a tapped source audio buffer to Python.
+
+        Args:
+            appsink: The audio appsink element
+
+        Returns:
+            Gst.FlowReturn.OK
+        """
+        sample = appsink.emit("pull-sample")
+        if sample is None:
+            return Gst.FlowReturn.OK
+
+        audio = read_audio_sample(sample)
+        if audio is not None:
+            try:
+                self._on_audio_buffer(*audio)
+            except Exception as e:
+                logger.error(f"Error in audio buffer callback: {e}")
+
+        return Gst.FlowReturn.OK
+
+    def push_video(
+        self,
+        data: bytes,
+        pts_ns: int,
+        duration_ns: int = 0,
+        frames: list[tuple[int, int, int]] | None = None,
+    ) -> bool:
+        """Video stays inside the pipeline; pushing it from Python is an error.
+
+        Takes OutputPipeline.push_video's arguments, including the frame
+        table, so callers written against OutputPipeline fail the same way.
+
+        Raises:
+            RuntimeError: Always
+        """
+        raise RuntimeError("DelayLinePipeline carries video internally; push_video is not used")
+
+    def cleanup(self) -> None:
+        """Clean up pipeline resources."""
+        super().cleanup()
+        self._h264parse = None
+        self._aacparse_in = None
+        self.has_video_pad = False
+        self.has_audio_pad = False
+        self.delay_overruns = 0
@@ -40,6 +40,48 @@ logger = logging.getLogger(__name__)
 BufferCallback = Callable[[bytes, int, int], None]  # (data, pts_ns, duration_ns)
 
 
+def read_audio_sample(sample: Gst.Sample) -> tuple[bytes, int, int] | None:
+    """Copy an AAC sample out of GStreamer with its timing.
+
+    Args:
+        sample: Sample pulled from an audio appsink
+
+    Returns:
+        (data, pts_ns, duration_ns), or None if the sample has no readable buffer.
+        A missing duration is derived from the caps sample rate (1024 samples
+        per AAC frame).
+    """
+    buffer = sample.get_buffer()
+    if buffer is None:
+        return None
+
+    result, map_info = buffer.map(Gst.MapFlags.READ)
+    if not result:
+        return None
+    data = bytes(map_info.data)
+    buffer.unmap(map_info)
+
+    pts_ns = buffer.pts if buffer.pts != Gst.CLOCK_TIME_NONE else 0
+    duration_ns = buffer.duration if buffer.duration != Gst.CLOCK_TIME_NONE else 0
+
+    # If duration is missing, calculate from caps (sample rate)
+    if duration_ns == 0:
+        caps = sample.get_caps()
+        if caps and not caps.is_empty():
+            structure = caps.get_structure(0)
+            sample_rate = (
+                structure.get_int("rate")[1] if structure.has_field("rate") else 44100
+            )
+            # AAC-LC: 1024 samples per frame
+            # Duration = samples_per_frame / sample_rate * 1e9 ns
+            duration_ns = int((1024 / sample_rate) * 1_000_000_000)
+            logger.debug(
+                f"Calculated audio buffer duration from caps: sample_rate={sample_rate}Hz, duration={duration_ns}ns ({duration_ns / 1e6:.2f}ms)"
+            )
+
+    return data, pts_ns, duration_ns
+
+
 class InputPipeline:
     """RTMP input pipeline with video and audio appsinks.
 
@@ -385,36 +427,10 @@ class InputPipeline:
         if sample is None:
             return Gst.FlowReturn.OK
 
-        buffer = sample.get_buffer()
-        if buffer is None:
-            return Gst.FlowReturn.OK
-
-        # Extract buffer data
-        result, map_info = buffer.map(Gst.MapFlags.READ)
-        if result:
-            data = bytes(map_info.data)
-            buffer.unmap(map_info)
-
-            pts_ns = buffer.pts if buffer.pts != Gst.CLOCK_TIME_NONE else 0
-            duration_ns = buffer.duration if buffer.duration != Gst.CLOCK_TIME_NONE else 0
-
-            # If duration is missing, calculate from caps (sample rate)
-            if duration_ns == 0:
-                caps = sample.get_caps()
-                if caps and not caps.is_empty():
-                    structure = caps.get_structure(0)
-                    sample_rate = (
-                        structure.get_int("rate")[1] if structure.has_field("rate") else 44100
-                    )
-                    # AAC-LC: 1024 samples per frame
-                    # Duration = samples_per_frame / sample_rate * 1e9 ns
-                    duration_ns = int((1024 / sample_rate) * 1_000_000_000)
-                    logger.debug(
-                        f"Calculated audio buffer duration from caps: sample_rate={sample_rate}Hz, duration={duration_ns}ns ({duration_ns / 1e6:.2f}ms)"
-                    )
-
+        audio = read_audio_sample(sample)
+        if audio is not None:
             try:
-                self._on_audio_buffer(data, pts_ns, duration_ns)
+                self._on_audio_buffer(*audio)
             except Exception as e:
                 logger.error(f"Error in audio buffer callback: {e}")
 
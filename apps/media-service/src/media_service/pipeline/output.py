@@ -4,16 +4,21 @@ Output pipeline for RTMP stream publishing.
 Publishes remuxed video (H.264) and audio (AAC) to MediaMTX via RTMP.
 
 Per spec 003:
-- Video codec-copied (H.264 passthrough)
+- Video codec-copied (H.264 passthrough); decode + x264 re-encode is an
+  opt-in fallback (video_transcode=True)
 - Audio AAC for output
 - FLV mux with streamable=true for RTMP
 - appsrc with is-live=true, format=time
+- Segments are pushed one access unit per buffer (a single Gst.BufferList
+  per segment) when their frame boundaries are known
 """
 
 from __future__ import annotations
 
 import logging
 
+from media_service.audio.mp4_adts import Mp4ParseError, adts_frame_table, m4a_to_adts
+
 # GStreamer imports
 try:
     import gi
@@ -32,6 +37,22 @@ except (ImportError, ValueError):
 logger = logging.getLogger(__name__)
 
 
+def is_adts(data: bytes) -> bool:
+    """Check whether audio data starts with an ADTS frame header.
+
+    Dubbed audio arrives as ADTS when the stream negotiated
+    output_format="adts" (or the STS echoed our own ADTS input), and as M4A
+    otherwise.
+
+    Args:
+        data: Audio data
+
+    Returns:
+        True if data begins with the 12-bit ADTS syncword (layer 0)
+    """
+    return len(data) >= 7 and data[0] == 0xFF and (data[1] & 0xF6) == 0xF0
+
+
 class OutputPipeline:
     """RTMP output pipeline with video and audio appsrcs.
 
@@ -46,13 +67,16 @@ class OutputPipeline:
         _video_appsrc: Video source element
         _audio_appsrc: Audio source element
         _state: Current pipeline state string
+        _video_transcode: Re-encode video instead of remuxing the input H.264
     """
 
-    def __init__(self, rtmp_url: str) -> None:
+    def __init__(self, rtmp_url: str, video_transcode: bool = False) -> None:
         """Initialize output pipeline.
 
         Args:
             rtmp_url: RTMP URL (e.g., "rtmp://mediamtx:1935/live/stream/out")
+            video_transcode: Decode and re-encode video with x264 (fallback for
+                sources whose segments are not keyframe-aligned)
 
         Raises:
             ValueError: If RTMP URL is empty or invalid format
@@ -64,6 +88,7 @@ class OutputPipeline:
             raise ValueError(f"Invalid RTMP URL: must start with 'rtmp://' - got '{rtmp_url}'")
 
         self._rtmp_url = rtmp_url
+        self._video_transcode = video_transcode
         self._pipeline: Gst.Pipeline | None = None
         self._video_appsrc: Gst.Element | None = None
         self._audio_appsrc: Gst.Element | None = None
@@ -96,34 +121,15 @@ class OutputPipeline:
         if self._pipeline is None:
             raise RuntimeError("Failed to create GStreamer pipeline")
 
-        # Create video path elements with DECODE → ENCODE pipeline
-        # This re-encodes video to ensure proper keyframe alignment and codec_data generation
+        # Create video path elements
         self._video_appsrc = Gst.ElementFactory.make("appsrc", "video_src")
-        h264parse_in = Gst.ElementFactory.make("h264parse", "h264parse_in")
-        avdec_h264 = Gst.ElementFactory.make("avdec_h264", "avdec_h264")
-        videoconvert = Gst.ElementFactory.make("videoconvert", "videoconvert")
-        x264enc = Gst.ElementFactory.make("x264enc", "x264enc")
-        h264parse_out = Gst.ElementFactory.make("h264parse", "h264parse_out")
+        video_chain = (
+            self._make_transcode_video_chain()
+            if self._video_transcode
+            else self._make_passthrough_video_chain()
+        )
         video_queue = Gst.ElementFactory.make("queue", "video_queue")
 
-        # Configure input h264parse to handle byte-stream input
-        h264parse_in.set_property("config-interval", -1)  # Insert SPS/PPS for decoder
-
-        # Configure x264enc for low-latency streaming
-        # - tune=zerolatency: minimize latency
-        # - key-int-max=30: keyframe every 1 second at 30fps
-        # - bframes=0: no B-frames for lower latency
-        # - speed-preset=veryfast: balance quality/speed
-        # - bitrate=2000: maintain quality (kbps)
-        x264enc.set_property("tune", 0x00000004)  # zerolatency
-        x264enc.set_property("key-int-max", 30)
-        x264enc.set_property("bframes", 0)
-        x264enc.set_property("speed-preset", 3)  # veryfast
-        x264enc.set_property("bitrate", 2000)
-
-        # Configure output h264parse for AVC output to flvmux
-        h264parse_out.set_property("config-interval", -1)
-
         # Create audio path elements
         self._audio_appsrc = Gst.ElementFactory.make("appsrc", "audio_src")
         aacparse = Gst.ElementFactory.make("aacparse", "aacparse")
@@ -136,11 +142,7 @@ class OutputPipeline:
         # Verify all elements created
         elements = [
             ("video_src", self._video_appsrc),
-            ("h264parse_in", h264parse_in),
-            ("avdec_h264", avdec_h264),
-            ("videoconvert", videoconvert),
-            ("x264enc", x264enc),
-            ("h264parse_out", h264parse_out),
+            *video_chain,
             ("video_queue", video_queue),
             ("audio_src", self._audio_appsrc),
             ("aacparse", aacparse),
@@ -157,9 +159,9 @@ class OutputPipeline:
         # Note: We use byte-stream format and let h264parse convert to AVC for flvmux.
         # The h264parse will extract SPS/PPS from the byte-stream data and set codec_data.
         # config-interval=-1 ensures SPS/PPS is re-inserted before each IDR frame.
-        video_caps = Gst.Caps.from_string(
-            "video/x-h264,stream-format=byte-stream,alignment=au"
-        )
+        # Buffers are single access units when the segment's frame table is
+        # known and whole segments otherwise, so no alignment is declared.
+        video_caps = Gst.Caps.from_string("video/x-h264,stream-format=byte-stream")
         self._video_appsrc.set_property("caps", video_caps)
         self._video_appsrc.set_property("is-live", True)
         self._video_appsrc.set_property("format", 3)  # GST_FORMAT_TIME
@@ -184,19 +186,11 @@ class OutputPipeline:
         for _, elem in elements:
             self._pipeline.add(elem)
 
-        # Link video path: appsrc → h264parse_in → avdec_h264 → videoconvert → x264enc → h264parse_out → queue
-        if not self._video_appsrc.link(h264parse_in):
-            raise RuntimeError("Failed to link video_src -> h264parse_in")
-        if not h264parse_in.link(avdec_h264):
-            raise RuntimeError("Failed to link h264parse_in -> avdec_h264")
-        if not avdec_h264.link(videoconvert):
-            raise RuntimeError("Failed to link avdec_h264 -> videoconvert")
-        if not videoconvert.link(x264enc):
-            raise RuntimeError("Failed to link videoconvert -> x264enc")
-        if not x264enc.link(h264parse_out):
-            raise RuntimeError("Failed to link x264enc -> h264parse_out")
-        if not h264parse_out.link(video_queue):
-            raise RuntimeError("Failed to link h264parse_out -> video_queue")
+        # Link video path: appsrc → video chain → queue
+        video_path = [("video_src", self._video_appsrc), *video_chain, ("video_queue", video_queue)]
+        for (src_name, src), (sink_name, sink) in zip(video_path, video_path[1:], strict=False):
+            if not src.link(sink):
+                raise RuntimeError(f"Failed to link {src_name} -> {sink_name}")
 
         # Link audio path
         if not self._audio_appsrc.link(aacparse):
@@ -225,11 +219,68 @@ class OutputPipeline:
         self._bus = self._pipeline.get_bus()
 
         self._state = "READY"
+        chain = " → ".join(name for name, _ in video_chain)
         logger.info(
-            f"🎬 Output pipeline built with VIDEO RE-ENCODING for {self._rtmp_url}\n"
-            f"   Pipeline: appsrc → h264parse → avdec_h264 → videoconvert → x264enc → h264parse → flvmux → rtmpsink"
+            f"🎬 Output pipeline built ({'transcode' if self._video_transcode else 'passthrough'} "
+            f"video) for {self._rtmp_url}\n"
+            f"   Pipeline: appsrc → {chain} → flvmux → rtmpsink"
         )
 
+    def _make_passthrough_video_chain(self) -> list[tuple[str, Gst.Element | None]]:
+        """Create the stream-copy video path: the input H.264 is only re-muxed.
+
+        Returns:
+            (name, element) pairs in link order
+        """
+        h264parse = Gst.ElementFactory.make("h264parse", "h264parse")
+        if h264parse is not None:
+            # Insert SPS/PPS before each IDR so every segment starts decodable
+            h264parse.set_property("config-interval", -1)
+        return [("h264parse", h264parse)]
+
+    def _make_transcode_video_chain(self) -> list[tuple[str, Gst.Element | None]]:
+        """Create the decode → x264 re-encode video path.
+
+        Re-encoding regenerates keyframes and codec_data, at the cost of a
+        full decode and encode of every frame.
+
+        Returns:
+            (name, element) pairs in link order
+        """
+        h264parse_in = Gst.ElementFactory.make("h264parse", "h264parse_in")
+        avdec_h264 = Gst.ElementFactory.make("avdec_h264", "avdec_h264")
+        videoconvert = Gst.ElementFactory.make("videoconvert", "videoconvert")
+        x264enc = Gst.ElementFactory.make("x264enc", "x264enc")
+        h264parse_out = Gst.ElementFactory.make("h264parse", "h264parse_out")
+        chain = [
+            ("h264parse_in", h264parse_in),
+            ("avdec_h264", avdec_h264),
+            ("videoconvert", videoconvert),
+            ("x264enc", x264enc),
+            ("h264parse_out", h264parse_out),
+        ]
+        if any(elem is None for _, elem in chain):
+            return chain
+
+        # Configure input h264parse to handle byte-stream input
+        h264parse_in.set_property("config-interval", -1)  # Insert SPS/PPS for decoder
+
+        # Configure x264enc for low-latency streaming
+        # - tune=zerolatency: minimize latency
+        # - key-int-max=30: keyframe every 1 second at 30fps
+        # - bframes=0: no B-frames for lower latency
+        # - speed-preset=veryfast: balance quality/speed
+        # - bitrate=2000: maintain quality (kbps)
+        x264enc.set_property("tune", 0x00000004)  # zerolatency
+        x264enc.set_property("key-int-max", 30)
+        x264enc.set_property("bframes", 0)
+        x264enc.set_property("speed-preset", 3)  # veryfast
+        x264enc.set_property("bitrate", 2000)
+
+        # Configure output h264parse for AVC output to flvmux
+        h264parse_out.set_property("config-interval", -1)
+        return chain
+
     def _on_bus_message(self, bus: Gst.Bus, message: Gst.Message) -> bool:
         """Handle GStreamer bus messages.
 
@@ -422,9 +473,26 @@ class OutputPipeline:
     def convert_m4a_bytes_to_adts(self, m4a_data: bytes) -> bytes:
         """Convert M4A container bytes to raw ADTS AAC frames.
 
-        Uses GStreamer to demux M4A and extract AAC in ADTS format.
         This is needed when audio data is in M4A format (from STS service)
-        but the output pipeline expects raw ADTS frames.
+        but the output pipeline expects raw ADTS frames. The AAC access units
+        are rewrapped in memory by parsing the MP4 sample tables; GStreamer
+        qtdemux is only used for files that parser rejects (fragmented MP4,
+        unusual sample entries).
+
+        Args:
+            m4a_data: M4A container data (in memory)
+
+        Returns:
+            AAC audio data in ADTS format (self-describing)
+        """
+        try:
+            return m4a_to_adts(m4a_data)
+        except Mp4ParseError as e:
+            logger.warning(f"In-memory M4A parse failed ({e}), falling back to GStreamer demux")
+        return self._convert_m4a_bytes_to_adts_gst(m4a_data)
+
+    def _convert_m4a_bytes_to_adts_gst(self, m4a_data: bytes) -> bytes:
+        """Convert M4A container bytes to ADTS with a qtdemux/aacparse pipeline.
 
         Args:
             m4a_data: M4A container data (in memory)
@@ -698,13 +766,62 @@ class OutputPipeline:
             return sps_data + pps_data
         return None
 
-    def push_video(self, data: bytes, pts_ns: int, duration_ns: int = 0) -> bool:
+    def _push_frames(
+        self,
+        appsrc: Gst.Element,
+        data: bytes,
+        frames: list[tuple[int, int, int]],
+        pts_ns: int,
+    ) -> Gst.FlowReturn:
+        """Push data as one buffer per frame in a single Gst.BufferList.
+
+        The data is wrapped once; each frame buffer is a sub-region sharing
+        its memory, so nothing is copied per frame.
+
+        Args:
+            appsrc: appsrc to push to
+            data: Concatenated frames
+            frames: (byte offset, pts_ns, duration_ns) per frame, in data order
+            pts_ns: Output PTS of the first frame; later frames keep their
+                spacing from the frame table
+
+        Returns:
+            Flow return of the push
+        """
+        parent = Gst.Buffer.new_wrapped(data)
+        buffer_list = Gst.BufferList.new_sized(len(frames))
+        base_pts = frames[0][1]
+        ends = [offset for offset, _, _ in frames[1:]] + [len(data)]
+
+        for (offset, frame_pts, duration), end in zip(frames, ends, strict=True):
+            buffer = parent.copy_region(Gst.BufferCopyFlags.MEMORY, offset, end - offset)
+            buffer.pts = pts_ns + frame_pts - base_pts
+            if duration > 0:
+                buffer.duration = duration
+            buffer.set_flags(Gst.BufferFlags.LIVE)
+            buffer_list.insert(-1, buffer)
+
+        return appsrc.emit("push-buffer-list", buffer_list)
+
+    def push_video(
+        self,
+        data: bytes,
+        pts_ns: int,
+        duration_ns: int = 0,
+        frames: list[tuple[int, int, int]] | None = None,
+    ) -> bool:
         """Push video buffer to output pipeline.
 
+        With a frame table each access unit is pushed as its own buffer at
+        its original spacing, so h264parse does not re-split a 6 s blob and
+        flvmux sees evenly paced input.
+
         Args:
             data: H.264 encoded video data
             pts_ns: Presentation timestamp in nanoseconds
             duration_ns: Buffer duration in nanoseconds (optional)
+            frames: (byte offset, pts_ns, duration_ns) of each access unit in
+                data (optional; without it data is pushed as one buffer)
 
         Returns:
             True if push succeeded
@@ -735,6 +852,10 @@ class OutputPipeline:
         original_size = len(data)
         if self._sps_pps_data and not (has_sps_at_start and has_pps_at_start):
             data = self._sps_pps_data + data
+            if frames:
+                # The parameter sets become part of the first access unit
+                prefix = len(self._sps_pps_data)
+                frames = [frames[0]] + [(off + prefix, pts, dur) for off, pts, dur in frames[1:]]
             logger.info(
                 f"📼 Prepended SPS/PPS: {len(self._sps_pps_data)} bytes to "
                 f"{original_size} bytes (SPS/PPS was later in segment)"
@@ -743,18 +864,22 @@ class OutputPipeline:
         # Poll bus messages to process pipeline state changes
         self._poll_bus_messages()
 
-        buffer = Gst.Buffer.new_allocate(None, len(data), None)
-        buffer.fill(0, data)
-        buffer.pts = pts_ns
-        if duration_ns > 0:
-            buffer.duration = duration_ns
-
-        # Mark buffer as keyframe since we always have SPS/PPS at start
-        # (either originally or prepended). This helps h264parse/flvmux process correctly.
-        # LIVE flag indicates this is a live stream, no DELTA_UNIT means it's a keyframe.
-        buffer.set_flags(Gst.BufferFlags.LIVE)
-
-        ret = self._video_appsrc.emit("push-buffer", buffer)
+        if frames:
+            # h264parse sets DELTA_UNIT per access unit from the slice types
+            ret = self._push_frames(self._video_appsrc, data, frames, pts_ns)
+        else:
+            buffer = Gst.Buffer.new_allocate(None, len(data), None)
+            buffer.fill(0, data)
+            buffer.pts = pts_ns
+            if duration_ns > 0:
+                buffer.duration = duration_ns
+
+            # Mark buffer as keyframe since we always have SPS/PPS at start
+            # (either originally or prepended). This helps h264parse/flvmux process correctly.
+            # LIVE flag indicates this is a live stream, no DELTA_UNIT means it's a keyframe.
+            buffer.set_flags(Gst.BufferFlags.LIVE)
+
+            ret = self._video_appsrc.emit("push-buffer", buffer)
         success = ret == Gst.FlowReturn.OK
 
         if not success:
@@ -765,7 +890,8 @@ class OutputPipeline:
         else:
             logger.info(
                 f"📹 VIDEO PUSHED: pts={pts_ns / 1e9:.2f}s, "
-                f"size={len(data)}, duration={duration_ns / 1e9:.3f}s"
+                f"size={len(data)}, duration={duration_ns / 1e9:.3f}s, "
+                f"buffers={len(frames) if frames else 1}"
             )
 
         return success
@@ -773,6 +899,9 @@ class OutputPipeline:
     def push_audio(self, data: bytes, pts_ns: int, duration_ns: int = 0) -> bool:
         """Push audio buffer to output pipeline.
 
+        ADTS data is pushed one AAC frame per buffer, timed from the frame
+        headers; anything else is pushed as a single buffer.
+
         Args:
             data: AAC encoded audio data
             pts_ns: Presentation timestamp in nanoseconds
@@ -790,13 +919,17 @@ class OutputPipeline:
         # Poll bus messages to process pipeline state changes
         self._poll_bus_messages()
 
-        buffer = Gst.Buffer.new_allocate(None, len(data), None)
-        buffer.fill(0, data)
-        buffer.pts = pts_ns
-        if duration_ns > 0:
-            buffer.duration = duration_ns
+        frames = adts_frame_table(data)
+        if frames:
+            ret = self._push_frames(self._audio_appsrc, data, frames, pts_ns)
+        else:
+            buffer = Gst.Buffer.new_allocate(None, len(data), None)
+            buffer.fill(0, data)
+            buffer.pts = pts_ns
+            if duration_ns > 0:
+                buffer.duration = duration_ns
 
-        ret = self._audio_appsrc.emit("push-buffer", buffer)
+            ret = self._audio_appsrc.emit("push-buffer", buffer)
         success = ret == Gst.FlowReturn.OK
 
         if not success:
@@ -807,7 +940,8 @@ class OutputPipeline:
         else:
             logger.info(
                 f"🔊 AUDIO PUSHED: pts={pts_ns / 1e9:.2f}s, "
-                f"size={len(data)}, duration={duration_ns / 1e9:.3f}s"
+                f"size={len(data)}, duration={duration_ns / 1e9:.3f}s, "
+                f"buffers={len(frames) or 1}"
             )
 
         return success
@@ -28,10 +28,16 @@ class StreamConfig:
         source_language: Language code of input audio (e.g., "en", "en-US").
         target_language: Language code for dubbing output (e.g., "es", "es-ES").
         voice_profile: TTS voice profile identifier.
-        format: Audio format for transport (always "m4a").
+        format: Format of the fragment audio sent to STS ("m4a", or "aac"
+            for the ADTS frames the input pipeline produces).
         sample_rate_hz: Audio sample rate in Hz.
         channels: Number of audio channels (1=mono, 2=stereo).
         chunk_duration_ms: Segment duration in milliseconds.
+        binary_audio: Offer to exchange fragment audio as raw bytes
+            attachments instead of base64 (used only if the server agrees
+            in stream:ready capabilities).
+        output_format: Format requested for dubbed audio ("m4a" or "adts").
+            Servers that predate format negotiation always return "m4a".
     """
 
     source_language: str = "en"
@@ -41,6 +47,8 @@ class StreamConfig:
     sample_rate_hz: int = 48000
     channels: int = 2
     chunk_duration_ms: int = 6000
+    binary_audio: bool = True
+    output_format: str = "m4a"
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Socket.IO payload."""
@@ -52,6 +60,8 @@ class StreamConfig:
             "sample_rate_hz": self.sample_rate_hz,
             "channels": self.channels,
             "chunk_duration_ms": self.chunk_duration_ms,
+            "binary_audio": self.binary_audio,
+            "output_format": self.output_format,
         }
 
 
@@ -86,20 +96,24 @@ class AudioData:
     """Audio data structure for Socket.IO fragment events.
 
     Used in both fragment:data (sending) and fragment:processed (receiving).
+    The audio travels base64-encoded, or as raw bytes (a Socket.IO binary
+    attachment) when the stream negotiated binary_audio.
 
     Attributes:
         format: Audio format (always "m4a").
         sample_rate_hz: Sample rate in Hz.
         channels: Number of channels.
         duration_ms: Duration in milliseconds.
-        data_base64: Base64-encoded audio data.
+        data_base64: Base64-encoded audio data (empty when data is set).
+        data: Raw audio data for binary_audio streams.
     """
 
     format: str
     sample_rate_hz: int
     channels: int
     duration_ms: int
-    data_base64: str
+    data_base64: str = ""
+    data: bytes | None = None
 
     @classmethod
     def from_m4a_file(cls, file_path: Path, duration_ms: int) -> AudioData:
@@ -128,6 +142,8 @@ class AudioData:
         duration_ms: int,
         sample_rate_hz: int = 48000,
         channels: int = 2,
+        binary: bool = False,
+        audio_format: str = "m4a",
     ) -> AudioData:
         """Create AudioData from raw bytes.
 
@@ -136,12 +152,22 @@ class AudioData:
             duration_ms: Duration in milliseconds.
             sample_rate_hz: Sample rate.
             channels: Number of channels.
+            binary: Keep the raw bytes instead of base64-encoding them.
+            audio_format: Format identifier of the data (e.g. "m4a", "aac").
 
         Returns:
-            AudioData with base64-encoded data.
+            AudioData with raw or base64-encoded data.
         """
+        if binary:
+            return cls(
+                format=audio_format,
+                sample_rate_hz=sample_rate_hz,
+                channels=channels,
+                duration_ms=duration_ms,
+                data=data,
+            )
         return cls(
-            format="m4a",
+            format=audio_format,
             sample_rate_hz=sample_rate_hz,
             channels=channels,
             duration_ms=duration_ms,
@@ -150,16 +176,22 @@ class AudioData:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for Socket.IO payload."""
-        return {
+        result = {
             "format": self.format,
             "sample_rate_hz": self.sample_rate_hz,
             "channels": self.channels,
             "duration_ms": self.duration_ms,
-            "data_base64": self.data_base64,
         }
+        if self.data is not None:
+            result["data"] = self.data
+        else:
+            result["data_base64"] = self.data_base64
+        return result
 
     def decode_audio(self) -> bytes:
-        """Decode base64 audio data to bytes."""
+        """Get the audio bytes (raw data, or decoded base64)."""
+        if self.data is not None:
+            return self.data
         return base64.b64decode(self.data_base64)
 
 
@@ -212,12 +244,16 @@ class FragmentDataPayload:
         cls,
         segment: AudioSegment,
         sequence_number: int,
+        binary: bool = False,
+        audio_format: str = "m4a",
     ) -> FragmentDataPayload:
         """Create FragmentDataPayload from an AudioSegment.
 
         Args:
             segment: AudioSegment with M4A file.
             sequence_number: Current sequence number.
+            binary: Send the audio as a raw bytes attachment.
+            audio_format: Format label negotiated in stream:init.
 
         Returns:
             FragmentDataPayload ready for Socket.IO emit.
@@ -231,6 +267,8 @@ class FragmentDataPayload:
             audio=AudioData.from_bytes(
                 data=audio_data,
                 duration_ms=segment.duration_ms,
+                binary=binary,
+                audio_format=audio_format,
             ),
             metadata=FragmentMetadata(pts_ns=segment.t0_ns),
         )
@@ -338,7 +376,8 @@ class FragmentProcessedPayload:
                 sample_rate_hz=da.get("sample_rate_hz", 48000),
                 channels=da.get("channels", 2),
                 duration_ms=da.get("duration_ms", 0),
-                data_base64=da.get("data_base64", ""),
+                data_base64=da.get("data_base64") or "",
+                data=da.get("data"),
             )
 
         stage_timings = None
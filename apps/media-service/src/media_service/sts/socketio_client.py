@@ -49,6 +49,12 @@ class StsSocketIOClient:
         stream_id: Current stream identifier
         max_inflight: Maximum concurrent in-flight fragments
         session_id: STS session ID (assigned by server)
+        binary_audio: Whether fragment audio is sent and received as raw
+            bytes attachments (negotiated in stream:ready)
+        audio_format: Format label for outgoing fragment audio (from stream:init)
+        output_format: Dubbed audio format to expect (from stream:init, or m4a
+            if the server does not list it)
+        server_formats: Input/output formats the server advertised in stream:ready
     """
 
     def __init__(
@@ -74,6 +80,10 @@ class StsSocketIOClient:
         self.stream_id: str | None = None
         self.session_id: str | None = None
         self.max_inflight: int = 3
+        self.binary_audio: bool = False
+        self.audio_format: str = "m4a"
+        self.output_format: str = "m4a"
+        self.server_formats: dict[str, list[str]] = {}
 
         self._sio: socketio.AsyncClient | None = None
         self._connected = False
@@ -161,16 +171,52 @@ class StsSocketIOClient:
         """Handle stream:ready event from server.
 
         Args:
-            data: Response data containing session_id, max_inflight
+            data: Response data containing session_id, max_inflight, capabilities
         """
         self.session_id = data.get("session_id")
         self.max_inflight = data.get("max_inflight", 3)
+        # Servers that predate binary_audio omit it: keep base64
+        capabilities = data.get("capabilities") or {}
+        self.binary_audio = bool(capabilities.get("binary_audio", False))
+        self.server_formats = {
+            "input": capabilities.get("input_formats") or [],
+            "output": capabilities.get("output_formats") or [],
+        }
+        self._apply_server_formats()
 
-        logger.info(f"Stream ready: session_id={self.session_id}, max_inflight={self.max_inflight}")
+        logger.info(
+            f"Stream ready: session_id={self.session_id}, max_inflight={self.max_inflight}, "
+            f"binary_audio={self.binary_audio}, formats={self.server_formats}, "
+            f"format={self.audio_format}, output_format={self.output_format}"
+        )
 
         self._stream_ready = True
         self._ready_event.set()
 
+    def _apply_server_formats(self) -> None:
+        """Reconcile the requested formats with what the server advertised.
+
+        Fragments keep the label of the bytes actually sent (the worker does
+        not remux them), so an unlisted input format is only reported; the
+        STS decoder probes the container. Dubbed audio falls back to M4A,
+        which every STS version returns, when the requested output format is
+        not offered, including by servers that predate format negotiation.
+        """
+        input_formats = self.server_formats["input"]
+        if input_formats and self.audio_format not in input_formats:
+            logger.warning(
+                f"STS does not list format={self.audio_format} "
+                f"(supported: {input_formats}); sending it unchanged"
+            )
+
+        if self.output_format not in self.server_formats["output"]:
+            if self.output_format != "m4a":
+                logger.warning(
+                    f"STS does not offer output_format={self.output_format} "
+                    f"(supported: {self.server_formats['output']}), expecting m4a"
+                )
+            self.output_format = "m4a"
+
     async def _handle_fragment_ack(self, data: dict) -> None:
         """Handle fragment:ack event from server.
 
@@ -260,6 +306,9 @@ class StsSocketIOClient:
         self.stream_id = stream_id
         self._ready_event.clear()
         self._sequence_number = 0
+        self.binary_audio = False
+        self.audio_format = config.format
+        self.output_format = config.output_format
 
         # Send stream:init
         await self._sio.emit(
@@ -313,6 +362,8 @@ class StsSocketIOClient:
         payload = FragmentDataPayload.from_segment(
             segment=segment,
             sequence_number=self._sequence_number,
+            binary=self.binary_audio,
+            audio_format=self.audio_format,
         )
 
         # Send fragment:data
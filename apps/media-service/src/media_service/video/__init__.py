@@ -6,12 +6,15 @@ MP4 files (H.264 codec-copy) to disk.
 
 Components:
 - VideoSegmentWriter: Writes video segments as MP4 files
+- is_keyframe: IDR detection for GOP-aligned segmentation
 """
 
 from __future__ import annotations
 
+from media_service.video.h264 import is_keyframe
 from media_service.video.segment_writer import VideoSegmentWriter
 
 __all__ = [
     "VideoSegmentWriter",
+    "is_keyframe",
 ]
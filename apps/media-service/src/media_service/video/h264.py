@@ -0,0 +1,49 @@
+"""
+H.264 byte-stream inspection helpers.
+
+The input pipeline delivers one access unit per buffer in Annex B
+byte-stream format (start-code delimited NAL units). These helpers look at
+NAL headers only; nothing is decoded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+NAL_TYPE_SLICE = 1
+NAL_TYPE_IDR = 5
+NAL_TYPE_SPS = 7
+NAL_TYPE_PPS = 8
+
+
+def iter_nal_types(data: bytes) -> Iterator[int]:
+    """Yield the nal_unit_type of each NAL unit in byte-stream data.
+
+    Args:
+        data: H.264 Annex B data (3- or 4-byte start codes)
+
+    Yields:
+        nal_unit_type (low 5 bits of each NAL header byte)
+    """
+    pos = data.find(b"\x00\x00\x01")
+    while pos != -1 and pos + 3 < len(data):
+        yield data[pos + 3] & 0x1F
+        pos = data.find(b"\x00\x00\x01", pos + 3)
+
+
+def is_keyframe(data: bytes) -> bool:
+    """Check whether an access unit is an IDR picture.
+
+    Parameter sets, SEI and AUD NAL units precede the first slice of an
+    access unit, so the scan stops at the first coded slice.
+
+    Args:
+        data: One H.264 access unit in byte-stream format
+
+    Returns:
+        True if the access unit's first coded slice is an IDR slice
+    """
+    for nal_type in iter_nal_types(data):
+        if NAL_TYPE_SLICE <= nal_type <= NAL_TYPE_IDR:
+            return nal_type == NAL_TYPE_IDR
+    return False
@@ -8,6 +8,10 @@ Coordinates all components:
 - A/V sync (pair video with dubbed audio)
 - Output pipeline (appsrc -> RTMP)
 
+With video_delay_line=True the input and output pipelines are replaced by a
+single DelayLinePipeline: video is delayed inside GStreamer and only audio
+segments travel through Python.
+
 Per spec 003:
 - Full dubbing pipeline orchestration
 - Lifecycle management (start/stop/cleanup)
@@ -27,8 +31,9 @@ from media_service.audio.segment_writer import AudioSegmentWriter
 from media_service.buffer.segment_buffer import SegmentBuffer
 from media_service.metrics.prometheus import WorkerMetrics
 from media_service.models.segments import AudioSegment, VideoSegment
+from media_service.pipeline.delay_line import DelayLinePipeline
 from media_service.pipeline.input import InputPipeline
-from media_service.pipeline.output import OutputPipeline
+from media_service.pipeline.output import OutputPipeline, is_adts
 from media_service.sts.backpressure_handler import BackpressureHandler
 from media_service.sts.circuit_breaker import StsCircuitBreaker
 from media_service.sts.fragment_tracker import FragmentTracker
@@ -53,6 +58,15 @@ class WorkerConfig:
         source_language: Source audio language
         target_language: Target dubbing language
         segment_duration_ns: Segment duration in nanoseconds
+        sts_input_format: Format label for audio sent to STS ("aac" = the
+            ADTS frames produced by the input pipeline, no conversion)
+        sts_output_format: Dubbed audio format requested from STS ("adts"
+            skips the M4A -> ADTS demux before output)
+        video_transcode: Decode and re-encode video in the output pipeline
+            instead of stream-copying keyframe-aligned segments
+        video_delay_line: Keep video inside one GStreamer pipeline behind a
+            delay queue sized to the A/V offset; only audio reaches Python
+            (video_transcode is ignored)
     """
 
     stream_id: str
@@ -64,6 +78,10 @@ class WorkerConfig:
     target_language: str = "zh"
     voice_profile: str = "default"
     segment_duration_ns: int = 6_000_000_000  # 6 seconds
+    sts_input_format: str = "aac"
+    sts_output_format: str = "adts"
+    video_transcode: bool = False
+    video_delay_line: bool = False
 
 
 class WorkerRunner:
@@ -110,6 +128,9 @@ class WorkerRunner:
             stream_id=self.config.stream_id,
             segment_dir=self.config.segment_dir,
             segment_duration_ns=self.config.segment_duration_ns,
+            # Passthrough output needs every video segment to start on an IDR
+            # (the delay line never segments video, so audio cuts on duration)
+            keyframe_aligned=not (self.config.video_transcode or self.config.video_delay_line),
         )
 
         # Segment writers
@@ -190,6 +211,8 @@ class WorkerRunner:
             source_language=self.config.source_language,
             target_language=self.config.target_language,
             voice_profile=self.config.voice_profile,
+            format=self.config.sts_input_format,
+            output_format=self.config.sts_output_format,
         )
 
         await self.sts_client.init_stream(
@@ -199,6 +222,18 @@ class WorkerRunner:
 
     def _build_pipelines(self) -> None:
         """Build input and output GStreamer pipelines."""
+        if self.config.video_delay_line:
+            # One pipeline: it is both the audio source and the output
+            self.output_pipeline = DelayLinePipeline(
+                rtmp_input_url=self.config.rtmp_input_url,
+                rtmp_url=self.config.rtmp_url,
+                on_audio_buffer=self._on_audio_buffer,
+                video_delay_ns=self.av_sync.state.av_offset_ns,
+            )
+            self.output_pipeline.build()
+            self.output_pipeline.start()
+            return
+
         # Input pipeline - uses RTMP to pull stream from MediaMTX
         self.input_pipeline = InputPipeline(
             rtmp_url=self.config.rtmp_input_url,
@@ -211,6 +246,7 @@ class WorkerRunner:
         # Output pipeline - uses RTMP to publish dubbed stream
         self.output_pipeline = OutputPipeline(
             rtmp_url=self.config.rtmp_url,
+            video_transcode=self.config.video_transcode,
         )
         self.output_pipeline.build()
         self.output_pipeline.start()
@@ -373,10 +409,7 @@ class WorkerRunner:
         # Read original audio
         audio_data = segment.get_m4a_data()
 
-        # Push to A/V sync
-        pair = await self.av_sync.push_audio(segment, audio_data)
-        if pair:
-            await self._output_pair(pair)
+        await self._route_audio(segment, audio_data)
 
     async def _on_fragment_processed(
         self,
@@ -410,13 +443,7 @@ class WorkerRunner:
             segment = inflight.segment
             segment = await self.audio_writer.write_dubbed(segment, dubbed_data)
 
-            # Push to A/V sync
-            pair = await self.av_sync.push_audio(segment, dubbed_data)
-            if pair:
-                logger.info(f"A/V pair ready: batch={pair.video_segment.batch_number}, outputting...")
-                await self._output_pair(pair)
-            else:
-                logger.info(f"A/V sync waiting for video: audio batch={segment.batch_number}")
+            await self._route_audio(segment, dubbed_data)
 
         elif payload.is_failed:
             # Use fallback
@@ -448,6 +475,75 @@ class WorkerRunner:
         logger.error(f"STS error: {code} - {message}")
         self.metrics.record_error(f"sts_{code.lower()}")
 
+    async def _route_audio(self, segment: AudioSegment, data: bytes) -> None:
+        """Send a dubbed (or fallback) audio segment towards the output.
+
+        With the delay line, audio goes straight back into the pipeline that
+        holds the video; otherwise it waits in A/V sync for its video segment.
+
+        Args:
+            segment: AudioSegment the data belongs to
+            data: Dubbed or original audio data
+        """
+        if self.config.video_delay_line:
+            await self._output_audio(segment, data)
+            return
+
+        pair = await self.av_sync.push_audio(segment, data)
+        if pair:
+            logger.info(f"A/V pair ready: batch={pair.video_segment.batch_number}, outputting...")
+            await self._output_pair(pair)
+        else:
+            logger.info(f"A/V sync waiting for video: audio batch={segment.batch_number}")
+
+    def _prepare_output_audio(self, segment: AudioSegment, data: bytes) -> bytes:
+        """Return audio as the ADTS frames the output pipeline's aacparse expects.
+
+        Args:
+            segment: AudioSegment the data belongs to
+            data: Dubbed or original audio data
+
+        Returns:
+            ADTS audio data (the input unchanged if conversion fails)
+        """
+        if segment.is_dubbed and not is_adts(data):
+            # Dubbed audio came back in M4A container format (server did not
+            # honour output_format="adts"). Convert to raw ADTS AAC for the
+            # output pipeline's aacparse.
+            try:
+                converted = self.output_pipeline.convert_m4a_bytes_to_adts(data)
+                logger.info(f"🔊 Converted M4A to ADTS: {len(data)} -> {len(converted)} bytes")
+                return converted
+            except Exception as e:
+                logger.error(f"Failed to convert M4A to ADTS: {e}")
+                # Fall back to original audio data
+        # Original audio is already in raw AAC/ADTS format from input aacparse
+        return data
+
+    async def _output_audio(self, segment: AudioSegment, data: bytes) -> None:
+        """Re-inject an audio segment into the delay-line pipeline.
+
+        The segment keeps its source PTS: the delayed video in the same
+        pipeline is on that timeline too.
+
+        Args:
+            segment: AudioSegment the data belongs to
+            data: Dubbed or original audio data
+        """
+        if self.output_pipeline is None:
+            logger.warning("⚠️ Output pipeline is None, skipping audio output")
+            return
+
+        try:
+            self.output_pipeline.push_audio(
+                self._prepare_output_audio(segment, data),
+                segment.t0_ns,
+                segment.duration_ns,
+            )
+        except Exception as e:
+            logger.error(f"Error outputting audio segment: {e}", exc_info=True)
+            self.metrics.record_error("output")
+
     async def _output_pair(self, pair: SyncPair) -> None:
         """Output synchronized video/audio pair.
 
@@ -471,28 +567,17 @@ class WorkerRunner:
             # Push video/audio data directly from SyncPair (no file I/O needed)
             # T033: Use in-memory buffers instead of push_segment_files()
 
-            # Video is already in H.264 byte-stream format from input pipeline
+            # Video is already in H.264 byte-stream format from input pipeline;
+            # its frame table lets each access unit go out as its own buffer
             video_ok = self.output_pipeline.push_video(
                 pair.video_data,
                 pair.pts_ns,
                 pair.video_segment.duration_ns,
+                frames=pair.video_segment.frames,
             )
 
             # Prepare audio data for output
-            audio_data = pair.audio_data
-            if pair.audio_segment.is_dubbed:
-                # Dubbed audio comes from STS in M4A container format.
-                # Convert to raw ADTS AAC for the output pipeline's aacparse.
-                try:
-                    audio_data = self.output_pipeline.convert_m4a_bytes_to_adts(audio_data)
-                    logger.info(
-                        f"🔊 Converted M4A to ADTS: {len(pair.audio_data)} -> {len(audio_data)} bytes"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to convert M4A to ADTS: {e}")
-                    # Fall back to original audio data
-                    audio_data = pair.audio_data
-            # Original audio is already in raw AAC/ADTS format from input aacparse
+            audio_data = self._prepare_output_audio(pair.audio_segment, pair.audio_data)
 
             audio_ok = self.output_pipeline.push_audio(
                 audio_data,
@@ -0,0 +1 @@
+"""Microbenchmarks for media-service hot paths (run directly, not collected by pytest)."""
@@ -0,0 +1,101 @@
+"""Microbenchmark: dubbed audio M4A -> ADTS, in-memory parser vs GStreamer demux.
+
+Rewraps each fixture's audio track as ADTS the way WorkerRunner does for
+dubbed audio that came back in an M4A container, with the pure-Python MP4
+parser and (when available) the qtdemux/aacparse pipeline it replaced.
+
+Fixtures default to tests/fixtures/test-streams/*.m4a|*.mp4 at the repo root.
+Git LFS pointer files (fixtures not pulled) are replaced by a synthesized
+6 s AAC fragment in an M4A container (ffmpeg CLI), so the benchmark always
+has something to run.
+
+Usage:
+    python tests/benchmarks/bench_mp4_to_adts.py [--iterations N] [FILE ...]
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from media_service.audio.mp4_adts import m4a_to_adts
+from media_service.pipeline.output import GST_AVAILABLE, OutputPipeline
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "test-streams"
+
+
+def synthesize_fragment(duration_s: float = 6.0, sample_rate: int = 48000) -> bytes:
+    """Encode a sine tone to stereo AAC in an M4A container with the ffmpeg CLI."""
+    with tempfile.NamedTemporaryFile(suffix=".m4a") as tmp:
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate={sample_rate}",
+                "-t", str(duration_s), "-ac", "2", "-c:a", "aac", "-b:a", "128k",
+                "-f", "ipod", tmp.name,
+            ],
+            check=True,
+        )  # fmt: skip
+        return Path(tmp.name).read_bytes()
+
+
+def load_fixtures(paths: list[Path]) -> list[tuple[str, bytes]]:
+    """Return (label, bytes) for each fixture, synthesizing stand-ins."""
+    fixtures = []
+    for path in paths:
+        data = path.read_bytes()
+        if data.startswith(b"version https://git-lfs"):
+            if not shutil.which("ffmpeg"):
+                print(f"skip {path.name}: LFS pointer and ffmpeg unavailable to synthesize")
+                continue
+            data = synthesize_fragment()
+            label = f"{path.name} (synthesized 6s)"
+        else:
+            label = path.name
+        fixtures.append((label, data))
+    return fixtures
+
+
+def bench(convert: Callable[[bytes], bytes], data: bytes, iterations: int) -> tuple[float, int]:
+    """Return (median ms per conversion, ADTS output size)."""
+    adts = convert(data)  # warm-up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        convert(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(adts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.files or sorted(p for p in FIXTURE_DIR.glob("*") if p.suffix in (".m4a", ".mp4"))
+
+    converters: list[tuple[str, Callable[[bytes], bytes]]] = [("python", m4a_to_adts)]
+    if GST_AVAILABLE:
+        from gi.repository import Gst
+
+        Gst.init(None)
+        pipeline = OutputPipeline("rtmp://localhost:1935/live/bench")
+        converters.append(("gst", pipeline._convert_m4a_bytes_to_adts_gst))
+
+    print(f"{'fixture':<38} {'backend':<8} {'median ms':>10} {'bytes':>9}")
+    for label, data in load_fixtures(paths):
+        for name, convert in converters:
+            median_ms, size = bench(convert, data, args.iterations)
+            print(f"{label:<38} {name:<8} {median_ms:>10.2f} {size:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Microbenchmark: output video path CPU cost, stream-copy vs decode/x264 re-encode.
+
+Runs the same H.264 elementary stream through the video chain OutputPipeline
+builds for each mode (passthrough: h264parse; transcode: h264parse ->
+avdec_h264 -> videoconvert -> x264enc -> h264parse) into flvmux ! fakesink,
+as fast as possible, and reports process CPU time per second of media: the
+number of cores one stream occupies in real time.
+
+Fixtures default to tests/fixtures/test-streams/*.mp4 at the repo root.
+Git LFS pointer files (fixtures not pulled) are replaced by a synthesized
+720p30 x264 stream, so the benchmark always has something to run.
+
+Usage:
+    python tests/benchmarks/bench_video_output.py [--duration S] [FILE ...]
+"""
+
+import argparse
+import resource
+import sys
+import time
+from pathlib import Path
+
+from media_service.pipeline.output import GST_AVAILABLE, OutputPipeline
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "test-streams"
+
+if GST_AVAILABLE:
+    from gi.repository import Gst
+
+
+def _collect(pipeline_str: str) -> bytes:
+    """Run a pipeline ending in appsink name=sink and return all output bytes."""
+    pipeline = Gst.parse_launch(pipeline_str)
+    appsink = pipeline.get_by_name("sink")
+    out = bytearray()
+
+    def on_new_sample(sink):
+        buffer = sink.emit("pull-sample").get_buffer()
+        success, map_info = buffer.map(Gst.MapFlags.READ)
+        if success:
+            out.extend(map_info.data)
+            buffer.unmap(map_info)
+        return Gst.FlowReturn.OK
+
+    appsink.connect("new-sample", on_new_sample)
+    pipeline.set_state(Gst.State.PLAYING)
+    msg = pipeline.get_bus().timed_pop_filtered(
+        Gst.CLOCK_TIME_NONE, Gst.MessageType.EOS | Gst.MessageType.ERROR
+    )
+    pipeline.set_state(Gst.State.NULL)
+    if msg and msg.type == Gst.MessageType.ERROR:
+        raise RuntimeError(msg.parse_error()[0].message)
+    return bytes(out)
+
+
+def synthesize_stream(duration_s: float, fps: int = 30) -> bytes:
+    """Encode a moving test pattern to 720p H.264 byte-stream (2 s GOP)."""
+    return _collect(
+        f"videotestsrc pattern=ball num-buffers={int(duration_s * fps)} ! "
+        f"video/x-raw,width=1280,height=720,framerate={fps}/1 ! "
+        f"x264enc tune=zerolatency speed-preset=veryfast bitrate=2500 key-int-max={2 * fps} ! "
+        "h264parse config-interval=-1 ! video/x-h264,stream-format=byte-stream ! "
+        "appsink name=sink emit-signals=true sync=false"
+    )
+
+
+def fixture_duration_s(path: Path) -> float:
+    """Return the container duration of an MP4 fixture."""
+    pipeline = Gst.parse_launch(f"filesrc location={path} ! qtdemux ! fakesink")
+    pipeline.set_state(Gst.State.PAUSED)
+    pipeline.get_state(5 * Gst.SECOND)
+    ok, duration_ns = pipeline.query_duration(Gst.Format.TIME)
+    pipeline.set_state(Gst.State.NULL)
+    return duration_ns / 1e9 if ok else 0.0
+
+
+def load_streams(paths: list[Path], duration_s: float) -> list[tuple[str, bytes, float]]:
+    """Return (label, H.264 byte-stream, media seconds), synthesizing stand-ins."""
+    streams = []
+    synthesize = not paths
+    for path in paths:
+        if path.read_bytes()[:64].startswith(b"version https://git-lfs"):
+            print(f"{path.name}: LFS pointer, using synthesized stream")
+            synthesize = True
+            continue
+        data = OutputPipeline("rtmp://localhost/bench")._read_mp4_video(str(path))
+        streams.append((path.name, data, fixture_duration_s(path)))
+    if synthesize:
+        label = f"synthetic 720p30 ({duration_s:.0f}s)"
+        streams.append((label, synthesize_stream(duration_s), duration_s))
+    return streams
+
+
+def run_chain(data: bytes, video_transcode: bool) -> tuple[float, float]:
+    """Push one stream through the output video chain; return (cpu s, wall s)."""
+    output = OutputPipeline("rtmp://localhost/bench", video_transcode=video_transcode)
+    chain = (
+        output._make_transcode_video_chain()
+        if video_transcode
+        else output._make_passthrough_video_chain()
+    )
+
+    pipeline = Gst.Pipeline.new("bench")
+    appsrc = Gst.ElementFactory.make("appsrc")
+    appsrc.set_property("caps", Gst.Caps.from_string("video/x-h264,stream-format=byte-stream"))
+    appsrc.set_property("format", 3)  # GST_FORMAT_TIME
+    flvmux = Gst.ElementFactory.make("flvmux")
+    flvmux.set_property("streamable", True)
+    sink = Gst.ElementFactory.make("fakesink")
+    sink.set_property("sync", False)
+
+    elements = [appsrc, *(elem for _, elem in chain), flvmux, sink]
+    for elem in elements:
+        pipeline.add(elem)
+    for src, dst in zip(elements, elements[1:], strict=False):
+        if not src.link(dst):
+            raise RuntimeError(f"Failed to link {src.get_name()} -> {dst.get_name()}")
+
+    buffer = Gst.Buffer.new_wrapped(data)
+    buffer.pts = 0
+
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    pipeline.set_state(Gst.State.PLAYING)
+    appsrc.emit("push-buffer", buffer)
+    appsrc.emit("end-of-stream")
+    msg = pipeline.get_bus().timed_pop_filtered(
+        Gst.CLOCK_TIME_NONE, Gst.MessageType.EOS | Gst.MessageType.ERROR
+    )
+    wall_s = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    pipeline.set_state(Gst.State.NULL)
+
+    if msg and msg.type == Gst.MessageType.ERROR:
+        raise RuntimeError(msg.parse_error()[0].message)
+    cpu_s = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return cpu_s, wall_s
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--duration", type=float, default=30.0, help="synthesized seconds")
+    args = parser.parse_args()
+
+    if not GST_AVAILABLE:
+        print("GStreamer (PyGObject) is not available")
+        return 1
+    Gst.init(None)
+
+    paths = args.files or sorted(FIXTURE_DIR.glob("*.mp4"))
+
+    print(f"{'stream':<34} {'mode':<12} {'cpu s':>8} {'wall s':>8} {'cores/stream':>13}")
+    for label, data, media_s in load_streams(paths, args.duration):
+        for video_transcode in (False, True):
+            cpu_s, wall_s = run_chain(data, video_transcode)
+            mode = "transcode" if video_transcode else "passthrough"
+            cores = cpu_s / media_s if media_s else float("nan")
+            print(f"{label:<34} {mode:<12} {cpu_s:>8.2f} {wall_s:>8.2f} {cores:>13.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Unit tests for the single-pipeline video delay line.
+
+Tests DelayLinePipeline with mocked GStreamer.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from media_service.pipeline.delay_line import DelayLinePipeline
+
+IN_URL = "rtmp://localhost:1935/live/test/in"
+OUT_URL = "rtmp://localhost:1935/live/test/out"
+DELAY_NS = 6_000_000_000
+
+
+def _mock_gst() -> tuple[MagicMock, dict[str, MagicMock]]:
+    """Return a mocked Gst module and the elements it creates, keyed by name."""
+    mock_gst = MagicMock()
+    mock_gst.is_initialized.return_value = True
+    mock_gst.SECOND = 1_000_000_000
+    elements: dict[str, MagicMock] = {}
+
+    def make(factory: str, name: str) -> MagicMock:
+        element = MagicMock(name=name)
+        element.get_name.return_value = name
+        element.get_static_pad.return_value.link.return_value = mock_gst.PadLinkReturn.OK
+        elements[name] = element
+        return element
+
+    mock_gst.ElementFactory.make.side_effect = make
+    return mock_gst, elements
+
+
+def _properties(element: MagicMock) -> dict:
+    return {c.args[0]: c.args[1] for c in element.set_property.call_args_list}
+
+
+class TestDelayLinePipelineInit:
+    """Tests for DelayLinePipeline initialization."""
+
+    def test_init_sets_urls_and_delay(self) -> None:
+        """Test URLs and delay are stored."""
+        pipeline = DelayLinePipeline(IN_URL, OUT_URL, MagicMock(), DELAY_NS)
+
+        assert pipeline._rtmp_input_url == IN_URL
+        assert pipeline._rtmp_url == OUT_URL
+        assert pipeline._video_delay_ns == DELAY_NS
+        assert pipeline.get_state() == "NULL"
+
+    @pytest.mark.parametrize(
+        "rtmp_input_url,delay_ns",
+        [("", DELAY_NS), ("rtsp://localhost/in", DELAY_NS), (IN_URL, 0)],
+    )
+    def test_init_rejects_invalid_arguments(self, rtmp_input_url: str, delay_ns: int) -> None:
+        """Test a non-RTMP input URL or non-positive delay raises ValueError."""
+        with pytest.raises(ValueError):
+            DelayLinePipeline(rtmp_input_url, OUT_URL, MagicMock(), delay_ns)
+
+
+class TestDelayLinePipelineBuild:
+    """Tests for DelayLinePipeline.build."""
+
+    def test_build_raises_when_gst_unavailable(self) -> None:
+        """Test build raises RuntimeError without GStreamer."""
+        with patch.dict("media_service.pipeline.delay_line.__dict__", {"GST_AVAILABLE": False}):
+            pipeline = DelayLinePipeline(IN_URL, OUT_URL, MagicMock(), DELAY_NS)
+            with pytest.raises(RuntimeError, match="not available"):
+                pipeline.build()
+
+    def test_build_delays_video_inside_gstreamer(self) -> None:
+        """Test the video queue holds the delay and flvmux waits as long for audio."""
+        mock_gst, elements = _mock_gst()
+
+        with patch.dict(
+            "media_service.pipeline.delay_line.__dict__",
+            {"GST_AVAILABLE": True, "Gst": mock_gst},
+        ):
+            pipeline = DelayLinePipeline(IN_URL, OUT_URL, MagicMock(), DELAY_NS)
+            pipeline.build()
+
+        assert pipeline.get_state() == "READY"
+        delay = _properties(elements["video_delay"])
+        assert delay["min-threshold-time"] == DELAY_NS
+        assert delay["max-size-time"] > DELAY_NS
+        assert _properties(elements["flvmux"])["latency"] == DELAY_NS
+        assert _properties(elements["rtmpsrc"])["location"] == IN_URL
+        assert _properties(elements["rtmpsink"])["location"] == OUT_URL
+        # No decoder or appsrc on the video path
+        factories = [c.args[0] for c in mock_gst.ElementFactory.make.call_args_list]
+        assert "avdec_h264" not in factories
+        assert factories.count("appsrc") == 1
+
+
+    def test_build_never_blocks_demux_on_video(self) -> None:
+        """Test both flvdemux branches drop rather than block, so the audio tap keeps running."""
+        mock_gst, elements = _mock_gst()
+
+        with patch.dict(
+            "media_service.pipeline.delay_line.__dict__",
+            {"GST_AVAILABLE": True, "Gst": mock_gst},
+        ):
+            pipeline = DelayLinePipeline(IN_URL, OUT_URL, MagicMock(), DELAY_NS)
+            pipeline.build()
+
+        assert _properties(elements["video_delay"])["leaky"] == 2
+        assert _properties(elements["audio_tap_queue"])["leaky"] == 2
+        elements["video_delay"].connect.assert_called_once_with(
+            "overrun", pipeline._on_delay_overrun
+        )
+
+        pipeline._on_delay_overrun(elements["video_delay"])
+        assert pipeline.delay_overruns == 1
+
+
+class TestDelayLinePipelineCallbacks:
+    """Tests for the audio tap and video push."""
+
+    def test_audio_sample_forwarded_to_callback(self) -> None:
+        """Test tapped audio reaches on_audio_buffer as (data, pts, duration)."""
+        on_audio = MagicMock()
+        pipeline = DelayLinePipeline(IN_URL, OUT_URL, on_audio, DELAY_NS)
+        appsink = MagicMock()
+
+        with (
+            patch.dict("media_service.pipeline.delay_line.__dict__", {"Gst": MagicMock()}),
+            patch(
+                "media_service.pipeline.delay_line.read_audio_sample",
+                return_value=(b"adts", 1_000, 21_333_333),
+            ),
+        ):
+            pipeline._on_audio_sample(appsink)
+
+        on_audio.assert_called_once_with(b"adts", 1_000, 21_333_333)
+
+    def test_push_video_not_supported(self) -> None:
+        """Test video cannot be pushed from Python."""
+        pipeline = DelayLinePipeline(IN_URL, OUT_URL, MagicMock(), DELAY_NS)
+
+        with pytest.raises(RuntimeError):
+            pipeline.push_video(b"h264", 0)
+        with pytest.raises(RuntimeError):
+            pipeline.push_video(b"h264", 0, 33_333_333, frames=[(0, 0, 33_333_333)])
@@ -0,0 +1,334 @@
+"""
+Unit tests for in-memory MP4/M4A to ADTS conversion.
+
+Files are built box by box so every layout the parser handles (moov before
+or after mdat, stco/co64, multi-chunk stsc runs) is covered without an
+encoder. Fuzz tests truncate and mutate those files, plus any non-LFS
+fixtures in tests/fixtures/test-streams, and require that the parser
+either returns ADTS or raises Mp4ParseError.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from pathlib import Path
+
+import pytest
+from media_service.audio.mp4_adts import (
+    ADTS_HEADER_SIZE,
+    AacConfig,
+    Mp4ParseError,
+    adts_frame_table,
+    adts_header,
+    m4a_to_adts,
+    parse_audio_specific_config,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parents[4] / "tests" / "fixtures" / "test-streams"
+
+# AudioSpecificConfig: AAC-LC (2), 48 kHz (index 3), stereo (2)
+ASC_LC_48K_STEREO = bytes((0x11, 0x90))
+
+
+def _box(name: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), name) + payload
+
+
+def _full_box(name: bytes, payload: bytes) -> bytes:
+    return _box(name, b"\x00\x00\x00\x00" + payload)
+
+
+def _descriptor(tag: int, body: bytes) -> bytes:
+    # 4-byte expandable length, as written by ffmpeg
+    n = len(body)
+    length = bytes(0x80 | (n >> shift) & 0x7F for shift in (21, 14, 7)) + bytes((n & 0x7F,))
+    return bytes((tag,)) + length + body
+
+
+def _esds(asc: bytes) -> bytes:
+    decoder_config = (
+        bytes((0x40, 0x15)) + b"\x00\x00\x00" + struct.pack(">II", 128000, 128000)
+    ) + _descriptor(0x05, asc)
+    es = struct.pack(">HB", 1, 0) + _descriptor(0x04, decoder_config) + _descriptor(0x06, b"\x02")
+    return _full_box(b"esds", _descriptor(0x03, es))
+
+
+def _mp4a(asc: bytes) -> bytes:
+    fixed = (
+        b"\x00" * 6
+        + struct.pack(">H", 1)  # data_reference_index
+        + struct.pack(">HHI", 0, 0, 0)  # version, revision, vendor
+        + struct.pack(">HHHH", 2, 16, 0, 0)  # channels, sample size, compression, packet size
+        + struct.pack(">I", 48000 << 16)
+    )
+    return _box(b"mp4a", fixed + _esds(asc))
+
+
+def _trak(handler: bytes, stbl: bytes = b"") -> bytes:
+    hdlr = _full_box(b"hdlr", b"\x00" * 4 + handler + b"\x00" * 12 + b"\x00")
+    minf = _box(b"minf", _box(b"stbl", stbl)) if stbl else b""
+    return _box(b"trak", _box(b"mdia", hdlr + minf))
+
+
+def _moov(
+    frames: list[bytes],
+    chunk_sizes: list[int],
+    base: int,
+    co64: bool,
+    asc: bytes,
+    with_video_track: bool,
+) -> bytes:
+    stsd = _full_box(b"stsd", struct.pack(">I", 1) + _mp4a(asc))
+    stsz = _full_box(
+        b"stsz", struct.pack(f">II{len(frames)}I", 0, len(frames), *(len(f) for f in frames))
+    )
+
+    runs = []
+    for chunk, per_chunk in enumerate(chunk_sizes, start=1):
+        if not runs or runs[-1][1] != per_chunk:
+            runs.append((chunk, per_chunk, 1))
+    stsc = _full_box(
+        b"stsc", struct.pack(">I", len(runs)) + b"".join(struct.pack(">III", *r) for r in runs)
+    )
+
+    offsets = []
+    offset, index = base, 0
+    for per_chunk in chunk_sizes:
+        offsets.append(offset)
+        offset += sum(len(f) for f in frames[index : index + per_chunk])
+        index += per_chunk
+    if co64:
+        chunk_table = _full_box(b"co64", struct.pack(f">I{len(offsets)}Q", len(offsets), *offsets))
+    else:
+        chunk_table = _full_box(b"stco", struct.pack(f">I{len(offsets)}I", len(offsets), *offsets))
+
+    traks = _trak(b"vide") if with_video_track else b""
+    traks += _trak(b"soun", stsd + stsz + stsc + chunk_table)
+    return _box(b"moov", _full_box(b"mvhd", b"\x00" * 96) + traks)
+
+
+def build_m4a(
+    frames: list[bytes],
+    *,
+    chunk_sizes: list[int] | None = None,
+    moov_first: bool = True,
+    co64: bool = False,
+    asc: bytes = ASC_LC_48K_STEREO,
+    with_video_track: bool = False,
+) -> bytes:
+    """Build a minimal M4A file carrying frames as AAC access units."""
+    chunk_sizes = chunk_sizes or [len(frames)]
+    assert sum(chunk_sizes) == len(frames)
+    ftyp = _box(b"ftyp", b"M4A \x00\x00\x02\x00M4A mp42isom")
+    mdat = _box(b"mdat", b"".join(frames))
+
+    def moov(base: int) -> bytes:
+        return _moov(frames, chunk_sizes, base, co64, asc, with_video_track)
+
+    if moov_first:
+        # Chunk offset tables are fixed-width, so the moov size does not depend on base
+        moov_size = len(moov(0))
+        return ftyp + moov(len(ftyp) + moov_size + 8) + mdat
+    return ftyp + mdat + moov(len(ftyp) + 8)
+
+
+def make_frames(count: int = 8, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    return [bytes(rng.randrange(256) for _ in range(rng.randint(80, 400))) for _ in range(count)]
+
+
+def split_adts(data: bytes) -> list[tuple[bytes, bytes]]:
+    """Split ADTS data into (header, payload) pairs using each frame_length."""
+    frames = []
+    pos = 0
+    while pos < len(data):
+        header = data[pos : pos + ADTS_HEADER_SIZE]
+        frame_length = ((header[3] & 0x3) << 11) | (header[4] << 3) | (header[5] >> 5)
+        frames.append((header, data[pos + ADTS_HEADER_SIZE : pos + frame_length]))
+        pos += frame_length
+    assert pos == len(data)
+    return frames
+
+
+class TestAdtsHeader:
+    """Tests for ADTS header construction."""
+
+    def test_header_fields(self) -> None:
+        """Test syncword, profile, sampling index, channels and frame length."""
+        header = adts_header(AacConfig(object_type=2, sampling_index=3, channel_config=2), 100)
+
+        assert len(header) == ADTS_HEADER_SIZE
+        assert header[0] == 0xFF and header[1] == 0xF1
+        assert header[2] >> 6 == 1  # profile = object_type - 1
+        assert (header[2] >> 2) & 0xF == 3
+        assert ((header[2] & 0x1) << 2) | (header[3] >> 6) == 2
+        assert ((header[3] & 0x3) << 11) | (header[4] << 3) | (header[5] >> 5) == 107
+
+    def test_oversized_access_unit_rejected(self) -> None:
+        """Test frames beyond the 13-bit frame_length raise Mp4ParseError."""
+        with pytest.raises(Mp4ParseError):
+            adts_header(AacConfig(2, 3, 2), 8192)
+
+
+class TestAdtsFrameTable:
+    """Tests for indexing concatenated ADTS frames."""
+
+    def test_offsets_and_timing(self) -> None:
+        """Test offsets follow frame_length and PTS follow 1024-sample frames."""
+        frames = make_frames(count=4)
+        adts = m4a_to_adts(build_m4a(frames))
+
+        table = adts_frame_table(adts)
+
+        offsets = [offset for offset, _, _ in table]
+        assert offsets == [sum(len(f) + ADTS_HEADER_SIZE for f in frames[:i]) for i in range(4)]
+        assert [pts for _, pts, _ in table] == [i * 1024 * 10**9 // 48000 for i in range(4)]
+        assert sum(duration for _, _, duration in table) == 4 * 1024 * 10**9 // 48000
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"\x00\x00\x00\x18ftypM4A ",  # M4A
+            adts_header(AacConfig(2, 3, 2), 10) + b"\x00" * 4,  # truncated frame
+        ],
+    )
+    def test_non_adts_yields_empty_table(self, data: bytes) -> None:
+        """Test data that is not a whole run of ADTS frames is not indexed."""
+        assert adts_frame_table(data) == []
+
+
+class TestParseAudioSpecificConfig:
+    """Tests for AudioSpecificConfig parsing."""
+
+    def test_aac_lc(self) -> None:
+        """Test AAC-LC 48 kHz stereo."""
+        assert parse_audio_specific_config(ASC_LC_48K_STEREO) == AacConfig(2, 3, 2)
+
+    def test_he_aac_maps_to_lc_core(self) -> None:
+        """Test SBR (object type 5) is described by its AAC-LC core."""
+        # object type 5, index 6 (24 kHz core), mono
+        asc = ((5 << 11) | (6 << 7) | (1 << 3)).to_bytes(2, "big")
+        assert parse_audio_specific_config(asc) == AacConfig(2, 6, 1)
+
+    def test_explicit_sample_rate(self) -> None:
+        """Test an escaped 24-bit sample rate is mapped back to its index."""
+        # 5 + 4 + 24 + 4 bits, padded to 40
+        bits = (2 << 32) | (0xF << 28) | (44100 << 4) | 2
+        asc = (bits << 3).to_bytes(5, "big")
+        assert parse_audio_specific_config(asc) == AacConfig(2, 4, 2)
+
+    @pytest.mark.parametrize(
+        "asc",
+        [
+            b"\x11",  # too short
+            (((31 << 6) | (42 - 32)) << 5).to_bytes(2, "big") + b"\x00\x00",  # USAC via escape
+            bytes((0x11, 0x80)),  # channel_config 0 (PCE)
+        ],
+    )
+    def test_unsupported_config_rejected(self, asc: bytes) -> None:
+        """Test configurations ADTS cannot express raise Mp4ParseError."""
+        with pytest.raises(Mp4ParseError):
+            parse_audio_specific_config(asc)
+
+
+class TestM4aToAdts:
+    """Tests for M4A to ADTS conversion."""
+
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            {},
+            {"moov_first": False},
+            {"co64": True},
+            {"chunk_sizes": [3, 3, 2]},
+            {"chunk_sizes": [1, 2, 2, 3], "moov_first": False},
+            {"with_video_track": True},
+        ],
+    )
+    def test_round_trip(self, layout: dict) -> None:
+        """Test every access unit comes out in order behind a valid header."""
+        frames = make_frames()
+        adts = m4a_to_adts(build_m4a(frames, **layout))
+
+        parsed = split_adts(adts)
+        assert [payload for _, payload in parsed] == frames
+        for header, _ in parsed:
+            assert header[:2] == b"\xff\xf1"
+            assert header[2] == adts_header(AacConfig(2, 3, 2), 0)[2]
+
+    def test_empty_track(self) -> None:
+        """Test a track with no samples converts to empty output."""
+        assert m4a_to_adts(build_m4a([], chunk_sizes=[])) == b""
+
+    def test_fragmented_mp4_rejected(self) -> None:
+        """Test moof-based files are left to the GStreamer fallback."""
+        data = build_m4a(make_frames(), moov_first=False) + _box(b"moof", b"")
+        with pytest.raises(Mp4ParseError, match="Fragmented"):
+            m4a_to_adts(data)
+
+    def test_non_aac_track_rejected(self) -> None:
+        """Test a non-mp4a sample entry raises Mp4ParseError."""
+        data = build_m4a(make_frames()).replace(b"mp4a", b"Opus")
+        with pytest.raises(Mp4ParseError, match="not AAC"):
+            m4a_to_adts(data)
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"\xff\xf1\x50\x80\x02\x1f\xfc", b"\x00\x00\x00\x10ftypM4A "]
+    )
+    def test_non_mp4_rejected(self, data: bytes) -> None:
+        """Test empty, ADTS and truncated input raise Mp4ParseError."""
+        with pytest.raises(Mp4ParseError):
+            m4a_to_adts(data)
+
+
+def _fixture_files() -> list[Path]:
+    files = [p for p in sorted(FIXTURE_DIR.glob("*")) if p.suffix in (".m4a", ".mp4")]
+    return [p for p in files if not p.read_bytes()[:64].startswith(b"version https://git-lfs")]
+
+
+def _fuzz_corpus() -> list[tuple[str, bytes]]:
+    corpus = [
+        ("synthetic", build_m4a(make_frames(), chunk_sizes=[3, 3, 2])),
+        ("synthetic-co64-tail", build_m4a(make_frames(seed=1), co64=True, moov_first=False)),
+    ]
+    return corpus + [(p.name, p.read_bytes()) for p in _fixture_files()]
+
+
+def _convert_or_reject(data: bytes) -> None:
+    try:
+        result = m4a_to_adts(data)
+    except Mp4ParseError:
+        return
+    assert isinstance(result, bytes)
+
+
+class TestM4aToAdtsFuzz:
+    """Malformed input must raise Mp4ParseError, never anything else."""
+
+    @pytest.mark.parametrize("label,data", _fuzz_corpus())
+    def test_truncations(self, label: str, data: bytes) -> None:
+        """Test every truncation point (sampled on large files)."""
+        step = max(1, len(data) // 2000)
+        for cut in range(0, len(data), step):
+            _convert_or_reject(data[:cut])
+
+    @pytest.mark.parametrize("label,data", _fuzz_corpus())
+    def test_byte_mutations(self, label: str, data: bytes) -> None:
+        """Test random byte flips inside the box headers and sample tables."""
+        rng = random.Random(label)
+        # Mutations past the moov are almost always inside mdat payload
+        region = min(len(data), 4096)
+        for _ in range(500):
+            mutated = bytearray(data)
+            for _ in range(rng.randint(1, 4)):
+                mutated[rng.randrange(region)] = rng.randrange(256)
+            _convert_or_reject(bytes(mutated))
+
+    @pytest.mark.parametrize("path", _fixture_files(), ids=lambda p: p.name)
+    def test_fixture_converts(self, path: Path) -> None:
+        """Test real fixture files (when LFS content is present) convert cleanly."""
+        adts = m4a_to_adts(path.read_bytes())
+        assert adts[:2] in (b"\xff\xf1", b"\xff\xf9")
+        split_adts(adts)
@@ -109,6 +109,7 @@ class TestOutputPipelineBuild:
             # Need to reimport to get patched version
             pipeline = OutputPipeline.__new__(OutputPipeline)
             pipeline._rtmp_url = "rtmp://localhost:1935/live/test"
+            pipeline._video_transcode = False
             pipeline._pipeline = None
             pipeline._video_appsrc = None
             pipeline._audio_appsrc = None
@@ -133,6 +134,34 @@ class TestOutputPipelineBuild:
                 if orig_gst:
                     output_module.Gst = orig_gst
 
+    @pytest.mark.parametrize(
+        "video_transcode,expected",
+        [
+            (False, ["h264parse"]),
+            (True, ["h264parse_in", "avdec_h264", "videoconvert", "x264enc", "h264parse_out"]),
+        ],
+    )
+    def test_video_chain_per_mode(self, video_transcode: bool, expected: list[str]) -> None:
+        """Test passthrough only re-parses H.264 and transcode decodes/re-encodes."""
+        mock_gst = MagicMock()
+        mock_gst.ElementFactory.make.side_effect = lambda factory, name: MagicMock(name=name)
+
+        with patch.dict("media_service.pipeline.output.__dict__", {"Gst": mock_gst}):
+            from media_service.pipeline.output import OutputPipeline
+
+            pipeline = OutputPipeline(
+                "rtmp://localhost:1935/live/test", video_transcode=video_transcode
+            )
+            chain = (
+                pipeline._make_transcode_video_chain()
+                if video_transcode
+                else pipeline._make_passthrough_video_chain()
+            )
+
+        assert [name for name, _ in chain] == expected
+        factories = [c.args[0] for c in mock_gst.ElementFactory.make.call_args_list]
+        assert ("avdec_h264" in factories) is video_transcode
+
 
 class TestOutputPipelineGetState:
     """Tests for get_state functionality."""
@@ -188,6 +217,77 @@ class TestOutputPipelinePushAudio:
             assert "Pipeline not built" in str(exc_info.value)
 
 
+class TestOutputPipelinePushFrames:
+    """Tests for per-access-unit pushing."""
+
+    @staticmethod
+    def _pipeline(mock_gst: MagicMock):
+        from media_service.pipeline.output import OutputPipeline
+
+        mock_gst.Buffer.new_wrapped.return_value.copy_region.side_effect = (
+            lambda flags, offset, size: MagicMock(offset=offset, size=size)
+        )
+        mock_gst.BufferList.new_sized.return_value = MagicMock()
+        pipeline = OutputPipeline("rtmp://localhost:1935/live/test")
+        pipeline._video_appsrc = MagicMock()
+        pipeline._audio_appsrc = MagicMock()
+        pipeline._sps_pps_data = None
+        return pipeline
+
+    @staticmethod
+    def _pushed(mock_gst: MagicMock) -> list[MagicMock]:
+        inserts = mock_gst.BufferList.new_sized.return_value.insert.call_args_list
+        return [c.args[1] for c in inserts]
+
+    def test_push_video_with_frames_pushes_buffer_list(self) -> None:
+        """Test each access unit becomes a buffer at its own PTS, in one list."""
+        mock_gst = MagicMock()
+        with patch.dict("media_service.pipeline.output.__dict__", {"Gst": mock_gst}):
+            pipeline = self._pipeline(mock_gst)
+            frames = [(0, 1_000, 40), (10, 1_040, 40), (25, 1_080, 40)]
+
+            pipeline.push_video(b"\x00" * 30, 9_000, 120, frames=frames)
+
+        buffers = self._pushed(mock_gst)
+        assert [(b.offset, b.size) for b in buffers] == [(0, 10), (10, 15), (25, 5)]
+        assert [b.pts for b in buffers] == [9_000, 9_040, 9_080]
+        assert [b.duration for b in buffers] == [40, 40, 40]
+        pipeline._video_appsrc.emit.assert_called_once_with(
+            "push-buffer-list", mock_gst.BufferList.new_sized.return_value
+        )
+
+    def test_push_video_without_frames_pushes_one_buffer(self) -> None:
+        """Test data without a frame table is pushed whole."""
+        mock_gst = MagicMock()
+        with patch.dict("media_service.pipeline.output.__dict__", {"Gst": mock_gst}):
+            pipeline = self._pipeline(mock_gst)
+
+            pipeline.push_video(b"\x00" * 30, 9_000, 120)
+
+        assert pipeline._video_appsrc.emit.call_args.args[0] == "push-buffer"
+        mock_gst.BufferList.new_sized.assert_not_called()
+
+    def test_push_audio_splits_adts_frames(self) -> None:
+        """Test ADTS audio is pushed one AAC frame per buffer."""
+        from media_service.audio.mp4_adts import AacConfig, adts_header
+
+        config = AacConfig(object_type=2, sampling_index=3, channel_config=2)
+        adts = b"".join(adts_header(config, n) + b"\x00" * n for n in (100, 120, 90))
+
+        mock_gst = MagicMock()
+        with patch.dict("media_service.pipeline.output.__dict__", {"Gst": mock_gst}):
+            pipeline = self._pipeline(mock_gst)
+
+            pipeline.push_audio(adts, 6_000_000_000, 64_000_000)
+
+        buffers = self._pushed(mock_gst)
+        assert [b.size for b in buffers] == [107, 127, 97]
+        assert [b.pts for b in buffers] == [
+            6_000_000_000 + i * 1024 * 10**9 // 48000 for i in range(3)
+        ]
+        assert pipeline._audio_appsrc.emit.call_args.args[0] == "push-buffer-list"
+
+
 class TestOutputPipelineStart:
     """Tests for start functionality."""
 
@@ -247,3 +347,60 @@ class TestOutputPipelineCleanup:
 
             assert pipeline._video_appsrc is None
             assert pipeline._audio_appsrc is None
+
+
+class TestIsAdts:
+    """Tests for ADTS detection of dubbed audio."""
+
+    def test_adts_header_detected(self) -> None:
+        """Test an ADTS syncword (MPEG-4 and MPEG-2) is recognised."""
+        from media_service.pipeline.output import is_adts
+
+        assert is_adts(b"\xff\xf1\x50\x80\x02\x1f\xfc")
+        assert is_adts(b"\xff\xf9\x50\x80\x02\x1f\xfc")
+
+    def test_m4a_and_short_data_rejected(self) -> None:
+        """Test M4A containers and truncated data are not ADTS."""
+        from media_service.pipeline.output import is_adts
+
+        assert not is_adts(b"\x00\x00\x00\x18ftypM4A \x00\x00\x00\x00")
+        assert not is_adts(b"\xff\xf1")
+
+
+class TestConvertM4aBytesToAdts:
+    """Tests for M4A -> ADTS conversion of dubbed audio."""
+
+    def test_in_memory_conversion_skips_gstreamer(self) -> None:
+        """Test parseable M4A is rewrapped without a GStreamer pipeline."""
+        with patch.dict("media_service.pipeline.output.__dict__", {"GST_AVAILABLE": False}):
+            from media_service.pipeline.output import OutputPipeline
+
+            pipeline = OutputPipeline("rtmp://localhost:1935/live/test")
+            with (
+                patch("media_service.pipeline.output.m4a_to_adts", return_value=b"adts") as rewrap,
+                patch.object(pipeline, "_convert_m4a_bytes_to_adts_gst") as gst,
+            ):
+                assert pipeline.convert_m4a_bytes_to_adts(b"m4a") == b"adts"
+
+            rewrap.assert_called_once_with(b"m4a")
+            gst.assert_not_called()
+
+    def test_parse_error_falls_back_to_gstreamer(self) -> None:
+        """Test unsupported MP4 layouts fall back to the GStreamer demux."""
+        with patch.dict("media_service.pipeline.output.__dict__", {"GST_AVAILABLE": False}):
+            from media_service.audio.mp4_adts import Mp4ParseError
+            from media_service.pipeline.output import OutputPipeline
+
+            pipeline = OutputPipeline("rtmp://localhost:1935/live/test")
+            with (
+                patch(
+                    "media_service.pipeline.output.m4a_to_adts",
+                    side_effect=Mp4ParseError("Fragmented MP4 is not supported"),
+                ),
+                patch.object(
+                    pipeline, "_convert_m4a_bytes_to_adts_gst", return_value=b"adts-gst"
+                ) as gst,
+            ):
+                assert pipeline.convert_m4a_bytes_to_adts(b"fmp4") == b"adts-gst"
+
+            gst.assert_called_once_with(b"fmp4")
@@ -139,6 +139,8 @@ class TestSegmentBufferVideo:
         assert segment.stream_id == "test"
         assert segment.t0_ns == 0
         assert segment.duration_ns == 2_000_000_000
+        # Access-unit boundaries travel with the segment for per-frame output
+        assert segment.frames == [(0, 0, 1_000_000_000), (6, 1_000_000_000, 1_000_000_000)]
 
     def test_video_batch_number_increments(self, tmp_path: Path) -> None:
         """Test video batch number increments with each segment."""
@@ -263,3 +265,140 @@ class TestSegmentBufferReset:
         assert buffer.audio_accumulated_duration_ns == 0
         assert buffer.video_batch_number == 0
         assert buffer.audio_batch_number == 0
+
+
+# H.264 access units: SPS + PPS + IDR slice, and a non-IDR slice
+IDR_AU = b"\x00\x00\x00\x01\x67sps\x00\x00\x00\x01\x68pps\x00\x00\x01\x65idr"
+P_AU = b"\x00\x00\x00\x01\x41p"
+
+
+class TestBufferAccumulatorSplit:
+    """Tests for splitting an accumulator at a presentation time."""
+
+    def test_split_before(self) -> None:
+        """Test buffers before the cut move to the head, the rest stay."""
+        acc = BufferAccumulator()
+        for i, chunk in enumerate((b"aa", b"bbb", b"c")):
+            acc.append(chunk, i * 100, 100)
+
+        head = acc.split_before(150)
+
+        assert bytes(head.data) == b"aabbb"
+        assert head.t0_ns == 0
+        assert head.duration_ns == 200
+        assert head.buffer_count == 2
+        assert bytes(acc.data) == b"c"
+        assert acc.t0_ns == 200
+        assert acc.duration_ns == 100
+        assert acc.frames == [(0, 200, 100)]
+
+    def test_split_before_first_buffer_is_empty(self) -> None:
+        """Test a cut before all buffers leaves the accumulator untouched."""
+        acc = BufferAccumulator()
+        acc.append(b"late", 500, 100)
+
+        head = acc.split_before(100)
+
+        assert head.is_empty() is True
+        assert bytes(acc.data) == b"late"
+        assert acc.t0_ns == 500
+
+
+class TestSegmentBufferKeyframeAligned:
+    """Tests for IDR-aligned segmentation (video passthrough)."""
+
+    FRAME_NS = 500_000_000
+
+    def _buffer(self, tmp_path: Path) -> SegmentBuffer:
+        return SegmentBuffer(
+            stream_id="test",
+            segment_dir=tmp_path,
+            segment_duration_ns=1_000_000_000,
+            keyframe_aligned=True,
+        )
+
+    def test_leading_non_keyframes_dropped(self, tmp_path: Path) -> None:
+        """Test the first video segment starts on an IDR frame."""
+        buffer = self._buffer(tmp_path)
+
+        buffer.push_video(P_AU, 0, self.FRAME_NS)
+        assert buffer.video_accumulated_duration_ns == 0
+
+        buffer.push_video(IDR_AU, self.FRAME_NS, self.FRAME_NS)
+        assert buffer.video_accumulated_duration_ns == self.FRAME_NS
+
+    def test_video_cut_waits_for_keyframe(self, tmp_path: Path) -> None:
+        """Test a full segment is only emitted when the next IDR arrives."""
+        buffer = self._buffer(tmp_path)
+        gop = [IDR_AU, P_AU, P_AU]  # 1.5 s GOP, longer than the 1 s target
+
+        segments = []
+        for i, au in enumerate(gop + gop):
+            segment, data = buffer.push_video(au, i * self.FRAME_NS, self.FRAME_NS)
+            if segment is not None:
+                segments.append((segment, data))
+
+        assert len(segments) == 1
+        segment, data = segments[0]
+        assert data == IDR_AU + P_AU + P_AU
+        assert segment.t0_ns == 0
+        assert segment.duration_ns == 3 * self.FRAME_NS
+        assert buffer.video_accumulated_duration_ns == 3 * self.FRAME_NS
+
+    def test_audio_cut_at_video_boundary(self, tmp_path: Path) -> None:
+        """Test audio batches end where the matching video batch ends."""
+        buffer = self._buffer(tmp_path)
+        audio_ns = 250_000_000
+
+        # Audio runs ahead of video: 1.75 s before the first video cut is known
+        for i in range(7):
+            segment, _ = buffer.push_audio(bytes([i]), i * audio_ns, audio_ns)
+            assert segment is None
+
+        for i, au in enumerate([IDR_AU, P_AU, P_AU, IDR_AU]):
+            video_segment, _ = buffer.push_video(au, i * self.FRAME_NS, self.FRAME_NS)
+        assert video_segment is not None
+
+        segment, data = buffer.push_audio(b"\x07", 7 * audio_ns, audio_ns)
+
+        assert segment is not None
+        assert segment.batch_number == video_segment.batch_number
+        assert segment.t0_ns == 0
+        assert segment.duration_ns == 6 * audio_ns  # everything before 1.5 s
+        assert data == bytes(range(6))
+        assert buffer.audio_accumulated_duration_ns == 2 * audio_ns
+
+    def test_audio_before_first_keyframe_dropped(self, tmp_path: Path) -> None:
+        """Test batch 0 audio starts at the first IDR, like batch 0 video."""
+        buffer = self._buffer(tmp_path)
+        audio_ns = 250_000_000
+
+        # Video opens mid-GOP: the first IDR is at 1.0 s
+        for i, au in enumerate([P_AU, P_AU, IDR_AU, P_AU, P_AU, IDR_AU]):
+            video_segment, _ = buffer.push_video(au, i * self.FRAME_NS, self.FRAME_NS)
+        assert video_segment is not None
+        assert video_segment.t0_ns == 2 * self.FRAME_NS
+
+        segments = []
+        for i in range(11):
+            segment, data = buffer.push_audio(bytes([i]), i * audio_ns, audio_ns)
+            if segment is not None:
+                segments.append((segment, data))
+
+        assert len(segments) == 1
+        segment, data = segments[0]
+        assert segment.batch_number == video_segment.batch_number == 0
+        assert segment.t0_ns == video_segment.t0_ns
+        assert segment.duration_ns == video_segment.duration_ns
+        assert data == bytes(range(4, 10))
+
+    def test_reset_clears_cut_points(self, tmp_path: Path) -> None:
+        """Test reset forgets video cuts not yet applied to audio."""
+        buffer = self._buffer(tmp_path)
+        for i, au in enumerate([IDR_AU, P_AU, IDR_AU]):
+            buffer.push_video(au, i * self.FRAME_NS, self.FRAME_NS)
+
+        buffer.reset()
+        segment, _ = buffer.push_audio(b"a", 2 * self.FRAME_NS, self.FRAME_NS)
+
+        assert segment is None
@@ -73,6 +73,15 @@ class TestStreamConfig:
         assert result["sample_rate_hz"] == 48000
         assert result["channels"] == 2
 
+    def test_to_dict_negotiated_formats(self) -> None:
+        """Test input and output audio formats are offered in stream:init."""
+        config = StreamConfig(format="aac", output_format="adts")
+
+        result = config.to_dict()
+
+        assert result["format"] == "aac"
+        assert result["output_format"] == "adts"
+
 
 class TestInFlightFragment:
     """Tests for InFlightFragment data model (T016)."""
@@ -193,6 +202,16 @@ class TestAudioData:
         assert result["duration_ms"] == 6000
         assert result["data_base64"] == "dGVzdA=="
 
+    def test_binary_round_trip(self) -> None:
+        """Test that binary AudioData carries raw bytes instead of base64."""
+        audio = AudioData.from_bytes(data=b"test", duration_ms=6000, binary=True)
+
+        result = audio.to_dict()
+
+        assert result["data"] == b"test"
+        assert "data_base64" not in result
+        assert audio.decode_audio() == b"test"
+
 
 class TestFragmentDataPayload:
     """Tests for FragmentDataPayload model."""
@@ -336,6 +355,27 @@ class TestFragmentProcessedPayload:
         assert payload.is_partial is True
         assert payload.dubbed_audio is not None
 
+    def test_from_dict_binary_audio(self) -> None:
+        """Test that dubbed audio sent as a binary attachment is used as is."""
+        data = {
+            "fragment_id": "frag-001",
+            "stream_id": "test-stream",
+            "sequence_number": 0,
+            "status": "success",
+            "dubbed_audio": {
+                "format": "m4a",
+                "sample_rate_hz": 48000,
+                "channels": 2,
+                "duration_ms": 6000,
+                "data": b"test",
+            },
+        }
+
+        payload = FragmentProcessedPayload.from_dict(data)
+
+        assert payload.dubbed_audio is not None
+        assert payload.dubbed_audio.decode_audio() == b"test"
+
 
 class TestBackpressurePayload:
     """Tests for BackpressurePayload model."""
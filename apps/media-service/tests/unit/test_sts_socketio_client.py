@@ -6,6 +6,7 @@ Tests T040-T052 from tasks.md - Socket.IO client functionality.
 
 from __future__ import annotations
 
+import base64
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -344,6 +345,72 @@ class TestStsSocketIOClientStreamReady:
         assert sts_client.is_stream_ready
 
 
+    @pytest.mark.asyncio
+    async def test_handle_stream_ready_keeps_advertised_formats(
+        self, sts_client: StsSocketIOClient
+    ) -> None:
+        """Test that requested formats the server lists are kept."""
+        sts_client.audio_format = "aac"
+        sts_client.output_format = "adts"
+
+        await sts_client._handle_stream_ready(
+            {
+                "session_id": "session-456",
+                "capabilities": {
+                    "input_formats": ["m4a", "aac", "pcm_s16le"],
+                    "output_formats": ["m4a", "adts"],
+                },
+            }
+        )
+
+        assert sts_client.audio_format == "aac"
+        assert sts_client.output_format == "adts"
+
+    @pytest.mark.asyncio
+    async def test_unlisted_formats_keep_input_bytes_and_expect_m4a(
+        self,
+        sts_client: StsSocketIOClient,
+        mock_socketio: AsyncMock,
+        audio_segment: AudioSegment,
+    ) -> None:
+        """Test that an unlisted input format is sent unchanged and output falls back to m4a."""
+        await sts_client.connect()
+        config = StreamConfig(format="aac", output_format="adts", binary_audio=False)
+
+        async def emit_and_respond(*args, **kwargs):
+            if args[0] == "stream:init":
+                await sts_client._handle_stream_ready(
+                    {
+                        "session_id": "session-456",
+                        "capabilities": {"input_formats": ["m4a"], "output_formats": ["m4a"]},
+                    }
+                )
+
+        mock_socketio.emit.side_effect = emit_and_respond
+        await sts_client.init_stream("test-stream", config)
+        mock_socketio.emit.side_effect = None
+
+        await sts_client.send_fragment(audio_segment)
+
+        audio = mock_socketio.emit.call_args_list[-1].args[1]["audio"]
+        assert audio["format"] == "aac"
+        assert base64.b64decode(audio["data_base64"]) == audio_segment.get_m4a_data()
+        assert sts_client.output_format == "m4a"
+
+    @pytest.mark.asyncio
+    async def test_handle_stream_ready_without_formats(
+        self, sts_client: StsSocketIOClient
+    ) -> None:
+        """Test that a server predating negotiation keeps the input label and answers in m4a."""
+        sts_client.audio_format = "aac"
+        sts_client.output_format = "adts"
+
+        await sts_client._handle_stream_ready({"session_id": "session-456"})
+
+        assert sts_client.audio_format == "aac"
+        assert sts_client.output_format == "m4a"
+
+
 class TestStsSocketIOClientSendFragment:
     """Tests for fragment sending."""
 
@@ -497,6 +564,45 @@ class TestStsSocketIOClientSendFragment:
         with pytest.raises(FileNotFoundError):
             await sts_client.send_fragment(segment)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("binary_audio", [True, False])
+    async def test_send_fragment_uses_negotiated_encoding(
+        self,
+        sts_client: StsSocketIOClient,
+        mock_socketio: AsyncMock,
+        stream_config: StreamConfig,
+        audio_segment: AudioSegment,
+        binary_audio: bool,
+    ) -> None:
+        """Test that audio is a raw bytes attachment only if the server agreed."""
+        await sts_client.connect()
+
+        async def emit_and_respond(*args, **kwargs):
+            if args[0] == "stream:init":
+                assert args[1]["config"]["binary_audio"] is True
+                await sts_client._handle_stream_ready(
+                    {
+                        "session_id": "session-123",
+                        "max_inflight": 3,
+                        "capabilities": {"binary_audio": binary_audio},
+                    }
+                )
+
+        mock_socketio.emit.side_effect = emit_and_respond
+        await sts_client.init_stream("test-stream", stream_config)
+        mock_socketio.emit.side_effect = None
+
+        await sts_client.send_fragment(audio_segment)
+
+        audio = mock_socketio.emit.call_args_list[-1].args[1]["audio"]
+        assert audio["format"] == stream_config.format
+        if binary_audio:
+            assert audio["data"] == audio_segment.get_m4a_data()
+            assert "data_base64" not in audio
+        else:
+            assert "data" not in audio
+            assert audio["data_base64"]
+
 
 class TestStsSocketIOClientFragmentProcessed:
     """Tests for fragment:processed handling."""
@@ -0,0 +1,39 @@
+"""
+Unit tests for H.264 byte-stream inspection helpers.
+"""
+
+from __future__ import annotations
+
+from media_service.video.h264 import is_keyframe, iter_nal_types
+
+
+class TestIterNalTypes:
+    """Tests for NAL unit type scanning."""
+
+    def test_three_and_four_byte_start_codes(self) -> None:
+        """Test both start code lengths are recognised."""
+        data = b"\x00\x00\x00\x01\x67sps\x00\x00\x01\x68pps\x00\x00\x00\x01\x65idr"
+        assert list(iter_nal_types(data)) == [7, 8, 5]
+
+    def test_no_start_code(self) -> None:
+        """Test data without a start code yields nothing."""
+        assert list(iter_nal_types(b"\x67\x68\x65")) == []
+
+
+class TestIsKeyframe:
+    """Tests for IDR access unit detection."""
+
+    def test_idr_after_parameter_sets(self) -> None:
+        """Test an AU with AUD/SPS/PPS/SEI before an IDR slice is a keyframe."""
+        data = b"\x00\x00\x00\x01\x09\xf0\x00\x00\x00\x01\x67s\x00\x00\x00\x01\x68p" + (
+            b"\x00\x00\x01\x06sei\x00\x00\x01\x65idr"
+        )
+        assert is_keyframe(data) is True
+
+    def test_non_idr_slice(self) -> None:
+        """Test a P/B slice access unit is not a keyframe."""
+        assert is_keyframe(b"\x00\x00\x00\x01\x41slice") is False
+
+    def test_parameter_sets_only(self) -> None:
+        """Test SPS/PPS without a slice is not a keyframe."""
+        assert is_keyframe(b"\x00\x00\x00\x01\x67s\x00\x00\x00\x01\x68p") is False
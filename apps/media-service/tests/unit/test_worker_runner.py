@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from media_service.models.segments import AudioSegment, VideoSegment
+from media_service.sync.av_sync import SyncPair
 from media_service.worker.worker_runner import WorkerConfig, WorkerRunner
 
 
@@ -113,6 +114,19 @@ class TestWorkerRunnerInit:
         assert worker.input_pipeline is None
         assert worker.output_pipeline is None
 
+    def test_segment_buffer_keyframe_aligned_unless_transcoding(
+        self, worker_config: WorkerConfig
+    ) -> None:
+        """Test passthrough video (the default) cuts segments on IDR frames."""
+        assert WorkerRunner(worker_config).segment_buffer.keyframe_aligned is True
+
+        worker_config.video_transcode = True
+        assert WorkerRunner(worker_config).segment_buffer.keyframe_aligned is False
+
+        worker_config.video_transcode = False
+        worker_config.video_delay_line = True
+        assert WorkerRunner(worker_config).segment_buffer.keyframe_aligned is False
+
 
 class TestWorkerRunnerIsRunning:
     """Tests for is_running property."""
@@ -193,6 +207,106 @@ class TestWorkerRunnerUseFallback:
         # Verify push_audio was called
         worker.av_sync.push_audio.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_use_fallback_delay_line_pushes_at_source_pts(
+        self, worker_config: WorkerConfig, tmp_segment_dir: Path
+    ) -> None:
+        """Test the delay line re-injects audio at its own PTS, bypassing A/V sync."""
+        worker_config.video_delay_line = True
+        worker = WorkerRunner(worker_config)
+        worker.output_pipeline = MagicMock()
+        worker.av_sync.push_audio = AsyncMock(return_value=None)
+
+        segment = AudioSegment(
+            fragment_id="fallback-002",
+            stream_id="test-stream",
+            batch_number=3,
+            t0_ns=18_000_000_000,
+            duration_ns=6_000_000_000,
+            file_path=tmp_segment_dir / "test-stream" / "000003_audio.m4a",
+        )
+        segment.file_path.parent.mkdir(parents=True, exist_ok=True)
+        segment.file_path.write_bytes(b"original_audio_data")
+
+        await worker._use_fallback(segment)
+
+        worker.av_sync.push_audio.assert_not_called()
+        worker.output_pipeline.push_audio.assert_called_once_with(
+            b"original_audio_data", 18_000_000_000, 6_000_000_000
+        )
+
+
+class TestWorkerRunnerOutputPair:
+    """Tests for _output_pair audio format handling."""
+
+    @staticmethod
+    def _pair(tmp_segment_dir: Path, audio_data: bytes) -> SyncPair:
+        audio_segment = AudioSegment(
+            fragment_id="out-001",
+            stream_id="test-stream",
+            batch_number=0,
+            t0_ns=0,
+            duration_ns=6_000_000_000,
+            file_path=tmp_segment_dir / "000000_audio.m4a",
+        )
+        audio_segment.set_dubbed(tmp_segment_dir / "000000_audio_dubbed.m4a")
+        video_segment = VideoSegment(
+            fragment_id="out-001",
+            stream_id="test-stream",
+            batch_number=0,
+            t0_ns=0,
+            duration_ns=6_000_000_000,
+            file_path=tmp_segment_dir / "000000_video.mp4",
+        )
+        return SyncPair(
+            video_segment=video_segment,
+            video_data=b"h264",
+            audio_segment=audio_segment,
+            audio_data=audio_data,
+            pts_ns=0,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("audio_data", "converted"),
+        [
+            (b"\xff\xf1\x50\x80\x02\x1f\xfc", False),  # ADTS (output_format="adts")
+            (b"\x00\x00\x00\x18ftypM4A ", True),  # M4A from a server without ADTS output
+        ],
+    )
+    async def test_dubbed_audio_converted_only_when_not_adts(
+        self,
+        worker_config: WorkerConfig,
+        tmp_segment_dir: Path,
+        audio_data: bytes,
+        converted: bool,
+    ) -> None:
+        """Test dubbed ADTS audio is pushed as is and M4A is demuxed first."""
+        worker = WorkerRunner(worker_config)
+        worker.output_pipeline = MagicMock()
+        worker.output_pipeline.convert_m4a_bytes_to_adts.return_value = b"adts-from-m4a"
+
+        await worker._output_pair(self._pair(tmp_segment_dir, audio_data))
+
+        pushed = worker.output_pipeline.push_audio.call_args.args[0]
+        assert worker.output_pipeline.convert_m4a_bytes_to_adts.called is converted
+        assert pushed == (b"adts-from-m4a" if converted else audio_data)
+
+    @pytest.mark.asyncio
+    async def test_video_frame_table_passed_to_output(
+        self, worker_config: WorkerConfig, tmp_segment_dir: Path
+    ) -> None:
+        """Test video is pushed with its access-unit table for per-frame output."""
+        worker = WorkerRunner(worker_config)
+        worker.output_pipeline = MagicMock()
+        pair = self._pair(tmp_segment_dir, b"\xff\xf1\x50\x80\x02\x1f\xfc")
+        pair.video_segment.frames = [(0, 0, 3_000_000_000), (2, 3_000_000_000, 3_000_000_000)]
+
+        await worker._output_pair(pair)
+
+        call = worker.output_pipeline.push_video.call_args
+        assert call.kwargs["frames"] == pair.video_segment.frames
+
 
 class TestWorkerRunnerProcessVideoSegment:
     """Tests for _process_video_segment method."""
@@ -571,3 +685,30 @@ class TestRTMPURLConstruction:
                 kwargs = call_kwargs.kwargs if hasattr(call_kwargs, "kwargs") else call_kwargs[1]
                 assert "rtmp_url" in kwargs, "InputPipeline must be called with rtmp_url"
                 assert kwargs["rtmp_url"].startswith("rtmp://"), "rtmp_url must start with rtmp://"
+
+    def test_worker_runner_delay_line_builds_single_pipeline(self, tmp_segment_dir: Path) -> None:
+        """Test video_delay_line replaces both pipelines with one DelayLinePipeline."""
+        config = WorkerConfig(
+            stream_id="delay-test",
+            rtmp_input_url="rtmp://mediamtx:1935/live/delay/in",
+            rtmp_url="rtmp://mediamtx:1935/live/delay/out",
+            sts_url="http://localhost:3000",
+            segment_dir=tmp_segment_dir,
+            video_delay_line=True,
+        )
+        worker = WorkerRunner(config)
+
+        with (
+            patch("media_service.worker.worker_runner.InputPipeline") as mock_input_pipeline,
+            patch("media_service.worker.worker_runner.DelayLinePipeline") as mock_delay_line,
+        ):
+            worker._build_pipelines()
+
+        mock_input_pipeline.assert_not_called()
+        kwargs = mock_delay_line.call_args.kwargs
+        assert kwargs["rtmp_input_url"] == config.rtmp_input_url
+        assert kwargs["rtmp_url"] == config.rtmp_url
+        assert kwargs["video_delay_ns"] == worker.av_sync.state.av_offset_ns
+        assert worker.input_pipeline is None
+        assert worker.output_pipeline is mock_delay_line.return_value
+        worker.output_pipeline.start.assert_called_once()
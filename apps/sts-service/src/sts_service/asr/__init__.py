@@ -9,6 +9,7 @@ Components:
     - FasterWhisperASR: Production ASR component using faster-whisper
     - MockASRComponent: Deterministic mock for testing
     - create_asr_component: Factory function for component creation
+    - StreamingASR: Incremental transcription with local-agreement commits
 
 Interface:
     - ASRComponent: Protocol defining the ASR contract
@@ -69,6 +70,8 @@ from .models import (
     AudioFormat,
     # Input models
     AudioFragment,
+    BatchingConfig,
+    StreamingASRConfig,
     TranscriptAsset,
     TranscriptionConfig,
     TranscriptSegment,
@@ -81,7 +84,8 @@ from .models import (
 from .postprocessing import improve_sentence_boundaries, shape_utterances, split_long_segments
 
 # Preprocessing and postprocessing utilities
-from .preprocessing import preprocess_audio
+from .preprocessing import AudioPreprocessor, preprocess_audio
+from .streaming import StreamingASR
 
 
 def get_transcriber() -> type:
@@ -104,6 +108,7 @@ __all__ = [
     "MockASRConfig",
     "create_asr_component",
     "get_transcriber",
+    "StreamingASR",
     # Interface
     "ASRComponent",
     "BaseASRComponent",
@@ -126,10 +131,13 @@ __all__ = [
     "VADConfig",
     "TranscriptionConfig",
     "UtteranceShapingConfig",
+    "BatchingConfig",
+    "StreamingASRConfig",
     "ASRConfig",
     # Models - Observability
     "ASRMetrics",
     # Utilities
+    "AudioPreprocessor",
     "preprocess_audio",
     "shape_utterances",
     "improve_sentence_boundaries",
@@ -0,0 +1,198 @@
+"""
+Cross-stream ASR batch scheduler.
+
+Each session transcribes its own fragments, so with N concurrent streams
+the model sees N independent single-fragment calls. The scheduler groups
+requests that can share one inference call (same model, language, prompt
+and decoding options) and runs them as a batch:
+
+- The first request for a group becomes the batch leader. It waits up to
+  max_wait_ms for more requests, or until max_batch_size is reached, then
+  runs the batch on its own thread.
+- Followers block until the leader hands back their result (or exception).
+- Different groups, and successive batches of the same group, run in
+  parallel on their leaders' threads; no scheduler thread is needed.
+
+Callers block for the whole batch, so the ASR stage pool must have at
+least max_batch_size worker threads for full batches to form.
+
+Listeners receive one BatchEvent per batch (the Full STS service exports
+batch size and queue wait as Prometheus metrics).
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Runs one batch; returns one result per item, in order
+BatchRunner = Callable[[list[Any]], Sequence[Any]]
+
+
+@dataclass(frozen=True)
+class BatchEvent:
+    """A batch handed to the runner, as seen by scheduler listeners."""
+
+    size: int
+    wait_s: list[float]  # Per request, from submit() to batch start
+
+
+BatchEventListener = Callable[[BatchEvent], None]
+
+
+@dataclass
+class _Request:
+    item: Any
+    submitted_at: float
+    future: Future = field(default_factory=Future)
+
+
+@dataclass
+class _Batch:
+    requests: list[_Request] = field(default_factory=list)
+    closed: bool = False
+
+
+class BatchScheduler:
+    """Groups concurrent requests into batches within a short time window.
+
+    Features:
+    - Batches bounded by size and by the oldest request's wait time
+    - Leader/follower execution on the callers' own threads
+    - Runner exceptions propagated to every request in the batch
+    - Thread-safe (requests arrive from ASR stage worker threads)
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[Hashable, _Batch] = {}
+        self._cond = threading.Condition()
+        self._listeners: list[BatchEventListener] = []
+
+    def add_listener(self, listener: BatchEventListener) -> None:
+        """Register a callback for executed batches.
+
+        Registering the same listener twice has no effect.
+
+        Args:
+            listener: Called with a BatchEvent before the batch runs
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def submit(
+        self,
+        key: Hashable,
+        item: Any,
+        runner: BatchRunner,
+        max_batch_size: int,
+        max_wait_ms: float,
+    ) -> Any:
+        """Add an item to the open batch for its key and wait for its result.
+
+        Args:
+            key: Requests with equal keys may share a batch
+            item: Input passed to the runner
+            runner: Runs a batch (only the leader's runner is used)
+            max_batch_size: Batch size that triggers immediate execution
+            max_wait_ms: Longest time the leader waits for more requests
+
+        Returns:
+            The runner's result for this item
+
+        Raises:
+            ValueError: If max_batch_size is less than 1
+            Exception: Whatever the runner raises
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"Batch size must be >= 1, got {max_batch_size}")
+
+        request = _Request(item, time.perf_counter())
+        with self._cond:
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._open[key] = batch
+            batch.requests.append(request)
+            if len(batch.requests) >= max_batch_size:
+                self._close(key, batch)
+
+        if leader:
+            self._lead(key, batch, runner, request.submitted_at + max_wait_ms / 1000)
+        return request.future.result()
+
+    def _lead(self, key: Hashable, batch: _Batch, runner: BatchRunner, deadline: float) -> None:
+        """Wait for the batch to fill or time out, then run it."""
+        with self._cond:
+            while not batch.closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._close(key, batch)
+                    break
+                self._cond.wait(remaining)
+
+        started_at = time.perf_counter()
+        requests = batch.requests
+        self._notify(BatchEvent(len(requests), [started_at - r.submitted_at for r in requests]))
+
+        try:
+            results = runner([r.item for r in requests])
+            if len(results) != len(requests):
+                raise RuntimeError(
+                    f"Batch runner returned {len(results)} results for {len(requests)} items"
+                )
+        except BaseException as e:
+            for r in requests:
+                r.future.set_exception(e)
+            return
+
+        for r, result in zip(requests, results, strict=True):
+            r.future.set_result(result)
+
+    def _close(self, key: Hashable, batch: _Batch) -> None:
+        """Stop accepting requests into a batch (caller holds the lock)."""
+        batch.closed = True
+        if self._open.get(key) is batch:
+            del self._open[key]
+        self._cond.notify_all()
+
+    def _notify(self, event: BatchEvent) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Batch scheduler listener failed: {e}")
+
+
+# Process-wide scheduler shared by all sessions
+_scheduler: BatchScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_batch_scheduler() -> BatchScheduler:
+    """Get the process-wide ASR batch scheduler, creating it on first use.
+
+    Returns:
+        The shared BatchScheduler instance.
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = BatchScheduler()
+    return _scheduler
+
+
+def set_batch_scheduler(scheduler: BatchScheduler | None) -> None:
+    """Set the process-wide ASR batch scheduler (for testing).
+
+    Args:
+        scheduler: The scheduler to use, or None to reset.
+    """
+    global _scheduler
+    _scheduler = scheduler
@@ -8,6 +8,8 @@ Both the real faster-whisper implementation and mock implementations conform to
 from abc import ABC, abstractmethod
 from typing import Protocol, runtime_checkable
 
+from sts_service.audio_buffer import PCMData
+
 from .models import TranscriptAsset
 
 
@@ -36,7 +38,7 @@ class ASRComponent(Protocol):
 
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: PCMData,
         stream_id: str,
         sequence_number: int,
         start_time_ms: int,
@@ -48,7 +50,7 @@ class ASRComponent(Protocol):
         """Transcribe an audio fragment.
 
         Args:
-            audio_data: Raw PCM audio bytes (float32 little-endian)
+            audio_data: Raw PCM audio bytes (float32 little-endian) or AudioBuffer
             stream_id: Logical stream/session identifier
             sequence_number: Fragment index within stream
             start_time_ms: Fragment start in stream timeline
@@ -101,7 +103,7 @@ class BaseASRComponent(ABC):
     @abstractmethod
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: PCMData,
         stream_id: str,
         sequence_number: int,
         start_time_ms: int,
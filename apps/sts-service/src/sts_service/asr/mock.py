@@ -8,6 +8,8 @@ import random
 import time
 from dataclasses import dataclass
 
+from sts_service.audio_buffer import PCMData
+
 from .interface import BaseASRComponent
 from .models import (
     ASRError,
@@ -63,7 +65,7 @@ class MockASRComponent(BaseASRComponent):
 
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: PCMData,
         stream_id: str,
         sequence_number: int,
         start_time_ms: int,
@@ -357,6 +357,11 @@ class ASRModelConfig(BaseModel):
         pattern=r"^(int8|float16|float32)$",
         description="Compute precision",
     )
+    replicas: int = Field(
+        default=1,
+        ge=1,
+        description="Model replicas shared across sessions for concurrent inference",
+    )
 
 
 class VADConfig(BaseModel):
@@ -405,6 +410,48 @@ class UtteranceShapingConfig(BaseModel):
     )
 
 
+class BatchingConfig(BaseModel):
+    """Cross-stream batching configuration."""
+
+    max_batch_size: int = Field(
+        default=1, ge=1, le=32, description="Fragments per batched inference (1 = no batching)"
+    )
+    max_wait_ms: int = Field(
+        default=20, ge=0, le=1000, description="Longest wait for a batch to fill"
+    )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether fragments from different sessions may share an inference call."""
+        return self.max_batch_size > 1
+
+
+class StreamingASRConfig(BaseModel):
+    """Streaming (incremental) transcription configuration."""
+
+    min_chunk_ms: int = Field(
+        default=1000, ge=100, description="New audio required before the window is re-decoded"
+    )
+    agreement: int = Field(
+        default=2,
+        ge=2,
+        le=5,
+        description="Consecutive hypotheses that must agree before words commit",
+    )
+    buffer_trim_ms: int = Field(
+        default=15000, ge=1000, description="Trim the window at the last commit beyond this"
+    )
+    max_buffer_ms: int = Field(
+        default=30000,
+        ge=2000,
+        le=30000,
+        description="Force-commit the hypothesis and trim at this window length",
+    )
+    overlap_ms: int = Field(
+        default=500, ge=0, description="Committed audio kept before the trim point as context"
+    )
+
+
 class ASRConfig(BaseModel):
     """Complete ASR component configuration."""
 
@@ -412,6 +459,7 @@ class ASRConfig(BaseModel):
     vad: VADConfig = Field(default_factory=VADConfig)
     transcription: TranscriptionConfig = Field(default_factory=TranscriptionConfig)
     utterance_shaping: UtteranceShapingConfig = Field(default_factory=UtteranceShapingConfig)
+    batching: BatchingConfig = Field(default_factory=BatchingConfig)
 
     # Operational settings
     timeout_ms: int = Field(
@@ -3,19 +3,200 @@ Audio preprocessing functions for ASR.
 
 Provides audio normalization, filtering, and format conversion.
 Uses scipy/numpy only (no librosa dependency).
+
+AudioPreprocessor is the chain used for transcription. Filter designs are
+cached per sample rate, resampling is polyphase (cost independent of the
+fragment length's factorization), and the high-pass and pre-emphasis run as
+one causal float32 filter pass. Whisper's log-mel front end ignores phase,
+so the zero-phase (forward-backward) filtering of apply_highpass_filter is
+not needed there.
+
+Input may be PCM f32le bytes or an AudioBuffer; both are read in place.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+from math import gcd
 from typing import cast
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy import signal
 
+from sts_service.audio_buffer import PCMData, as_float32
+
+# Kaiser window parameters used by scipy.signal.resample_poly
+_RESAMPLE_HALF_TAPS_PER_RATE = 10
+_RESAMPLE_KAISER_BETA = 5.0
+
+
+@lru_cache(maxsize=32)
+def highpass_sos(sample_rate: int, cutoff_hz: float = 80, order: int = 5) -> NDArray[np.float32]:
+    """Butterworth high-pass design as float32 second-order sections (cached).
+
+    Second-order sections stay stable in float32, so filtering float32
+    audio needs no float64 round trip.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        cutoff_hz: Cutoff frequency in Hz
+        order: Filter order
+
+    Returns:
+        SOS coefficients (shared between calls; do not modify)
+    """
+    normalized_cutoff = min(max(cutoff_hz / (sample_rate / 2), 0.001), 0.999)
+    sos = signal.butter(order, normalized_cutoff, btype="high", output="sos")
+    return cast(NDArray[np.float32], sos.astype(np.float32))
+
+
+@lru_cache(maxsize=32)
+def _resample_plan(orig_sr: int, target_sr: int) -> tuple[int, int, NDArray[np.float32]]:
+    """Reduced up/down factors and anti-aliasing FIR taps for a rate pair (cached)."""
+    divisor = gcd(orig_sr, target_sr)
+    up, down = target_sr // divisor, orig_sr // divisor
+    max_rate = max(up, down)
+    taps = signal.firwin(
+        2 * _RESAMPLE_HALF_TAPS_PER_RATE * max_rate + 1,
+        1.0 / max_rate,
+        window=("kaiser", _RESAMPLE_KAISER_BETA),
+    )
+    return up, down, taps.astype(np.float32)
+
+
+@lru_cache(maxsize=32)
+def _filter_plan(
+    sample_rate: int, cutoff_hz: float, order: int, preemphasis: float
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """High-pass + pre-emphasis as one SOS cascade, with its step-response state (cached)."""
+    sections = [highpass_sos(sample_rate, cutoff_hz, order)]
+    if preemphasis:
+        # y[n] = x[n] - c * x[n-1] as a first-order section
+        sections.append(np.array([[1.0, -preemphasis, 0.0, 1.0, 0.0, 0.0]], dtype=np.float32))
+    sos = np.concatenate(sections).astype(np.float32)
+    return sos, signal.sosfilt_zi(sos).astype(np.float32)
+
+
+class AudioPreprocessor:
+    """Single-pass ASR preprocessing chain with cached filter designs.
+
+    Steps: mono downmix, polyphase resampling, causal high-pass with
+    pre-emphasis in the same filter cascade, and in-place peak
+    normalization. The input bytes are read without copying, and each step
+    makes at most one float32 array.
+    """
+
+    def __init__(
+        self,
+        target_sample_rate: int = 16000,
+        highpass_cutoff_hz: float = 80,
+        highpass_order: int = 5,
+        preemphasis: float = 0.97,
+    ):
+        """Initialize the chain.
+
+        Args:
+            target_sample_rate: Output sample rate (default 16000 for Whisper)
+            highpass_cutoff_hz: High-pass cutoff in Hz
+            highpass_order: High-pass Butterworth order
+            preemphasis: Pre-emphasis coefficient
+        """
+        self.target_sample_rate = target_sample_rate
+        self.highpass_cutoff_hz = highpass_cutoff_hz
+        self.highpass_order = highpass_order
+        self.preemphasis = preemphasis
+
+    def output_length(self, num_bytes: int, sample_rate: int, channels: int = 1) -> int:
+        """Number of output samples for an input of num_bytes.
+
+        Args:
+            num_bytes: Size of the PCM f32le input
+            sample_rate: Input sample rate in Hz
+            channels: Number of input channels
+
+        Returns:
+            Samples process() writes for that input
+        """
+        frames = num_bytes // (4 * channels)
+        if sample_rate == self.target_sample_rate:
+            return frames
+        return frames * self.target_sample_rate // sample_rate
+
+    def process(
+        self,
+        audio_bytes: PCMData,
+        sample_rate: int,
+        channels: int = 1,
+        apply_filters: bool = True,
+        out: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.float32]:
+        """Preprocess one fragment.
+
+        Args:
+            audio_bytes: Raw PCM audio bytes (float32 little-endian) or AudioBuffer
+            sample_rate: Input sample rate in Hz
+            channels: Number of input channels (1=mono, 2=stereo)
+            apply_filters: Whether to apply highpass and preemphasis filters
+            out: Float32 buffer of at least output_length() samples to write into
+
+        Returns:
+            Preprocessed audio (a view of out when given)
+
+        Raises:
+            ValueError: If sample_rate is invalid or out is too small
+        """
+        if sample_rate <= 0:
+            raise ValueError(f"Invalid sample rate: {sample_rate}")
+
+        audio: NDArray = as_float32(audio_bytes)
+        # Only arrays created in this call may be normalized in place, never the caller's
+        owned = False
+        if channels == 2:
+            frames = len(audio) // 2
+            audio = np.add(audio[0 : 2 * frames : 2], audio[1 : 2 * frames : 2])
+            audio *= np.float32(0.5)
+            owned = True
+
+        if sample_rate != self.target_sample_rate:
+            up, down, taps = _resample_plan(sample_rate, self.target_sample_rate)
+            length = len(audio) * self.target_sample_rate // sample_rate
+            audio = signal.resample_poly(audio, up, down, window=taps)[:length]
+            owned = True
+
+        if apply_filters and len(audio):
+            sos, zi = _filter_plan(
+                self.target_sample_rate,
+                self.highpass_cutoff_hz,
+                self.highpass_order,
+                self.preemphasis,
+            )
+            # Start in steady state for the first sample so there is no onset transient
+            audio, _ = signal.sosfilt(sos, audio, zi=zi * audio[0])
+            owned = True
+
+        if out is not None:
+            if len(out) < len(audio):
+                raise ValueError(f"Output buffer holds {len(out)} samples, need {len(audio)}")
+            result = out[: len(audio)]
+            result[:] = audio
+        elif owned and audio.dtype == np.float32:
+            result = audio
+        else:
+            result = audio.astype(np.float32)
+
+        if len(result):
+            peak = max(float(result.max()), -float(result.min()))
+            if peak >= 1e-10:
+                result *= np.float32(1.0 / peak)
+        return result
+
+
+_default_preprocessor = AudioPreprocessor()
+
 
 def preprocess_audio(
-    audio_bytes: bytes,
+    audio_bytes: PCMData,
     sample_rate: int,
     target_sample_rate: int = 16000,
     channels: int = 1,
@@ -32,7 +213,7 @@ def preprocess_audio(
     6. Amplitude normalization
 
     Args:
-        audio_bytes: Raw PCM audio bytes (float32 little-endian)
+        audio_bytes: Raw PCM audio bytes (float32 little-endian) or AudioBuffer
         sample_rate: Input sample rate in Hz
         target_sample_rate: Output sample rate (default 16000 for Whisper)
         channels: Number of input channels (1=mono, 2=stereo)
@@ -44,44 +225,12 @@ def preprocess_audio(
     Raises:
         ValueError: If sample_rate is invalid
     """
-    if sample_rate <= 0:
-        raise ValueError(f"Invalid sample rate: {sample_rate}")
-
-    # Convert bytes to float32 array
-    audio = bytes_to_float32_array(audio_bytes)
-    import logging
-
-    logger = logging.getLogger(__name__)
-    logger.info(f"DEBUG preprocess: After bytes_to_float32: {len(audio)} samples")
-
-    # Convert stereo to mono if needed
-    if channels == 2:
-        audio = stereo_to_mono(audio)
-        logger.info(f"DEBUG preprocess: After stereo_to_mono: {len(audio)} samples")
-
-    # Resample if needed
-    if sample_rate != target_sample_rate:
-        logger.info(
-            f"DEBUG preprocess: Resampling {len(audio)} samples from {sample_rate}Hz to {target_sample_rate}Hz"
-        )
-        audio = resample_audio(audio, orig_sr=sample_rate, target_sr=target_sample_rate)
-        logger.info(f"DEBUG preprocess: After resample: {len(audio)} samples")
-
-    # Apply filters if requested
-    if apply_filters:
-        # High-pass filter to remove low-frequency rumble
-        audio = apply_highpass_filter(audio, sample_rate=target_sample_rate, cutoff_hz=80)
-        logger.info(f"DEBUG preprocess: After highpass: {len(audio)} samples")
-
-        # Pre-emphasis to boost high frequencies
-        audio = apply_preemphasis(audio, coefficient=0.97)
-        logger.info(f"DEBUG preprocess: After preemphasis: {len(audio)} samples")
-
-    # Normalize amplitude
-    audio = normalize_audio(audio)
-    logger.info(f"DEBUG preprocess: After normalize: {len(audio)} samples")
-
-    return audio.astype(np.float32)
+    preprocessor = _default_preprocessor
+    if target_sample_rate != preprocessor.target_sample_rate:
+        preprocessor = AudioPreprocessor(target_sample_rate=target_sample_rate)
+    return preprocessor.process(
+        audio_bytes, sample_rate, channels=channels, apply_filters=apply_filters
+    )
 
 
 def bytes_to_float32_array(audio_bytes: bytes) -> NDArray[np.float32]:
@@ -127,7 +276,10 @@ def resample_audio(
 ) -> NDArray[np.float32]:
     """Resample audio to target sample rate.
 
-    Uses scipy's resample function for high-quality resampling.
+    Uses polyphase filtering with a cached anti-aliasing filter per rate pair.
+    This replaced FFT resampling (scipy.signal.resample): output length is
+    unchanged and band-limited audio matches within 1e-3 away from the
+    edges, where FFT resampling wrapped the signal around.
 
     Args:
         audio: Input audio array
@@ -140,14 +292,11 @@ def resample_audio(
     if orig_sr == target_sr:
         return audio
 
-    # Calculate number of output samples
-    duration = len(audio) / orig_sr
-    num_samples = int(duration * target_sr)
+    up, down, taps = _resample_plan(orig_sr, target_sr)
+    num_samples = len(audio) * target_sr // orig_sr
+    resampled = signal.resample_poly(audio, up, down, window=taps)[:num_samples]
 
-    # Use scipy resample for high quality
-    resampled = signal.resample(audio, num_samples)
-
-    return cast(NDArray[np.float32], resampled.astype(np.float32))
+    return cast(NDArray[np.float32], resampled.astype(np.float32, copy=False))
 
 
 def apply_highpass_filter(
@@ -167,20 +316,7 @@ def apply_highpass_filter(
     Returns:
         Filtered audio array
     """
-    # Nyquist frequency
-    nyquist = sample_rate / 2
-
-    # Normalized cutoff frequency
-    normalized_cutoff = cutoff_hz / nyquist
-
-    # Clamp to valid range
-    normalized_cutoff = min(max(normalized_cutoff, 0.001), 0.999)
-
-    # Design Butterworth high-pass filter
-    b, a = signal.butter(order, normalized_cutoff, btype="high")
-
-    # Apply filter
-    filtered = signal.filtfilt(b, a, audio)
+    filtered = signal.sosfiltfilt(highpass_sos(sample_rate, cutoff_hz, order), audio)
 
     return cast(NDArray[np.float32], filtered.astype(np.float32))
 
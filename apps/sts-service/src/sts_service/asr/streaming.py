@@ -0,0 +1,313 @@
+"""
+Streaming ASR with local agreement.
+
+Wraps any ASRComponent so audio can be fed incrementally instead of as
+complete fragments. Words are committed as soon as they are stable, so
+translation and TTS can start before the full fragment has arrived.
+
+Algorithm (LocalAgreement-n, as in whisper_streaming):
+1. Audio chunks are appended to a rolling window that starts at (or just
+   before) the last committed word.
+2. Once min_chunk_ms of new audio has arrived, the whole window is
+   re-transcribed, producing a word-level hypothesis.
+3. The longest common prefix of the last n hypotheses is committed;
+   the rest stays tentative until later hypotheses confirm it.
+4. When the window grows beyond buffer_trim_ms it is trimmed at the last
+   committed word (keeping overlap_ms of context); at max_buffer_ms the
+   whole hypothesis is force-committed so the window never exceeds one
+   Whisper window.
+
+Usage:
+    streaming = StreamingASR(asr, stream_id="stream-123", language="en")
+    for chunk in chunks:
+        streaming.insert_audio(chunk)
+        for segment in streaming.process():
+            translate(segment.text)
+    remaining = streaming.finish()
+"""
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from .interface import ASRComponent
+from .models import StreamingASRConfig, TranscriptSegment, TranscriptStatus, WordTiming
+
+logger = logging.getLogger(__name__)
+
+# Words starting this long before the last commit are still compared to it
+_COMMIT_TOLERANCE_MS = 100
+# Repeated n-grams at the commit boundary are dropped if they start this close to it
+_BOUNDARY_WINDOW_MS = 1000
+_MAX_BOUNDARY_NGRAM = 5
+
+_PUNCTUATION = re.compile(r"[^\w']+")
+
+
+def _normalize(word: str) -> str:
+    """Comparison form of a word: casefolded, without surrounding punctuation."""
+    return _PUNCTUATION.sub("", word).casefold()
+
+
+@dataclass(frozen=True)
+class _Word:
+    start_ms: int
+    end_ms: int
+    text: str
+    confidence: float
+
+    @property
+    def key(self) -> str:
+        return _normalize(self.text)
+
+
+class StreamingASR:
+    """Incremental transcription of one stream with committed-prefix output.
+
+    Features:
+    - Sub-fragment audio input with a rolling, trimmed window
+    - LocalAgreement-n commit policy over word-level hypotheses
+    - Boundary de-duplication of words re-recognized in the overlap
+    - Committed output as TranscriptSegment with absolute timestamps
+    """
+
+    def __init__(
+        self,
+        asr: ASRComponent,
+        stream_id: str,
+        config: StreamingASRConfig | None = None,
+        sample_rate_hz: int = 16000,
+        language: str = "en",
+        domain: str = "general",
+        start_time_ms: int = 0,
+    ):
+        """Initialize a streaming session.
+
+        Args:
+            asr: Component used to transcribe the window
+            stream_id: Logical stream/session identifier
+            config: Streaming configuration (uses defaults if not provided)
+            sample_rate_hz: Sample rate of inserted audio
+            language: Expected language code
+            domain: Domain hint for vocabulary priming
+            start_time_ms: Stream time of the first inserted sample
+        """
+        self._asr = asr
+        self._stream_id = stream_id
+        self._config = config or StreamingASRConfig()
+        self._sample_rate_hz = sample_rate_hz
+        self._language = language
+        self._domain = domain
+
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start_ms = start_time_ms
+        self._new_samples = 0
+        self._decodes = 0
+
+        self._hypotheses: deque[list[_Word]] = deque(maxlen=self._config.agreement)
+        self._committed: list[_Word] = []
+        self._last_committed_end_ms = start_time_ms
+
+    @property
+    def buffer_duration_ms(self) -> int:
+        """Length of the audio window that the next decode will transcribe."""
+        return len(self._buffer) * 1000 // self._sample_rate_hz
+
+    @property
+    def committed_text(self) -> str:
+        """All text committed so far."""
+        return " ".join(word.text for word in self._committed)
+
+    @property
+    def pending_text(self) -> str:
+        """Latest hypothesis beyond the committed prefix (may still change)."""
+        return " ".join(word.text for word in self._hypotheses[-1]) if self._hypotheses else ""
+
+    def insert_audio(self, audio_data: bytes) -> None:
+        """Append a chunk of audio to the window.
+
+        Args:
+            audio_data: Raw PCM audio bytes (float32 little-endian)
+        """
+        chunk = np.frombuffer(audio_data, dtype="<f4")
+        self._buffer = np.concatenate([self._buffer, chunk])
+        self._new_samples += len(chunk)
+
+    def process(self) -> list[TranscriptSegment]:
+        """Re-decode the window if enough new audio arrived and commit stable words.
+
+        Returns:
+            Newly committed segment (empty if nothing became stable)
+        """
+        if self._new_samples * 1000 < self._config.min_chunk_ms * self._sample_rate_hz:
+            return []
+
+        hypothesis = self._decode()
+        if hypothesis is None:
+            return []
+
+        self._hypotheses.append(hypothesis)
+        committed = self._commit(self._agreed_prefix())
+
+        if self.buffer_duration_ms > self._config.max_buffer_ms:
+            # Nothing stabilized within one Whisper window: take the hypothesis as is
+            committed.extend(self._commit(self._hypotheses[-1]))
+            self._hypotheses.clear()
+            tail_ms = self._buffer_end_ms - self._config.overlap_ms
+            self._trim(max(self._last_committed_end_ms, tail_ms))
+        elif self.buffer_duration_ms > self._config.buffer_trim_ms:
+            self._trim(self._last_committed_end_ms - self._config.overlap_ms)
+
+        return self._to_segments(committed)
+
+    def finish(self) -> list[TranscriptSegment]:
+        """Decode any remaining audio and commit the final hypothesis.
+
+        Returns:
+            Final committed segment (empty if there was nothing left)
+        """
+        if self._new_samples:
+            hypothesis = self._decode()
+            if hypothesis is not None:
+                self._hypotheses.append(hypothesis)
+
+        committed = self._commit(self._hypotheses[-1]) if self._hypotheses else []
+        self._hypotheses.clear()
+        self._trim(self._buffer_end_ms)
+        return self._to_segments(committed)
+
+    @property
+    def _buffer_end_ms(self) -> int:
+        return self._buffer_start_ms + self.buffer_duration_ms
+
+    def _decode(self) -> list[_Word] | None:
+        """Transcribe the window and return words not yet committed."""
+        self._new_samples = 0
+        result = self._asr.transcribe(
+            audio_data=self._buffer.tobytes(),
+            stream_id=self._stream_id,
+            sequence_number=self._decodes,
+            start_time_ms=self._buffer_start_ms,
+            end_time_ms=max(self._buffer_end_ms, self._buffer_start_ms + 1),
+            sample_rate_hz=self._sample_rate_hz,
+            domain=self._domain,
+            language=self._language,
+        )
+        self._decodes += 1
+
+        if result.status == TranscriptStatus.FAILED:
+            logger.warning(
+                f"Streaming ASR decode failed for {self._stream_id}: "
+                f"{result.errors[0].message if result.errors else 'unknown error'}"
+            )
+            return None
+
+        words = [
+            word
+            for segment in result.segments
+            for word in _segment_words(segment)
+            if word.start_ms > self._last_committed_end_ms - _COMMIT_TOLERANCE_MS
+        ]
+        return self._drop_boundary_repeats(words)
+
+    def _drop_boundary_repeats(self, words: list[_Word]) -> list[_Word]:
+        """Drop words at the start of a hypothesis that repeat the committed tail."""
+        if not words or not self._committed:
+            return words
+        if words[0].start_ms - self._last_committed_end_ms > _BOUNDARY_WINDOW_MS:
+            return words
+
+        limit = min(len(self._committed), len(words), _MAX_BOUNDARY_NGRAM)
+        for n in range(limit, 0, -1):
+            tail = [w.key for w in self._committed[-n:]]
+            if tail == [w.key for w in words[:n]]:
+                return words[n:]
+        return words
+
+    def _agreed_prefix(self) -> list[_Word]:
+        """Longest common prefix of the last n hypotheses (newest wording wins)."""
+        if len(self._hypotheses) < self._config.agreement:
+            return []
+
+        newest = self._hypotheses[-1]
+        length = 0
+        while length < len(newest) and all(
+            length < len(h) and h[length].key == newest[length].key for h in self._hypotheses
+        ):
+            length += 1
+        return newest[:length]
+
+    def _commit(self, words: list[_Word]) -> list[_Word]:
+        """Commit words and remove them from every stored hypothesis."""
+        if not words:
+            return []
+
+        self._committed.extend(words)
+        self._last_committed_end_ms = words[-1].end_ms
+        for i, hypothesis in enumerate(self._hypotheses):
+            self._hypotheses[i] = [
+                w for w in hypothesis[len(words) :] if w.end_ms > self._last_committed_end_ms
+            ]
+        return list(words)
+
+    def _trim(self, cut_ms: int) -> None:
+        """Drop audio before cut_ms from the window."""
+        cut_ms = min(max(cut_ms, self._buffer_start_ms), self._buffer_end_ms)
+        samples = (cut_ms - self._buffer_start_ms) * self._sample_rate_hz // 1000
+        if samples <= 0:
+            return
+        self._buffer = self._buffer[samples:]
+        self._buffer_start_ms += samples * 1000 // self._sample_rate_hz
+
+    def _to_segments(self, words: list[_Word]) -> list[TranscriptSegment]:
+        """Build one transcript segment from newly committed words."""
+        if not words:
+            return []
+        start_ms = words[0].start_ms
+        return [
+            TranscriptSegment(
+                start_time_ms=start_ms,
+                end_time_ms=max(words[-1].end_ms, start_ms + 1),
+                text=" ".join(w.text for w in words),
+                confidence=sum(w.confidence for w in words) / len(words),
+                words=[
+                    WordTiming(
+                        start_time_ms=w.start_ms,
+                        end_time_ms=max(w.end_ms, w.start_ms + 1),
+                        word=w.text,
+                        confidence=w.confidence,
+                    )
+                    for w in words
+                ],
+            )
+        ]
+
+
+def _segment_words(segment: TranscriptSegment) -> list[_Word]:
+    """Word-level view of a segment; splits evenly if it has no word timings."""
+    if segment.words:
+        return [
+            _Word(
+                start_ms=w.start_time_ms,
+                end_ms=w.end_time_ms,
+                text=w.word,
+                confidence=w.confidence if w.confidence is not None else segment.confidence,
+            )
+            for w in segment.words
+            if w.word.strip()
+        ]
+
+    texts = segment.text.split()
+    step = segment.duration_ms / len(texts) if texts else 0
+    return [
+        _Word(
+            start_ms=segment.start_time_ms + int(i * step),
+            end_ms=segment.start_time_ms + int((i + 1) * step),
+            text=text,
+            confidence=segment.confidence,
+        )
+        for i, text in enumerate(texts)
+    ]
@@ -5,11 +5,20 @@ Provides CPU-friendly Whisper transcription with model caching.
 """
 
 import time
+from bisect import bisect_right
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
+import numpy as np
 from faster_whisper import WhisperModel
 
+from sts_service.audio_buffer import AudioBuffer, PCMData, as_pcm_bytes
+from sts_service.model_registry import ModelHandle, get_model_registry
+from sts_service.tracing import TraceLevel, get_tracer
+
+from .batching import get_batch_scheduler
 from .confidence import calculate_confidence
 from .domain_prompts import get_domain_prompt
 from .errors import create_asr_error
@@ -22,50 +31,86 @@ from .models import (
     WordTiming,
 )
 from .postprocessing import shape_utterances
-from .preprocessing import preprocess_audio
-
-# Global model cache keyed by (model_size, device, compute_type)
-_MODEL_CACHE: dict[tuple[str, str, str], WhisperModel] = {}
+from .preprocessing import AudioPreprocessor
+
+# Approximate Whisper parameter counts, for the model registry's memory budget
+_WHISPER_PARAMETERS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large-v1": 1_550_000_000,
+    "large-v2": 1_550_000_000,
+    "large-v3": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+_BYTES_PER_PARAMETER = {"int8": 1, "float16": 2, "float32": 4}
+
+_SAMPLE_RATE = 16000
+# Longer fragments exceed one Whisper window and are never batched
+_MAX_BATCH_SAMPLES = 30 * _SAMPLE_RATE
+
+_PREPROCESSOR = AudioPreprocessor(target_sample_rate=_SAMPLE_RATE)
+
+
+def _estimate_model_bytes(model_size: str, compute_type: str) -> int:
+    """Estimate resident memory of a Whisper model from its size and precision."""
+    return _WHISPER_PARAMETERS.get(model_size, 0) * _BYTES_PER_PARAMETER.get(compute_type, 4)
+
+
+def _shift_segment(segment: Any, offset_s: float) -> SimpleNamespace:
+    """Copy a faster-whisper segment with timestamps moved earlier by offset_s."""
+    words = None
+    if getattr(segment, "words", None):
+        words = [
+            SimpleNamespace(
+                start=word.start - offset_s,
+                end=word.end - offset_s,
+                word=word.word,
+                probability=word.probability,
+            )
+            for word in segment.words
+        ]
+    return SimpleNamespace(
+        start=segment.start - offset_s,
+        end=segment.end - offset_s,
+        text=segment.text,
+        avg_logprob=segment.avg_logprob,
+        no_speech_prob=segment.no_speech_prob,
+        words=words,
+    )
 
 
 def _get_or_load_model(
     model_size: str,
     device: str = "cpu",
     compute_type: str = "int8",
-) -> WhisperModel:
-    """Get cached model or load a new one.
+    replicas: int = 1,
+) -> ModelHandle:
+    """Acquire a shared model from the process-wide registry, loading it if needed.
 
     Args:
         model_size: Whisper model size (tiny, base, small, etc.)
         device: Compute device (cpu, cuda, cuda:0)
         compute_type: Compute precision (int8, float16, float32)
+        replicas: Model replicas for concurrent inference
 
     Returns:
-        Loaded WhisperModel instance
+        Handle to the shared WhisperModel (release it on shutdown)
     """
-    cache_key = (model_size, device, compute_type)
-
-    if cache_key not in _MODEL_CACHE:
-        _MODEL_CACHE[cache_key] = WhisperModel(
-            model_size,
-            device=device,
-            compute_type=compute_type,
-        )
-
-    return _MODEL_CACHE[cache_key]
-
-
-def _clear_model_cache() -> None:
-    """Clear the model cache to free memory."""
-    global _MODEL_CACHE
-    _MODEL_CACHE = {}
+    return get_model_registry().acquire(
+        ("faster-whisper", model_size, device, compute_type),
+        lambda: WhisperModel(model_size, device=device, compute_type=compute_type),
+        replicas=replicas,
+        size_bytes=_estimate_model_bytes(model_size, compute_type),
+    )
 
 
 class FasterWhisperASR(BaseASRComponent):
     """Production ASR component using faster-whisper.
 
     Features:
-    - Model caching across fragments
+    - Model shared across fragments and sessions via the model registry
     - Preprocessing (highpass, preemphasis, normalization)
     - Domain-specific vocabulary priming
     - VAD filtering
@@ -80,16 +125,17 @@ class FasterWhisperASR(BaseASRComponent):
             config: ASR configuration (uses defaults if not provided)
         """
         self._config = config or ASRConfig()
-        self._model: WhisperModel | None = None
+        self._model: ModelHandle | None = None
         self._load_model()
 
     def _load_model(self) -> None:
-        """Load the Whisper model."""
+        """Acquire the shared Whisper model."""
         model_config = self._config.model
         self._model = _get_or_load_model(
             model_size=model_config.model_size,
             device=model_config.device,
             compute_type=model_config.compute_type,
+            replicas=model_config.replicas,
         )
 
     @property
@@ -105,7 +151,7 @@ class FasterWhisperASR(BaseASRComponent):
 
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: PCMData,
         stream_id: str,
         sequence_number: int,
         start_time_ms: int,
@@ -117,7 +163,8 @@ class FasterWhisperASR(BaseASRComponent):
         """Transcribe an audio fragment.
 
         Args:
-            audio_data: Raw PCM audio bytes (float32 little-endian)
+            audio_data: Raw PCM audio bytes (float32 little-endian) or AudioBuffer
+                (whose sample rate and channel count take precedence)
             stream_id: Logical stream/session identifier
             sequence_number: Fragment index within stream
             start_time_ms: Fragment start in stream timeline
@@ -130,89 +177,53 @@ class FasterWhisperASR(BaseASRComponent):
             TranscriptAsset with transcription results
         """
         start_time = time.time()
+        channels = 1
+        if isinstance(audio_data, AudioBuffer):
+            sample_rate_hz, channels = audio_data.sample_rate_hz, audio_data.channels
+        work: AudioBuffer | None = None
 
         try:
-            # Preprocess audio
-            audio = preprocess_audio(
-                audio_data,
-                sample_rate=sample_rate_hz,
-                target_sample_rate=16000,
+            # Preprocess audio into a pooled buffer, held until Whisper is done with it
+            num_bytes = len(as_pcm_bytes(audio_data))
+            work = AudioBuffer.allocate(
+                _PREPROCESSOR.output_length(num_bytes, sample_rate_hz, channels), _SAMPLE_RATE
             )
-
-            # DEBUG
-            import logging
-            import numpy as np
-
-            logger = logging.getLogger(__name__)
-            logger.info(
-                f"DEBUG transcriber: Audio shape={audio.shape if hasattr(audio, 'shape') else len(audio)}, dtype={audio.dtype if hasattr(audio, 'dtype') else type(audio)}"
+            audio = _PREPROCESSOR.process(
+                audio_data, sample_rate_hz, channels=channels, out=work.samples
             )
-            if hasattr(audio, "shape"):
-                logger.info(
-                    f"DEBUG transcriber: Audio min={audio.min():.4f}, max={audio.max():.4f}, mean={np.abs(audio).mean():.4f}"
+
+            trace = get_tracer().for_fragment(stream_id, sequence_number)
+            if trace.enabled(TraceLevel.DEBUG):
+                trace.event(
+                    TraceLevel.DEBUG,
+                    "asr_input",
+                    samples=len(audio),
+                    peak=float(np.abs(audio).max()) if len(audio) else 0.0,
+                    mean_abs=float(np.abs(audio).mean()) if len(audio) else 0.0,
+                    vad_filter=self._config.vad.enabled,
+                    no_speech_threshold=self._config.transcription.no_speech_threshold,
                 )
+            trace.capture("asr_input", audio)
 
             # Get domain prompt
             initial_prompt = get_domain_prompt(domain)
 
-            # Configure VAD
-            vad_config = self._config.vad
-            vad_filter = vad_config.enabled
-            vad_parameters = {
-                "threshold": vad_config.threshold,
-                "min_silence_duration_ms": vad_config.min_silence_duration_ms,
-                "min_speech_duration_ms": vad_config.min_speech_duration_ms,
-                "speech_pad_ms": vad_config.speech_pad_ms,
-            }
-
-            # Configure transcription
-            trans_config = self._config.transcription
-
             # Run transcription
             if self._model is None:
                 raise RuntimeError("Model not loaded")
 
-            # DEBUG: Log transcription config
-            logger.info(
-                f"DEBUG transcriber: no_speech_threshold={trans_config.no_speech_threshold}"
-            )
-            logger.info(f"DEBUG transcriber: vad_filter={vad_filter}, vad_params={vad_parameters}")
+            segments_list, info = self._decode(audio, language, initial_prompt)
 
-            # DEBUG: Save audio to file for comparison
-            import tempfile
-            from pathlib import Path
-
-            debug_audio_file = Path("/tmp/debug_audio_from_transcriber.npy")
-            np.save(debug_audio_file, audio)
-            logger.info(f"DEBUG transcriber: Saved audio to {debug_audio_file}")
-
-            segments_iter, info = self._model.transcribe(
-                audio,
-                language=language,
-                initial_prompt=initial_prompt,
-                beam_size=trans_config.beam_size,
-                best_of=trans_config.best_of,
-                temperature=trans_config.temperature,
-                compression_ratio_threshold=trans_config.compression_ratio_threshold,
-                log_prob_threshold=trans_config.log_prob_threshold,
-                no_speech_threshold=trans_config.no_speech_threshold,
-                word_timestamps=trans_config.word_timestamps,
-                vad_filter=vad_filter,
-                vad_parameters=vad_parameters if vad_filter else None,
-            )
-
-            # DEBUG: Convert to list immediately to check
-            import logging
-
-            logger = logging.getLogger(__name__)
-            segments_list = list(segments_iter)
-            logger.info(
-                f"DEBUG transcriber: faster-whisper returned {len(segments_list)} raw segments"
-            )
-            for i, seg in enumerate(segments_list):
-                logger.info(
-                    f"DEBUG transcriber: Raw segment {i}: [{seg.start:.2f}s-{seg.end:.2f}s] '{seg.text}'"
-                )
+            if trace.enabled(TraceLevel.VERBOSE):
+                for i, seg in enumerate(segments_list):
+                    trace.event(
+                        TraceLevel.VERBOSE,
+                        "asr_raw_segment",
+                        index=i,
+                        start_s=round(seg.start, 2),
+                        end_s=round(seg.end, 2),
+                        text=seg.text,
+                    )
 
             # Convert segments (use segments_list, not the exhausted iterator!)
             transcript_segments = self._convert_segments(
@@ -221,20 +232,19 @@ class FasterWhisperASR(BaseASRComponent):
                 end_time_ms=end_time_ms,
             )
 
-            # DEBUG
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.info(f"DEBUG transcriber: Converted {len(transcript_segments)} segments")
-
             # Apply utterance shaping
             shaped_segments = shape_utterances(
                 transcript_segments,
                 self._config.utterance_shaping,
             )
 
-            # DEBUG
-            logger.info(f"DEBUG transcriber: Shaped {len(shaped_segments)} segments")
+            trace.event(
+                TraceLevel.DEBUG,
+                "asr_segments",
+                raw=len(segments_list),
+                converted=len(transcript_segments),
+                shaped=len(shaped_segments),
+            )
 
             processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -270,6 +280,156 @@ class FasterWhisperASR(BaseASRComponent):
             self._emit_transcript_artifact(result)
             return result
 
+        finally:
+            if work is not None:
+                work.release()
+
+    def _vad_parameters(self) -> dict[str, Any]:
+        """Silero VAD parameters from the VAD configuration."""
+        vad_config = self._config.vad
+        return {
+            "threshold": vad_config.threshold,
+            "min_silence_duration_ms": vad_config.min_silence_duration_ms,
+            "min_speech_duration_ms": vad_config.min_speech_duration_ms,
+            "speech_pad_ms": vad_config.speech_pad_ms,
+        }
+
+    def _decode(
+        self, audio: np.ndarray, language: str, initial_prompt: str | None
+    ) -> tuple[list[Any], Any]:
+        """Run Whisper on preprocessed audio, batched with other sessions if enabled.
+
+        Args:
+            audio: 16kHz mono float32 samples
+            language: Transcription language
+            initial_prompt: Domain vocabulary prompt
+
+        Returns:
+            Tuple of (faster-whisper segments, transcription info)
+        """
+        if self._model is None:
+            raise RuntimeError("Model not loaded")
+
+        batching = self._config.batching
+        if not batching.enabled or len(audio) > _MAX_BATCH_SAMPLES:
+            return self._decode_single(audio, language, initial_prompt)
+
+        # Only fragments decoded with identical model and options share a batch
+        key = (
+            self._model.key,
+            language,
+            initial_prompt,
+            self._config.transcription.model_dump_json(),
+            self._config.vad.model_dump_json(),
+        )
+        return get_batch_scheduler().submit(
+            key,
+            audio,
+            partial(self._decode_batch, language=language, initial_prompt=initial_prompt),
+            max_batch_size=batching.max_batch_size,
+            max_wait_ms=batching.max_wait_ms,
+        )
+
+    def _decode_single(
+        self, audio: np.ndarray, language: str, initial_prompt: str | None
+    ) -> tuple[list[Any], Any]:
+        """Transcribe one fragment with WhisperModel.transcribe."""
+        trans_config = self._config.transcription
+        vad_filter = self._config.vad.enabled
+
+        with self._model.checkout() as model:
+            segments_iter, info = model.transcribe(
+                audio,
+                language=language,
+                initial_prompt=initial_prompt,
+                beam_size=trans_config.beam_size,
+                best_of=trans_config.best_of,
+                temperature=trans_config.temperature,
+                compression_ratio_threshold=trans_config.compression_ratio_threshold,
+                log_prob_threshold=trans_config.log_prob_threshold,
+                no_speech_threshold=trans_config.no_speech_threshold,
+                word_timestamps=trans_config.word_timestamps,
+                vad_filter=vad_filter,
+                vad_parameters=self._vad_parameters() if vad_filter else None,
+            )
+            # Segments decode lazily; consume them while the replica is held
+            return list(segments_iter), info
+
+    def _decode_batch(
+        self, audios: list[np.ndarray], language: str, initial_prompt: str | None
+    ) -> list[tuple[list[Any], Any]]:
+        """Transcribe fragments from several sessions in one batched call.
+
+        The fragments are concatenated and each one's speech span (per VAD)
+        becomes one clip of BatchedInferencePipeline, so CTranslate2 decodes
+        them as a single batch. Segments are mapped back to their fragment
+        and made relative to its start.
+
+        Args:
+            audios: 16kHz mono float32 samples, one array per fragment
+            language: Transcription language (shared by the batch)
+            initial_prompt: Domain vocabulary prompt (shared by the batch)
+
+        Returns:
+            One (segments, info) tuple per fragment, in order
+        """
+        if len(audios) == 1:
+            return [self._decode_single(audios[0], language, initial_prompt)]
+
+        from faster_whisper import BatchedInferencePipeline
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        clips = []
+        offsets = []
+        offset = 0
+        for audio in audios:
+            start, end = 0, len(audio)
+            if self._config.vad.enabled:
+                speech = get_speech_timestamps(audio, VadOptions(**self._vad_parameters()))
+                start, end = (speech[0]["start"], speech[-1]["end"]) if speech else (0, 0)
+            if end > start:
+                # clip_timestamps are in seconds of the concatenated audio
+                clips.append(
+                    {
+                        "start": (offset + start) / _SAMPLE_RATE,
+                        "end": (offset + end) / _SAMPLE_RATE,
+                    }
+                )
+            offsets.append(offset)
+            offset += len(audio)
+
+        # Language is fixed by the caller, as in WhisperModel.transcribe(language=...)
+        info = SimpleNamespace(language=language, language_probability=1.0)
+        results: list[tuple[list[Any], Any]] = [([], info) for _ in audios]
+        if not clips:
+            return results
+
+        trans_config = self._config.transcription
+        with self._model.checkout() as model:
+            segments_iter, _ = BatchedInferencePipeline(model).transcribe(
+                np.concatenate(audios),
+                language=language,
+                initial_prompt=initial_prompt,
+                beam_size=trans_config.beam_size,
+                best_of=trans_config.best_of,
+                temperature=trans_config.temperature,
+                compression_ratio_threshold=trans_config.compression_ratio_threshold,
+                log_prob_threshold=trans_config.log_prob_threshold,
+                no_speech_threshold=trans_config.no_speech_threshold,
+                word_timestamps=trans_config.word_timestamps,
+                without_timestamps=False,
+                vad_filter=False,
+                clip_timestamps=clips,
+                batch_size=len(clips),
+            )
+            segments = list(segments_iter)
+
+        for segment in segments:
+            midpoint = int((segment.start + segment.end) / 2 * _SAMPLE_RATE)
+            index = max(bisect_right(offsets, midpoint) - 1, 0)
+            results[index][0].append(_shift_segment(segment, offsets[index] / _SAMPLE_RATE))
+        return results
+
     def _convert_segments(
         self,
         segments_iter: Any,
@@ -292,16 +452,7 @@ class FasterWhisperASR(BaseASRComponent):
         result = []
         fragment_duration_s = (end_time_ms - start_time_ms) / 1000.0
 
-        import logging
-
-        logger = logging.getLogger(__name__)
-        segment_count = 0
-
         for segment in segments_iter:
-            segment_count += 1
-            logger.info(
-                f"DEBUG _convert_segments: Processing segment {segment_count}: '{segment.text}'"
-            )
             # Convert relative seconds to absolute milliseconds
             seg_start_s = segment.start
             seg_end_s = segment.end
@@ -311,8 +462,8 @@ class FasterWhisperASR(BaseASRComponent):
             seg_end_s = max(seg_start_s, min(seg_end_s, fragment_duration_s))
 
             # Convert to absolute milliseconds
-            abs_start_ms = start_time_ms + int(seg_start_s * 1000)
-            abs_end_ms = start_time_ms + int(seg_end_s * 1000)
+            abs_start_ms = start_time_ms + round(seg_start_s * 1000)
+            abs_end_ms = start_time_ms + round(seg_end_s * 1000)
 
             # Ensure valid range
             abs_start_ms = max(start_time_ms, abs_start_ms)
@@ -372,8 +523,8 @@ class FasterWhisperASR(BaseASRComponent):
             word_end_s = max(word_start_s, min(word.end, fragment_duration_s))
 
             # Convert to absolute milliseconds
-            abs_start = start_time_ms + int(word_start_s * 1000)
-            abs_end = start_time_ms + int(word_end_s * 1000)
+            abs_start = start_time_ms + round(word_start_s * 1000)
+            abs_end = start_time_ms + round(word_end_s * 1000)
 
             # Ensure valid range
             abs_end = max(abs_end, abs_start + 1)
@@ -413,7 +564,11 @@ class FasterWhisperASR(BaseASRComponent):
                 f.write(f"{content}\n")
 
     def shutdown(self) -> None:
-        """Release model resources."""
-        # Clear the model cache to free memory
-        _clear_model_cache()
-        self._model = None
+        """Release this component's reference to the shared model.
+
+        The model stays resident for other sessions; the registry evicts
+        idle models only when over its memory budget.
+        """
+        if self._model is not None:
+            self._model.release()
+            self._model = None
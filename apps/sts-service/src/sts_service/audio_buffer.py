@@ -0,0 +1,318 @@
+"""
+Shared PCM Audio Buffer.
+
+Fragment audio used to cross every stage boundary as bytes: decoded PCM was
+copied out of its NumPy array with tobytes(), silence was built as bytes and
+concatenated onto the TTS output, and each consumer re-read the bytes with
+np.frombuffer. AudioBuffer carries the float32 samples together with their
+sample rate and channel count so stages hand the same memory along:
+
+- from_pcm() views existing PCM bytes without copying
+- memoryview() exports the samples as PCM f32le bytes without copying, for
+  base64, subprocess pipes and anything else that takes a bytes-like object
+- padded() and silence() allocate from a BufferPool, so the fragment-sized
+  arrays of one fragment are reused by the next instead of reallocated
+
+Pooled buffers are returned with release() once their owner is done (after
+the encode in PipelineCoordinator). Releasing is optional: a buffer that is
+never released is simply garbage-collected.
+
+Usage:
+    pcm = AudioBuffer.from_pcm(pcm_bytes, sample_rate_hz=16000)
+    padded = pcm.padded(6000)
+    encode_to_m4a(padded, padded.sample_rate_hz, padded.channels)
+    padded.release()
+"""
+
+import os
+import threading
+from collections import defaultdict
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Smallest pooled allocation, in samples (256 ms of 16 kHz mono)
+MIN_POOLED_SAMPLES = 4096
+
+
+class BufferPool:
+    """Free lists of float32 arrays, bucketed by size class.
+
+    Requested sizes are rounded up to one of eight size classes per power of
+    two (at most 12.5% slack), so fragments of slightly different lengths
+    share buffers. Idle arrays are capped at max_bytes; releases beyond the
+    cap are dropped.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        """Initialize the pool.
+
+        Args:
+            max_bytes: Bytes of idle arrays kept for reuse
+                (default: AUDIO_BUFFER_POOL_MAX_BYTES, 64 MiB; 0 disables pooling)
+        """
+        if max_bytes is None:
+            max_bytes = int(os.getenv("AUDIO_BUFFER_POOL_MAX_BYTES", str(64 * 1024 * 1024)))
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._free: dict[int, list[NDArray[np.float32]]] = defaultdict(list)
+        self._idle_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def size_class(num_samples: int) -> int:
+        """Capacity of the array used for a request of num_samples."""
+        if num_samples <= MIN_POOLED_SAMPLES:
+            return MIN_POOLED_SAMPLES
+        step = 1 << (num_samples.bit_length() - 4)
+        return -(-num_samples // step) * step
+
+    @property
+    def idle_bytes(self) -> int:
+        """Bytes held in the free lists."""
+        return self._idle_bytes
+
+    def acquire(self, num_samples: int) -> NDArray[np.float32]:
+        """Get an uninitialized float32 block that holds at least num_samples.
+
+        Args:
+            num_samples: Samples needed
+
+        Returns:
+            Block of size_class(num_samples) samples
+        """
+        capacity = self.size_class(num_samples)
+        with self._lock:
+            free = self._free.get(capacity)
+            if free:
+                self.hits += 1
+                self._idle_bytes -= capacity * 4
+                return free.pop()
+            self.misses += 1
+        return np.empty(capacity, dtype=np.float32)
+
+    def release(self, block: NDArray[np.float32]) -> None:
+        """Return a block from acquire() for reuse.
+
+        Args:
+            block: The block (not a view of it)
+        """
+        with self._lock:
+            if self._idle_bytes + block.nbytes > self._max_bytes:
+                return
+            self._free[len(block)].append(block)
+            self._idle_bytes += block.nbytes
+
+
+class AudioBuffer:
+    """Interleaved float32 PCM with its sample rate and channel count.
+
+    samples is a 1-D C-contiguous float32 array. Buffers made from bytes are
+    read-only views of those bytes; buffers from allocate() are writable.
+    """
+
+    __slots__ = ("samples", "sample_rate_hz", "channels", "_pool", "_block")
+
+    def __init__(
+        self,
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        channels: int = 1,
+        _pool: BufferPool | None = None,
+        _block: NDArray[np.float32] | None = None,
+    ):
+        if sample_rate_hz <= 0:
+            raise ValueError(f"Invalid sample rate: {sample_rate_hz}")
+        if channels not in (1, 2):
+            raise ValueError(f"Invalid channel count: {channels}")
+        self.samples = samples
+        self.sample_rate_hz = sample_rate_hz
+        self.channels = channels
+        self._pool = _pool
+        self._block = _block
+
+    @classmethod
+    def from_pcm(
+        cls, data: "bytes | bytearray | memoryview", sample_rate_hz: int, channels: int = 1
+    ) -> "AudioBuffer":
+        """View PCM f32le bytes as a buffer (no copy; a trailing partial sample is ignored).
+
+        Args:
+            data: PCM F32LE bytes
+            sample_rate_hz: Sample rate in Hz
+            channels: Number of interleaved channels
+        """
+        samples = np.frombuffer(data, dtype="<f4", count=len(data) // 4)
+        return cls(samples, sample_rate_hz, channels)
+
+    @classmethod
+    def from_array(
+        cls, samples: ArrayLike, sample_rate_hz: int, channels: int = 1
+    ) -> "AudioBuffer":
+        """Wrap interleaved samples (no copy if already contiguous float32).
+
+        Args:
+            samples: Interleaved samples, any shape (flattened)
+            sample_rate_hz: Sample rate in Hz
+            channels: Number of interleaved channels
+        """
+        array = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1)
+        return cls(array, sample_rate_hz, channels)
+
+    @classmethod
+    def allocate(
+        cls,
+        num_samples: int,
+        sample_rate_hz: int,
+        channels: int = 1,
+        pool: BufferPool | None = None,
+    ) -> "AudioBuffer":
+        """Allocate an uninitialized buffer from a pool.
+
+        Args:
+            num_samples: Interleaved samples (frames * channels)
+            sample_rate_hz: Sample rate in Hz
+            channels: Number of interleaved channels
+            pool: Pool to allocate from (default: the process-wide pool)
+        """
+        pool = pool or get_buffer_pool()
+        block = pool.acquire(num_samples)
+        return cls(block[:num_samples], sample_rate_hz, channels, _pool=pool, _block=block)
+
+    @classmethod
+    def silence(
+        cls,
+        duration_ms: int,
+        sample_rate_hz: int,
+        channels: int = 1,
+        pool: BufferPool | None = None,
+    ) -> "AudioBuffer":
+        """Allocate a zero-filled buffer of duration_ms.
+
+        Args:
+            duration_ms: Duration in milliseconds
+            sample_rate_hz: Sample rate in Hz
+            channels: Number of interleaved channels
+            pool: Pool to allocate from (default: the process-wide pool)
+        """
+        frames = duration_ms * sample_rate_hz // 1000
+        buffer = cls.allocate(frames * channels, sample_rate_hz, channels, pool)
+        buffer.samples.fill(0.0)
+        return buffer
+
+    @property
+    def frames(self) -> int:
+        """Samples per channel."""
+        return len(self.samples) // self.channels
+
+    @property
+    def duration_ms(self) -> int:
+        """Duration in whole milliseconds."""
+        return self.frames * 1000 // self.sample_rate_hz
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the samples as PCM f32le."""
+        return self.samples.nbytes
+
+    def memoryview(self) -> memoryview:
+        """Export the samples as PCM f32le bytes without copying."""
+        return memoryview(self.samples).cast("B")
+
+    def tobytes(self) -> bytes:
+        """Copy the samples out as PCM f32le bytes."""
+        return self.samples.tobytes()
+
+    def padded(self, duration_ms: int, pool: BufferPool | None = None) -> "AudioBuffer":
+        """Extend with trailing silence to at least duration_ms.
+
+        Args:
+            duration_ms: Target duration in milliseconds
+            pool: Pool to allocate from (default: the process-wide pool)
+
+        Returns:
+            A new pooled buffer, or self if it is already long enough
+        """
+        frames = duration_ms * self.sample_rate_hz // 1000
+        if frames <= self.frames:
+            return self
+        length = len(self.samples)
+        buffer = AudioBuffer.allocate(
+            frames * self.channels, self.sample_rate_hz, self.channels, pool
+        )
+        buffer.samples[:length] = self.samples
+        buffer.samples[length:] = 0.0
+        return buffer
+
+    def release(self) -> None:
+        """Return a pooled buffer's memory for reuse; samples must not be used afterwards.
+
+        No-op for buffers that do not come from a pool, and on repeated calls.
+        """
+        block, self._block = self._block, None
+        if block is not None and self._pool is not None:
+            self.samples = block[:0]
+            self._pool.release(block)
+
+    def __repr__(self) -> str:
+        return (
+            f"AudioBuffer(frames={self.frames}, sample_rate_hz={self.sample_rate_hz}, "
+            f"channels={self.channels})"
+        )
+
+
+# PCM f32le bytes or an AudioBuffer, as accepted by ASR, speech gate and encoders
+PCMData: TypeAlias = bytes | bytearray | memoryview | AudioBuffer
+
+
+def as_float32(audio: PCMData) -> NDArray[np.float32]:
+    """Float32 samples of PCM f32le bytes or an AudioBuffer, without copying.
+
+    Args:
+        audio: PCM F32LE bytes or AudioBuffer
+
+    Returns:
+        1-D float32 array (read-only for bytes input)
+    """
+    if isinstance(audio, AudioBuffer):
+        return audio.samples
+    return np.frombuffer(audio, dtype="<f4", count=len(audio) // 4)
+
+
+def as_pcm_bytes(audio: PCMData) -> "bytes | bytearray | memoryview":
+    """PCM f32le bytes-like view of bytes or an AudioBuffer, without copying."""
+    if isinstance(audio, AudioBuffer):
+        return audio.memoryview()
+    return audio
+
+
+_pool: BufferPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_buffer_pool() -> BufferPool:
+    """Get the process-wide buffer pool, creating it on first use.
+
+    Returns:
+        The shared BufferPool instance.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BufferPool()
+    return _pool
+
+
+def set_buffer_pool(pool: BufferPool | None) -> None:
+    """Set the process-wide buffer pool (for testing).
+
+    Args:
+        pool: The pool to use, or None to reset.
+    """
+    global _pool
+    _pool = pool
@@ -5,6 +5,7 @@ echo functionality and in-order delivery.
 """
 
 import asyncio
+import base64
 import logging
 import time
 from typing import Any
@@ -27,7 +28,7 @@ from sts_service.echo.session import SessionStore, StreamSession
 
 logger = logging.getLogger(__name__)
 
-# Maximum fragment size (10MB decoded from base64)
+# Maximum fragment size (10MB raw, or decoded from base64)
 MAX_FRAGMENT_SIZE = 10 * 1024 * 1024
 MAX_BASE64_SIZE = MAX_FRAGMENT_SIZE * 4 // 3 + 4
 
@@ -76,8 +77,9 @@ async def handle_fragment_data(
 
     # Check fragment size before validation
     audio_data = data.get("audio", {})
-    data_base64 = audio_data.get("data_base64", "")
-    if len(data_base64) > MAX_BASE64_SIZE:
+    data_base64 = audio_data.get("data_base64") or ""
+    raw_data = audio_data.get("data") or b""
+    if len(data_base64) > MAX_BASE64_SIZE or len(raw_data) > MAX_FRAGMENT_SIZE:
         error = ErrorPayload.from_error_code(
             code="FRAGMENT_TOO_LARGE",
             stream_id=session.stream_id,
@@ -145,13 +147,7 @@ async def handle_fragment_data(
             stream_id=payload.stream_id,
             sequence_number=payload.sequence_number,
             status="success",
-            dubbed_audio=AudioData(
-                format=payload.audio.format,
-                sample_rate_hz=payload.audio.sample_rate_hz,
-                channels=payload.audio.channels,
-                duration_ms=payload.audio.duration_ms,
-                data_base64=payload.audio.data_base64,  # Echo original audio
-            ),
+            dubbed_audio=_echo_audio(payload.audio, session.binary_audio),
             transcript=f"[ECHO] Original audio (seq={payload.sequence_number})",
             translated_text=f"[ECHO] Audio original (seq={payload.sequence_number})",
             processing_time_ms=processing_time_ms,
@@ -186,6 +182,31 @@ async def handle_fragment_data(
         logger.info(f"All fragments processed: stream_id={session.stream_id}, sid={sid}")
 
 
+def _echo_audio(audio: AudioData, binary: bool) -> AudioData:
+    """Echo the original audio in the session's negotiated encoding.
+
+    Args:
+        audio: Audio received in fragment:data.
+        binary: Whether the session negotiated binary_audio.
+
+    Returns:
+        AudioData carrying the same audio as raw bytes or base64.
+    """
+    if binary:
+        audio_fields = {"data": audio.audio_bytes()}
+    elif audio.data_base64 is not None:
+        audio_fields = {"data_base64": audio.data_base64}
+    else:
+        audio_fields = {"data_base64": base64.b64encode(audio.audio_bytes()).decode("utf-8")}
+    return AudioData(
+        format=audio.format,
+        sample_rate_hz=audio.sample_rate_hz,
+        channels=audio.channels,
+        duration_ms=audio.duration_ms,
+        **audio_fields,
+    )
+
+
 async def handle_fragment_ack(
     sio: Any,
     sid: str,
@@ -63,6 +63,7 @@ async def handle_stream_init(
         session.sample_rate_hz = payload.config.sample_rate_hz
         session.channels = payload.config.channels
         session.format = payload.config.format
+        session.binary_audio = payload.config.binary_audio
         session.max_inflight = payload.max_inflight
         session.timeout_ms = payload.timeout_ms
 
@@ -81,6 +82,7 @@ async def handle_stream_init(
             capabilities=ServerCapabilities(
                 batch_processing=False,
                 async_delivery=True,
+                binary_audio=session.binary_audio,
             ),
         )
 
@@ -4,16 +4,26 @@ Implements fragment:data, fragment:processed, fragment:ack, and backpressure
 messages as defined in spec 016 (WebSocket Audio Fragment Protocol).
 """
 
-from typing import Literal
+import base64
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 
 class AudioData(BaseModel):
     """Audio data within a fragment.
 
     Matches spec 016 section 5.1 audio field structure.
-    Uses M4A (AAC in MP4 container) as the default audio format.
+    Uses M4A (AAC in MP4 container) as the default audio format. The audio
+    is base64-encoded in data_base64, or raw bytes in data on streams that
+    negotiated binary_audio.
     """
 
     format: str = Field(
@@ -35,20 +45,46 @@ class AudioData(BaseModel):
         le=60000,
         description="Fragment duration in milliseconds",
     )
-    data_base64: str = Field(
+    data_base64: str | None = Field(
+        default=None,
         description="Base64-encoded M4A audio data",
     )
+    data: bytes | None = Field(
+        default=None,
+        max_length=10 * 1024 * 1024,
+        description="Raw M4A audio data (binary_audio streams)",
+    )
 
     @field_validator("data_base64")
     @classmethod
-    def validate_base64_size(cls, v: str) -> str:
+    def validate_base64_size(cls, v: str | None) -> str | None:
         """Validate that base64 data doesn't exceed 10MB when decoded."""
         # Base64 encoding increases size by ~33%, so 10MB decoded = ~13.3MB encoded
         max_base64_size = 10 * 1024 * 1024 * 4 // 3 + 4  # Account for padding
-        if len(v) > max_base64_size:
+        if v is not None and len(v) > max_base64_size:
             raise ValueError("Audio data exceeds 10MB limit")
         return v
 
+    @model_validator(mode="after")
+    def validate_one_encoding(self) -> "AudioData":
+        """Validate that exactly one of data and data_base64 is set."""
+        if (self.data is None) == (self.data_base64 is None):
+            raise ValueError("Exactly one of data and data_base64 is required")
+        return self
+
+    @model_serializer(mode="wrap")
+    def serialize_one_encoding(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Omit the unused encoding so base64 clients see the payload they always have."""
+        result = handler(self)
+        result.pop("data_base64" if self.data is not None else "data", None)
+        return result
+
+    def audio_bytes(self) -> bytes:
+        """M4A audio bytes, whichever way they were sent."""
+        if self.data is not None:
+            return self.data
+        return base64.b64decode(self.data_base64 or "")
+
 
 class FragmentMetadata(BaseModel):
     """Optional metadata for a fragment.
@@ -45,6 +45,10 @@ class StreamConfigPayload(BaseModel):
         default="m4a",
         description="Audio format identifier (m4a = AAC audio in MP4 container)",
     )
+    binary_audio: bool = Field(
+        default=False,
+        description="Worker sends and accepts fragment audio as raw bytes attachments",
+    )
 
 
 class StreamInitPayload(BaseModel):
@@ -89,6 +93,10 @@ class ServerCapabilities(BaseModel):
         default=True,
         description="Whether server supports async fragment delivery",
     )
+    binary_audio: bool = Field(
+        default=False,
+        description="Whether fragment audio is exchanged as raw bytes attachments",
+    )
 
 
 class StreamReadyPayload(BaseModel):
@@ -96,6 +96,7 @@ class StreamSession:
     sample_rate_hz: int = 48000
     channels: int = 1
     format: str = "m4a"
+    binary_audio: bool = False  # Fragment audio as raw bytes instead of base64
     max_inflight: int = 3
     timeout_ms: int = 8000
 
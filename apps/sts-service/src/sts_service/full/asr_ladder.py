@@ -0,0 +1,357 @@
+"""Load-Adaptive ASR Quality Ladder for Full STS Service.
+
+ASR settings used to be fixed per stream at stream:init, so on an
+oversubscribed node every stream fell behind together. The ladder gives
+each session three named latency profiles and moves between them per
+fragment:
+
+- fast: ASR_LADDER_FAST_MODEL (default tiny), greedy decoding, no
+  temperature fallback, no word timestamps
+- balanced: beam 3, one fallback temperature, word timestamps
+- accurate: ASR_LADDER_ACCURATE_MODEL, beam 8, full temperature fallback,
+  word timestamps
+
+Profile models default to ASR_MODEL_SIZE; the decoding settings above
+replace the configured ASR decoding settings for every profile.
+
+The ladder is opt-in (ASR_LADDER_ENABLED=true): it preloads the fast
+profile's model and trades transcription quality for latency under load.
+
+The controller measures ASR latency as a fraction of the session's
+timeout_ms, plus the ASR stage queue depth. It steps down one profile after
+step_down_fragments consecutive fragments above the high watermark (or with
+a backed-up queue) and steps up one profile after min_dwell_fragments
+consecutive fragments with the latency EMA below the low watermark.
+A step up that is undone within the dwell period doubles the dwell before
+the next step up, so a node on the edge does not flap between profiles.
+
+AdaptiveASRComponent wraps one ASR component per profile behind the ASR
+component interface. All profiles are created when the session starts
+(models are shared through the model registry and preloaded by the startup
+warm-up), so a step down under load never waits for a model to load.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Optional
+
+from sts_service.asr.interface import ASRComponent, BaseASRComponent
+from sts_service.asr.models import ASRConfig, TranscriptAsset
+from sts_service.audio_buffer import PCMData
+
+from .config import ASRLadderConfig
+from .observability.metrics import record_asr_profile_fragment, record_asr_profile_switch
+from .stage_executor import get_stage_executor
+
+logger = logging.getLogger(__name__)
+
+# Latency EMA smoothing (weight of the newest fragment)
+EMA_ALPHA = 0.3
+# Upper bound for the backed-off step-up dwell, in fragments
+MAX_DWELL_FRAGMENTS = 64
+
+
+@dataclass(frozen=True)
+class ASRProfile:
+    """Named set of ASR settings on the quality ladder."""
+
+    name: str
+    model_size: Optional[str]
+    beam_size: int
+    best_of: int
+    temperature: tuple[float, ...]
+    word_timestamps: bool
+
+
+def build_profiles(config: Optional[ASRLadderConfig] = None) -> list[ASRProfile]:
+    """Build the ladder profiles, fastest first.
+
+    Args:
+        config: Ladder settings (default: from environment)
+
+    Returns:
+        fast, balanced and accurate profiles
+    """
+    config = config or ASRLadderConfig()
+    return [
+        ASRProfile(
+            name="fast",
+            model_size=config.fast_model or None,
+            beam_size=1,
+            best_of=1,
+            temperature=(0.0,),
+            word_timestamps=False,
+        ),
+        ASRProfile(
+            name="balanced",
+            model_size=config.balanced_model or None,
+            beam_size=3,
+            best_of=3,
+            temperature=(0.0, 0.4),
+            word_timestamps=True,
+        ),
+        ASRProfile(
+            name="accurate",
+            model_size=config.accurate_model or None,
+            beam_size=8,
+            best_of=8,
+            temperature=(0.0, 0.2, 0.4),
+            word_timestamps=True,
+        ),
+    ]
+
+
+def apply_profile(base: ASRConfig, profile: ASRProfile) -> ASRConfig:
+    """Derive a profile's ASR configuration from the session's base configuration.
+
+    Args:
+        base: Session ASR configuration
+        profile: Profile to apply
+
+    Returns:
+        Copy of base with the profile's model and decoding settings
+    """
+    model = base.model
+    if profile.model_size:
+        model = model.model_copy(update={"model_size": profile.model_size})
+    transcription = base.transcription.model_copy(
+        update={
+            "beam_size": profile.beam_size,
+            "best_of": profile.best_of,
+            "temperature": list(profile.temperature),
+            "word_timestamps": profile.word_timestamps,
+        }
+    )
+    return base.model_copy(update={"model": model, "transcription": transcription})
+
+
+class ASRLadderController:
+    """Chooses a session's profile from measured ASR latency and queue depth.
+
+    Not thread-safe; AdaptiveASRComponent serializes access.
+    """
+
+    def __init__(
+        self,
+        profile_names: list[str],
+        timeout_ms: int,
+        config: Optional[ASRLadderConfig] = None,
+    ):
+        """Initialize the controller.
+
+        Args:
+            profile_names: Profile names, fastest first
+            timeout_ms: Session fragment timeout the latency is measured against
+            config: Ladder settings (default: from environment)
+        """
+        self._config = config or ASRLadderConfig()
+        self._config.validate()
+        self._names = profile_names
+        self._timeout_ms = max(timeout_ms, 1)
+        self._index = profile_names.index(self._config.start_profile)
+
+        self._latency_ema_ms: Optional[float] = None
+        self._overloaded = 0
+        self._underloaded = 0
+        self._since_switch = 0
+        self._dwell = self._config.min_dwell_fragments
+        self._last_step_up = False
+
+    @property
+    def profile(self) -> str:
+        """Name of the current profile."""
+        return self._names[self._index]
+
+    @property
+    def latency_ratio(self) -> Optional[float]:
+        """Smoothed ASR latency as a fraction of timeout_ms (None before any fragment)."""
+        if self._latency_ema_ms is None:
+            return None
+        return self._latency_ema_ms / self._timeout_ms
+
+    def observe(self, latency_ms: float, queue_depth: int) -> Optional[str]:
+        """Record one transcribed fragment and switch profiles if warranted.
+
+        Args:
+            latency_ms: ASR latency of the fragment
+            queue_depth: ASR calls waiting for a worker
+
+        Returns:
+            Name of the new profile if the controller switched, else None
+        """
+        previous = self._latency_ema_ms
+        self._latency_ema_ms = (
+            latency_ms if previous is None else EMA_ALPHA * latency_ms + (1 - EMA_ALPHA) * previous
+        )
+        self._since_switch += 1
+        ratio = latency_ms / self._timeout_ms
+        smoothed_ratio = self._latency_ema_ms / self._timeout_ms
+
+        # Step down on consecutive slow fragments (the count filters spikes);
+        # step up only once the smoothed latency is well inside the budget
+        if ratio > self._config.high_watermark or queue_depth >= self._config.queue_high:
+            self._overloaded += 1
+            self._underloaded = 0
+        elif smoothed_ratio < self._config.low_watermark and queue_depth == 0:
+            self._underloaded += 1
+            self._overloaded = 0
+        else:
+            self._overloaded = 0
+            self._underloaded = 0
+
+        if self._index > 0 and self._overloaded >= self._config.step_down_fragments:
+            if self._last_step_up and self._since_switch <= self._dwell:
+                # The previous step up did not hold: wait longer before the next one
+                self._dwell = min(self._dwell * 2, MAX_DWELL_FRAGMENTS)
+            return self._switch(self._index - 1)
+
+        if self._index < len(self._names) - 1 and self._underloaded >= self._dwell:
+            return self._switch(self._index + 1)
+
+        if self._last_step_up and self._since_switch > self._dwell:
+            # The step up held; later ones no longer need the backed-off dwell
+            self._dwell = self._config.min_dwell_fragments
+            self._last_step_up = False
+
+        return None
+
+    def _switch(self, index: int) -> str:
+        self._last_step_up = index > self._index
+        self._index = index
+        # Latency measured on the old profile says nothing about the new one
+        self._latency_ema_ms = None
+        self._overloaded = 0
+        self._underloaded = 0
+        self._since_switch = 0
+        return self.profile
+
+
+class AdaptiveASRComponent(BaseASRComponent):
+    """ASR component that transcribes each fragment with the ladder's current profile.
+
+    Features:
+    - One wrapped component per profile, all created at init
+    - Per-fragment latency measurement feeding ASRLadderController
+    - Profile residency and switches exported via observability.metrics
+    """
+
+    def __init__(
+        self,
+        base_config: ASRConfig,
+        timeout_ms: int,
+        factory: Callable[[ASRConfig], ASRComponent],
+        config: Optional[ASRLadderConfig] = None,
+        queue_depth: Optional[Callable[[], int]] = None,
+    ):
+        """Initialize the ladder for a session.
+
+        Args:
+            base_config: Session ASR configuration the profiles are derived from
+            timeout_ms: Session fragment timeout
+            factory: Creates an ASR component from a configuration
+            config: Ladder settings (default: from environment)
+            queue_depth: Returns the ASR queue depth (default: stage executor "asr" queue)
+        """
+        self._config = config or ASRLadderConfig()
+        self._profiles = {profile.name: profile for profile in build_profiles(self._config)}
+        self._controller = ASRLadderController(list(self._profiles), timeout_ms, self._config)
+        self._queue_depth = queue_depth or (lambda: get_stage_executor().queue_depth("asr"))
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Load every profile now: switching happens when the node is overloaded,
+        # which is the worst time to load a model on the ASR worker
+        self._components: dict[str, ASRComponent] = {}
+        for name, profile in self._profiles.items():
+            component = factory(apply_profile(base_config, profile))
+            self._components[name] = component
+            logger.info(f"ASR ladder loaded profile {name}: {component.component_instance}")
+        record_asr_profile_switch(None, self._controller.profile)
+
+    @property
+    def profile(self) -> str:
+        """Name of the profile the next fragment will use."""
+        with self._lock:
+            return self._controller.profile
+
+    @property
+    def component_instance(self) -> str:
+        """Return the current profile's component identifier."""
+        return self._component(self.profile).component_instance
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the current profile's component is ready."""
+        return not self._closed and self._component(self.profile).is_ready
+
+    def _component(self, name: str) -> ASRComponent:
+        return self._components[name]
+
+    def transcribe(
+        self,
+        audio_data: PCMData,
+        stream_id: str,
+        sequence_number: int,
+        start_time_ms: int,
+        end_time_ms: int,
+        sample_rate_hz: int = 16000,
+        domain: str = "general",
+        language: str = "en",
+    ) -> TranscriptAsset:
+        """Transcribe with the current profile and update the ladder.
+
+        Args:
+            audio_data: Raw PCM audio bytes (float32 little-endian) or AudioBuffer
+            stream_id: Logical stream/session identifier
+            sequence_number: Fragment index within stream
+            start_time_ms: Fragment start time in stream timeline
+            end_time_ms: Fragment end time in stream timeline
+            sample_rate_hz: Audio sample rate
+            domain: Domain hint for vocabulary priming
+            language: Expected language code
+
+        Returns:
+            TranscriptAsset from the profile's component
+        """
+        profile = self.profile
+        component = self._component(profile)
+
+        start = time.perf_counter()
+        result = component.transcribe(
+            audio_data=audio_data,
+            stream_id=stream_id,
+            sequence_number=sequence_number,
+            start_time_ms=start_time_ms,
+            end_time_ms=end_time_ms,
+            sample_rate_hz=sample_rate_hz,
+            domain=domain,
+            language=language,
+        )
+        latency_ms = (time.perf_counter() - start) * 1000
+        record_asr_profile_fragment(profile)
+
+        with self._lock:
+            current = self._controller.profile
+            switched = self._controller.observe(latency_ms, self._queue_depth())
+        if switched is not None:
+            logger.info(
+                f"ASR ladder {stream_id}: {current} -> {switched} "
+                f"(latency {latency_ms:.0f}ms, fragment {sequence_number})"
+            )
+            record_asr_profile_switch(current, switched)
+        return result
+
+    def shutdown(self) -> None:
+        """Shut down every profile's component."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            components = list(self._components.values())
+            profile = self._controller.profile
+        record_asr_profile_switch(profile, None)
+        for component in components:
+            component.shutdown()
@@ -0,0 +1,295 @@
+"""Fragment Audio Decoders for Full STS Service.
+
+Decodes incoming fragment audio (M4A/MP4 or ADTS AAC) to float32 PCM at the
+sample rate and channel count the ASR stage expects.
+
+Backends:
+- pyav: In-process decode with PyAV (libav) straight from a BytesIO - no
+  temp file and no subprocess per fragment
+- ffmpeg: Writes a temp file and pipes PCM out of the ffmpeg CLI (the
+  original path, kept as fallback)
+
+Selected with AUDIO_DECODER_BACKEND (auto, pyav, ffmpeg). "auto" uses PyAV
+when it is installed and falls back to ffmpeg per fragment if PyAV cannot
+decode it.
+
+Raw PCM fragments (pcm_s16le, pcm_f32le) skip both backends: they are
+converted with NumPy and only downmixed/resampled when the stream's rate or
+layout differs from what ASR expects.
+"""
+
+import io
+import logging
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from sts_service.asr.preprocessing import resample_audio
+
+from .config import AudioCodecConfig
+
+logger = logging.getLogger(__name__)
+
+try:
+    import av
+
+    PYAV_AVAILABLE = True
+except ImportError:
+    av = None
+    PYAV_AVAILABLE = False
+
+# Backend names accepted by AUDIO_DECODER_BACKEND
+DECODER_BACKENDS: tuple[str, ...] = ("auto", "pyav", "ffmpeg")
+
+# Fragment format identifier -> libav demuxer name (None lets libav probe).
+# Media-service workers have always sent raw ADTS labelled "m4a", so m4a/mp4
+# are probed rather than forced through the mp4 demuxer.
+_AV_DEMUXERS: dict[str, Optional[str]] = {
+    "m4a": None,
+    "mp4": None,
+    "aac": "aac",
+    "adts": "aac",
+}
+
+# Raw PCM fragment formats -> sample dtype and full-scale value
+_PCM_FORMATS: dict[str, tuple[str, float]] = {
+    "pcm_s16le": ("<i2", 32768.0),
+    "pcm_f32le": ("<f4", 1.0),
+}
+
+# Fragment formats a stream may declare as format in stream:init
+INPUT_FORMATS: tuple[str, ...] = (*_AV_DEMUXERS, *_PCM_FORMATS)
+
+
+class AudioDecoder(ABC):
+    """Base class for fragment audio decoders."""
+
+    name: str = "base"
+
+    def decode(
+        self,
+        audio_bytes: bytes,
+        input_format: str,
+        sample_rate: int,
+        channels: int,
+        source_sample_rate: Optional[int] = None,
+        source_channels: Optional[int] = None,
+    ) -> np.ndarray:
+        """Decode encoded audio to interleaved float32 PCM.
+
+        Args:
+            audio_bytes: Encoded audio (M4A/AAC container or raw PCM)
+            input_format: Format identifier (m4a, aac, pcm_s16le, pcm_f32le, etc.)
+            sample_rate: Target sample rate
+            channels: Target number of channels
+            source_sample_rate: Sample rate of raw PCM input (default: target rate)
+            source_channels: Channel count of raw PCM input (default: target channels)
+
+        Returns:
+            1-D float32 array of interleaved samples
+
+        Raises:
+            RuntimeError: If decoding fails
+        """
+        if input_format in _PCM_FORMATS:
+            return _convert_pcm(
+                audio_bytes,
+                input_format,
+                source_sample_rate or sample_rate,
+                source_channels or channels,
+                sample_rate,
+                channels,
+            )
+        return self._decode(audio_bytes, input_format, sample_rate, channels)
+
+    @abstractmethod
+    def _decode(
+        self,
+        audio_bytes: bytes,
+        input_format: str,
+        sample_rate: int,
+        channels: int,
+    ) -> np.ndarray:
+        """Subclasses must decode a container/codec format to float32 PCM."""
+        pass
+
+
+def _convert_pcm(
+    audio_bytes: bytes,
+    input_format: str,
+    source_sample_rate: int,
+    source_channels: int,
+    sample_rate: int,
+    channels: int,
+) -> np.ndarray:
+    """Convert raw PCM to float32 at the target rate and channel count."""
+    dtype, full_scale = _PCM_FORMATS[input_format]
+    raw = np.frombuffer(audio_bytes, dtype=dtype)
+    unchanged = source_sample_rate == sample_rate and source_channels == channels
+    if raw.dtype == np.float32 and unchanged:
+        return raw.astype(np.float32, copy=False)
+
+    samples = raw.astype(np.float32)
+    if full_scale != 1.0:
+        samples *= 1.0 / full_scale
+
+    if source_channels != channels:
+        whole_frames = len(samples) - len(samples) % source_channels
+        frames = samples[:whole_frames].reshape(-1, source_channels)
+        mono = frames.mean(axis=1, dtype=np.float32)
+        samples = mono if channels == 1 else np.repeat(mono, channels)
+
+    if source_sample_rate != sample_rate:
+        if channels == 1:
+            samples = resample_audio(samples, source_sample_rate, sample_rate)
+        else:
+            planes = samples.reshape(-1, channels).T
+            samples = np.stack(
+                [resample_audio(p, source_sample_rate, sample_rate) for p in planes], axis=1
+            ).reshape(-1)
+
+    return samples.astype(np.float32, copy=False)
+
+
+class FFmpegAudioDecoder(AudioDecoder):
+    """Decode via the ffmpeg CLI (temp file in, PCM f32le on stdout)."""
+
+    name = "ffmpeg"
+
+    def _decode(
+        self,
+        audio_bytes: bytes,
+        input_format: str,
+        sample_rate: int,
+        channels: int,
+    ) -> np.ndarray:
+        with tempfile.NamedTemporaryFile(suffix=f".{input_format}", delete=False) as input_file:
+            input_path = Path(input_file.name)
+            input_file.write(audio_bytes)
+
+        try:
+            cmd = [
+                "ffmpeg",
+                "-y",
+                "-i",
+                str(input_path),
+                "-ar",
+                str(sample_rate),
+                "-ac",
+                str(channels),
+                "-f",
+                "f32le",
+                "-acodec",
+                "pcm_f32le",
+                "pipe:1",
+            ]
+            result = subprocess.run(cmd, capture_output=True, check=False)
+
+            if result.returncode != 0:
+                error_msg = result.stderr.decode() if result.stderr else "Unknown ffmpeg error"
+                raise RuntimeError(f"Failed to decode {input_format} to PCM: {error_msg}")
+
+            return np.frombuffer(result.stdout, dtype=np.float32)
+
+        finally:
+            if input_path.exists():
+                input_path.unlink()
+
+
+class PyAVAudioDecoder(AudioDecoder):
+    """Decode in-process with PyAV from an in-memory buffer.
+
+    Frames are resampled to packed float32 at the target rate/layout by
+    libswresample as they are decoded.
+    """
+
+    name = "pyav"
+
+    def __init__(self, fallback: Optional[AudioDecoder] = None):
+        """Initialize the PyAV decoder.
+
+        Args:
+            fallback: Decoder to use when PyAV cannot decode a fragment
+
+        Raises:
+            ImportError: If PyAV is not installed
+        """
+        if not PYAV_AVAILABLE:
+            raise ImportError("PyAV package not installed. Run: pip install av")
+        self._fallback = fallback
+
+    def _decode(
+        self,
+        audio_bytes: bytes,
+        input_format: str,
+        sample_rate: int,
+        channels: int,
+    ) -> np.ndarray:
+        try:
+            return self._decode_with_av(audio_bytes, input_format, sample_rate, channels)
+        except (av.error.FFmpegError, IndexError) as e:
+            if self._fallback is None:
+                raise RuntimeError(f"Failed to decode {input_format} to PCM: {e}") from e
+            logger.warning(
+                f"PyAV decode failed, falling back to {self._fallback.name}: "
+                f"format={input_format}, error={e}"
+            )
+            return self._fallback.decode(audio_bytes, input_format, sample_rate, channels)
+
+    @staticmethod
+    def _decode_with_av(
+        audio_bytes: bytes,
+        input_format: str,
+        sample_rate: int,
+        channels: int,
+    ) -> np.ndarray:
+        layout = "mono" if channels == 1 else "stereo"
+        resampler = av.AudioResampler(format="flt", layout=layout, rate=sample_rate)
+        chunks: list[np.ndarray] = []
+
+        with av.open(io.BytesIO(audio_bytes), format=_AV_DEMUXERS.get(input_format)) as container:
+            stream = container.streams.audio[0]
+            for frame in container.decode(stream):
+                for out in resampler.resample(frame):
+                    chunks.append(out.to_ndarray().reshape(-1))
+            for out in resampler.resample(None):
+                chunks.append(out.to_ndarray().reshape(-1))
+
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
+
+
+def create_audio_decoder(backend: Optional[str] = None) -> AudioDecoder:
+    """Create a fragment audio decoder.
+
+    Args:
+        backend: auto, pyav or ffmpeg (defaults to AUDIO_DECODER_BACKEND)
+
+    Returns:
+        AudioDecoder instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If backend is "pyav" and PyAV is not installed
+    """
+    backend = (backend or AudioCodecConfig().decoder_backend).lower()
+    if backend not in DECODER_BACKENDS:
+        raise ValueError(
+            f"Unknown audio decoder backend: {backend} (expected one of {DECODER_BACKENDS})"
+        )
+
+    if backend == "ffmpeg":
+        return FFmpegAudioDecoder()
+    if backend == "pyav":
+        return PyAVAudioDecoder()
+
+    # auto: in-process when available, ffmpeg otherwise (and as per-fragment fallback)
+    if PYAV_AVAILABLE:
+        return PyAVAudioDecoder(fallback=FFmpegAudioDecoder())
+    logger.info("PyAV not installed, using ffmpeg audio decoder")
+    return FFmpegAudioDecoder()
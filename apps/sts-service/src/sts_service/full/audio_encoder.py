@@ -0,0 +1,105 @@
+"""Shared AAC Encoder for Full STS Service.
+
+One process-wide AACEncoder (sts_service.tts.encoding) used for every
+PCM -> M4A conversion: dubbed and silence fragments in PipelineCoordinator
+and audio artifacts in ArtifactLogger. The backend is probed once, and each
+encode's latency is exported as sts_audio_encode_seconds.
+
+Configured with AUDIO_ENCODER_BACKEND (auto, pyav, ffmpeg) and
+AUDIO_ENCODER_BITRATE_KBPS. Fragments are returned as M4A by default or as
+ADTS for streams that negotiated output_format="adts" in stream:init.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from sts_service.audio_buffer import PCMData
+from sts_service.tts.encoding import AACEncoder
+from sts_service.tts.models import AudioFormat
+
+from .config import AudioCodecConfig
+from .observability.metrics import record_audio_encode
+
+logger = logging.getLogger(__name__)
+
+# Dubbed audio formats a stream may request as output_format in stream:init
+OUTPUT_FORMATS: tuple[str, ...] = ("m4a", "adts")
+
+# Process-wide encoder shared by the pipeline and artifact logger
+_encoder: Optional[AACEncoder] = None
+_encoder_lock = threading.Lock()
+
+
+def get_audio_encoder() -> AACEncoder:
+    """Get the process-wide AAC encoder, creating it on first use.
+
+    Safe to call from stage worker threads.
+
+    Returns:
+        The shared AACEncoder instance.
+
+    Raises:
+        EncodingError: If the configured backend is not available.
+    """
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                config = AudioCodecConfig()
+                _encoder = AACEncoder(
+                    backend=config.encoder_backend,
+                    bitrate_kbps=config.encoder_bitrate_kbps,
+                )
+    return _encoder
+
+
+def set_audio_encoder(encoder: Optional[AACEncoder]) -> None:
+    """Set the process-wide AAC encoder (for testing).
+
+    Args:
+        encoder: The encoder to use, or None to reset.
+    """
+    global _encoder
+    _encoder = encoder
+
+
+def encode_to_m4a(
+    pcm_data: PCMData,
+    sample_rate_hz: int,
+    channels: int,
+    input_format: AudioFormat = AudioFormat.PCM_F32LE,
+    bitrate_kbps: Optional[int] = None,
+    container: str = "m4a",
+) -> bytes:
+    """Encode PCM to M4A/AAC with the shared encoder and record its latency.
+
+    Args:
+        pcm_data: Raw interleaved PCM audio bytes or AudioBuffer
+        sample_rate_hz: Sample rate in Hz
+        channels: Number of audio channels (1=mono, 2=stereo)
+        input_format: PCM format of input data (PCM_F32LE or PCM_S16LE)
+        bitrate_kbps: Target bitrate in kbps (default: AUDIO_ENCODER_BITRATE_KBPS)
+        container: Output container, one of OUTPUT_FORMATS
+
+    Returns:
+        AAC encoded audio bytes in the requested container
+
+    Raises:
+        EncodingError: If encoding fails
+    """
+    encoder = get_audio_encoder()
+
+    start_time = time.perf_counter()
+    result = encoder.encode(
+        pcm_data=pcm_data,
+        sample_rate_hz=sample_rate_hz,
+        channels=channels,
+        input_format=input_format,
+        bitrate_kbps=bitrate_kbps,
+        container=container,
+    )
+    record_audio_encode(encoder.backend, (time.perf_counter() - start_time) * 1000)
+
+    return result.audio_data
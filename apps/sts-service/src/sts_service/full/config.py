@@ -155,6 +155,378 @@ class PipelineConfig:
             )
 
 
+@dataclass(frozen=True)
+class StageExecutorConfig:
+    """Thread pool sizing for blocking pipeline stages.
+
+    Each stage gets its own bounded pool so a slow stage (e.g. ASR on CPU)
+    cannot starve the others, and none of them run on the event loop.
+    """
+
+    decode_workers: int = field(
+        default_factory=lambda: int(os.getenv("STAGE_DECODE_WORKERS", "2"))
+    )
+    asr_workers: int = field(default_factory=lambda: int(os.getenv("STAGE_ASR_WORKERS", "2")))
+    translation_workers: int = field(
+        default_factory=lambda: int(os.getenv("STAGE_TRANSLATION_WORKERS", "4"))
+    )
+    tts_workers: int = field(default_factory=lambda: int(os.getenv("STAGE_TTS_WORKERS", "2")))
+    encode_workers: int = field(
+        default_factory=lambda: int(os.getenv("STAGE_ENCODE_WORKERS", "2"))
+    )
+    artifact_workers: int = field(
+        default_factory=lambda: int(os.getenv("STAGE_ARTIFACT_WORKERS", "1"))
+    )
+
+    def workers_for(self, stage: str) -> int:
+        """Return the configured pool size for a stage.
+
+        Args:
+            stage: Stage name (decode, asr, translation, tts, encode, artifacts).
+
+        Returns:
+            Number of worker threads for the stage.
+
+        Raises:
+            ValueError: If the stage is unknown.
+        """
+        sizes = {
+            "decode": self.decode_workers,
+            "asr": self.asr_workers,
+            "translation": self.translation_workers,
+            "tts": self.tts_workers,
+            "encode": self.encode_workers,
+            "artifacts": self.artifact_workers,
+        }
+        if stage not in sizes:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        return sizes[stage]
+
+    def validate(self) -> None:
+        """Validate pool sizes.
+
+        Raises:
+            ValueError: If any pool size is less than 1.
+        """
+        for stage in ("decode", "asr", "translation", "tts", "encode", "artifacts"):
+            if self.workers_for(stage) < 1:
+                raise ValueError(
+                    f"Stage worker count for '{stage}' must be >= 1, "
+                    f"got {self.workers_for(stage)}"
+                )
+
+
+@dataclass(frozen=True)
+class StagedPipelineConfig:
+    """Per-stream stage pipelining of consecutive fragments.
+
+    When enabled, each stream gets one bounded queue and worker set per
+    pipeline stage, so fragment N+1 can be in ASR while fragment N is in TTS.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("STAGED_PIPELINE_ENABLED", "true").lower() == "true"
+    )
+    queue_size: int = field(
+        default_factory=lambda: int(os.getenv("STAGED_PIPELINE_QUEUE_SIZE", "4"))
+    )
+    workers_per_stage: int = field(
+        default_factory=lambda: int(os.getenv("STAGED_PIPELINE_WORKERS_PER_STAGE", "1"))
+    )
+
+    def validate(self) -> None:
+        """Validate queue and worker sizing.
+
+        Raises:
+            ValueError: If queue_size or workers_per_stage is less than 1.
+        """
+        if self.queue_size < 1:
+            raise ValueError(f"STAGED_PIPELINE_QUEUE_SIZE must be >= 1, got {self.queue_size}")
+        if self.workers_per_stage < 1:
+            raise ValueError(
+                f"STAGED_PIPELINE_WORKERS_PER_STAGE must be >= 1, got {self.workers_per_stage}"
+            )
+
+
+@dataclass(frozen=True)
+class AudioCodecConfig:
+    """Audio decode/encode backends for fragment ingest and output."""
+
+    # Fragment decoder: auto (PyAV if installed, else ffmpeg), pyav, ffmpeg
+    decoder_backend: str = field(
+        default_factory=lambda: os.getenv("AUDIO_DECODER_BACKEND", "auto").lower()
+    )
+
+    # Output encoder: auto (PyAV in-memory if installed, else ffmpeg), pyav, ffmpeg
+    encoder_backend: str = field(
+        default_factory=lambda: os.getenv("AUDIO_ENCODER_BACKEND", "auto").lower()
+    )
+    encoder_bitrate_kbps: int = field(
+        default_factory=lambda: int(os.getenv("AUDIO_ENCODER_BITRATE_KBPS", "128"))
+    )
+
+    # Encoded silence payloads kept for silent fragments (distinct durations/formats)
+    silence_cache_max_entries: int = field(
+        default_factory=lambda: int(os.getenv("SILENCE_CACHE_MAX_ENTRIES", "32"))
+    )
+
+    def validate(self) -> None:
+        """Validate backend names.
+
+        Raises:
+            ValueError: If a backend is unknown or a size/bitrate is not positive.
+        """
+        if self.decoder_backend not in ("auto", "pyav", "ffmpeg"):
+            raise ValueError(
+                "AUDIO_DECODER_BACKEND must be one of auto, pyav, ffmpeg, "
+                f"got {self.decoder_backend}"
+            )
+        if self.encoder_backend not in ("auto", "pyav", "ffmpeg"):
+            raise ValueError(
+                "AUDIO_ENCODER_BACKEND must be one of auto, pyav, ffmpeg, "
+                f"got {self.encoder_backend}"
+            )
+        if self.encoder_bitrate_kbps <= 0:
+            raise ValueError(
+                f"AUDIO_ENCODER_BITRATE_KBPS must be > 0, got {self.encoder_bitrate_kbps}"
+            )
+        if self.silence_cache_max_entries < 1:
+            raise ValueError(
+                f"SILENCE_CACHE_MAX_ENTRIES must be >= 1, got {self.silence_cache_max_entries}"
+            )
+
+
+@dataclass(frozen=True)
+class TranslationCacheConfig:
+    """Translation result cache shared by all sessions.
+
+    Repeated phrases (same normalized text, language pair and policies) are
+    served from an in-memory LRU, optionally backed by a SQLite file that
+    survives restarts.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("TRANSLATION_CACHE_ENABLED", "true").lower() == "true"
+    )
+    max_entries: int = field(
+        default_factory=lambda: int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "2048"))
+    )
+
+    # Entry lifetime in seconds (0 = never expire)
+    ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400"))
+    )
+
+    # SQLite file for the persistent tier (empty = memory only)
+    db_path: str = field(default_factory=lambda: os.getenv("TRANSLATION_CACHE_DB_PATH", ""))
+
+    def validate(self) -> None:
+        """Validate cache sizing.
+
+        Raises:
+            ValueError: If max_entries is less than 1 or ttl_seconds is negative.
+        """
+        if self.max_entries < 1:
+            raise ValueError(f"TRANSLATION_CACHE_MAX_ENTRIES must be >= 1, got {self.max_entries}")
+        if self.ttl_seconds < 0:
+            raise ValueError(f"TRANSLATION_CACHE_TTL_SECONDS must be >= 0, got {self.ttl_seconds}")
+
+
+@dataclass(frozen=True)
+class TTSCacheConfig:
+    """Synthesized-audio cache shared by all sessions.
+
+    Raw PCM from the TTS provider (before duration matching) is stored on
+    disk, content-addressed by text, voice and output format, and evicted
+    least-recently-used once the byte budget is exceeded.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+    )
+    cache_dir: str = field(
+        default_factory=lambda: os.getenv("TTS_CACHE_DIR", "/tmp/sts-tts-cache")
+    )
+    max_bytes: int = field(
+        default_factory=lambda: int(os.getenv("TTS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+    )
+
+    def validate(self) -> None:
+        """Validate cache sizing.
+
+        Raises:
+            ValueError: If max_bytes is not positive or cache_dir is empty.
+        """
+        if self.max_bytes <= 0:
+            raise ValueError(f"TTS_CACHE_MAX_BYTES must be > 0, got {self.max_bytes}")
+        if not self.cache_dir:
+            raise ValueError("TTS_CACHE_DIR must not be empty")
+
+
+@dataclass(frozen=True)
+class SpeechGateConfig:
+    """Speech/non-speech pre-gate run before ASR.
+
+    Fragments classified as non-speech (silence, crowd noise, music beds)
+    skip ASR, translation and TTS and take the silence path. The energy
+    backend is a framewise RMS + spectral flatness heuristic; the silero
+    backend runs Silero VAD (ONNX, bundled with faster-whisper).
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("SPEECH_GATE_ENABLED", "true").lower() == "true"
+    )
+    backend: str = field(
+        default_factory=lambda: os.getenv("SPEECH_GATE_BACKEND", "energy").lower()
+    )
+    min_rms_dbfs: float = field(
+        default_factory=lambda: float(os.getenv("SPEECH_GATE_MIN_RMS_DBFS", "-50"))
+    )
+    max_flatness: float = field(
+        default_factory=lambda: float(os.getenv("SPEECH_GATE_MAX_FLATNESS", "0.3"))
+    )
+    min_speech_ms: int = field(
+        default_factory=lambda: int(os.getenv("SPEECH_GATE_MIN_SPEECH_MS", "250"))
+    )
+
+    def validate(self) -> None:
+        """Validate gate settings.
+
+        Raises:
+            ValueError: If the backend is unknown or a threshold is out of range.
+        """
+        if self.backend not in ("energy", "silero"):
+            raise ValueError(
+                f"SPEECH_GATE_BACKEND must be 'energy' or 'silero', got {self.backend!r}"
+            )
+        if not 0.0 < self.max_flatness <= 1.0:
+            raise ValueError(f"SPEECH_GATE_MAX_FLATNESS must be in (0, 1], got {self.max_flatness}")
+        if self.min_rms_dbfs >= 0:
+            raise ValueError(f"SPEECH_GATE_MIN_RMS_DBFS must be < 0, got {self.min_rms_dbfs}")
+        if self.min_speech_ms < 0:
+            raise ValueError(f"SPEECH_GATE_MIN_SPEECH_MS must be >= 0, got {self.min_speech_ms}")
+
+
+@dataclass(frozen=True)
+class ASRLadderConfig:
+    """Load-adaptive ASR quality ladder.
+
+    Each session switches per fragment between the fast, balanced and
+    accurate profiles based on ASR latency relative to the session's
+    timeout_ms and the ASR stage queue depth. An empty profile model uses
+    ASR_MODEL_SIZE.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("ASR_LADDER_ENABLED", "false").lower() == "true"
+    )
+    start_profile: str = field(
+        default_factory=lambda: os.getenv("ASR_LADDER_START_PROFILE", "accurate").lower()
+    )
+    fast_model: str = field(default_factory=lambda: os.getenv("ASR_LADDER_FAST_MODEL", "tiny"))
+    balanced_model: str = field(default_factory=lambda: os.getenv("ASR_LADDER_BALANCED_MODEL", ""))
+    accurate_model: str = field(default_factory=lambda: os.getenv("ASR_LADDER_ACCURATE_MODEL", ""))
+    high_watermark: float = field(
+        default_factory=lambda: float(os.getenv("ASR_LADDER_HIGH_WATERMARK", "0.4"))
+    )
+    low_watermark: float = field(
+        default_factory=lambda: float(os.getenv("ASR_LADDER_LOW_WATERMARK", "0.15"))
+    )
+    queue_high: int = field(default_factory=lambda: int(os.getenv("ASR_LADDER_QUEUE_HIGH", "4")))
+    step_down_fragments: int = field(
+        default_factory=lambda: int(os.getenv("ASR_LADDER_STEP_DOWN_FRAGMENTS", "2"))
+    )
+    min_dwell_fragments: int = field(
+        default_factory=lambda: int(os.getenv("ASR_LADDER_MIN_DWELL_FRAGMENTS", "5"))
+    )
+
+    def validate(self) -> None:
+        """Validate ladder settings.
+
+        Raises:
+            ValueError: If the start profile is unknown or thresholds are inconsistent.
+        """
+        if self.start_profile not in ("fast", "balanced", "accurate"):
+            raise ValueError(
+                "ASR_LADDER_START_PROFILE must be 'fast', 'balanced' or 'accurate', "
+                f"got {self.start_profile!r}"
+            )
+        if not 0.0 < self.low_watermark < self.high_watermark:
+            raise ValueError(
+                "ASR_LADDER_LOW_WATERMARK must be > 0 and below ASR_LADDER_HIGH_WATERMARK, "
+                f"got {self.low_watermark} / {self.high_watermark}"
+            )
+        if self.queue_high < 1:
+            raise ValueError(f"ASR_LADDER_QUEUE_HIGH must be >= 1, got {self.queue_high}")
+        if self.step_down_fragments < 1:
+            raise ValueError(
+                f"ASR_LADDER_STEP_DOWN_FRAGMENTS must be >= 1, got {self.step_down_fragments}"
+            )
+        if self.min_dwell_fragments < 1:
+            raise ValueError(
+                f"ASR_LADDER_MIN_DWELL_FRAGMENTS must be >= 1, got {self.min_dwell_fragments}"
+            )
+
+
+def _default_warmup_asr_models() -> str:
+    """ASR_MODEL_SIZE plus the ASR ladder's profile models when the ladder is enabled."""
+    sizes = [os.getenv("ASR_MODEL_SIZE", "tiny")]
+    ladder = ASRLadderConfig()
+    if ladder.enabled:
+        sizes += [ladder.fast_model, ladder.balanced_model, ladder.accurate_model]
+    return ",".join(dict.fromkeys(size for size in sizes if size))
+
+
+@dataclass(frozen=True)
+class WarmupConfig:
+    """Model warm-up run at startup, before /ready reports ready.
+
+    Lists are comma-separated. Language pairs are "source-target" codes.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    )
+    asr_models: str = field(
+        default_factory=lambda: os.getenv("WARMUP_ASR_MODELS") or _default_warmup_asr_models()
+    )
+    tts_voices: str = field(default_factory=lambda: os.getenv("WARMUP_TTS_VOICES", ""))
+    language_pairs: str = field(default_factory=lambda: os.getenv("WARMUP_LANGUAGE_PAIRS", "en-es"))
+
+    @property
+    def asr_model_sizes(self) -> list[str]:
+        """Whisper model sizes to preload."""
+        return [size.strip() for size in self.asr_models.split(",") if size.strip()]
+
+    @property
+    def tts_voice_profiles(self) -> list[str]:
+        """voices.json profiles to preload for each target language."""
+        return [voice.strip() for voice in self.tts_voices.split(",") if voice.strip()]
+
+    @property
+    def language_pair_list(self) -> list[tuple[str, str]]:
+        """(source, target) language pairs to warm up."""
+        pairs = []
+        for pair in self.language_pairs.split(","):
+            if pair.strip():
+                source, _, target = pair.strip().partition("-")
+                pairs.append((source, target))
+        return pairs
+
+    def validate(self) -> None:
+        """Validate language pairs.
+
+        Raises:
+            ValueError: If a language pair is not "source-target".
+        """
+        for source, target in self.language_pair_list:
+            if not source or not target:
+                raise ValueError(
+                    f"WARMUP_LANGUAGE_PAIRS entries must be 'source-target', "
+                    f"got {self.language_pairs!r}"
+                )
+
+
 @dataclass(frozen=True)
 class FullSTSConfig:
     """Complete configuration for Full STS Service.
@@ -165,6 +537,14 @@ class FullSTSConfig:
     server: ServerConfig
     observability: ObservabilityConfig
     pipeline: PipelineConfig
+    executor: StageExecutorConfig = field(default_factory=StageExecutorConfig)
+    staging: StagedPipelineConfig = field(default_factory=StagedPipelineConfig)
+    audio_codec: AudioCodecConfig = field(default_factory=AudioCodecConfig)
+    translation_cache: TranslationCacheConfig = field(default_factory=TranslationCacheConfig)
+    tts_cache: TTSCacheConfig = field(default_factory=TTSCacheConfig)
+    speech_gate: SpeechGateConfig = field(default_factory=SpeechGateConfig)
+    asr_ladder: ASRLadderConfig = field(default_factory=ASRLadderConfig)
+    warmup: WarmupConfig = field(default_factory=WarmupConfig)
 
     @classmethod
     def from_env(cls) -> "FullSTSConfig":
@@ -180,10 +560,26 @@ class FullSTSConfig:
             server=ServerConfig(),
             observability=ObservabilityConfig(),
             pipeline=PipelineConfig(),
+            executor=StageExecutorConfig(),
+            staging=StagedPipelineConfig(),
+            audio_codec=AudioCodecConfig(),
+            translation_cache=TranslationCacheConfig(),
+            tts_cache=TTSCacheConfig(),
+            speech_gate=SpeechGateConfig(),
+            asr_ladder=ASRLadderConfig(),
+            warmup=WarmupConfig(),
         )
 
         # Validate pipeline configuration (required fields)
         config.pipeline.validate()
+        config.executor.validate()
+        config.staging.validate()
+        config.audio_codec.validate()
+        config.translation_cache.validate()
+        config.tts_cache.validate()
+        config.speech_gate.validate()
+        config.asr_ladder.validate()
+        config.warmup.validate()
 
         return config
 
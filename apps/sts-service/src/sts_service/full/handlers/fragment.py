@@ -7,11 +7,12 @@ as defined in spec 021.
 import asyncio
 import logging
 import time
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import ValidationError
 
 from sts_service.full.backpressure_tracker import BackpressureTracker
+from sts_service.full.config import StagedPipelineConfig
 from sts_service.full.models.asset import AssetStatus
 from sts_service.full.models.error import ErrorResponse
 from sts_service.full.models.fragment import (
@@ -19,11 +20,14 @@ from sts_service.full.models.fragment import (
     FragmentAck,
     FragmentData,
     FragmentResult,
+    ProcessingError,
     ProcessingStatus,
 )
 from sts_service.full.models.stream import StreamState
 from sts_service.full.observability.metrics import decrement_inflight, increment_inflight
 from sts_service.full.session import SessionStore, StreamSession
+from sts_service.full.staged_pipeline import StagedFragmentPipeline
+from sts_service.tracing import TraceLevel, get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -124,15 +128,34 @@ async def handle_fragment_data(
                 )
 
         # Process fragment asynchronously
-        asyncio.create_task(
-            _process_fragment_async(
-                sio=sio,
-                sid=sid,
-                fragment_data=fragment_data,
-                session=session,
-                backpressure_tracker=backpressure_tracker,
+        fragment_pipeline = _get_fragment_pipeline(sio, sid, session, backpressure_tracker)
+        if fragment_pipeline is not None:
+            # Stage-pipelined: overlaps with neighbouring fragments of this stream
+            try:
+                await fragment_pipeline.submit(fragment_data)
+            except Exception as e:
+                # The fragment is already acked and counted in-flight; emit a
+                # failed result for its sequence number so the counters are
+                # released and later fragments are not held back.
+                logger.exception(f"Error submitting fragment {fragment_data.fragment_id}: {e}")
+                await _emit_in_order(
+                    sio=sio,
+                    sid=sid,
+                    sequence_number=fragment_data.sequence_number,
+                    result=_failed_result(fragment_data, e),
+                    session=session,
+                    backpressure_tracker=backpressure_tracker,
+                )
+        else:
+            asyncio.create_task(
+                _process_fragment_async(
+                    sio=sio,
+                    sid=sid,
+                    fragment_data=fragment_data,
+                    session=session,
+                    backpressure_tracker=backpressure_tracker,
+                )
             )
-        )
 
         logger.debug(
             f"Fragment queued: fragment_id={fragment_data.fragment_id}, "
@@ -166,6 +189,104 @@ async def handle_fragment_data(
         await sio.emit("error", error.model_dump(), to=sid)
 
 
+def _get_fragment_pipeline(
+    sio: Any,
+    sid: str,
+    session: StreamSession,
+    backpressure_tracker: BackpressureTracker,
+) -> Optional[StagedFragmentPipeline]:
+    """Get the session's staged pipeline, creating it on first use.
+
+    Args:
+        sio: Socket.IO server instance.
+        sid: Socket.IO session ID.
+        session: The stream session.
+        backpressure_tracker: Backpressure tracker instance.
+
+    Returns:
+        The session's StagedFragmentPipeline, or None if staging is disabled
+        or the pipeline coordinator is not initialized.
+    """
+    if session.fragment_pipeline is not None:
+        return session.fragment_pipeline
+
+    config = StagedPipelineConfig()
+    if not config.enabled or session.pipeline_coordinator is None:
+        return None
+
+    async def on_result(fragment_data: FragmentData, result: FragmentResult) -> None:
+        await _emit_in_order(
+            sio=sio,
+            sid=sid,
+            sequence_number=fragment_data.sequence_number,
+            result=result,
+            session=session,
+            backpressure_tracker=backpressure_tracker,
+        )
+
+    session.fragment_pipeline = StagedFragmentPipeline(
+        coordinator=session.pipeline_coordinator,
+        session=session,
+        on_result=on_result,
+        config=config,
+    )
+    return session.fragment_pipeline
+
+
+def _failed_result(fragment_data: FragmentData, error: Exception) -> FragmentResult:
+    """Build a failed FragmentResult for a fragment that could not be processed.
+
+    Args:
+        fragment_data: The fragment that failed.
+        error: The exception raised while processing it.
+
+    Returns:
+        A FAILED FragmentResult carrying a retryable pipeline error.
+    """
+    return FragmentResult(
+        fragment_id=fragment_data.fragment_id,
+        stream_id=fragment_data.stream_id,
+        sequence_number=fragment_data.sequence_number,
+        status=ProcessingStatus.FAILED,
+        processing_time_ms=0,
+        error=ProcessingError(
+            stage="pipeline",
+            code="PROCESSING_ERROR",
+            message=str(error),
+            retryable=True,
+        ),
+    )
+
+
+async def _emit_in_order(
+    sio: Any,
+    sid: str,
+    sequence_number: int,
+    result: FragmentResult,
+    session: StreamSession,
+    backpressure_tracker: BackpressureTracker,
+) -> None:
+    """Buffer a processed fragment and emit every fragment now in order.
+
+    Args:
+        sio: Socket.IO server instance.
+        sid: Socket.IO session ID.
+        sequence_number: Sequence number of the processed fragment.
+        result: The processed fragment result.
+        session: The stream session.
+        backpressure_tracker: Backpressure tracker instance.
+    """
+    session.add_pending_fragment(sequence_number, result)
+    for frag_result in session.get_fragments_to_emit():
+        await emit_fragment_processed(
+            sio=sio,
+            sid=sid,
+            fragment_result=frag_result,
+            session=session,
+            backpressure_tracker=backpressure_tracker,
+        )
+
+
 async def _process_fragment_async(
     sio: Any,
     sid: str,
@@ -189,39 +310,21 @@ async def _process_fragment_async(
 
         result = await session.pipeline_coordinator.process_fragment(fragment_data, session)
 
-        # Add to pending fragments for in-order emission
-        session.add_pending_fragment(fragment_data.sequence_number, result)
-
-        # Emit fragments in order
-        fragments_to_emit = session.get_fragments_to_emit()
-        for frag_result in fragments_to_emit:
-            await emit_fragment_processed(
-                sio=sio,
-                sid=sid,
-                fragment_result=frag_result,
-                session=session,
-                backpressure_tracker=backpressure_tracker,
-            )
+        # Add to pending fragments and emit in order
+        await _emit_in_order(
+            sio=sio,
+            sid=sid,
+            sequence_number=fragment_data.sequence_number,
+            result=result,
+            session=session,
+            backpressure_tracker=backpressure_tracker,
+        )
 
     except Exception as e:
         logger.exception(f"Error processing fragment {fragment_data.fragment_id}: {e}")
 
         # Create error result
-        from sts_service.full.models.fragment import ProcessingError
-
-        error_result = FragmentResult(
-            fragment_id=fragment_data.fragment_id,
-            stream_id=fragment_data.stream_id,
-            sequence_number=fragment_data.sequence_number,
-            status=ProcessingStatus.FAILED,
-            processing_time_ms=0,
-            error=ProcessingError(
-                stage="pipeline",
-                code="PROCESSING_ERROR",
-                message=str(e),
-                retryable=True,
-            ),
-        )
+        error_result = _failed_result(fragment_data, e)
 
         # Add to pending and try to emit
         session.add_pending_fragment(fragment_data.sequence_number, error_result)
@@ -252,14 +355,7 @@ async def emit_fragment_processed(
         session: The stream session.
         backpressure_tracker: Backpressure tracker instance.
     """
-    # DEBUG: Log what we're about to send
     payload = fragment_result.model_dump()
-    logger.info(
-        f"EMIT fragment:processed: fragment_id={fragment_result.fragment_id}, "
-        f"status={fragment_result.status.value}, "
-        f"has_dubbed_audio={fragment_result.dubbed_audio is not None}, "
-        f"payload_status={payload.get('status')}"
-    )
 
     # Emit fragment:processed
     await sio.emit(
@@ -292,9 +388,13 @@ async def emit_fragment_processed(
                 f"Backpressure relieved: stream_id={session.stream_id}, inflight={session.inflight_count}"
             )
 
-    logger.debug(
-        f"Fragment processed: fragment_id={fragment_result.fragment_id}, "
-        f"status={fragment_result.status.value}, latency={fragment_result.processing_time_ms:.0f}ms"
+    get_tracer().for_fragment(session.stream_id, fragment_result.sequence_number).event(
+        TraceLevel.DEBUG,
+        "fragment_emitted",
+        fragment_id=fragment_result.fragment_id,
+        status=fragment_result.status.value,
+        has_dubbed_audio=fragment_result.dubbed_audio is not None,
+        processing_time_ms=fragment_result.processing_time_ms,
     )
 
 
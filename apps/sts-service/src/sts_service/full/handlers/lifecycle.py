@@ -69,8 +69,15 @@ async def handle_disconnect(
     )
 
     # Clean up resources
-    # Cancel any in-flight tasks if needed
-    # (In our implementation, tasks are background asyncio tasks that will complete)
+    # Stop stage workers; fragments still queued are dropped with the session
+    if session.fragment_pipeline is not None:
+        await session.fragment_pipeline.close()
+        session.fragment_pipeline = None
+
+    # Release the session's references to shared models
+    if session.pipeline_coordinator is not None:
+        session.pipeline_coordinator.shutdown()
+        session.pipeline_coordinator = None
 
     # Delete session
     await session_store.delete(sid)
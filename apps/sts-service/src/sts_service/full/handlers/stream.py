@@ -9,12 +9,16 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import ValidationError
 
 from sts_service.asr.factory import create_asr_component
-from sts_service.asr.models import ASRConfig
+from sts_service.asr.models import ASRConfig, ASRModelConfig, BatchingConfig
+from sts_service.full.asr_ladder import AdaptiveASRComponent
+from sts_service.full.audio_decoder import INPUT_FORMATS
+from sts_service.full.audio_encoder import OUTPUT_FORMATS
+from sts_service.full.config import ASRLadderConfig, TranslationCacheConfig, TTSCacheConfig
 from sts_service.full.models.error import ErrorResponse
 from sts_service.translation.factory import create_translation_component
 from sts_service.translation.models import TranslationConfig
@@ -34,6 +38,9 @@ from sts_service.full.observability.metrics import (
 )
 from sts_service.full.pipeline import PipelineCoordinator
 from sts_service.full.session import SessionStore, StreamSession
+from sts_service.full.translation_cache import CachedTranslationComponent
+from sts_service.full.speech_gate import create_speech_gate
+from sts_service.full.tts_cache import CachedTTSComponent
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,48 @@ def load_voices_config() -> dict[str, Any]:
         return json.load(f)
 
 
+def build_asr_config(model_size: Optional[str] = None) -> ASRConfig:
+    """Build the ASR configuration for a session from ASR_* environment variables.
+
+    Args:
+        model_size: Whisper model size (default: ASR_MODEL_SIZE)
+
+    Returns:
+        ASR configuration.
+    """
+    return ASRConfig(
+        model=ASRModelConfig(
+            model_size=model_size or os.getenv("ASR_MODEL_SIZE", "tiny"),
+            device=os.getenv("ASR_DEVICE", "cpu"),
+            compute_type="int8",
+            replicas=int(os.getenv("ASR_MODEL_REPLICAS", "1")),
+        ),
+        batching=BatchingConfig(
+            max_batch_size=int(os.getenv("ASR_BATCH_MAX_SIZE", "1")),
+            max_wait_ms=int(os.getenv("ASR_BATCH_MAX_WAIT_MS", "20")),
+        ),
+    )
+
+
+def build_tts_config(voice_config: dict[str, Any], target_language: str) -> TTSConfig:
+    """Build the TTS configuration for a voices.json profile.
+
+    Args:
+        voice_config: Voice profile entry from voices.json.
+        target_language: Synthesis language.
+
+    Returns:
+        TTS configuration.
+    """
+    return TTSConfig(
+        model_name=voice_config.get("model", "tts_models/en/vctk/vits"),
+        speaker=voice_config.get("speaker"),
+        language=target_language,
+        device=os.getenv("TTS_DEVICE", "cpu"),
+        model_replicas=int(os.getenv("TTS_MODEL_REPLICAS", "1")),
+    )
+
+
 async def handle_stream_init(
     sio: Any,
     sid: str,
@@ -94,6 +143,29 @@ async def handle_stream_init(
             await sio.emit("error", error.model_dump(), to=sid)
             return
 
+        # Reject audio formats this server cannot decode or produce
+        format_error = None
+        if payload.config.format not in INPUT_FORMATS:
+            format_error = (
+                f"Unsupported input format '{payload.config.format}' "
+                f"(supported: {', '.join(INPUT_FORMATS)})"
+            )
+        elif payload.config.output_format not in OUTPUT_FORMATS:
+            format_error = (
+                f"Unsupported output format '{payload.config.output_format}' "
+                f"(supported: {', '.join(OUTPUT_FORMATS)})"
+            )
+        if format_error:
+            error = ErrorResponse(
+                code="INVALID_CONFIG",
+                message=format_error,
+                severity="error",
+                retryable=False,
+                stream_id=payload.stream_id,
+            )
+            await sio.emit("error", error.model_dump(), to=sid)
+            return
+
         # Create session
         session = await session_store.create(
             sid=sid,
@@ -109,19 +181,22 @@ async def handle_stream_init(
         session.sample_rate_hz = payload.config.sample_rate_hz
         session.channels = payload.config.channels
         session.format = payload.config.format
+        session.output_format = payload.config.output_format
         session.domain_hints = payload.config.domain_hints
+        session.binary_audio = payload.config.binary_audio
         session.max_inflight = payload.max_inflight
         session.timeout_ms = payload.timeout_ms
 
         # Initialize pipeline components
         # Create ASR component
-        asr_config = ASRConfig(
-            model_size=os.getenv("ASR_MODEL_SIZE", "tiny"),
-            device=os.getenv("ASR_DEVICE", "cpu"),
-            compute_type="int8",
-            language=session.source_language,
-        )
-        asr = create_asr_component(config=asr_config, mock=False)
+        if ASRLadderConfig().enabled:
+            asr = AdaptiveASRComponent(
+                base_config=build_asr_config(),
+                timeout_ms=session.timeout_ms,
+                factory=lambda config: create_asr_component(config=config, mock=False),
+            )
+        else:
+            asr = create_asr_component(config=build_asr_config(), mock=False)
 
         # Create Translation component
         translation_config = TranslationConfig(
@@ -129,16 +204,16 @@ async def handle_stream_init(
             target_language=session.target_language,
         )
         translation = create_translation_component(config=translation_config, mock=False)
+        if TranslationCacheConfig().enabled:
+            translation = CachedTranslationComponent(translation)
 
         # Create TTS component (uses TTS_PROVIDER env var, defaults to elevenlabs)
-        voice_config_dict = voices_config[session.voice_profile]
-        tts_config = TTSConfig(
-            model_name=voice_config_dict.get("model", "tts_models/en/vctk/vits"),
-            speaker=voice_config_dict.get("speaker"),
-            language=session.target_language,
-            device=os.getenv("TTS_DEVICE", "cpu"),
+        tts_config = build_tts_config(
+            voices_config[session.voice_profile], session.target_language
         )
         tts = create_tts_component(config=tts_config)  # Provider from TTS_PROVIDER env var
+        if TTSCacheConfig().enabled:
+            tts = CachedTTSComponent(tts, voice_name=session.voice_profile)
 
         # Initialize pipeline coordinator with components
         enable_artifact_logging = os.getenv("ENABLE_ARTIFACT_LOGGING", "true").lower() == "true"
@@ -147,6 +222,7 @@ async def handle_stream_init(
             translation=translation,
             tts=tts,
             enable_artifact_logging=enable_artifact_logging,
+            speech_gate=create_speech_gate(),
         )
         session.pipeline_coordinator = pipeline
 
@@ -164,6 +240,9 @@ async def handle_stream_init(
             capabilities=ServerCapabilities(
                 batch_processing=False,
                 async_delivery=True,
+                binary_audio=session.binary_audio,
+                input_formats=list(INPUT_FORMATS),
+                output_formats=list(OUTPUT_FORMATS),
             ),
         )
 
@@ -351,6 +430,9 @@ async def _wait_for_inflight_fragments(session: StreamSession) -> None:
     Args:
         session: The stream session.
     """
+    if session.fragment_pipeline is not None:
+        await session.fragment_pipeline.drain()
+
     while session.inflight_count > 0:
         await asyncio.sleep(0.1)
 
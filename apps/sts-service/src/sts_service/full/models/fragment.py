@@ -8,10 +8,22 @@ Defines typed models for fragment events per spec 021:
 Matches contracts/fragment-schema.json.
 """
 
+import base64
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
+
+# Maximum decoded audio payload per fragment
+MAX_AUDIO_BYTES = 10 * 1024 * 1024
 
 
 class ProcessingStatus(str, Enum):
@@ -34,7 +46,10 @@ class AckStatus(str, Enum):
 class AudioData(BaseModel):
     """Audio data within a fragment.
 
-    Matches spec 021 fragment-schema.json audio_data definition.
+    Matches spec 021 fragment-schema.json audio_data definition. The audio
+    travels either base64-encoded in data_base64 or, on streams that
+    negotiated binary_audio, as raw bytes in data (a Socket.IO binary
+    attachment). Exactly one of the two is set.
     """
 
     format: str = Field(
@@ -56,21 +71,64 @@ class AudioData(BaseModel):
         le=60000,
         description="Fragment duration in milliseconds",
     )
-    data_base64: str = Field(
+    data_base64: str | None = Field(
+        default=None,
         min_length=1,
         description="Base64-encoded audio data",
     )
+    data: bytes | None = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_AUDIO_BYTES,
+        description="Raw audio data (binary_audio streams)",
+    )
 
     @field_validator("data_base64")
     @classmethod
-    def validate_base64_size(cls, v: str) -> str:
+    def validate_base64_size(cls, v: str | None) -> str | None:
         """Validate that base64 data doesn't exceed 10MB when decoded."""
         # Base64 encoding increases size by ~33%, so 10MB decoded = ~13.3MB encoded
-        max_base64_size = 10 * 1024 * 1024 * 4 // 3 + 4  # Account for padding
-        if len(v) > max_base64_size:
+        max_base64_size = MAX_AUDIO_BYTES * 4 // 3 + 4  # Account for padding
+        if v is not None and len(v) > max_base64_size:
             raise ValueError("Audio data exceeds 10MB limit")
         return v
 
+    @model_validator(mode="after")
+    def validate_one_encoding(self) -> "AudioData":
+        """Validate that exactly one of data and data_base64 is set."""
+        if (self.data is None) == (self.data_base64 is None):
+            raise ValueError("Exactly one of data and data_base64 is required")
+        return self
+
+    @model_serializer(mode="wrap")
+    def serialize_one_encoding(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Omit the unused encoding so base64 clients see the payload they always have."""
+        result = handler(self)
+        result.pop("data_base64" if self.data is not None else "data", None)
+        return result
+
+    @classmethod
+    def from_bytes(cls, audio: bytes, binary: bool = False, **fields: Any) -> "AudioData":
+        """Build AudioData from encoded audio bytes.
+
+        Args:
+            audio: Encoded audio bytes
+            binary: Send as a raw bytes attachment instead of base64
+            **fields: format, sample_rate_hz, channels, duration_ms
+
+        Returns:
+            AudioData carrying the audio in data or data_base64
+        """
+        if binary:
+            return cls(data=bytes(audio), **fields)
+        return cls(data_base64=base64.b64encode(audio).decode("utf-8"), **fields)
+
+    def audio_bytes(self) -> bytes:
+        """Encoded audio bytes, whichever way they were sent."""
+        if self.data is not None:
+            return self.data
+        return base64.b64decode(self.data_base64 or "")
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
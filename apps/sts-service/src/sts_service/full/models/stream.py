@@ -66,12 +66,22 @@ class StreamConfig(BaseModel):
     )
     format: str = Field(
         default="m4a",
-        description="Audio format identifier (m4a, pcm_s16le, wav)",
+        description=(
+            "Fragment audio format sent by the worker (m4a, aac/adts, pcm_s16le, pcm_f32le)"
+        ),
+    )
+    output_format: str = Field(
+        default="m4a",
+        description="Dubbed audio format returned to the worker (m4a, adts)",
     )
     domain_hints: list[str] | None = Field(
         default=None,
         description="Optional domain hints for vocabulary priming",
     )
+    binary_audio: bool = Field(
+        default=False,
+        description="Client sends and accepts fragment audio as raw bytes attachments",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -83,6 +93,7 @@ class StreamConfig(BaseModel):
                 "sample_rate_hz": 48000,
                 "channels": 1,
                 "format": "m4a",
+                "output_format": "m4a",
                 "domain_hints": ["sports", "general"],
             }
         }
@@ -138,12 +149,27 @@ class ServerCapabilities(BaseModel):
         default=True,
         description="Whether server delivers results asynchronously (out of order)",
     )
+    binary_audio: bool = Field(
+        default=False,
+        description="Whether fragment audio is exchanged as raw bytes attachments",
+    )
+    input_formats: list[str] = Field(
+        default_factory=list,
+        description="Fragment audio formats the server accepts as config.format",
+    )
+    output_formats: list[str] = Field(
+        default_factory=list,
+        description="Dubbed audio formats the server can return as config.output_format",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "batch_processing": False,
                 "async_delivery": True,
+                "binary_audio": False,
+                "input_formats": ["m4a", "mp4", "aac", "adts", "pcm_s16le", "pcm_f32le"],
+                "output_formats": ["m4a", "adts"],
             }
         }
     )
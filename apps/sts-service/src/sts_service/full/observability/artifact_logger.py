@@ -18,7 +18,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from sts_service.full.audio_encoder import encode_to_m4a
 from sts_service.full.models.asset import AudioAsset, TranscriptAsset, TranslationAsset
+from sts_service.tts.models import AudioFormat
 
 logger = logging.getLogger(__name__)
 
@@ -125,15 +127,13 @@ class ArtifactLogger:
             M4A encoded audio bytes
 
         Note:
-            Uses pydub and ffmpeg for encoding. If encoding fails, returns
-            raw PCM audio as fallback.
+            Uses the shared AAC encoder (same as the pipeline output). If
+            encoding fails, returns raw PCM audio as fallback.
 
             Handles both int16 (2 bytes/sample) and float32 (4 bytes/sample) input.
-            Float32 audio is converted to int16 before encoding.
         """
         try:
             import numpy as np
-            from pydub import AudioSegment
 
             # Detect if input is float32 (4 bytes per sample) vs int16 (2 bytes per sample)
             # Calculate expected sample count for each format
@@ -186,33 +186,16 @@ class ArtifactLogger:
                     is_float32 = False
 
             if is_float32:
-                logger.info(
-                    f"Converting float32 PCM ({len(pcm_audio)} bytes) to int16 for M4A encoding"
-                )
-                # Convert float32 to int16
-                float_array = np.frombuffer(pcm_audio, dtype=np.float32)
                 # Clip to valid range [-1.0, 1.0]
-                float_array = np.clip(float_array, -1.0, 1.0)
-                # Scale to int16 range [-32768, 32767]
-                int16_array = (float_array * 32767).astype(np.int16)
-                # Convert back to bytes
-                pcm_audio = int16_array.tobytes()
-                logger.info(f"Converted to int16 PCM ({len(pcm_audio)} bytes)")
-
-            # Create AudioSegment from raw PCM (now guaranteed to be int16)
-            audio = AudioSegment(
-                data=pcm_audio,
-                sample_width=2,  # 16-bit PCM
-                frame_rate=sample_rate,
+                float_array = np.clip(np.frombuffer(pcm_audio, dtype=np.float32), -1.0, 1.0)
+                pcm_audio = float_array.tobytes()
+
+            return encode_to_m4a(
+                pcm_data=pcm_audio,
+                sample_rate_hz=sample_rate,
                 channels=channels,
+                input_format=AudioFormat.PCM_F32LE if is_float32 else AudioFormat.PCM_S16LE,
             )
-
-            # Export as M4A (AAC codec)
-            from io import BytesIO
-
-            buffer = BytesIO()
-            audio.export(buffer, format="ipod", codec="aac")
-            return buffer.getvalue()
         except Exception as e:
             logger.warning(f"Failed to encode PCM to M4A: {e}. Saving raw PCM.")
             return pcm_audio
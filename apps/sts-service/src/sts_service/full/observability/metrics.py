@@ -5,6 +5,16 @@ Defines and exports metrics for monitoring:
 - Stage timings (ASR, Translation, TTS histograms)
 - Error counts (counter)
 - In-flight fragments (gauge)
+- Stage executor queue depth and wait time (gauge, histogram)
+- Audio encode latency (histogram)
+- Encoded silence cache hits/misses and size (counter, gauge)
+- Translation cache hits (memory/disk)/misses and size (counter, gauge)
+- TTS audio cache hits/misses and bytes on disk (counter, gauge)
+- Speech pre-gate decisions, skipped audio and avoided ASR time (counters)
+- ASR cross-stream batch size and queue wait (histograms)
+- ASR quality ladder profile residency and switches (counters, gauge)
+- Model registry loads, load time, evictions and resident size (counter, histogram, gauge)
+- Startup warm-up duration, total and per model (gauges)
 - Active sessions (gauge)
 - GPU utilization and memory (gauges)
 
@@ -12,10 +22,13 @@ Tasks: T119-T122, T126-T127
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 from prometheus_client import Counter, Gauge, Histogram
 
+from sts_service.asr.batching import BatchEvent
+from sts_service.model_registry import ModelEvent
+
 logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
@@ -63,6 +76,173 @@ sts_tts_duration_seconds = Histogram(
     buckets=(0.5, 1.0, 2.0, 4.0, 8.0, 16.0, float("inf")),
 )
 
+# -----------------------------------------------------------------------------
+# Stage Executor Metrics
+# -----------------------------------------------------------------------------
+
+sts_stage_queue_depth = Gauge(
+    "sts_stage_queue_depth",
+    "Number of stage calls waiting for a free worker thread",
+    labelnames=["stage"],
+)
+
+sts_stage_wait_seconds = Histogram(
+    "sts_stage_wait_seconds",
+    "Time a stage call waited for a worker thread in seconds",
+    labelnames=["stage"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 4.0, 8.0, float("inf")),
+)
+
+# -----------------------------------------------------------------------------
+# Audio Codec Metrics
+# -----------------------------------------------------------------------------
+
+sts_audio_encode_seconds = Histogram(
+    "sts_audio_encode_seconds",
+    "PCM to AAC/M4A encode latency in seconds",
+    labelnames=["backend"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf")),
+)
+
+sts_silence_cache_requests_total = Counter(
+    "sts_silence_cache_requests_total",
+    "Encoded silence cache lookups",
+    labelnames=["result"],
+)
+
+sts_silence_cache_entries = Gauge(
+    "sts_silence_cache_entries",
+    "Number of encoded silence payloads cached",
+)
+
+sts_translation_cache_requests_total = Counter(
+    "sts_translation_cache_requests_total",
+    "Translation cache lookups by result (hit_memory, hit_disk, miss)",
+    labelnames=["result"],
+)
+
+sts_translation_cache_entries = Gauge(
+    "sts_translation_cache_entries",
+    "Number of translations held in the in-memory cache tier",
+)
+
+sts_tts_cache_requests_total = Counter(
+    "sts_tts_cache_requests_total",
+    "Synthesized-audio cache lookups",
+    labelnames=["result"],
+)
+
+sts_tts_cache_bytes = Gauge(
+    "sts_tts_cache_bytes",
+    "Bytes of synthesized PCM held in the TTS cache",
+)
+
+# -----------------------------------------------------------------------------
+# Speech Gate Metrics
+# -----------------------------------------------------------------------------
+
+sts_speech_gate_decisions_total = Counter(
+    "sts_speech_gate_decisions_total",
+    "Fragments classified by the speech pre-gate",
+    labelnames=["backend", "result"],
+)
+
+sts_speech_gate_skipped_audio_seconds_total = Counter(
+    "sts_speech_gate_skipped_audio_seconds_total",
+    "Seconds of fragment audio not sent to ASR because it had no speech",
+)
+
+sts_speech_gate_asr_seconds_avoided_total = Counter(
+    "sts_speech_gate_asr_seconds_avoided_total",
+    "Estimated ASR time avoided by the speech pre-gate in seconds",
+)
+
+# -----------------------------------------------------------------------------
+# ASR Batching Metrics
+# -----------------------------------------------------------------------------
+
+sts_asr_batch_size = Histogram(
+    "sts_asr_batch_size",
+    "Fragments decoded per batched ASR inference call",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16, 24, 32),
+)
+
+sts_asr_batch_wait_seconds = Histogram(
+    "sts_asr_batch_wait_seconds",
+    "Time a fragment waited for its ASR batch to start in seconds",
+    buckets=(0.001, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf")),
+)
+
+# -----------------------------------------------------------------------------
+# ASR Quality Ladder Metrics
+# -----------------------------------------------------------------------------
+
+sts_asr_profile_fragments_total = Counter(
+    "sts_asr_profile_fragments_total",
+    "Fragments transcribed per ASR latency profile",
+    labelnames=["profile"],
+)
+
+sts_asr_profile_switches_total = Counter(
+    "sts_asr_profile_switches_total",
+    "ASR latency profile switches made by the quality ladder",
+    labelnames=["from_profile", "to_profile"],
+)
+
+sts_asr_profile_sessions = Gauge(
+    "sts_asr_profile_sessions",
+    "Sessions currently on each ASR latency profile",
+    labelnames=["profile"],
+)
+
+# -----------------------------------------------------------------------------
+# Model Registry Metrics
+# -----------------------------------------------------------------------------
+
+sts_model_loads_total = Counter(
+    "sts_model_loads_total",
+    "Models loaded into the shared model registry",
+    labelnames=["family"],
+)
+
+sts_model_load_seconds = Histogram(
+    "sts_model_load_seconds",
+    "Model load time in seconds (all replicas)",
+    labelnames=["family"],
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, float("inf")),
+)
+
+sts_model_evictions_total = Counter(
+    "sts_model_evictions_total",
+    "Idle models evicted from the shared model registry",
+    labelnames=["family"],
+)
+
+sts_models_resident = Gauge(
+    "sts_models_resident",
+    "Models currently resident in the shared model registry",
+)
+
+sts_model_registry_bytes = Gauge(
+    "sts_model_registry_bytes",
+    "Estimated memory of resident models in bytes",
+)
+
+# -----------------------------------------------------------------------------
+# Startup Metrics
+# -----------------------------------------------------------------------------
+
+sts_startup_seconds = Gauge(
+    "sts_startup_seconds",
+    "Duration of the startup warm-up phase in seconds",
+)
+
+sts_warmup_seconds = Gauge(
+    "sts_warmup_seconds",
+    "Model load plus first inference time during startup warm-up",
+    labelnames=["component", "model"],
+)
+
 # -----------------------------------------------------------------------------
 # Session Metrics
 # -----------------------------------------------------------------------------
@@ -167,6 +347,231 @@ def record_stage_timing(stage: str, duration_ms: int) -> None:
         logger.error(f"Failed to record stage timing: {e}")
 
 
+def set_stage_queue_depth(stage: str, depth: int) -> None:
+    """Set the number of calls queued for a stage's worker pool.
+
+    Args:
+        stage: Stage name (decode, asr, translation, tts, encode, artifacts)
+        depth: Number of calls submitted but not yet started
+    """
+    try:
+        sts_stage_queue_depth.labels(stage=stage).set(depth)
+    except Exception as e:
+        logger.error(f"Failed to set stage queue depth: {e}")
+
+
+def record_stage_wait(stage: str, wait_ms: float) -> None:
+    """Record how long a stage call waited for a worker thread.
+
+    Args:
+        stage: Stage name (decode, asr, translation, tts, encode, artifacts)
+        wait_ms: Queue wait time in milliseconds
+    """
+    try:
+        sts_stage_wait_seconds.labels(stage=stage).observe(wait_ms / 1000.0)
+    except Exception as e:
+        logger.error(f"Failed to record stage wait: {e}")
+
+
+def record_audio_encode(backend: str, duration_ms: float) -> None:
+    """Record the latency of one PCM to AAC/M4A encode.
+
+    Args:
+        backend: Encoder backend (pyav, ffmpeg)
+        duration_ms: Encode time in milliseconds
+    """
+    try:
+        sts_audio_encode_seconds.labels(backend=backend).observe(duration_ms / 1000.0)
+    except Exception as e:
+        logger.error(f"Failed to record audio encode: {e}")
+
+
+def record_silence_cache_lookup(hit: bool) -> None:
+    """Record an encoded silence cache lookup.
+
+    Args:
+        hit: True if the payload was cached
+    """
+    try:
+        sts_silence_cache_requests_total.labels(result="hit" if hit else "miss").inc()
+    except Exception as e:
+        logger.error(f"Failed to record silence cache lookup: {e}")
+
+
+def set_silence_cache_entries(count: int) -> None:
+    """Set the number of cached encoded silence payloads.
+
+    Args:
+        count: Current cache size
+    """
+    try:
+        sts_silence_cache_entries.set(count)
+    except Exception as e:
+        logger.error(f"Failed to set silence cache entries: {e}")
+
+
+def record_translation_cache_lookup(result: str) -> None:
+    """Record a translation cache lookup.
+
+    Args:
+        result: hit_memory, hit_disk or miss
+    """
+    try:
+        sts_translation_cache_requests_total.labels(result=result).inc()
+    except Exception as e:
+        logger.error(f"Failed to record translation cache lookup: {e}")
+
+
+def set_translation_cache_entries(count: int) -> None:
+    """Set the number of translations in the in-memory cache tier.
+
+    Args:
+        count: Current in-memory cache size
+    """
+    try:
+        sts_translation_cache_entries.set(count)
+    except Exception as e:
+        logger.error(f"Failed to set translation cache entries: {e}")
+
+
+def record_tts_cache_lookup(hit: bool) -> None:
+    """Record a synthesized-audio cache lookup.
+
+    Args:
+        hit: True if the PCM was cached
+    """
+    try:
+        sts_tts_cache_requests_total.labels(result="hit" if hit else "miss").inc()
+    except Exception as e:
+        logger.error(f"Failed to record TTS cache lookup: {e}")
+
+
+def set_tts_cache_bytes(size_bytes: int) -> None:
+    """Set the number of bytes held in the TTS cache.
+
+    Args:
+        size_bytes: Current cache size in bytes
+    """
+    try:
+        sts_tts_cache_bytes.set(size_bytes)
+    except Exception as e:
+        logger.error(f"Failed to set TTS cache bytes: {e}")
+
+
+def record_speech_gate_decision(
+    backend: str, is_speech: bool, audio_ms: int, avoided_asr_ms: int
+) -> None:
+    """Record a speech pre-gate decision.
+
+    Args:
+        backend: Detector backend (energy, silero)
+        is_speech: Whether the fragment goes on to ASR
+        audio_ms: Fragment duration
+        avoided_asr_ms: Estimated ASR time saved (0 for speech)
+    """
+    try:
+        result = "speech" if is_speech else "non_speech"
+        sts_speech_gate_decisions_total.labels(backend=backend, result=result).inc()
+        if not is_speech:
+            sts_speech_gate_skipped_audio_seconds_total.inc(audio_ms / 1000.0)
+            sts_speech_gate_asr_seconds_avoided_total.inc(avoided_asr_ms / 1000.0)
+    except Exception as e:
+        logger.error(f"Failed to record speech gate decision: {e}")
+
+
+def record_asr_profile_fragment(profile: str) -> None:
+    """Record a fragment transcribed with an ASR latency profile.
+
+    Args:
+        profile: Profile name (fast, balanced, accurate)
+    """
+    try:
+        sts_asr_profile_fragments_total.labels(profile=profile).inc()
+    except Exception as e:
+        logger.error(f"Failed to record ASR profile fragment: {e}")
+
+
+def record_asr_profile_switch(from_profile: Optional[str], to_profile: Optional[str]) -> None:
+    """Move a session between ASR latency profiles.
+
+    A session entering the ladder has no from_profile; one leaving it has no
+    to_profile. Only real switches are counted.
+
+    Args:
+        from_profile: Profile the session leaves
+        to_profile: Profile the session moves to
+    """
+    try:
+        if from_profile is not None:
+            sts_asr_profile_sessions.labels(profile=from_profile).dec()
+        if to_profile is not None:
+            sts_asr_profile_sessions.labels(profile=to_profile).inc()
+        if from_profile is not None and to_profile is not None:
+            sts_asr_profile_switches_total.labels(
+                from_profile=from_profile, to_profile=to_profile
+            ).inc()
+    except Exception as e:
+        logger.error(f"Failed to record ASR profile switch: {e}")
+
+
+def record_asr_batch(event: BatchEvent) -> None:
+    """Record an ASR batch (batch scheduler listener).
+
+    Args:
+        event: Event emitted by the ASR batch scheduler
+    """
+    try:
+        sts_asr_batch_size.observe(event.size)
+        for wait_s in event.wait_s:
+            sts_asr_batch_wait_seconds.observe(wait_s)
+    except Exception as e:
+        logger.error(f"Failed to record ASR batch: {e}")
+
+
+def record_model_registry_event(event: ModelEvent) -> None:
+    """Record a model registry load or eviction (registry listener).
+
+    Args:
+        event: Event emitted by the model registry
+    """
+    try:
+        if event.event == "load":
+            sts_model_loads_total.labels(family=event.family).inc()
+            sts_model_load_seconds.labels(family=event.family).observe(event.duration_s)
+        elif event.event == "evict":
+            sts_model_evictions_total.labels(family=event.family).inc()
+        sts_models_resident.set(event.resident_models)
+        sts_model_registry_bytes.set(event.resident_bytes)
+    except Exception as e:
+        logger.error(f"Failed to record model registry event: {e}")
+
+
+def set_warmup_duration(component: str, model: str, seconds: float) -> None:
+    """Record how long a model took to load and run its warm-up inference.
+
+    Args:
+        component: Pipeline component (asr, tts)
+        model: Model identifier
+        seconds: Load plus first inference time
+    """
+    try:
+        sts_warmup_seconds.labels(component=component, model=model).set(seconds)
+    except Exception as e:
+        logger.error(f"Failed to set warmup duration: {e}")
+
+
+def set_startup_duration(seconds: float) -> None:
+    """Record the total startup warm-up duration.
+
+    Args:
+        seconds: Warm-up phase duration
+    """
+    try:
+        sts_startup_seconds.set(seconds)
+    except Exception as e:
+        logger.error(f"Failed to set startup duration: {e}")
+
+
 def increment_inflight(stream_id: str) -> None:
     """Increment in-flight fragment count.
 
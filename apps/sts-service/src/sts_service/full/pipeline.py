@@ -6,23 +6,25 @@ asset lineage tracking, and stage timing.
 Task IDs: T079-T083
 """
 
-import base64
+import asyncio
 import os
-import subprocess
-import tempfile
 import time
 import uuid
-from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable
+from dataclasses import dataclass, field
+from typing import Any, Optional, Protocol, runtime_checkable
 
 from sts_service.asr.models import TranscriptAsset as ASRTranscriptAsset
 from sts_service.asr.models import TranscriptStatus
+from sts_service.audio_buffer import AudioBuffer, PCMData
+from sts_service.tracing import NULL_TRACE, TraceLevel, get_tracer
 from sts_service.translation.models import TextAsset, TranslationStatus
-from sts_service.tts.duration_matching import generate_silence, pad_audio_with_silence
-from sts_service.tts.encoding import encode_pcm_to_m4a
+from sts_service.tts.duration_matching import pad_audio_with_silence
 from sts_service.tts.models import AudioAsset as TTSAudioAsset
 from sts_service.tts.models import AudioFormat, AudioStatus
 
+from .audio_decoder import AudioDecoder, create_audio_decoder
+from .audio_encoder import encode_to_m4a
+from .config import AudioCodecConfig
 from .models.asset import (
     AssetStatus,
     AudioAsset,
@@ -50,6 +52,9 @@ from .observability.metrics import (
     record_stage_timing,
 )
 from .session import StreamSession
+from .silence_cache import EncodedSilence, SilenceCache, SilenceKey, get_silence_cache
+from .speech_gate import SpeechGate
+from .stage_executor import StageExecutor, get_stage_executor
 
 
 # -----------------------------------------------------------------------------
@@ -72,7 +77,7 @@ class ASRComponentProtocol(Protocol):
 
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: PCMData,
         stream_id: str,
         sequence_number: int,
         start_time_ms: int,
@@ -82,6 +87,8 @@ class ASRComponentProtocol(Protocol):
         language: str = "en",
     ) -> ASRTranscriptAsset: ...
 
+    def shutdown(self) -> None: ...
+
 
 @runtime_checkable
 class TranslationComponentProtocol(Protocol):
@@ -108,6 +115,8 @@ class TranslationComponentProtocol(Protocol):
         normalization_policy: object | None = None,
     ) -> TextAsset: ...
 
+    def shutdown(self) -> None: ...
+
 
 @runtime_checkable
 class TTSComponentProtocol(Protocol):
@@ -131,6 +140,61 @@ class TTSComponentProtocol(Protocol):
         voice_profile: object | None = None,
     ) -> TTSAudioAsset: ...
 
+    def shutdown(self) -> None: ...
+
+
+# -----------------------------------------------------------------------------
+# Fragment Context
+# -----------------------------------------------------------------------------
+
+# Stage order for one fragment. Each stage is independently schedulable so
+# StagedFragmentPipeline can overlap consecutive fragments.
+PIPELINE_STAGES: tuple[str, ...] = ("asr", "translation", "tts", "encode")
+
+# Error stage reported when a pipeline stage raises unexpectedly
+_ERROR_STAGES: dict[str, ErrorStage] = {
+    "asr": ErrorStage.ASR,
+    "translation": ErrorStage.TRANSLATION,
+    "tts": ErrorStage.TTS,
+    "encode": ErrorStage.TTS,
+}
+
+
+@dataclass
+class FragmentContext:
+    """Per-fragment state handed from one pipeline stage to the next.
+
+    A stage that finishes the fragment early (failure or silence) sets
+    `result`; no further stages run for that fragment.
+    """
+
+    fragment_data: FragmentData
+    session: StreamSession
+    logger: Any
+    start_time: float
+    stage_timings: StageTiming = field(default_factory=StageTiming)
+    status: ProcessingStatus = ProcessingStatus.SUCCESS
+    # Debug trace (no-op unless tracing is enabled for the stream and sampled)
+    trace: Any = NULL_TRACE
+
+    # Stage outputs
+    pcm_audio: Optional[AudioBuffer] = None
+    asr_result: Any = None
+    transcript: str = ""
+    translation_result: Any = None
+    translated_text: str = ""
+    tts_result: Any = None
+
+    # Final result (set by the last stage, or earlier on failure/silence)
+    result: Optional[FragmentResult] = None
+
+
+def _release_after(task: "asyncio.Future[Any]", pcm: AudioBuffer) -> None:
+    """Done-callback releasing a buffer once the call reading it has finished."""
+    if not task.cancelled():
+        task.exception()  # Retrieved so a failed orphaned encode is not logged as unhandled
+    pcm.release()
+
 
 # -----------------------------------------------------------------------------
 # Pipeline Coordinator
@@ -142,6 +206,8 @@ class PipelineCoordinator:
 
     Features:
     - Sequential pipeline execution (ASR, then Translation, then TTS)
+    - Stages runnable one at a time via run_stage() for stage pipelining
+    - Blocking stage calls run on the shared StageExecutor thread pools
     - Error propagation (stops pipeline on failure)
     - Asset lineage tracking (parent_asset_ids chain)
     - Stage timing measurement
@@ -154,6 +220,10 @@ class PipelineCoordinator:
         translation: TranslationComponentProtocol,
         tts: TTSComponentProtocol,
         enable_artifact_logging: bool = True,
+        stage_executor: Optional[StageExecutor] = None,
+        audio_decoder: Optional[AudioDecoder] = None,
+        silence_cache: Optional[SilenceCache] = None,
+        speech_gate: Optional[SpeechGate] = None,
     ):
         """Initialize pipeline coordinator with component instances.
 
@@ -162,10 +232,23 @@ class PipelineCoordinator:
             translation: Translation component for text translation
             tts: TTS component for speech synthesis
             enable_artifact_logging: Enable artifact logging (default: True)
+            stage_executor: Thread pools for blocking stage calls
+                (default: process-wide shared executor)
+            audio_decoder: Fragment audio decoder
+                (default: AUDIO_DECODER_BACKEND, PyAV with ffmpeg fallback)
+            silence_cache: Encoded silence cache for silent fragments
+                (default: process-wide shared cache)
+            speech_gate: Speech pre-gate; fragments it classifies as
+                non-speech skip ASR (default: no gate)
         """
         self._asr = asr
         self._translation = translation
         self._tts = tts
+        self._executor = stage_executor or get_stage_executor()
+        self._decoder = audio_decoder or create_audio_decoder()
+        self._silence_cache = silence_cache if silence_cache is not None else get_silence_cache()
+        self._silence_bitrate_kbps = AudioCodecConfig().encoder_bitrate_kbps
+        self._speech_gate = speech_gate
 
         # Setup structured logging
         self.logger = get_logger(__name__)
@@ -185,65 +268,91 @@ class PipelineCoordinator:
         else:
             self.artifact_logger = None
 
+    def shutdown(self) -> None:
+        """Shut down the session's components.
+
+        Shared resources (models, caches, stage executor) stay available to
+        other sessions; components only drop their references.
+        """
+        for component in (self._asr, self._translation, self._tts):
+            try:
+                component.shutdown()
+            except Exception as e:
+                self.logger.warning("component_shutdown_failed", error=str(e))
+
     def _decode_audio_to_pcm(
         self,
         audio_bytes: bytes,
         input_format: str,
         sample_rate: int,
         channels: int,
-    ) -> bytes:
+        source_sample_rate: Optional[int] = None,
+        source_channels: Optional[int] = None,
+    ) -> AudioBuffer:
         """Decode audio from M4A/AAC to PCM f32le format.
 
         Args:
             audio_bytes: Input audio bytes (M4A/AAC container or PCM)
-            input_format: Format identifier (m4a, aac, pcm_f32le, etc.)
+            input_format: Format identifier (m4a, aac, pcm_s16le, pcm_f32le, etc.)
             sample_rate: Target sample rate
             channels: Target number of channels
+            source_sample_rate: Sample rate of PCM input (default: target rate)
+            source_channels: Channel count of PCM input (default: target channels)
 
         Returns:
-            PCM f32le bytes suitable for ASR processing
+            Decoded PCM suitable for ASR processing (matching f32 PCM is viewed, not copied)
 
         Raises:
-            RuntimeError: If ffmpeg decoding fails
+            RuntimeError: If decoding fails
         """
-        # If already PCM, return as-is
-        if input_format == "pcm_f32le":
-            return audio_bytes
+        # If already PCM in the target layout, wrap as-is
+        if (
+            input_format == "pcm_f32le"
+            and source_sample_rate in (None, sample_rate)
+            and source_channels in (None, channels)
+        ):
+            return AudioBuffer.from_pcm(audio_bytes, sample_rate, channels)
+
+        pcm = self._decoder.decode(
+            audio_bytes,
+            input_format,
+            sample_rate,
+            channels,
+            source_sample_rate=source_sample_rate,
+            source_channels=source_channels,
+        )
+        return AudioBuffer.from_array(pcm, sample_rate, channels)
+
+    def start_fragment(
+        self,
+        fragment_data: FragmentData,
+        session: StreamSession,
+    ) -> FragmentContext:
+        """Create the per-fragment context that stages pass along.
 
-        # Need to decode M4A/AAC to PCM using ffmpeg
-        with tempfile.NamedTemporaryFile(suffix=f".{input_format}", delete=False) as input_file:
-            input_path = Path(input_file.name)
-            input_file.write(audio_bytes)
+        Args:
+            fragment_data: Input fragment with audio data
+            session: Stream session with configuration
 
-        try:
-            # Decode to PCM f32le using ffmpeg
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(input_path),
-                "-ar",
-                str(sample_rate),
-                "-ac",
-                str(channels),
-                "-f",
-                "f32le",
-                "-acodec",
-                "pcm_f32le",
-                "pipe:1",
-            ]
-            result = subprocess.run(cmd, capture_output=True, check=False)
-
-            if result.returncode != 0:
-                error_msg = result.stderr.decode() if result.stderr else "Unknown ffmpeg error"
-                raise RuntimeError(f"Failed to decode {input_format} to PCM: {error_msg}")
-
-            return result.stdout
-
-        finally:
-            # Clean up temp file
-            if input_path.exists():
-                input_path.unlink()
+        Returns:
+            FragmentContext ready for the first stage
+        """
+        logger = bind_stream_context(
+            self.logger,
+            stream_id=fragment_data.stream_id,
+            fragment_id=fragment_data.fragment_id,
+        )
+        logger.info("fragment_processing_started", sequence_number=fragment_data.sequence_number)
+
+        return FragmentContext(
+            fragment_data=fragment_data,
+            session=session,
+            logger=logger,
+            start_time=time.perf_counter(),
+            trace=get_tracer().for_fragment(
+                fragment_data.stream_id, fragment_data.sequence_number
+            ),
+        )
 
     async def process_fragment(
         self,
@@ -252,13 +361,15 @@ class PipelineCoordinator:
     ) -> FragmentResult:
         """Process a single fragment through the full STS pipeline.
 
+        Runs every stage in PIPELINE_STAGES back to back for one fragment.
+        StagedFragmentPipeline drives the same stages with one queue per
+        stage so consecutive fragments overlap.
+
         Pipeline stages:
-        1. Decode audio (base64 -> PCM bytes)
-        2. ASR transcription
-        3. Translation (if transcript not empty)
-        4. TTS synthesis
-        5. Encode audio (PCM -> base64)
-        6. Build FragmentResult
+        1. asr: Decode audio (M4A -> PCM) and transcribe
+        2. translation: Translate transcript (skipped for silence)
+        3. tts: Synthesize translated text
+        4. encode: Pad/encode audio (PCM -> AAC) and build FragmentResult
 
         Args:
             fragment_data: Input fragment with audio data
@@ -267,493 +378,662 @@ class PipelineCoordinator:
         Returns:
             FragmentResult with dubbed audio or error details
         """
-        start_time = time.perf_counter()
-        stage_timings = StageTiming()
+        ctx = self.start_fragment(fragment_data, session)
+        for stage in PIPELINE_STAGES:
+            await self.run_stage(stage, ctx)
+            if ctx.result is not None:
+                break
 
-        # Bind logging context
-        logger = bind_stream_context(
-            self.logger,
-            stream_id=fragment_data.stream_id,
-            fragment_id=fragment_data.fragment_id,
-        )
+        assert ctx.result is not None, "encode stage must produce a result"
+        return ctx.result
 
-        logger.info("fragment_processing_started", sequence_number=fragment_data.sequence_number)
+    async def run_stage(self, stage: str, ctx: FragmentContext) -> None:
+        """Run one pipeline stage for a fragment.
+
+        Stages that end the fragment early (failure, silence) set ctx.result;
+        callers must stop advancing the fragment once it is set.
 
-        # Initialize result fields
-        transcript = ""
-        translated_text = ""
-        dubbed_audio = None
-        duration_metadata = None
-        error = None
-        status = ProcessingStatus.SUCCESS
+        Args:
+            stage: Stage name (one of PIPELINE_STAGES)
+            ctx: Fragment context produced by start_fragment()
+
+        Raises:
+            ValueError: If the stage is unknown
+        """
+        handlers = {
+            "asr": self._run_asr_stage,
+            "translation": self._run_translation_stage,
+            "tts": self._run_tts_stage,
+            "encode": self._run_encode_stage,
+        }
+        if stage not in handlers:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        if ctx.result is not None:
+            return
 
         try:
-            # Step 1: Decode audio from base64
-            audio_bytes_encoded = base64.b64decode(fragment_data.audio.data_base64)
-            logger.info(
-                f"DEBUG pipeline: Encoded audio size: {len(audio_bytes_encoded)} bytes, format={fragment_data.audio.format}, reported duration={fragment_data.audio.duration_ms}ms"
-            )
+            await handlers[stage](ctx)
+        except Exception as e:
+            # Unexpected error
+            self.fail_stage(stage, ctx, e)
 
-            # Step 1.5: Decode M4A/AAC to PCM if needed
-            audio_bytes = self._decode_audio_to_pcm(
-                audio_bytes=audio_bytes_encoded,
-                input_format=fragment_data.audio.format,
-                sample_rate=16000,  # ASR always uses 16kHz
-                channels=1,  # ASR always uses mono
-            )
+    def fail_stage(self, stage: str, ctx: FragmentContext, error: Exception) -> None:
+        """Finish a fragment with a failed result for an unexpected stage error.
+
+        Args:
+            stage: Stage name where the error occurred
+            ctx: Fragment context to finish
+            error: The exception raised
+        """
+        ctx.result = self._create_failed_result(
+            fragment_data=ctx.fragment_data,
+            stage=_ERROR_STAGES.get(stage, ErrorStage.ASR),
+            error_message=str(error),
+            stage_timings=ctx.stage_timings,
+            processing_time_ms=self._elapsed_ms(ctx.start_time),
+            retryable=True,
+        )
 
-            # DEBUG: Check decoded audio size
-            expected_samples = 16000 * (fragment_data.audio.duration_ms / 1000.0)
-            actual_samples = len(audio_bytes) / 4  # 4 bytes per f32le sample
-            logger.info(
-                f"DEBUG pipeline: Decoded PCM size: {len(audio_bytes)} bytes ({actual_samples} samples), expected: {expected_samples} samples for {fragment_data.audio.duration_ms}ms"
+    async def _run_asr_stage(self, ctx: FragmentContext) -> None:
+        """Decode fragment audio and transcribe it."""
+        fragment_data = ctx.fragment_data
+        session = ctx.session
+        stage_timings = ctx.stage_timings
+        logger = ctx.logger
+        trace = ctx.trace
+
+        # Step 1: Get the encoded audio (raw attachment or base64)
+        audio_bytes_encoded = fragment_data.audio.audio_bytes()
+        trace.event(
+            TraceLevel.DEBUG,
+            "fragment_audio_received",
+            encoded_bytes=len(audio_bytes_encoded),
+            format=fragment_data.audio.format,
+            duration_ms=fragment_data.audio.duration_ms,
+        )
+
+        # Step 1.5: Decode M4A/AAC (or convert raw PCM) to 16 kHz mono
+        pcm = await self._executor.run(
+            "decode",
+            self._decode_audio_to_pcm,
+            audio_bytes=audio_bytes_encoded,
+            input_format=fragment_data.audio.format,
+            sample_rate=16000,  # ASR always uses 16kHz
+            channels=1,  # ASR always uses mono
+            source_sample_rate=fragment_data.audio.sample_rate_hz,
+            source_channels=fragment_data.audio.channels,
+        )
+        ctx.pcm_audio = pcm
+
+        trace.event(
+            TraceLevel.DEBUG,
+            "fragment_audio_decoded",
+            samples=len(pcm.samples),
+            expected_samples=16 * fragment_data.audio.duration_ms,
+        )
+        trace.capture("decoded_pcm", pcm.samples)
+
+        # Step 1.75: Skip ASR for fragments without speech
+        if self._speech_gate is not None:
+            decision = await self._executor.run(
+                "decode", self._speech_gate.classify, pcm, 16000
+            )
+            if not decision.is_speech:
+                logger.info(
+                    "speech_gate_skipped_asr",
+                    speech_ms=decision.speech_ms,
+                    backend=decision.backend,
+                )
+                ctx.result = await self._build_silence_result(ctx)
+                return
+
+        # Step 2: ASR transcription
+        logger.info("asr_started")
+        asr_start = time.perf_counter()
+        asr_result = await self._executor.run(
+            "asr",
+            self._asr.transcribe,
+            audio_data=pcm,
+            stream_id=fragment_data.stream_id,
+            sequence_number=fragment_data.sequence_number,
+            start_time_ms=0,
+            end_time_ms=fragment_data.audio.duration_ms,
+            sample_rate_hz=16000,  # PCM was decoded to 16kHz above
+            domain=session.domain_hints[0] if session.domain_hints else "general",
+            language=session.source_language,
+        )
+        stage_timings.asr_ms = int((time.perf_counter() - asr_start) * 1000)
+        ctx.asr_result = asr_result
+
+        logger.info("asr_completed", latency_ms=stage_timings.asr_ms)
+        record_stage_timing("asr", stage_timings.asr_ms)
+        if self._speech_gate is not None:
+            self._speech_gate.observe_asr(fragment_data.audio.duration_ms, stage_timings.asr_ms)
+
+        if trace.enabled(TraceLevel.DEBUG):
+            trace.event(
+                TraceLevel.DEBUG,
+                "asr_result",
+                segments=len(getattr(asr_result, "segments", None) or []),
+                text=getattr(asr_result, "total_text", None),
             )
 
-            # Step 2: ASR transcription
-            logger.info("asr_started")
-            asr_start = time.perf_counter()
-            asr_result = self._asr.transcribe(
-                audio_data=audio_bytes,
+        # Check ASR status
+        if self._is_failed(asr_result.status):
+            ctx.result = self._create_failed_result(
+                fragment_data=fragment_data,
+                stage=ErrorStage.ASR,
+                error_message=getattr(asr_result, "error_message", None)
+                or "ASR processing failed",
+                stage_timings=stage_timings,
+                processing_time_ms=self._elapsed_ms(ctx.start_time),
+                retryable=True,
+            )
+            return
+
+        # Extract transcript - check for real string values
+        raw_transcript = None
+        if hasattr(asr_result, "total_text"):
+            raw_transcript = asr_result.total_text
+        if raw_transcript is None or not isinstance(raw_transcript, str):
+            if hasattr(asr_result, "transcript"):
+                raw_transcript = asr_result.transcript
+        if raw_transcript is None or not isinstance(raw_transcript, str):
+            # Try joining segments
+            segments = getattr(asr_result, "segments", [])
+            if segments and hasattr(segments, "__iter__"):
+                try:
+                    raw_transcript = " ".join(str(getattr(seg, "text", "")) for seg in segments)
+                except Exception:
+                    raw_transcript = ""
+
+        # Ensure transcript is a string
+        transcript = str(raw_transcript) if raw_transcript is not None else ""
+        ctx.transcript = transcript
+
+        # Log transcript artifact if enabled
+        if self.artifact_logger:
+            transcript_asset = TranscriptAsset(
+                asset_id=f"transcript-{fragment_data.fragment_id}",
+                fragment_id=fragment_data.fragment_id,
                 stream_id=fragment_data.stream_id,
-                sequence_number=fragment_data.sequence_number,
-                start_time_ms=0,
-                end_time_ms=fragment_data.audio.duration_ms,
-                sample_rate_hz=16000,  # PCM was decoded to 16kHz above
-                domain=session.domain_hints[0] if session.domain_hints else "general",
+                status=AssetStatus.SUCCESS,
+                transcript=transcript,
+                segments=[],
+                confidence=getattr(asr_result, "confidence", 0.0),
                 language=session.source_language,
+                audio_duration_ms=fragment_data.audio.duration_ms,
+                parent_asset_ids=[],
+                latency_ms=stage_timings.asr_ms,
+            )
+            await self._executor.run(
+                "artifacts", self.artifact_logger.log_transcript, transcript_asset
             )
-            stage_timings.asr_ms = int((time.perf_counter() - asr_start) * 1000)
 
-            logger.info("asr_completed", latency_ms=stage_timings.asr_ms)
-            record_stage_timing("asr", stage_timings.asr_ms)
+        # Handle empty transcript (silence/no speech detected by VAD)
+        # Skip translation and TTS, generate silence matching input duration
+        if not transcript.strip():
+            ctx.result = await self._build_silence_result(ctx)
 
-            # DEBUG: Log ASR result
-            logger.info(
-                f"DEBUG: ASR result has {len(getattr(asr_result, 'segments', []))} segments"
-            )
-            logger.info(f"DEBUG: ASR total_text: '{getattr(asr_result, 'total_text', 'NO ATTR')}'")
-
-            # Check ASR status
-            if self._is_failed(asr_result.status):
-                return self._create_failed_result(
-                    fragment_data=fragment_data,
-                    stage=ErrorStage.ASR,
-                    error_message=getattr(asr_result, "error_message", None)
-                    or "ASR processing failed",
-                    stage_timings=stage_timings,
-                    processing_time_ms=self._elapsed_ms(start_time),
-                    retryable=True,
-                )
+    async def _build_silence_result(self, ctx: FragmentContext) -> FragmentResult:
+        """Build a silence passthrough result for a fragment with no speech."""
+        fragment_data = ctx.fragment_data
+        session = ctx.session
+        stage_timings = ctx.stage_timings
+        logger = ctx.logger
 
-            # Extract transcript - check for real string values
-            raw_transcript = None
-            if hasattr(asr_result, "total_text"):
-                raw_transcript = asr_result.total_text
-            if raw_transcript is None or not isinstance(raw_transcript, str):
-                if hasattr(asr_result, "transcript"):
-                    raw_transcript = asr_result.transcript
-            if raw_transcript is None or not isinstance(raw_transcript, str):
-                # Try joining segments
-                segments = getattr(asr_result, "segments", [])
-                if segments and hasattr(segments, "__iter__"):
-                    try:
-                        raw_transcript = " ".join(str(getattr(seg, "text", "")) for seg in segments)
-                    except Exception:
-                        raw_transcript = ""
-
-            # Ensure transcript is a string
-            transcript = str(raw_transcript) if raw_transcript is not None else ""
-
-            # Log transcript artifact if enabled
-            if self.artifact_logger:
-                transcript_asset = TranscriptAsset(
-                    asset_id=f"transcript-{fragment_data.fragment_id}",
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    status=AssetStatus.SUCCESS,
-                    transcript=transcript,
-                    segments=[],
-                    confidence=getattr(asr_result, "confidence", 0.0),
-                    language=session.source_language,
-                    audio_duration_ms=fragment_data.audio.duration_ms,
-                    parent_asset_ids=[],
-                    latency_ms=stage_timings.asr_ms,
-                )
-                self.artifact_logger.log_transcript(transcript_asset)
+        logger.info(
+            "empty_transcript_detected",
+            message="No speech detected, generating silence passthrough",
+        )
 
-            # Handle empty transcript (silence/no speech detected by VAD)
-            # Skip translation and TTS, generate silence matching input duration
-            if not transcript.strip():
-                logger.info(
-                    "empty_transcript_detected",
-                    message="No speech detected, generating silence passthrough",
-                )
+        silence = await self._get_encoded_silence(ctx)
 
-                # Generate silence matching input duration
-                silence_pcm = generate_silence(
-                    duration_ms=fragment_data.audio.duration_ms,
-                    sample_rate_hz=session.sample_rate_hz,
-                    channels=session.channels,
-                    bytes_per_sample=4,  # float32
-                )
+        # Build silence audio response
+        dubbed_audio = silence.to_audio_data(
+            binary=session.binary_audio,
+            sample_rate_hz=session.sample_rate_hz,
+            channels=session.channels,
+            duration_ms=fragment_data.audio.duration_ms,
+        )
 
-                # Encode silence to AAC for media-service compatibility
-                try:
-                    silence_aac = encode_pcm_to_m4a(
-                        pcm_data=silence_pcm,
-                        sample_rate_hz=session.sample_rate_hz,
-                        channels=session.channels,
-                        input_format=AudioFormat.PCM_F32LE,
-                        bitrate_kbps=128,
-                    )
-                    output_format = "m4a"
-                except Exception as e:
-                    logger.warning("silence_encoding_failed", error=str(e))
-                    silence_aac = silence_pcm
-                    output_format = "pcm_f32le"
-
-                silence_b64 = base64.b64encode(silence_aac).decode("utf-8")
-
-                # Build silence audio response
-                dubbed_audio = AudioData(
-                    format=output_format,
-                    sample_rate_hz=session.sample_rate_hz,
-                    channels=session.channels,
-                    duration_ms=fragment_data.audio.duration_ms,
-                    data_base64=silence_b64,
-                )
+        duration_metadata = DurationMetadata(
+            original_duration_ms=fragment_data.audio.duration_ms,
+            dubbed_duration_ms=fragment_data.audio.duration_ms,
+            duration_variance_percent=0.0,
+            speed_ratio=1.0,
+        )
 
-                duration_metadata = DurationMetadata(
-                    original_duration_ms=fragment_data.audio.duration_ms,
-                    dubbed_duration_ms=fragment_data.audio.duration_ms,
-                    duration_variance_percent=0.0,
-                    speed_ratio=1.0,
-                )
+        # Record metrics
+        total_time = time.perf_counter() - ctx.start_time
+        record_fragment_success(
+            session.stream_id, int(total_time * 1000), stage_timings.model_dump()
+        )
 
-                # Record metrics
-                total_time = time.perf_counter() - start_time
-                record_fragment_success(
-                    session.stream_id, int(total_time * 1000), stage_timings.model_dump()
-                )
+        logger.info(
+            "fragment_processed_silence",
+            status="success",
+            total_time_ms=int(total_time * 1000),
+            asr_ms=stage_timings.asr_ms,
+        )
 
-                logger.info(
-                    "fragment_processed_silence",
-                    status="success",
-                    total_time_ms=int(total_time * 1000),
-                    asr_ms=stage_timings.asr_ms,
-                )
+        return FragmentResult(
+            fragment_id=fragment_data.fragment_id,
+            stream_id=fragment_data.stream_id,
+            sequence_number=fragment_data.sequence_number,
+            status=ProcessingStatus.SUCCESS,
+            dubbed_audio=dubbed_audio,
+            transcript="",
+            translated_text="",
+            processing_time_ms=self._elapsed_ms(ctx.start_time),
+            stage_timings=stage_timings,
+            metadata=duration_metadata,
+            error=None,
+        )
 
-                return FragmentResult(
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    sequence_number=fragment_data.sequence_number,
-                    status=ProcessingStatus.SUCCESS,
-                    dubbed_audio=dubbed_audio,
-                    transcript="",
-                    translated_text="",
-                    processing_time_ms=self._elapsed_ms(start_time),
-                    stage_timings=stage_timings,
-                    metadata=duration_metadata,
-                    error=None,
-                )
+    async def _get_encoded_silence(self, ctx: FragmentContext) -> EncodedSilence:
+        """Get encoded silence matching the fragment, from cache when possible."""
+        session = ctx.session
+        key = SilenceKey(
+            duration_ms=ctx.fragment_data.audio.duration_ms,
+            sample_rate_hz=session.sample_rate_hz,
+            channels=session.channels,
+            bitrate_kbps=self._silence_bitrate_kbps,
+            output_format=session.output_format,
+        )
+        cached = self._silence_cache.get(key)
+        if cached is not None:
+            return cached
 
-            # Step 3: Translation
-            logger.info("translation_started")
-            translation_start = time.perf_counter()
-            translation_result = self._translation.translate(
-                source_text=transcript,
+        # Generate silence matching input duration
+        silence_pcm = AudioBuffer.silence(key.duration_ms, key.sample_rate_hz, key.channels)
+
+        # Encode silence to AAC for media-service compatibility
+        try:
+            silence_aac = await self._encode_pooled(
+                silence_pcm,
+                sample_rate_hz=key.sample_rate_hz,
+                channels=key.channels,
+                input_format=AudioFormat.PCM_F32LE,
+                bitrate_kbps=key.bitrate_kbps,
+                container=key.output_format,
+            )
+        except Exception as e:
+            # Not cached: the next silent fragment retries the encode
+            ctx.logger.warning("silence_encoding_failed", error=str(e))
+            fallback = EncodedSilence(format="pcm_f32le", data=silence_pcm.tobytes())
+            silence_pcm.release()
+            return fallback
+        silence_pcm.release()
+
+        silence = EncodedSilence(format=key.output_format, data=silence_aac)
+        self._silence_cache.put(key, silence)
+        return silence
+
+    async def _encode_pooled(self, pcm: AudioBuffer, **encode_kwargs: Any) -> bytes:
+        """Encode a pooled PCM buffer on the encode pool.
+
+        If the awaiting task is cancelled (e.g. the stream disconnects), the
+        worker may still be reading the buffer, so it is released only once
+        the encode call has finished. Otherwise the caller still owns the
+        buffer and must release it.
+
+        Args:
+            pcm: Pooled PCM buffer to encode
+            **encode_kwargs: Keyword arguments for encode_to_m4a
+
+        Returns:
+            Encoded audio bytes
+        """
+        encode = asyncio.ensure_future(
+            self._executor.run("encode", encode_to_m4a, pcm_data=pcm, **encode_kwargs)
+        )
+        try:
+            return await asyncio.shield(encode)
+        except asyncio.CancelledError:
+            encode.add_done_callback(lambda task: _release_after(task, pcm))
+            raise
+
+    async def _run_translation_stage(self, ctx: FragmentContext) -> None:
+        """Translate the fragment transcript."""
+        fragment_data = ctx.fragment_data
+        session = ctx.session
+        stage_timings = ctx.stage_timings
+        logger = ctx.logger
+        transcript = ctx.transcript
+
+        # Step 3: Translation
+        logger.info("translation_started")
+        translation_start = time.perf_counter()
+        translation_result = await self._executor.run(
+            "translation",
+            self._translation.translate,
+            source_text=transcript,
+            stream_id=fragment_data.stream_id,
+            sequence_number=fragment_data.sequence_number,
+            source_language=session.source_language,
+            target_language=session.target_language,
+            parent_asset_ids=[getattr(ctx.asr_result, "asset_id", f"asr-{uuid.uuid4()}")],
+        )
+        stage_timings.translation_ms = int((time.perf_counter() - translation_start) * 1000)
+        ctx.translation_result = translation_result
+
+        logger.info("translation_completed", latency_ms=stage_timings.translation_ms)
+        record_stage_timing("translation", stage_timings.translation_ms)
+
+        # Check Translation status
+        if self._is_failed(translation_result.status):
+            ctx.result = self._create_failed_result(
+                fragment_data=fragment_data,
+                stage=ErrorStage.TRANSLATION,
+                error_message=getattr(translation_result, "error_message", None)
+                or "Translation failed",
+                stage_timings=stage_timings,
+                processing_time_ms=self._elapsed_ms(ctx.start_time),
+                retryable=True,
+                transcript=transcript,
+            )
+            return
+
+        # Extract translated text
+        raw_translated = translation_result.translated_text
+        translated_text = (
+            str(raw_translated)
+            if isinstance(raw_translated, str)
+            else str(raw_translated)
+            if raw_translated
+            else ""
+        )
+        ctx.translated_text = translated_text
+
+        # Log translation artifact if enabled
+        if self.artifact_logger:
+            # Calculate word expansion ratio
+            source_words = len(transcript.split()) if transcript else 1
+            target_words = len(translated_text.split()) if translated_text else 0
+            expansion_ratio = target_words / source_words if source_words > 0 else 1.0
+
+            translation_asset = TranslationAsset(
+                asset_id=f"translation-{fragment_data.fragment_id}",
+                fragment_id=fragment_data.fragment_id,
                 stream_id=fragment_data.stream_id,
-                sequence_number=fragment_data.sequence_number,
+                status=AssetStatus.SUCCESS,
+                translated_text=translated_text,
+                source_text=transcript,
                 source_language=session.source_language,
                 target_language=session.target_language,
-                parent_asset_ids=[getattr(asr_result, "asset_id", f"asr-{uuid.uuid4()}")],
-            )
-            stage_timings.translation_ms = int((time.perf_counter() - translation_start) * 1000)
-
-            logger.info("translation_completed", latency_ms=stage_timings.translation_ms)
-            record_stage_timing("translation", stage_timings.translation_ms)
-
-            # Check Translation status
-            if self._is_failed(translation_result.status):
-                return self._create_failed_result(
-                    fragment_data=fragment_data,
-                    stage=ErrorStage.TRANSLATION,
-                    error_message=getattr(translation_result, "error_message", None)
-                    or "Translation failed",
-                    stage_timings=stage_timings,
-                    processing_time_ms=self._elapsed_ms(start_time),
-                    retryable=True,
-                    transcript=transcript,
-                )
-
-            # Extract translated text
-            raw_translated = translation_result.translated_text
-            translated_text = (
-                str(raw_translated)
-                if isinstance(raw_translated, str)
-                else str(raw_translated)
-                if raw_translated
-                else ""
+                character_count=len(translated_text),
+                word_expansion_ratio=expansion_ratio,
+                parent_asset_ids=[f"transcript-{fragment_data.fragment_id}"],
+                latency_ms=stage_timings.translation_ms,
             )
-
-            # Log translation artifact if enabled
-            if self.artifact_logger:
-                # Calculate word expansion ratio
-                source_words = len(transcript.split()) if transcript else 1
-                target_words = len(translated_text.split()) if translated_text else 0
-                expansion_ratio = target_words / source_words if source_words > 0 else 1.0
-
-                translation_asset = TranslationAsset(
-                    asset_id=f"translation-{fragment_data.fragment_id}",
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    status=AssetStatus.SUCCESS,
-                    translated_text=translated_text,
-                    source_text=transcript,
-                    source_language=session.source_language,
-                    target_language=session.target_language,
-                    character_count=len(translated_text),
-                    word_expansion_ratio=expansion_ratio,
-                    parent_asset_ids=[f"transcript-{fragment_data.fragment_id}"],
-                    latency_ms=stage_timings.translation_ms,
-                )
-                self.artifact_logger.log_translation(translation_asset)
-
-            # Step 4: TTS synthesis
-            logger.info("tts_started")
-            tts_start = time.perf_counter()
-            tts_result = self._tts.synthesize(
-                text_asset=translation_result,
-                target_duration_ms=fragment_data.audio.duration_ms,
-                output_sample_rate_hz=session.sample_rate_hz,
-                output_channels=session.channels,
+            await self._executor.run(
+                "artifacts", self.artifact_logger.log_translation, translation_asset
             )
-            stage_timings.tts_ms = int((time.perf_counter() - tts_start) * 1000)
-
-            logger.info("tts_completed", latency_ms=stage_timings.tts_ms)
-            record_stage_timing("tts", stage_timings.tts_ms)
 
-            # DEBUG: Log TTS result details
-            logger.info(
-                "DEBUG: TTS result",
-                tts_status=str(tts_result.status),
-                audio_bytes_len=len(getattr(tts_result, "audio_bytes", b"")),
+    async def _run_tts_stage(self, ctx: FragmentContext) -> None:
+        """Synthesize the translated text."""
+        fragment_data = ctx.fragment_data
+        session = ctx.session
+        stage_timings = ctx.stage_timings
+        logger = ctx.logger
+
+        # Step 4: TTS synthesis
+        logger.info("tts_started")
+        tts_start = time.perf_counter()
+        tts_result = await self._executor.run(
+            "tts",
+            self._tts.synthesize,
+            text_asset=ctx.translation_result,
+            target_duration_ms=fragment_data.audio.duration_ms,
+            output_sample_rate_hz=session.sample_rate_hz,
+            output_channels=session.channels,
+        )
+        stage_timings.tts_ms = int((time.perf_counter() - tts_start) * 1000)
+        ctx.tts_result = tts_result
+
+        logger.info("tts_completed", latency_ms=stage_timings.tts_ms)
+        record_stage_timing("tts", stage_timings.tts_ms)
+
+        if ctx.trace.enabled(TraceLevel.DEBUG):
+            ctx.trace.event(
+                TraceLevel.DEBUG,
+                "tts_result",
+                status=str(tts_result.status),
+                audio_bytes=len(getattr(tts_result, "audio_bytes", None) or b""),
                 duration_ms=getattr(tts_result, "duration_ms", 0),
             )
 
-            # Check TTS status
-            if self._is_failed(tts_result.status):
-                return self._create_failed_result(
-                    fragment_data=fragment_data,
-                    stage=ErrorStage.TTS,
-                    error_message=getattr(tts_result, "error_message", None)
-                    or "TTS synthesis failed",
-                    stage_timings=stage_timings,
-                    processing_time_ms=self._elapsed_ms(start_time),
-                    retryable=False,  # Duration mismatch is not retryable
-                    transcript=transcript,
-                    translated_text=translated_text,
-                )
+        # Check TTS status
+        if self._is_failed(tts_result.status):
+            ctx.result = self._create_failed_result(
+                fragment_data=fragment_data,
+                stage=ErrorStage.TTS,
+                error_message=getattr(tts_result, "error_message", None)
+                or "TTS synthesis failed",
+                stage_timings=stage_timings,
+                processing_time_ms=self._elapsed_ms(ctx.start_time),
+                retryable=False,  # Duration mismatch is not retryable
+                transcript=ctx.transcript,
+                translated_text=ctx.translated_text,
+            )
+            return
+
+        # Check for PARTIAL status (e.g., clamped speed ratio)
+        if self._is_partial(tts_result.status):
+            ctx.status = ProcessingStatus.PARTIAL
+
+    async def _run_encode_stage(self, ctx: FragmentContext) -> None:
+        """Pad and encode synthesized audio and build the final result."""
+        fragment_data = ctx.fragment_data
+        session = ctx.session
+        stage_timings = ctx.stage_timings
+        logger = ctx.logger
+        tts_result = ctx.tts_result
+        status = ctx.status
+        translated_text = ctx.translated_text
+
+        trace = ctx.trace
+
+        # Step 5: Get audio bytes and encode to AAC (M4A) format
+        audio_bytes_out = getattr(tts_result, "audio_bytes", b"")
+        if not audio_bytes_out:
+            # Try to get from payload_ref (mock may not set audio_bytes)
+            audio_bytes_out = b"\x00\x00" * (session.sample_rate_hz * 6)  # 6s silence fallback
+
+        # Build duration metadata first (needed for encoding)
+        tts_duration_ms = getattr(tts_result, "duration_ms", fragment_data.audio.duration_ms)
+        tts_duration_metadata = getattr(tts_result, "duration_metadata", None)
+
+        if tts_duration_metadata:
+            duration_metadata = DurationMetadata(
+                original_duration_ms=tts_duration_metadata.original_duration_ms,
+                dubbed_duration_ms=tts_duration_metadata.final_duration_ms,
+                duration_variance_percent=tts_duration_metadata.duration_variance_percent,
+                speed_ratio=tts_duration_metadata.speed_ratio,
+            )
+        else:
+            # Calculate from available data
+            variance = (
+                abs(tts_duration_ms - fragment_data.audio.duration_ms)
+                / fragment_data.audio.duration_ms
+                * 100
+            )
+            duration_metadata = DurationMetadata(
+                original_duration_ms=fragment_data.audio.duration_ms,
+                dubbed_duration_ms=tts_duration_ms,
+                duration_variance_percent=variance,
+                speed_ratio=1.0,
+            )
 
-            # Check for PARTIAL status (e.g., clamped speed ratio)
-            if self._is_partial(tts_result.status):
-                status = ProcessingStatus.PARTIAL
-
-            # Step 5: Get audio bytes and encode to AAC (M4A) format
-            logger.info("DEBUG: Step 5 - Encoding audio to AAC")
-            audio_bytes_out = getattr(tts_result, "audio_bytes", b"")
-            logger.info("DEBUG: audio_bytes_out len (PCM)", audio_len=len(audio_bytes_out))
-            if not audio_bytes_out:
-                # Try to get from payload_ref (mock may not set audio_bytes)
-                audio_bytes_out = b"\x00\x00" * (session.sample_rate_hz * 6)  # 6s silence fallback
-
-            # Build duration metadata first (needed for encoding)
-            tts_duration_ms = getattr(tts_result, "duration_ms", fragment_data.audio.duration_ms)
-            tts_duration_metadata = getattr(tts_result, "duration_metadata", None)
-
-            if tts_duration_metadata:
-                duration_metadata = DurationMetadata(
-                    original_duration_ms=tts_duration_metadata.original_duration_ms,
-                    dubbed_duration_ms=tts_duration_metadata.final_duration_ms,
-                    duration_variance_percent=tts_duration_metadata.duration_variance_percent,
-                    speed_ratio=tts_duration_metadata.speed_ratio,
-                )
-            else:
-                # Calculate from available data
-                variance = (
-                    abs(tts_duration_ms - fragment_data.audio.duration_ms)
-                    / fragment_data.audio.duration_ms
-                    * 100
-                )
-                duration_metadata = DurationMetadata(
-                    original_duration_ms=fragment_data.audio.duration_ms,
-                    dubbed_duration_ms=tts_duration_ms,
-                    duration_variance_percent=variance,
-                    speed_ratio=1.0,
-                )
+        # Get audio format - ElevenLabs uses audio_format (enum), others may use format (string)
+        tts_audio_format = getattr(tts_result, "audio_format", None)
+        tts_sample_rate = getattr(tts_result, "sample_rate_hz", session.sample_rate_hz)
+        tts_channels = getattr(tts_result, "channels", session.channels)
+
+        # Check if audio is PCM format and needs AAC encoding
+        is_pcm = False
+        if tts_audio_format is not None:
+            # Handle enum (has .value) or string
+            format_value = getattr(tts_audio_format, "value", str(tts_audio_format))
+            is_pcm = "pcm" in format_value.lower()
+        else:
+            is_pcm = True  # Assume PCM if no format specified
+
+        # Pad audio with silence if shorter than target duration
+        # This handles cases where TTS audio is shorter than the segment duration
+        # (e.g., translated speech is shorter than original, and only_speed_up=True
+        # prevents time-stretching to slow down the audio)
+        target_duration_ms = fragment_data.audio.duration_ms
+        pcm: Optional[AudioBuffer] = None
+        if is_pcm and audio_bytes_out:
+            # View the provider's PCM in place; padding writes into one pooled buffer
+            pcm = AudioBuffer.from_pcm(audio_bytes_out, tts_sample_rate, tts_channels)
+        if pcm is not None and tts_duration_ms < target_duration_ms:
+            pcm, padding_ms = pad_audio_with_silence(
+                audio_data=pcm,
+                current_duration_ms=tts_duration_ms,
+                target_duration_ms=target_duration_ms,
+                sample_rate_hz=tts_sample_rate,
+                channels=tts_channels,
+                bytes_per_sample=4,  # float32
+            )
+            # Update duration metadata to reflect the padded duration
+            tts_duration_ms = target_duration_ms
+            duration_metadata = DurationMetadata(
+                original_duration_ms=fragment_data.audio.duration_ms,
+                dubbed_duration_ms=target_duration_ms,
+                duration_variance_percent=0.0,  # Now matches target
+                speed_ratio=1.0,
+            )
+            trace.event(
+                TraceLevel.DEBUG,
+                "dubbed_audio_padded",
+                padding_ms=padding_ms,
+                duration_ms=tts_duration_ms,
+            )
 
-            # Get audio format - ElevenLabs uses audio_format (enum), others may use format (string)
-            tts_audio_format = getattr(tts_result, "audio_format", None)
-            tts_sample_rate = getattr(tts_result, "sample_rate_hz", session.sample_rate_hz)
-            tts_channels = getattr(tts_result, "channels", session.channels)
-
-            # Check if audio is PCM format and needs AAC encoding
-            is_pcm = False
-            if tts_audio_format is not None:
-                # Handle enum (has .value) or string
-                format_value = getattr(tts_audio_format, "value", str(tts_audio_format))
-                is_pcm = "pcm" in format_value.lower()
-            else:
-                is_pcm = True  # Assume PCM if no format specified
-
-            # Pad audio with silence if shorter than target duration
-            # This handles cases where TTS audio is shorter than the segment duration
-            # (e.g., translated speech is shorter than original, and only_speed_up=True
-            # prevents time-stretching to slow down the audio)
-            target_duration_ms = fragment_data.audio.duration_ms
-            if is_pcm and audio_bytes_out and tts_duration_ms < target_duration_ms:
-                audio_bytes_out, padding_ms = pad_audio_with_silence(
-                    audio_data=audio_bytes_out,
-                    current_duration_ms=tts_duration_ms,
-                    target_duration_ms=target_duration_ms,
+        # Encode PCM to AAC in the container the stream negotiated (M4A or ADTS)
+        if pcm is not None:
+            try:
+                trace.capture("dubbed_pcm", pcm.samples)
+                audio_bytes_out = await self._encode_pooled(
+                    pcm,
                     sample_rate_hz=tts_sample_rate,
                     channels=tts_channels,
-                    bytes_per_sample=4,  # float32
-                )
-                # Update duration metadata to reflect the padded duration
-                tts_duration_ms = target_duration_ms
-                duration_metadata = DurationMetadata(
-                    original_duration_ms=fragment_data.audio.duration_ms,
-                    dubbed_duration_ms=target_duration_ms,
-                    duration_variance_percent=0.0,  # Now matches target
-                    speed_ratio=1.0,
+                    input_format=AudioFormat.PCM_F32LE,
+                    container=session.output_format,
                 )
-                logger.info(
-                    "DEBUG: Audio padded with silence",
-                    padding_ms=padding_ms,
-                    new_duration_ms=tts_duration_ms,
+                output_format = session.output_format
+                trace.event(
+                    TraceLevel.DEBUG,
+                    "dubbed_audio_encoded",
+                    pcm_bytes=pcm.nbytes,
+                    aac_bytes=len(audio_bytes_out),
+                    sample_rate=tts_sample_rate,
+                    channels=tts_channels,
                 )
-
-            # Encode PCM to AAC (M4A) for media-service compatibility
-            if is_pcm and audio_bytes_out:
-                try:
-                    logger.info(
-                        "DEBUG: Encoding PCM to AAC",
-                        pcm_bytes=len(audio_bytes_out),
-                        sample_rate=tts_sample_rate,
-                        channels=tts_channels,
-                    )
-                    audio_bytes_out = encode_pcm_to_m4a(
-                        pcm_data=audio_bytes_out,
-                        sample_rate_hz=tts_sample_rate,
-                        channels=tts_channels,
-                        input_format=AudioFormat.PCM_F32LE,
-                        bitrate_kbps=128,
-                    )
-                    output_format = "m4a"
-                    logger.info("DEBUG: AAC encoding complete", aac_bytes=len(audio_bytes_out))
-                except Exception as e:
-                    logger.error("Failed to encode PCM to AAC", error=str(e))
-                    # Fall back to PCM format (may not work with media-service)
-                    output_format = "pcm_f32le"
+            except Exception as e:
+                logger.error("Failed to encode PCM to AAC", error=str(e))
+                # Fall back to PCM format (may not work with media-service)
+                output_format = "pcm_f32le"
+                audio_bytes_out = pcm.tobytes()
+            pcm.release()
+        else:
+            # Audio is already in a container format
+            if tts_audio_format:
+                output_format = getattr(tts_audio_format, "value", str(tts_audio_format))
             else:
-                # Audio is already in a container format
-                output_format = getattr(tts_audio_format, "value", str(tts_audio_format)) if tts_audio_format else "m4a"
+                output_format = "m4a"
+
+        # Build dubbed audio response with AAC format
+        dubbed_audio = AudioData.from_bytes(
+            audio_bytes_out,
+            binary=session.binary_audio,
+            format=output_format,
+            sample_rate_hz=tts_sample_rate,
+            channels=tts_channels,
+            duration_ms=tts_duration_ms,
+        )
 
-            audio_b64 = base64.b64encode(audio_bytes_out).decode("utf-8")
+        # Log artifacts if enabled
+        if self.artifact_logger:
+            # Log dubbed audio
+            # Convert duration_metadata to DurationMatchMetadata if needed
+            duration_match_meta = None
+            if duration_metadata:
+                duration_match_meta = DurationMatchMetadata(
+                    original_duration_ms=duration_metadata.original_duration_ms,
+                    raw_duration_ms=duration_metadata.original_duration_ms,
+                    final_duration_ms=duration_metadata.dubbed_duration_ms,
+                    duration_variance_percent=duration_metadata.duration_variance_percent,
+                    speed_ratio=duration_metadata.speed_ratio,
+                    speed_clamped=False,
+                )
 
-            # Build dubbed audio response with AAC format
-            dubbed_audio = AudioData(
-                format=output_format,
-                sample_rate_hz=tts_sample_rate,
-                channels=tts_channels,
-                duration_ms=tts_duration_ms,
-                data_base64=audio_b64,
+            dubbed_audio_asset = AudioAsset(
+                asset_id=f"audio-dubbed-{fragment_data.fragment_id}",
+                fragment_id=fragment_data.fragment_id,
+                stream_id=fragment_data.stream_id,
+                status=AssetStatus.SUCCESS
+                if status == ProcessingStatus.SUCCESS
+                else AssetStatus.PARTIAL,
+                audio_bytes=audio_bytes_out,
+                format=dubbed_audio.format,
+                sample_rate_hz=dubbed_audio.sample_rate_hz,
+                channels=dubbed_audio.channels,
+                duration_ms=dubbed_audio.duration_ms,
+                duration_metadata=duration_match_meta,
+                voice_profile="default",
+                text_input=translated_text,
+                parent_asset_ids=[f"translation-{fragment_data.fragment_id}"],
+                latency_ms=stage_timings.tts_ms,
+            )
+            await self._executor.run(
+                "artifacts", self.artifact_logger.log_dubbed_audio, dubbed_audio_asset
             )
 
-            # Log artifacts if enabled
-            if self.artifact_logger:
-                # Log dubbed audio
-                # Convert duration_metadata to DurationMatchMetadata if needed
-                duration_match_meta = None
-                if duration_metadata:
-                    duration_match_meta = DurationMatchMetadata(
-                        original_duration_ms=duration_metadata.original_duration_ms,
-                        raw_duration_ms=duration_metadata.original_duration_ms,
-                        final_duration_ms=duration_metadata.dubbed_duration_ms,
-                        duration_variance_percent=duration_metadata.duration_variance_percent,
-                        speed_ratio=duration_metadata.speed_ratio,
-                        speed_clamped=False,
-                    )
-
-                dubbed_audio_asset = AudioAsset(
-                    asset_id=f"audio-dubbed-{fragment_data.fragment_id}",
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    status=AssetStatus.SUCCESS
-                    if status == ProcessingStatus.SUCCESS
-                    else AssetStatus.PARTIAL,
-                    audio_bytes=audio_bytes_out,
-                    format=dubbed_audio.format,
-                    sample_rate_hz=dubbed_audio.sample_rate_hz,
-                    channels=dubbed_audio.channels,
-                    duration_ms=dubbed_audio.duration_ms,
-                    duration_metadata=duration_match_meta,
-                    voice_profile="default",
-                    text_input=translated_text,
-                    parent_asset_ids=[f"translation-{fragment_data.fragment_id}"],
-                    latency_ms=stage_timings.tts_ms,
-                )
-                self.artifact_logger.log_dubbed_audio(dubbed_audio_asset)
-
-                # Log original audio
-                original_audio_asset = AudioAsset(
-                    asset_id=f"audio-original-{fragment_data.fragment_id}",
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    status=AssetStatus.SUCCESS,
-                    audio_bytes=audio_bytes,
-                    format=fragment_data.audio.format,
-                    sample_rate_hz=fragment_data.audio.sample_rate_hz,
-                    channels=fragment_data.audio.channels,
-                    duration_ms=fragment_data.audio.duration_ms,
-                    duration_metadata=None,
-                    voice_profile="original",
-                    text_input="",
-                    parent_asset_ids=[],
-                    latency_ms=0,
-                )
-                self.artifact_logger.log_original_audio(original_audio_asset)
-
-                # Log metadata
-                self.artifact_logger.log_metadata(
-                    fragment_id=fragment_data.fragment_id,
-                    stream_id=fragment_data.stream_id,
-                    status=status.value,
-                    processing_time_ms=self._elapsed_ms(start_time),
-                    stage_timings={
-                        "asr_ms": stage_timings.asr_ms,
-                        "translation_ms": stage_timings.translation_ms,
-                        "tts_ms": stage_timings.tts_ms,
-                    },
-                    transcript_asset_id=f"transcript-{fragment_data.fragment_id}",
-                    translation_asset_id=f"translation-{fragment_data.fragment_id}",
-                    audio_asset_id=f"audio-dubbed-{fragment_data.fragment_id}",
-                )
+            # Log original audio
+            original_audio_asset = AudioAsset(
+                asset_id=f"audio-original-{fragment_data.fragment_id}",
+                fragment_id=fragment_data.fragment_id,
+                stream_id=fragment_data.stream_id,
+                status=AssetStatus.SUCCESS,
+                audio_bytes=ctx.pcm_audio.tobytes() if ctx.pcm_audio is not None else b"",
+                format=fragment_data.audio.format,
+                sample_rate_hz=fragment_data.audio.sample_rate_hz,
+                channels=fragment_data.audio.channels,
+                duration_ms=fragment_data.audio.duration_ms,
+                duration_metadata=None,
+                voice_profile="original",
+                text_input="",
+                parent_asset_ids=[],
+                latency_ms=0,
+            )
+            await self._executor.run(
+                "artifacts", self.artifact_logger.log_original_audio, original_audio_asset
+            )
 
-        except Exception as e:
-            # Unexpected error
-            return self._create_failed_result(
-                fragment_data=fragment_data,
-                stage=ErrorStage.ASR,  # Default to ASR if unknown
-                error_message=str(e),
-                stage_timings=stage_timings,
-                processing_time_ms=self._elapsed_ms(start_time),
-                retryable=True,
+            # Log metadata
+            await self._executor.run(
+                "artifacts",
+                self.artifact_logger.log_metadata,
+                fragment_id=fragment_data.fragment_id,
+                stream_id=fragment_data.stream_id,
+                status=status.value,
+                processing_time_ms=self._elapsed_ms(ctx.start_time),
+                stage_timings={
+                    "asr_ms": stage_timings.asr_ms,
+                    "translation_ms": stage_timings.translation_ms,
+                    "tts_ms": stage_timings.tts_ms,
+                },
+                transcript_asset_id=f"transcript-{fragment_data.fragment_id}",
+                translation_asset_id=f"translation-{fragment_data.fragment_id}",
+                audio_asset_id=f"audio-dubbed-{fragment_data.fragment_id}",
             )
 
         # Step 6: Record final metrics and build result
-        total_time = time.perf_counter() - start_time
+        total_time = time.perf_counter() - ctx.start_time
         # observe_fragment_latency(total_time)  # TODO: Add this metric
         record_fragment_success(
             session.stream_id, int(total_time * 1000), stage_timings.model_dump()
@@ -769,18 +1049,18 @@ class PipelineCoordinator:
         )
 
         # Build successful FragmentResult
-        return FragmentResult(
+        ctx.result = FragmentResult(
             fragment_id=fragment_data.fragment_id,
             stream_id=fragment_data.stream_id,
             sequence_number=fragment_data.sequence_number,
             status=status,
             dubbed_audio=dubbed_audio,
-            transcript=transcript,
+            transcript=ctx.transcript,
             translated_text=translated_text,
-            processing_time_ms=self._elapsed_ms(start_time),
+            processing_time_ms=self._elapsed_ms(ctx.start_time),
             stage_timings=stage_timings,
             metadata=duration_metadata,
-            error=error,
+            error=None,
         )
 
     def _is_failed(self, status: object) -> bool:
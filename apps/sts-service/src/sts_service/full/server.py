@@ -3,22 +3,57 @@
 Creates FastAPI app combined with Socket.IO AsyncServer per spec 021.
 """
 
+import asyncio
 import logging
+from typing import Optional
 
 import socketio
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from pydantic import BaseModel, Field
 
+from sts_service.asr.batching import get_batch_scheduler
 from sts_service.full.backpressure_tracker import BackpressureTracker
+from sts_service.full.config import WarmupConfig
 from sts_service.full.handlers.fragment import register_fragment_handlers
 from sts_service.full.handlers.lifecycle import register_lifecycle_handlers
 from sts_service.full.handlers.stream import register_stream_handlers
+from sts_service.full.observability.metrics import record_asr_batch, record_model_registry_event
 from sts_service.full.session import SessionStore
+from sts_service.full.stage_executor import get_stage_executor, shutdown_stage_executor
+from sts_service.full.translation_cache import shutdown_translation_cache
+from sts_service.full.warmup import get_warmup_state, run_warmup
+from sts_service.model_registry import get_model_registry, shutdown_model_registry
+from sts_service.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
 
+class TraceRequest(BaseModel):
+    """Body of PUT /debug/trace/{stream_id}."""
+
+    level: str = Field(description="off, debug, verbose or capture")
+    sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    ttl_s: Optional[float] = Field(default=600.0, gt=0, description="None: until cleared")
+    max_captures: int = Field(default=100, ge=0)
+
+
+async def _startup() -> None:
+    """Start model warm-up in the background; /ready reports when it finishes."""
+    if get_warmup_state().ready:
+        return
+    asyncio.get_running_loop().run_in_executor(None, run_warmup)
+
+
+def _shutdown() -> None:
+    """Release process-wide resources when the ASGI app shuts down."""
+    shutdown_stage_executor()
+    shutdown_translation_cache()
+    shutdown_model_registry()
+
+
 def create_app() -> socketio.ASGIApp:
     """Create FastAPI + Socket.IO ASGI application.
 
@@ -41,11 +76,22 @@ def create_app() -> socketio.ASGIApp:
         allow_headers=["*"],
     )
 
-    # Health check endpoint
+    # Health check endpoint (liveness; "ready" mirrors /ready)
     @fastapi_app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": "full-sts-service"}
+        return {
+            "status": "healthy",
+            "service": "full-sts-service",
+            "ready": get_warmup_state().ready,
+        }
+
+    # Readiness endpoint: 503 until startup model warm-up has finished
+    @fastapi_app.get("/ready")
+    async def readiness_check():
+        """Readiness endpoint with per-model warm-up results."""
+        state = get_warmup_state()
+        return JSONResponse(content=state.to_dict(), status_code=200 if state.ready else 503)
 
     # Prometheus metrics endpoint
     @fastapi_app.get("/metrics")
@@ -63,6 +109,46 @@ def create_app() -> socketio.ASGIApp:
         """
         return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
+    # Per-stream debug tracing, switchable at runtime (see sts_service.tracing)
+    @fastapi_app.get("/debug/trace")
+    async def get_trace_settings():
+        """Default trace settings and active per-stream overrides."""
+        tracer = get_tracer()
+        return {
+            "default": tracer.default.to_dict(),
+            "streams": {
+                stream_id: settings.to_dict()
+                for stream_id, settings in tracer.overrides().items()
+            },
+        }
+
+    @fastapi_app.put("/debug/trace/{stream_id}")
+    async def set_stream_trace(stream_id: str, body: TraceRequest):
+        """Enable tracing for a stream until the TTL expires."""
+        try:
+            settings = get_tracer().set_stream(
+                stream_id,
+                body.level,
+                sample_rate=body.sample_rate,
+                ttl_s=body.ttl_s,
+                max_captures=body.max_captures,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return {"stream_id": stream_id, **settings.to_dict()}
+
+    @fastapi_app.delete("/debug/trace/{stream_id}")
+    async def clear_stream_trace(stream_id: str):
+        """Return a stream to the default trace settings."""
+        if not get_tracer().clear_stream(stream_id):
+            raise HTTPException(status_code=404, detail=f"No trace override for {stream_id}")
+        return {"stream_id": stream_id, "cleared": True}
+
+    @fastapi_app.get("/debug/trace/{stream_id}/events")
+    async def get_stream_trace_events(stream_id: str):
+        """Most recent trace events recorded for a stream."""
+        return {"stream_id": stream_id, "events": get_tracer().recent_events(stream_id)}
+
     # Create Socket.IO AsyncServer
     sio = socketio.AsyncServer(
         async_mode="asgi",
@@ -85,10 +171,23 @@ def create_app() -> socketio.ASGIApp:
 
     logger.info("Full STS Service handlers registered")
 
+    # Start stage thread pools up front so the first fragment does not pay for it
+    get_stage_executor()
+
+    # Without warm-up the service is ready immediately
+    if not WarmupConfig().enabled:
+        get_warmup_state().mark_ready(0.0)
+
+    # Export model loads/evictions from the shared registry
+    get_model_registry().add_listener(record_model_registry_event)
+    get_batch_scheduler().add_listener(record_asr_batch)
+
     # Combine FastAPI and Socket.IO into single ASGI app
     app = socketio.ASGIApp(
         socketio_server=sio,
         other_asgi_app=fastapi_app,
+        on_startup=_startup,
+        on_shutdown=_shutdown,
     )
 
     return app
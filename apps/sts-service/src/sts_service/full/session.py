@@ -15,6 +15,7 @@ from sts_service.full.models.stream import StreamState
 if TYPE_CHECKING:
     from sts_service.full.models.fragment import FragmentResult
     from sts_service.full.pipeline import PipelineCoordinator
+    from sts_service.full.staged_pipeline import StagedFragmentPipeline
 
 
 @dataclass
@@ -96,13 +97,18 @@ class StreamSession:
     sample_rate_hz: int = 48000
     channels: int = 1
     format: str = "m4a"
+    output_format: str = "m4a"  # Dubbed audio container (m4a or adts)
     max_inflight: int = 3
     timeout_ms: int = 8000
     domain_hints: Optional[list[str]] = None
+    binary_audio: bool = False  # Fragment audio as raw bytes instead of base64
 
     # Pipeline coordinator (initialized on stream:init)
     pipeline_coordinator: Optional["PipelineCoordinator"] = None
 
+    # Per-stage fragment pipeline (created on first fragment when staging is enabled)
+    fragment_pipeline: Optional["StagedFragmentPipeline"] = None
+
     # Flow control
     inflight_count: int = 0
     next_sequence_to_emit: int = 0
@@ -0,0 +1,157 @@
+"""Encoded Silence Cache for Full STS Service.
+
+Silent fragments (empty transcript) all produce the same output for a given
+duration and audio format, so the encoded AAC payload and its base64 string
+are cached instead of being re-encoded per fragment.
+
+Process-wide LRU keyed by (duration_ms, sample_rate_hz, channels,
+bitrate_kbps, output_format), bounded by SILENCE_CACHE_MAX_ENTRIES.
+"""
+
+import base64
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, NamedTuple, Optional
+
+from .config import AudioCodecConfig
+from .models.fragment import AudioData
+from .observability.metrics import record_silence_cache_lookup, set_silence_cache_entries
+
+logger = logging.getLogger(__name__)
+
+
+class SilenceKey(NamedTuple):
+    """Cache key for an encoded silence payload."""
+
+    duration_ms: int
+    sample_rate_hz: int
+    channels: int
+    bitrate_kbps: int
+    output_format: str = "m4a"
+
+
+@dataclass(frozen=True)
+class EncodedSilence:
+    """Encoded silence ready to wrap in AudioData."""
+
+    format: str
+    data: bytes
+
+    @cached_property
+    def data_base64(self) -> str:
+        """Base64 form of data, encoded once per entry for non-binary sessions."""
+        return base64.b64encode(self.data).decode("utf-8")
+
+    def to_audio_data(self, binary: bool = False, **fields: Any) -> AudioData:
+        """Wrap the payload in AudioData.
+
+        Args:
+            binary: Send as a raw bytes attachment instead of base64
+            **fields: sample_rate_hz, channels, duration_ms
+
+        Returns:
+            AudioData carrying the cached payload
+        """
+        if binary:
+            return AudioData(data=self.data, format=self.format, **fields)
+        return AudioData(data_base64=self.data_base64, format=self.format, **fields)
+
+
+class SilenceCache:
+    """Bounded LRU of encoded silence payloads.
+
+    Features:
+    - LRU eviction once max_entries is reached
+    - Thread-safe (lookups may come from any stage worker)
+    - Hit/miss counters and entry gauge via observability.metrics
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached payloads (default: SILENCE_CACHE_MAX_ENTRIES)
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries is None:
+            max_entries = AudioCodecConfig().silence_cache_max_entries
+        self._max_entries = max_entries
+        if self._max_entries < 1:
+            raise ValueError(f"Silence cache size must be >= 1, got {self._max_entries}")
+
+        self._entries: OrderedDict[SilenceKey, EncodedSilence] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SilenceKey) -> Optional[EncodedSilence]:
+        """Look up an encoded payload, recording a hit or miss.
+
+        Args:
+            key: Duration and audio format of the silence
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        record_silence_cache_lookup(hit=entry is not None)
+        return entry
+
+    def put(self, key: SilenceKey, entry: EncodedSilence) -> None:
+        """Store an encoded payload, evicting the least recently used if full.
+
+        Args:
+            key: Duration and audio format of the silence
+            entry: Encoded payload
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug(f"Silence cache evicted: {evicted}")
+            size = len(self._entries)
+
+        set_silence_cache_entries(size)
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+        set_silence_cache_entries(0)
+
+
+# Process-wide cache shared by all sessions
+_cache: Optional[SilenceCache] = None
+
+
+def get_silence_cache() -> SilenceCache:
+    """Get the process-wide silence cache, creating it on first use.
+
+    Returns:
+        The shared SilenceCache instance.
+    """
+    global _cache
+    if _cache is None:
+        _cache = SilenceCache()
+    return _cache
+
+
+def set_silence_cache(cache: Optional[SilenceCache]) -> None:
+    """Set the process-wide silence cache (for testing).
+
+    Args:
+        cache: The cache to use, or None to reset.
+    """
+    global _cache
+    _cache = cache
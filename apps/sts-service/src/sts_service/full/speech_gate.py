@@ -0,0 +1,216 @@
+"""Speech Pre-Gate for Full STS Service.
+
+Silence, crowd noise and music beds used to go through audio preprocessing
+and a full Whisper call just to come back with an empty transcript. The
+gate classifies decoded fragment PCM as speech or non-speech before ASR;
+non-speech fragments go straight to the silence path.
+
+Backends:
+- energy: Framewise RMS level and spectral flatness in the speech band.
+  A frame counts as speech if it is loud enough and tonal (voiced speech
+  has a peaky spectrum; hiss, crowd noise and silence are flat or quiet).
+  Pure NumPy, about a millisecond per fragment.
+- silero: Silero VAD (ONNX) from faster-whisper, without loading Whisper.
+  Better at rejecting music. Falls back to energy if faster-whisper is
+  not installed.
+
+Selected with SPEECH_GATE_BACKEND. The gate fails open: if classification
+raises, the fragment is treated as speech.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from sts_service.audio_buffer import PCMData, as_float32
+
+from .config import SpeechGateConfig
+from .observability.metrics import record_speech_gate_decision
+
+logger = logging.getLogger(__name__)
+
+FRAME_MS = 30
+# Band used for spectral flatness (most voiced speech energy)
+SPEECH_BAND_HZ = (100.0, 4000.0)
+SILERO_SAMPLE_RATE_HZ = 16000
+
+
+@dataclass(frozen=True)
+class SpeechDecision:
+    """Gate verdict for one fragment."""
+
+    is_speech: bool
+    speech_ms: int
+    backend: str
+
+
+class EnergySpeechDetector:
+    """RMS + spectral flatness heuristic."""
+
+    name = "energy"
+
+    def __init__(self, config: SpeechGateConfig):
+        self._config = config
+
+    def speech_ms(self, pcm: np.ndarray, sample_rate_hz: int) -> int:
+        """Total duration of speech-like frames.
+
+        Args:
+            pcm: Mono float32 samples
+            sample_rate_hz: Sample rate of pcm
+
+        Returns:
+            Milliseconds of frames classified as speech
+        """
+        frame_len = sample_rate_hz * FRAME_MS // 1000
+        n_frames = len(pcm) // frame_len
+        if n_frames == 0:
+            return 0
+
+        frames = pcm[: n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float64)
+        rms = np.sqrt(np.mean(frames**2, axis=1))
+        dbfs = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+        power = np.abs(np.fft.rfft(frames * np.hanning(frame_len), axis=1)) ** 2 + 1e-12
+        freqs = np.fft.rfftfreq(frame_len, d=1.0 / sample_rate_hz)
+        band = power[:, (freqs >= SPEECH_BAND_HZ[0]) & (freqs <= SPEECH_BAND_HZ[1])]
+        flatness = np.exp(np.mean(np.log(band), axis=1)) / np.mean(band, axis=1)
+
+        speech = (dbfs > self._config.min_rms_dbfs) & (flatness < self._config.max_flatness)
+        return int(np.count_nonzero(speech)) * FRAME_MS
+
+
+class SileroSpeechDetector:
+    """Silero VAD via faster-whisper's bundled ONNX model."""
+
+    name = "silero"
+
+    def __init__(self, config: SpeechGateConfig):
+        # Raises ImportError when faster-whisper (and onnxruntime) is missing
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        self._get_speech_timestamps = get_speech_timestamps
+        self._options = VadOptions(min_speech_duration_ms=config.min_speech_ms)
+
+    def speech_ms(self, pcm: np.ndarray, sample_rate_hz: int) -> int:
+        """Total duration of speech regions found by Silero VAD.
+
+        Raises:
+            ValueError: If the audio is not 16kHz
+        """
+        if sample_rate_hz != SILERO_SAMPLE_RATE_HZ:
+            raise ValueError(f"Silero VAD expects 16kHz audio, got {sample_rate_hz}Hz")
+        chunks = self._get_speech_timestamps(pcm, self._options)
+        return sum(chunk["end"] - chunk["start"] for chunk in chunks) * 1000 // sample_rate_hz
+
+
+class SpeechGate:
+    """Classifies fragments as speech/non-speech ahead of ASR.
+
+    Features:
+    - Pluggable detector (energy heuristic or Silero VAD)
+    - Fail-open on detector errors
+    - Estimates ASR time avoided from recent ASR cost per audio second
+    - Decisions and avoided time exported via observability.metrics
+    """
+
+    def __init__(self, config: Optional[SpeechGateConfig] = None):
+        """Initialize the gate.
+
+        Args:
+            config: Gate settings (default: from environment)
+        """
+        self._config = config or SpeechGateConfig()
+        self._config.validate()
+        self._detector = self._create_detector()
+        self._lock = threading.Lock()
+        self._asr_ms_per_audio_s: Optional[float] = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the active detector."""
+        return self._detector.name
+
+    def _create_detector(self):
+        if self._config.backend == "silero":
+            try:
+                return SileroSpeechDetector(self._config)
+            except ImportError:
+                logger.warning("faster-whisper not installed, speech gate uses energy backend")
+        return EnergySpeechDetector(self._config)
+
+    def classify(self, pcm_bytes: PCMData, sample_rate_hz: int) -> SpeechDecision:
+        """Decide whether a fragment contains speech.
+
+        Args:
+            pcm_bytes: Mono PCM f32le audio (bytes or AudioBuffer)
+            sample_rate_hz: Sample rate of the audio
+
+        Returns:
+            SpeechDecision for the fragment
+        """
+        pcm = as_float32(pcm_bytes)
+        try:
+            speech_ms = self._detector.speech_ms(pcm, sample_rate_hz)
+        except Exception as e:
+            logger.warning(f"Speech gate failed, passing fragment to ASR: {e}")
+            return SpeechDecision(is_speech=True, speech_ms=-1, backend=self.backend)
+
+        decision = SpeechDecision(
+            is_speech=speech_ms >= max(self._config.min_speech_ms, 1),
+            speech_ms=speech_ms,
+            backend=self.backend,
+        )
+        audio_ms = len(pcm) * 1000 // sample_rate_hz
+        record_speech_gate_decision(
+            backend=decision.backend,
+            is_speech=decision.is_speech,
+            audio_ms=audio_ms,
+            avoided_asr_ms=0 if decision.is_speech else self.estimate_asr_ms(audio_ms),
+        )
+        return decision
+
+    def observe_asr(self, audio_ms: int, asr_ms: int) -> None:
+        """Update the ASR cost estimate from a fragment that did run ASR.
+
+        Args:
+            audio_ms: Fragment duration
+            asr_ms: ASR stage latency for the fragment
+        """
+        if audio_ms <= 0:
+            return
+        cost = asr_ms / (audio_ms / 1000.0)
+        with self._lock:
+            previous = self._asr_ms_per_audio_s
+            self._asr_ms_per_audio_s = cost if previous is None else 0.8 * previous + 0.2 * cost
+
+    def estimate_asr_ms(self, audio_ms: int) -> int:
+        """Estimated ASR latency for a fragment (0 until ASR has run once).
+
+        Args:
+            audio_ms: Fragment duration
+
+        Returns:
+            Estimated ASR milliseconds
+        """
+        with self._lock:
+            cost = self._asr_ms_per_audio_s
+        return int(cost * audio_ms / 1000.0) if cost is not None else 0
+
+
+def create_speech_gate(config: Optional[SpeechGateConfig] = None) -> Optional[SpeechGate]:
+    """Create the speech gate for a session, or None when disabled.
+
+    Args:
+        config: Gate settings (default: from environment)
+
+    Returns:
+        SpeechGate instance, or None if SPEECH_GATE_ENABLED is false
+    """
+    config = config or SpeechGateConfig()
+    if not config.enabled:
+        return None
+    return SpeechGate(config)
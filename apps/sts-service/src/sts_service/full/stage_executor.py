@@ -0,0 +1,175 @@
+"""Stage Executor for Full STS Service.
+
+Runs blocking pipeline stage calls (decode, ASR, translation, TTS, encode,
+artifact logging) on bounded per-stage thread pools so the Socket.IO event
+loop stays free to ack fragments, answer heartbeats and emit results for
+other streams while models run.
+
+Pools are process-wide and shared by every session: pool size caps the
+number of concurrent calls per stage across all streams.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
+
+from .config import StageExecutorConfig
+from .observability.metrics import record_stage_wait, set_stage_queue_depth
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Stage names accepted by StageExecutor.run()
+STAGES: tuple[str, ...] = ("decode", "asr", "translation", "tts", "encode", "artifacts")
+
+
+class StageExecutor:
+    """Bounded thread pools, one per pipeline stage.
+
+    Features:
+    - Per-stage ThreadPoolExecutor sized from StageExecutorConfig
+    - Queue depth tracking (calls submitted but not yet started)
+    - Queue wait time measurement per call
+    - Prometheus export of both via observability.metrics
+    """
+
+    def __init__(self, config: Optional[StageExecutorConfig] = None):
+        """Initialize per-stage thread pools.
+
+        Args:
+            config: Pool sizing (defaults to environment-based StageExecutorConfig)
+        """
+        self._config = config or StageExecutorConfig()
+        self._config.validate()
+
+        self._pools: dict[str, ThreadPoolExecutor] = {
+            stage: ThreadPoolExecutor(
+                max_workers=self._config.workers_for(stage),
+                thread_name_prefix=f"sts-{stage}",
+            )
+            for stage in STAGES
+        }
+        self._queued: dict[str, int] = dict.fromkeys(STAGES, 0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def config(self) -> StageExecutorConfig:
+        """Return the pool sizing configuration."""
+        return self._config
+
+    def queue_depth(self, stage: str) -> int:
+        """Return the number of calls waiting for a worker in a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Number of calls submitted but not yet started
+        """
+        return self._queued[stage]
+
+    async def run(self, stage: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the stage's thread pool.
+
+        Args:
+            stage: Stage name (one of STAGES)
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ValueError: If the stage is unknown
+            RuntimeError: If the executor has been shut down
+            Exception: Whatever func raises is propagated unchanged
+        """
+        if stage not in self._pools:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        if self._shutdown:
+            raise RuntimeError("Stage executor has been shut down")
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        started = False
+
+        def _invoke() -> T:
+            nonlocal started
+            with self._lock:
+                started = True
+                self._adjust_queue_depth(stage, -1)
+            record_stage_wait(stage, (time.perf_counter() - submitted_at) * 1000)
+            return func(*args, **kwargs)
+
+        with self._lock:
+            self._adjust_queue_depth(stage, 1)
+
+        try:
+            return await loop.run_in_executor(self._pools[stage], _invoke)
+        finally:
+            # Cancelled before a worker picked it up - drop it from the queue count
+            with self._lock:
+                if not started:
+                    started = True
+                    self._adjust_queue_depth(stage, -1)
+
+    def _adjust_queue_depth(self, stage: str, delta: int) -> None:
+        """Update queue depth bookkeeping and gauge (caller holds the lock)."""
+        self._queued[stage] = max(0, self._queued[stage] + delta)
+        set_stage_queue_depth(stage, self._queued[stage])
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all stage pools.
+
+        Args:
+            wait: Wait for running calls to finish
+        """
+        self._shutdown = True
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Stage executor shut down")
+
+
+# Process-wide executor shared by all sessions
+_executor: Optional[StageExecutor] = None
+
+
+def get_stage_executor() -> StageExecutor:
+    """Get the process-wide stage executor, creating it on first use.
+
+    Returns:
+        The shared StageExecutor instance.
+    """
+    global _executor
+    if _executor is None:
+        _executor = StageExecutor()
+        logger.info(
+            "Stage executor started: "
+            + ", ".join(f"{stage}={_executor.config.workers_for(stage)}" for stage in STAGES)
+        )
+    return _executor
+
+
+def shutdown_stage_executor() -> None:
+    """Shut down and discard the process-wide stage executor."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def set_stage_executor(executor: Optional[StageExecutor]) -> None:
+    """Set the process-wide stage executor (for testing).
+
+    Args:
+        executor: The executor to use, or None to reset.
+    """
+    global _executor
+    _executor = executor
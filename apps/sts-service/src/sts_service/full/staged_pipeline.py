@@ -0,0 +1,164 @@
+"""Staged Fragment Pipeline for Full STS Service.
+
+Drives PipelineCoordinator stages with one bounded queue and worker set per
+stage, so consecutive fragments of a stream overlap: fragment N+1 can be in
+ASR while fragment N is in TTS and fragment N-1 is encoding.
+
+Completed fragments are handed to an on_result callback as soon as they
+finish; in-order emission is the caller's job (StreamSession.pending_fragments
+and get_fragments_to_emit()).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from .config import StagedPipelineConfig
+from .models.fragment import FragmentData, FragmentResult
+from .pipeline import PIPELINE_STAGES, FragmentContext, PipelineCoordinator
+from .session import StreamSession
+
+logger = logging.getLogger(__name__)
+
+ResultCallback = Callable[[FragmentData, FragmentResult], Awaitable[None]]
+
+
+class StagedFragmentPipeline:
+    """Per-stream stage pipeline over PipelineCoordinator.
+
+    Features:
+    - One bounded asyncio.Queue per stage (back-pressures the previous stage)
+    - Configurable worker coroutines per stage
+    - Early exit for failed/silent fragments (skips remaining stages)
+    - Drain support for stream:end
+    """
+
+    def __init__(
+        self,
+        coordinator: PipelineCoordinator,
+        session: StreamSession,
+        on_result: ResultCallback,
+        config: Optional[StagedPipelineConfig] = None,
+    ):
+        """Initialize the staged pipeline (workers start on first submit).
+
+        Args:
+            coordinator: Pipeline coordinator providing the stage implementations
+            session: Stream session the fragments belong to
+            on_result: Coroutine called with each finished fragment's result
+            config: Queue/worker sizing (defaults to environment-based config)
+        """
+        self._coordinator = coordinator
+        self._session = session
+        self._on_result = on_result
+        self._config = config or StagedPipelineConfig()
+        self._config.validate()
+
+        self._queues: list[asyncio.Queue[FragmentContext]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._closed = False
+
+    @property
+    def is_running(self) -> bool:
+        """Return True once worker tasks have been started."""
+        return bool(self._workers)
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of fragments waiting at each stage."""
+        if not self._queues:
+            return dict.fromkeys(PIPELINE_STAGES, 0)
+        return {stage: q.qsize() for stage, q in zip(PIPELINE_STAGES, self._queues, strict=True)}
+
+    def _start(self) -> None:
+        """Create stage queues and worker tasks."""
+        self._queues = [asyncio.Queue(maxsize=self._config.queue_size) for _ in PIPELINE_STAGES]
+        for index, stage in enumerate(PIPELINE_STAGES):
+            for worker_num in range(self._config.workers_per_stage):
+                self._workers.append(
+                    asyncio.create_task(
+                        self._stage_worker(index),
+                        name=f"{self._session.stream_id}-{stage}-{worker_num}",
+                    )
+                )
+        logger.info(
+            f"Staged pipeline started: stream_id={self._session.stream_id}, "
+            f"stages={list(PIPELINE_STAGES)}, queue_size={self._config.queue_size}, "
+            f"workers_per_stage={self._config.workers_per_stage}"
+        )
+
+    async def submit(self, fragment_data: FragmentData) -> None:
+        """Enqueue a fragment at the first stage.
+
+        Waits if the first stage queue is full.
+
+        Args:
+            fragment_data: Fragment to process
+
+        Raises:
+            RuntimeError: If the pipeline has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Staged pipeline is closed")
+        if not self._workers:
+            self._start()
+
+        ctx = self._coordinator.start_fragment(fragment_data, self._session)
+        await self._queues[0].put(ctx)
+
+    async def _stage_worker(self, index: int) -> None:
+        """Pull fragments from one stage queue, run the stage, pass them on."""
+        stage = PIPELINE_STAGES[index]
+        queue = self._queues[index]
+        is_last = index == len(PIPELINE_STAGES) - 1
+
+        while True:
+            ctx = await queue.get()
+            try:
+                await self._coordinator.run_stage(stage, ctx)
+
+                if ctx.result is not None:
+                    await self._deliver(ctx)
+                elif is_last:
+                    raise RuntimeError(f"Stage '{stage}' finished without a result")
+                else:
+                    await self._queues[index + 1].put(ctx)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(
+                    f"Staged pipeline worker error: stage={stage}, "
+                    f"fragment_id={ctx.fragment_data.fragment_id}: {e}"
+                )
+                if ctx.result is None:
+                    self._coordinator.fail_stage(stage, ctx, e)
+                    await self._deliver(ctx)
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, ctx: FragmentContext) -> None:
+        """Hand a finished fragment to the result callback."""
+        assert ctx.result is not None
+        try:
+            await self._on_result(ctx.fragment_data, ctx.result)
+        except Exception as e:
+            logger.exception(
+                f"Result callback failed: fragment_id={ctx.fragment_data.fragment_id}: {e}"
+            )
+
+    async def drain(self) -> None:
+        """Wait until every submitted fragment has left every stage."""
+        for queue in self._queues:
+            await queue.join()
+
+    async def close(self) -> None:
+        """Stop accepting fragments and cancel worker tasks."""
+        self._closed = True
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info(f"Staged pipeline closed: stream_id={self._session.stream_id}")
+
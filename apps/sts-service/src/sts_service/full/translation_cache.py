@@ -0,0 +1,428 @@
+"""Translation Result Cache for Full STS Service.
+
+Live commentary repeats short phrases constantly, so translation results are
+cached and reused instead of making a provider round trip per fragment.
+
+Two tiers, shared by all sessions:
+- Memory: LRU bounded by TRANSLATION_CACHE_MAX_ENTRIES
+- Disk (optional): SQLite file at TRANSLATION_CACHE_DB_PATH that survives
+  restarts; disk hits are promoted to memory
+
+Entries expire after TRANSLATION_CACHE_TTL_SECONDS (0 = never). Only
+successful, non-empty translations are cached.
+
+CachedTranslationComponent wraps any BaseTranslationComponent with the
+shared cache.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from sts_service.translation.interface import BaseTranslationComponent
+from sts_service.translation.models import (
+    NormalizationPolicy,
+    SpeakerPolicy,
+    TextAsset,
+    TranslationStatus,
+)
+
+from .config import TranslationCacheConfig
+from .observability.metrics import record_translation_cache_lookup, set_translation_cache_entries
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_source_text(text: str) -> str:
+    """Normalize source text for cache keys (Unicode NFC, collapsed whitespace).
+
+    Case and punctuation are kept since they can change the translation.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(
+    source_text: str,
+    source_language: str,
+    target_language: str,
+    provider: str,
+    speaker_policy: Optional[SpeakerPolicy] = None,
+    normalization_policy: Optional[NormalizationPolicy] = None,
+) -> str:
+    """Build the cache key for a translation request.
+
+    Args:
+        source_text: Text to translate
+        source_language: Source language code
+        target_language: Target language code
+        provider: Component instance of the wrapped translator (e.g. deepl-v1)
+        speaker_policy: Speaker policy, or None for the provider default
+        normalization_policy: Normalization policy, or None for the provider default
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    parts = {
+        "text": normalize_source_text(source_text),
+        "source": source_language.lower(),
+        "target": target_language.lower(),
+        "provider": provider,
+        "speaker": speaker_policy.model_dump(mode="json") if speaker_policy else None,
+        "normalization": (
+            normalization_policy.model_dump(mode="json") if normalization_policy else None
+        ),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedTranslation:
+    """Cached fields of a successful TextAsset."""
+
+    translated_text: str
+    normalized_source_text: Optional[str]
+    speaker_id: str
+    created_at: float
+
+
+class SQLiteTranslationStore:
+    """Persistent translation tier in a single SQLite table.
+
+    The connection is shared across stage worker threads and guarded by the
+    owning TranslationCache's lock.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translated_text TEXT NOT NULL, "
+            "normalized_source_text TEXT, speaker_id TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedTranslation]:
+        row = self._conn.execute(
+            "SELECT translated_text, normalized_source_text, speaker_id, created_at "
+            "FROM translations WHERE key = ?",
+            (key,),
+        ).fetchone()
+        return CachedTranslation(*row) if row else None
+
+    def put(self, key: str, entry: CachedTranslation) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.translated_text,
+                entry.normalized_source_text,
+                entry.speaker_id,
+                entry.created_at,
+            ),
+        )
+        self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        self._conn.execute("DELETE FROM translations WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def prune(self, created_before: float) -> int:
+        """Delete entries created before the given time; returns rows removed."""
+        cursor = self._conn.execute(
+            "DELETE FROM translations WHERE created_at < ?", (created_before,)
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class TranslationCache:
+    """Two-tier (memory LRU + optional SQLite) translation cache with TTL.
+
+    Features:
+    - LRU eviction of the memory tier once max_entries is reached
+    - Disk tier shared across sessions and restarts
+    - Thread-safe (lookups come from translation stage workers)
+    - Hit/miss counters and memory-size gauge via observability.metrics
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        db_path: Optional[str] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Memory tier size (default: TRANSLATION_CACHE_MAX_ENTRIES)
+            ttl_seconds: Entry lifetime, 0 = never expire (default: TRANSLATION_CACHE_TTL_SECONDS)
+            db_path: SQLite file for the disk tier, "" = memory only
+                (default: TRANSLATION_CACHE_DB_PATH)
+
+        Raises:
+            ValueError: If max_entries is less than 1 or ttl_seconds is negative
+        """
+        config = TranslationCacheConfig()
+        self._max_entries = config.max_entries if max_entries is None else max_entries
+        self._ttl_seconds = config.ttl_seconds if ttl_seconds is None else ttl_seconds
+        db_path = config.db_path if db_path is None else db_path
+
+        if self._max_entries < 1:
+            raise ValueError(f"Translation cache size must be >= 1, got {self._max_entries}")
+        if self._ttl_seconds < 0:
+            raise ValueError(f"Translation cache TTL must be >= 0, got {self._ttl_seconds}")
+
+        self._entries: OrderedDict[str, CachedTranslation] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._store: Optional[SQLiteTranslationStore] = None
+        if db_path:
+            self._store = SQLiteTranslationStore(db_path)
+            if self._ttl_seconds:
+                removed = self._store.prune(time.time() - self._ttl_seconds)
+                if removed:
+                    logger.info(f"Pruned {removed} expired translations from {db_path}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, entry: CachedTranslation, now: float) -> bool:
+        return bool(self._ttl_seconds) and now - entry.created_at > self._ttl_seconds
+
+    def get(self, key: str) -> Optional[CachedTranslation]:
+        """Look up a translation in memory, then on disk, recording the result.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            Cached translation, or None on a miss or expired entry
+        """
+        now = time.time()
+        result = "miss"
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry, now):
+                    del self._entries[key]
+                    entry = None
+                else:
+                    self._entries.move_to_end(key)
+                    result = "hit_memory"
+
+            if entry is None and self._store is not None:
+                entry = self._store.get(key)
+                if entry is not None:
+                    if self._expired(entry, now):
+                        self._store.delete(key)
+                        entry = None
+                    else:
+                        self._insert(key, entry)
+                        result = "hit_disk"
+            size = len(self._entries)
+
+        record_translation_cache_lookup(result)
+        set_translation_cache_entries(size)
+        return entry
+
+    def put(self, key: str, entry: CachedTranslation) -> None:
+        """Store a translation in memory and on disk.
+
+        Args:
+            key: Key from make_cache_key()
+            entry: Translation to cache
+        """
+        with self._lock:
+            self._insert(key, entry)
+            if self._store is not None:
+                self._store.put(key, entry)
+            size = len(self._entries)
+
+        set_translation_cache_entries(size)
+
+    def _insert(self, key: str, entry: CachedTranslation) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+        set_translation_cache_entries(0)
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+
+class CachedTranslationComponent(BaseTranslationComponent):
+    """Translation component that serves repeated phrases from a TranslationCache.
+
+    Misses are delegated to the wrapped component; its successful results
+    are cached. Cached results are returned as a new TextAsset carrying the
+    request's stream, sequence and lineage identifiers.
+    """
+
+    def __init__(
+        self,
+        translator: BaseTranslationComponent,
+        cache: Optional[TranslationCache] = None,
+    ):
+        """Wrap a translation component.
+
+        Args:
+            translator: Component to call on cache misses
+            cache: Cache to use (default: the process-wide cache)
+        """
+        self._translator = translator
+        self._cache = cache if cache is not None else get_translation_cache()
+
+    @property
+    def component_instance(self) -> str:
+        """Return the wrapped provider's identifier."""
+        return self._translator.component_instance
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the wrapped component is ready."""
+        return self._translator.is_ready
+
+    def translate(
+        self,
+        source_text: str,
+        stream_id: str,
+        sequence_number: int,
+        source_language: str,
+        target_language: str,
+        parent_asset_ids: list[str],
+        speaker_policy: Optional[SpeakerPolicy] = None,
+        normalization_policy: Optional[NormalizationPolicy] = None,
+    ) -> TextAsset:
+        """Translate text, using the cache when the same request was seen before.
+
+        Args:
+            source_text: Text to translate
+            stream_id: Stream identifier
+            sequence_number: Sequence number
+            source_language: Source language code (e.g., "en")
+            target_language: Target language code (e.g., "es")
+            parent_asset_ids: References to upstream assets
+            speaker_policy: Optional speaker detection policy
+            normalization_policy: Optional normalization policy
+
+        Returns:
+            TextAsset with translation results
+        """
+        start_time = time.time()
+        key = make_cache_key(
+            source_text,
+            source_language,
+            target_language,
+            self.component_instance,
+            speaker_policy,
+            normalization_policy,
+        )
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return TextAsset(
+                stream_id=stream_id,
+                sequence_number=sequence_number,
+                parent_asset_ids=parent_asset_ids,
+                component_instance=self.component_instance,
+                source_language=source_language,
+                target_language=target_language,
+                translated_text=cached.translated_text,
+                normalized_source_text=cached.normalized_source_text,
+                speaker_id=cached.speaker_id,
+                status=TranslationStatus.SUCCESS,
+                processing_time_ms=int((time.time() - start_time) * 1000),
+                model_info=self.component_instance,
+            )
+
+        result = self._translator.translate(
+            source_text=source_text,
+            stream_id=stream_id,
+            sequence_number=sequence_number,
+            source_language=source_language,
+            target_language=target_language,
+            parent_asset_ids=parent_asset_ids,
+            speaker_policy=speaker_policy,
+            normalization_policy=normalization_policy,
+        )
+
+        if result.status == TranslationStatus.SUCCESS and result.translated_text:
+            self._cache.put(
+                key,
+                CachedTranslation(
+                    translated_text=result.translated_text,
+                    normalized_source_text=result.normalized_source_text,
+                    speaker_id=result.speaker_id,
+                    created_at=time.time(),
+                ),
+            )
+        return result
+
+    def shutdown(self) -> None:
+        """Shut down the wrapped component (the shared cache stays open)."""
+        self._translator.shutdown()
+
+
+# Process-wide cache shared by all sessions
+_cache: Optional[TranslationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """Get the process-wide translation cache, creating it on first use.
+
+    Returns:
+        The shared TranslationCache instance.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TranslationCache()
+    return _cache
+
+
+def shutdown_translation_cache() -> None:
+    """Close and discard the process-wide translation cache."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+
+def set_translation_cache(cache: Optional[TranslationCache]) -> None:
+    """Set the process-wide translation cache (for testing).
+
+    Args:
+        cache: The cache to use, or None to reset.
+    """
+    global _cache
+    _cache = cache
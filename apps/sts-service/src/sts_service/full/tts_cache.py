@@ -0,0 +1,417 @@
+"""Synthesized Audio Cache for Full STS Service.
+
+Repeated phrases produce identical speech, so the TTS provider's raw PCM is
+cached and only the cheap duration-matching step (time-stretch, resample,
+channel conversion) runs per fragment.
+
+Entries are content-addressed files under TTS_CACHE_DIR, keyed by the
+translated text, language, voice, provider, sample rate and channel count.
+The cache is shared by all sessions, survives restarts, and evicts least
+recently used entries once TTS_CACHE_MAX_BYTES is exceeded. Only successful, non-empty
+syntheses are cached.
+
+CachedTTSComponent wraps any BaseTTSComponent with the shared cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from sts_service.translation.models import TextAsset
+from sts_service.tts.duration_matching import align_audio_to_duration
+from sts_service.tts.errors import TTSError, TTSErrorType, classify_error
+from sts_service.tts.interface import BaseTTSComponent
+from sts_service.tts.models import AudioAsset, AudioFormat, AudioStatus, VoiceProfile
+
+from .config import TTSCacheConfig
+from .observability.metrics import record_tts_cache_lookup, set_tts_cache_bytes
+
+logger = logging.getLogger(__name__)
+
+# Cached PCM is mono float32; duration matching expands channels afterwards
+CACHE_CHANNELS = 1
+BYTES_PER_SAMPLE = 4
+
+_PCM_SUFFIX = ".pcm"
+
+
+def make_tts_cache_key(
+    text: str,
+    language: str,
+    provider: str,
+    voice: dict | str | None,
+    sample_rate_hz: int,
+    channels: int = CACHE_CHANNELS,
+) -> str:
+    """Build the cache key for a synthesis request.
+
+    Args:
+        text: Translated text to synthesize
+        language: Synthesis language code
+        provider: Component instance of the wrapped TTS (e.g. elevenlabs-eleven_flash_v2_5)
+        voice: JSON-serializable voice description (profile fields or a voice name)
+        sample_rate_hz: Sample rate of the cached PCM
+        channels: Channel count of the cached PCM
+
+    Returns:
+        Hex SHA-256 digest identifying the audio
+    """
+    parts = {
+        "text": " ".join(unicodedata.normalize("NFC", text).split()),
+        "language": language.lower(),
+        "provider": provider,
+        "voice": voice,
+        "sample_rate_hz": sample_rate_hz,
+        "channels": channels,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """Content-addressed PCM file cache with LRU eviction by byte budget.
+
+    Features:
+    - One file per entry (<cache_dir>/<key[:2]>/<key>.pcm), written atomically
+    - Index rebuilt from disk on startup, oldest modification time first
+    - Thread-safe (lookups come from TTS stage workers)
+    - Hit/miss counters and size gauge via observability.metrics
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached PCM (default: TTS_CACHE_DIR)
+            max_bytes: Byte budget for cached PCM (default: TTS_CACHE_MAX_BYTES)
+
+        Raises:
+            ValueError: If max_bytes is less than 1
+        """
+        config = TTSCacheConfig()
+        self._dir = Path(config.cache_dir if cache_dir is None else cache_dir)
+        self._max_bytes = config.max_bytes if max_bytes is None else max_bytes
+
+        if self._max_bytes < 1:
+            raise ValueError(f"TTS cache size must be >= 1 byte, got {self._max_bytes}")
+
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes of PCM currently cached."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}{_PCM_SUFFIX}"
+
+    def _load_index(self) -> None:
+        entries = []
+        for path in self._dir.glob(f"*/*{_PCM_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+        with self._lock:
+            self._evict()
+        if self._sizes:
+            logger.info(
+                f"Loaded TTS cache index: {len(self._sizes)} entries, "
+                f"{self._total_bytes} bytes in {self._dir}"
+            )
+        set_tts_cache_bytes(self._total_bytes)
+
+    def get(self, key: str) -> bytes | None:
+        """Read cached PCM, recording the hit or miss.
+
+        Args:
+            key: Key from make_tts_cache_key()
+
+        Returns:
+            PCM F32LE bytes, or None on a miss
+        """
+        data = None
+        with self._lock:
+            if key in self._sizes:
+                path = self._path(key)
+                try:
+                    data = path.read_bytes()
+                    os.utime(path)  # Keeps LRU order across restarts
+                    self._sizes.move_to_end(key)
+                except OSError as e:
+                    logger.warning(f"Dropping unreadable TTS cache entry {key}: {e}")
+                    self._total_bytes -= self._sizes.pop(key)
+            size = self._total_bytes
+
+        record_tts_cache_lookup(data is not None)
+        set_tts_cache_bytes(size)
+        return data
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """Store PCM, evicting least recently used entries to stay within budget.
+
+        Entries larger than the whole budget are not cached.
+
+        Args:
+            key: Key from make_tts_cache_key()
+            audio_data: PCM F32LE bytes
+        """
+        if len(audio_data) > self._max_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with self._lock:
+            try:
+                path.parent.mkdir(exist_ok=True)
+                tmp_path.write_bytes(audio_data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to write TTS cache entry {key}: {e}")
+                tmp_path.unlink(missing_ok=True)
+                return
+
+            self._total_bytes += len(audio_data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(audio_data)
+            self._evict()
+            size = self._total_bytes
+
+        set_tts_cache_bytes(size)
+
+    def _evict(self) -> None:
+        while self._total_bytes > self._max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+            self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete all cached entries."""
+        with self._lock:
+            for key in self._sizes:
+                self._path(key).unlink(missing_ok=True)
+            self._sizes.clear()
+            self._total_bytes = 0
+        set_tts_cache_bytes(0)
+
+
+class CachedTTSComponent(BaseTTSComponent):
+    """TTS component that reuses cached provider audio for repeated text.
+
+    Misses call the wrapped component without a target duration, so its
+    output is the raw synthesis at the requested sample rate in mono; that
+    PCM is cached. Hits and misses then go through the same duration
+    matching the providers apply (speed clamps from the voice profile).
+    """
+
+    def __init__(
+        self,
+        tts: BaseTTSComponent,
+        cache: TTSAudioCache | None = None,
+        voice_name: str | None = None,
+    ):
+        """Wrap a TTS component.
+
+        Args:
+            tts: Component to call on cache misses
+            cache: Cache to use (default: the process-wide cache)
+            voice_name: Voice the component was configured with (e.g. the
+                session's voices.json profile); keys requests without a
+                VoiceProfile
+        """
+        self._tts = tts
+        self._cache = cache if cache is not None else get_tts_cache()
+        self._voice_name = voice_name
+
+    @property
+    def component_instance(self) -> str:
+        """Return the wrapped provider's identifier."""
+        return self._tts.component_instance
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the wrapped component is ready."""
+        return self._tts.is_ready
+
+    def synthesize(
+        self,
+        text_asset: TextAsset,
+        target_duration_ms: int | None = None,
+        output_sample_rate_hz: int = 16000,
+        output_channels: int = 1,
+        voice_profile: VoiceProfile | None = None,
+    ) -> AudioAsset:
+        """Synthesize speech, reusing cached audio for previously seen text.
+
+        Args:
+            text_asset: Input TextAsset from Translation module
+            target_duration_ms: Target duration for alignment (optional)
+            output_sample_rate_hz: Output sample rate (default 16000)
+            output_channels: Output channel count (default 1)
+            voice_profile: Voice configuration (optional)
+
+        Returns:
+            AudioAsset with synthesized speech audio
+        """
+        start_time = time.time()
+        voice = (
+            voice_profile.model_dump(mode="json") if voice_profile is not None else self._voice_name
+        )
+        key = make_tts_cache_key(
+            text_asset.translated_text,
+            text_asset.target_language,
+            self.component_instance,
+            voice,
+            output_sample_rate_hz,
+        )
+
+        audio_data = self._cache.get(key)
+        if audio_data is None:
+            result = self._tts.synthesize(
+                text_asset=text_asset,
+                target_duration_ms=None,
+                output_sample_rate_hz=output_sample_rate_hz,
+                output_channels=CACHE_CHANNELS,
+                voice_profile=voice_profile,
+            )
+            if result.status != AudioStatus.SUCCESS or not result.audio_bytes:
+                return result
+            audio_data = result.audio_bytes
+            self._cache.put(key, audio_data)
+
+        return self._align(
+            audio_data,
+            text_asset,
+            target_duration_ms,
+            output_sample_rate_hz,
+            output_channels,
+            voice_profile or VoiceProfile(language=text_asset.target_language),
+            start_time,
+        )
+
+    def _align(
+        self,
+        audio_data: bytes,
+        text_asset: TextAsset,
+        target_duration_ms: int | None,
+        sample_rate_hz: int,
+        output_channels: int,
+        voice_profile: VoiceProfile,
+        start_time: float,
+    ) -> AudioAsset:
+        """Apply duration matching and channel conversion to cached mono PCM."""
+        num_samples = len(audio_data) // BYTES_PER_SAMPLE
+        baseline_duration_ms = int(num_samples * 1000 / sample_rate_hz)
+        final_audio_data = audio_data
+        final_duration_ms = baseline_duration_ms
+        status = AudioStatus.SUCCESS
+        errors: list[TTSError] = []
+
+        if target_duration_ms is not None or output_channels != CACHE_CHANNELS:
+            try:
+                alignment_result = align_audio_to_duration(
+                    audio_data=audio_data,
+                    baseline_duration_ms=baseline_duration_ms,
+                    target_duration_ms=(
+                        target_duration_ms
+                        if target_duration_ms is not None
+                        else baseline_duration_ms
+                    ),
+                    input_sample_rate_hz=sample_rate_hz,
+                    output_sample_rate_hz=sample_rate_hz,
+                    input_channels=CACHE_CHANNELS,
+                    output_channels=output_channels,
+                    clamp_min=voice_profile.speed_clamp_min,
+                    clamp_max=voice_profile.speed_clamp_max,
+                    only_speed_up=voice_profile.only_speed_up,
+                )
+                final_audio_data = alignment_result.audio_data
+                final_duration_ms = alignment_result.final_duration_ms
+
+                if alignment_result.speed_factor_clamped:
+                    status = AudioStatus.PARTIAL
+                    errors.append(
+                        classify_error(
+                            TTSErrorType.ALIGNMENT_FAILED,
+                            f"Speed factor clamped: {alignment_result.speed_factor_applied:.2f}",
+                            retryable_override=False,
+                        )
+                    )
+            except Exception as e:
+                logger.warning(f"Duration matching failed: {e}")
+                status = AudioStatus.PARTIAL
+                errors.append(
+                    classify_error(
+                        TTSErrorType.ALIGNMENT_FAILED,
+                        f"Duration matching failed: {str(e)}",
+                        retryable_override=False,
+                    )
+                )
+
+        return AudioAsset(
+            stream_id=text_asset.stream_id,
+            sequence_number=text_asset.sequence_number,
+            parent_asset_ids=[text_asset.asset_id],
+            component_instance=self.component_instance,
+            audio_format=AudioFormat.PCM_F32LE,
+            sample_rate_hz=sample_rate_hz,
+            channels=output_channels,
+            duration_ms=final_duration_ms,
+            payload_ref=f"mem://fragments/{text_asset.stream_id}/{text_asset.sequence_number}",
+            audio_bytes=final_audio_data,
+            language=text_asset.target_language,
+            status=status,
+            errors=errors,
+            processing_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the wrapped component (the shared cache stays open)."""
+        self._tts.shutdown()
+
+
+# Process-wide cache shared by all sessions
+_cache: TTSAudioCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """Get the process-wide TTS cache, creating it on first use.
+
+    Returns:
+        The shared TTSAudioCache instance.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTSAudioCache()
+    return _cache
+
+
+def set_tts_cache(cache: TTSAudioCache | None) -> None:
+    """Set the process-wide TTS cache (for testing).
+
+    Args:
+        cache: The cache to use, or None to reset.
+    """
+    global _cache
+    _cache = cache
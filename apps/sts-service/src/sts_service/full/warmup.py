@@ -0,0 +1,249 @@
+"""Startup Model Warm-up for Full STS Service.
+
+A fresh pod would otherwise pay Whisper and Coqui model loads plus first
+inference allocation costs on its first stream:init, pushing the first
+fragments past the A/V offset. At startup the configured models are loaded
+into the shared model registry and run one dummy inference each; /ready
+reports ready once this finishes.
+
+Configuration (WarmupConfig):
+- WARMUP_ASR_MODELS: Whisper sizes (default: ASR_MODEL_SIZE plus the ASR
+  ladder's profile models when the ladder is enabled)
+- WARMUP_TTS_VOICES: voices.json profiles, synthesized once per target language
+- WARMUP_LANGUAGE_PAIRS: source-target pairs (ASR and TTS languages)
+
+Warm-up failures are logged and reported by /ready but do not block
+readiness; the model is loaded again on the first stream:init instead.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from sts_service.asr.factory import create_asr_component
+from sts_service.translation.models import TextAsset, TranslationStatus
+from sts_service.tts.factory import create_tts_component
+
+from .config import WarmupConfig
+from .handlers.stream import build_asr_config, build_tts_config, load_voices_config
+from .observability.metrics import set_startup_duration, set_warmup_duration
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SAMPLE_RATE_HZ = 16000
+WARMUP_AUDIO_MS = 1000
+WARMUP_TEXT = "Warm-up."
+WARMUP_STREAM_ID = "warmup"
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """Outcome of warming up one model."""
+
+    component: str  # "asr" or "tts"
+    model: str
+    duration_s: float
+    error: Optional[str] = None
+
+
+class WarmupState:
+    """Readiness of the service, shared by the warm-up thread and /ready."""
+
+    def __init__(self) -> None:
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._results: list[WarmupResult] = []
+        self.duration_s: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up has finished (or was skipped)."""
+        return self._ready.is_set()
+
+    @property
+    def results(self) -> list[WarmupResult]:
+        """Per-model results recorded so far."""
+        with self._lock:
+            return list(self._results)
+
+    def add_result(self, result: WarmupResult) -> None:
+        with self._lock:
+            self._results.append(result)
+
+    def mark_ready(self, duration_s: Optional[float] = None) -> None:
+        """Mark the service ready."""
+        self.duration_s = duration_s
+        self._ready.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until ready; returns False on timeout."""
+        return self._ready.wait(timeout)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the /ready endpoint."""
+        return {
+            "status": "ready" if self.ready else "warming_up",
+            "warmup_seconds": self.duration_s,
+            "models": [asdict(result) for result in self.results],
+        }
+
+
+def _warmup_audio() -> bytes:
+    """Quiet noise, so VAD and decoding run rather than short-circuiting on zeros."""
+    rng = np.random.default_rng(0)
+    samples = WARMUP_SAMPLE_RATE_HZ * WARMUP_AUDIO_MS // 1000
+    return (rng.standard_normal(samples) * 0.01).astype("<f4").tobytes()
+
+
+def warm_asr(model_size: str, language: str) -> WarmupResult:
+    """Load a Whisper model into the registry and run one transcription.
+
+    Args:
+        model_size: Whisper model size
+        language: Transcription language
+
+    Returns:
+        Warm-up result
+    """
+    start = time.perf_counter()
+    model = f"faster-whisper-{model_size}"
+    try:
+        asr = create_asr_component(config=build_asr_config(model_size), mock=False)
+        model = asr.component_instance
+        try:
+            asr.transcribe(
+                audio_data=_warmup_audio(),
+                stream_id=WARMUP_STREAM_ID,
+                sequence_number=0,
+                start_time_ms=0,
+                end_time_ms=WARMUP_AUDIO_MS,
+                sample_rate_hz=WARMUP_SAMPLE_RATE_HZ,
+                language=language,
+            )
+        finally:
+            asr.shutdown()  # Model stays resident in the registry
+    except Exception as e:
+        return WarmupResult("asr", model, time.perf_counter() - start, error=str(e))
+    return WarmupResult("asr", model, time.perf_counter() - start)
+
+
+def warm_tts(
+    voice_profile: str, voice_config: dict[str, Any], target_language: str
+) -> WarmupResult:
+    """Create the session TTS component for a voice and synthesize one phrase.
+
+    Args:
+        voice_profile: voices.json profile name
+        voice_config: voices.json profile entry
+        target_language: Synthesis language
+
+    Returns:
+        Warm-up result
+    """
+    start = time.perf_counter()
+    model = f"{voice_profile}/{target_language}"
+    try:
+        tts = create_tts_component(config=build_tts_config(voice_config, target_language))
+        model = f"{tts.component_instance}/{model}"
+        try:
+            tts.synthesize(
+                text_asset=TextAsset(
+                    stream_id=WARMUP_STREAM_ID,
+                    sequence_number=0,
+                    component_instance="warmup",
+                    source_language=target_language,
+                    target_language=target_language,
+                    translated_text=WARMUP_TEXT,
+                    status=TranslationStatus.SUCCESS,
+                ),
+                output_sample_rate_hz=WARMUP_SAMPLE_RATE_HZ,
+            )
+        finally:
+            tts.shutdown()
+    except Exception as e:
+        return WarmupResult("tts", model, time.perf_counter() - start, error=str(e))
+    return WarmupResult("tts", model, time.perf_counter() - start)
+
+
+def run_warmup(
+    config: Optional[WarmupConfig] = None,
+    state: Optional[WarmupState] = None,
+) -> list[WarmupResult]:
+    """Warm up all configured models, then mark the service ready.
+
+    Args:
+        config: Warm-up configuration (default: from environment)
+        state: Readiness state to update (default: process-wide state)
+
+    Returns:
+        Per-model results
+    """
+    config = config or WarmupConfig()
+    state = state if state is not None else get_warmup_state()
+    start = time.perf_counter()
+    pairs = config.language_pair_list or [("en", "en")]
+
+    try:
+        jobs = [(warm_asr, (size, pairs[0][0])) for size in config.asr_model_sizes]
+        if config.tts_voice_profiles:
+            voices_config = load_voices_config()
+            for voice in config.tts_voice_profiles:
+                if voice not in voices_config:
+                    logger.warning(f"Warm-up voice profile '{voice}' not found in voices.json")
+                    continue
+                for target in dict.fromkeys(target for _, target in pairs):
+                    jobs.append((warm_tts, (voice, voices_config[voice], target)))
+
+        for warm, args in jobs:
+            result = warm(*args)
+            state.add_result(result)
+            set_warmup_duration(result.component, result.model, result.duration_s)
+            if result.error:
+                logger.warning(
+                    f"Warm-up of {result.component} model {result.model} failed: {result.error}"
+                )
+            else:
+                logger.info(
+                    f"Warmed up {result.component} model {result.model} "
+                    f"in {result.duration_s:.2f}s"
+                )
+    finally:
+        duration_s = time.perf_counter() - start
+        set_startup_duration(duration_s)
+        state.mark_ready(duration_s)
+        logger.info(f"Warm-up complete in {duration_s:.2f}s; service ready")
+
+    return state.results
+
+
+# Process-wide readiness state
+_state: Optional[WarmupState] = None
+_state_lock = threading.Lock()
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the process-wide readiness state, creating it on first use.
+
+    Returns:
+        The shared WarmupState instance.
+    """
+    global _state
+    if _state is None:
+        with _state_lock:
+            if _state is None:
+                _state = WarmupState()
+    return _state
+
+
+def set_warmup_state(state: Optional[WarmupState]) -> None:
+    """Set the process-wide readiness state (for testing).
+
+    Args:
+        state: The state to use, or None to reset.
+    """
+    global _state
+    _state = state
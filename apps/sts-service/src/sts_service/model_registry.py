@@ -0,0 +1,322 @@
+"""
+Process-wide Model Registry.
+
+Loaded ASR and TTS models are shared by all sessions through one registry
+instead of per-component caches:
+
+- Reference counting: acquire() loads a model on first use and returns a
+  handle; release() drops the reference. Ending one stream never unloads a
+  model another stream is using.
+- Replica pools: a model may be loaded N times; checkout() lends a free
+  replica so concurrent fragments do not contend on one instance.
+- Idle models (no references) stay resident for the next stream and are
+  evicted least recently used only when MODEL_REGISTRY_MAX_BYTES is exceeded.
+- Listeners receive load/evict events (the Full STS service exports them as
+  Prometheus metrics).
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# (family, *identity), e.g. ("faster-whisper", "small", "cpu", "int8")
+ModelKey = tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class ModelEvent:
+    """A model load or eviction, as seen by registry listeners."""
+
+    event: str  # "load" or "evict"
+    family: str
+    key: ModelKey
+    duration_s: float  # Load time; 0.0 for evictions
+    resident_models: int
+    resident_bytes: int
+
+
+ModelEventListener = Callable[[ModelEvent], None]
+
+
+class ModelHandle:
+    """Shared reference to a loaded model (or pool of replicas).
+
+    Returned by ModelRegistry.acquire(); call release() when the owning
+    component shuts down.
+    """
+
+    def __init__(self, registry: "ModelRegistry", key: ModelKey, replicas: list[Any]):
+        self._registry = registry
+        self._key = key
+        self._replicas = replicas
+        self._free: queue.Queue[Any] | None = None
+        if len(replicas) > 1:
+            self._free = queue.Queue()
+            for replica in replicas:
+                self._free.put(replica)
+
+    @property
+    def key(self) -> ModelKey:
+        """Registry key of the model."""
+        return self._key
+
+    @property
+    def model(self) -> Any:
+        """The first replica (for callers that do not need pooling)."""
+        return self._replicas[0]
+
+    @property
+    def replicas(self) -> int:
+        """Number of loaded replicas."""
+        return len(self._replicas)
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Borrow a replica for one inference call.
+
+        A single replica is shared without locking (as before pooling);
+        with several replicas, callers block until one is free.
+
+        Yields:
+            The model replica
+        """
+        if self._free is None:
+            yield self._replicas[0]
+            return
+
+        replica = self._free.get()
+        try:
+            yield replica
+        finally:
+            self._free.put(replica)
+
+    def release(self) -> None:
+        """Drop this reference to the model."""
+        self._registry.release(self._key)
+
+
+@dataclass
+class _Entry:
+    handle: ModelHandle
+    size_bytes: int
+    refcount: int
+
+
+class ModelRegistry:
+    """Reference-counted model registry with memory-budgeted LRU eviction.
+
+    Features:
+    - One load per key; concurrent acquires of the same key wait for it
+    - Different keys load in parallel
+    - Idle models kept until the byte budget forces eviction
+    - Thread-safe (models are used from stage worker threads)
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        """Initialize the registry.
+
+        Args:
+            max_bytes: Budget for resident models in bytes, 0 = unlimited
+                (default: MODEL_REGISTRY_MAX_BYTES)
+
+        Raises:
+            ValueError: If max_bytes is negative
+        """
+        if max_bytes is None:
+            max_bytes = int(os.getenv("MODEL_REGISTRY_MAX_BYTES", "0"))
+        if max_bytes < 0:
+            raise ValueError(f"Model registry budget must be >= 0, got {max_bytes}")
+
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[ModelKey, _Entry] = OrderedDict()
+        self._key_locks: dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[ModelEventListener] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ModelKey) -> bool:
+        return key in self._entries
+
+    @property
+    def resident_bytes(self) -> int:
+        """Estimated bytes of all resident models."""
+        return sum(entry.size_bytes for entry in self._entries.values())
+
+    def refcount(self, key: ModelKey) -> int:
+        """Number of live references to a model (0 if idle or not loaded)."""
+        entry = self._entries.get(key)
+        return entry.refcount if entry is not None else 0
+
+    def add_listener(self, listener: ModelEventListener) -> None:
+        """Register a callback for load and evict events.
+
+        Registering the same listener twice has no effect.
+
+        Args:
+            listener: Called with a ModelEvent outside the registry lock
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def acquire(
+        self,
+        key: ModelKey,
+        loader: Callable[[], Any],
+        replicas: int = 1,
+        size_bytes: int = 0,
+    ) -> ModelHandle:
+        """Get a reference to a model, loading it if it is not resident.
+
+        Args:
+            key: Model identity; the first element is the model family
+            loader: Creates one replica of the model
+            replicas: Replicas to load (ignored if the model is already resident)
+            size_bytes: Estimated memory per replica, for the eviction budget
+
+        Returns:
+            Handle to the shared model
+
+        Raises:
+            ValueError: If replicas is less than 1
+            Exception: Whatever the loader raises
+        """
+        if replicas < 1:
+            raise ValueError(f"Model replicas must be >= 1, got {replicas}")
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refcount += 1
+                    self._entries.move_to_end(key)
+                    return entry.handle
+
+            logger.info(f"Loading model {key} ({replicas} replica(s))")
+            start = time.perf_counter()
+            models = [loader() for _ in range(replicas)]
+            duration_s = time.perf_counter() - start
+
+            handle = ModelHandle(self, key, models)
+            with self._lock:
+                self._entries[key] = _Entry(handle, size_bytes * replicas, refcount=1)
+                events = [self._event("load", key, duration_s)]
+                events.extend(self._evict_idle())
+
+        logger.info(f"Loaded model {key} in {duration_s:.2f}s")
+        self._notify(events)
+        return handle
+
+    def release(self, key: ModelKey) -> None:
+        """Drop one reference to a model; idle models stay resident.
+
+        Args:
+            key: Model key passed to acquire()
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                logger.warning(f"Release of unreferenced model {key}")
+                return
+            entry.refcount -= 1
+            if entry.refcount == 0:
+                self._entries.move_to_end(key)  # Most recently used idle model
+            events = self._evict_idle()
+
+        self._notify(events)
+
+    def clear(self) -> None:
+        """Unload all models regardless of references (process shutdown)."""
+        with self._lock:
+            events = []
+            while self._entries:
+                key, _ = self._entries.popitem(last=False)
+                events.append(self._event("evict", key, 0.0))
+        self._notify(events)
+
+    def _evict_idle(self) -> list[ModelEvent]:
+        """Evict idle models, least recently used first, until within budget."""
+        events: list[ModelEvent] = []
+        if not self._max_bytes:
+            return events
+
+        while self.resident_bytes > self._max_bytes:
+            idle = next((k for k, e in self._entries.items() if e.refcount == 0), None)
+            if idle is None:
+                logger.warning(
+                    f"Resident models ({self.resident_bytes} bytes) exceed "
+                    f"MODEL_REGISTRY_MAX_BYTES={self._max_bytes} and all are in use"
+                )
+                break
+            del self._entries[idle]
+            logger.info(f"Evicted idle model {idle}")
+            events.append(self._event("evict", idle, 0.0))
+        return events
+
+    def _event(self, event: str, key: ModelKey, duration_s: float) -> ModelEvent:
+        return ModelEvent(
+            event=event,
+            family=str(key[0]),
+            key=key,
+            duration_s=duration_s,
+            resident_models=len(self._entries),
+            resident_bytes=self.resident_bytes,
+        )
+
+    def _notify(self, events: list[ModelEvent]) -> None:
+        for event in events:
+            for listener in self._listeners:
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.error(f"Model registry listener failed: {e}")
+
+
+# Process-wide registry shared by all sessions
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry, creating it on first use.
+
+    Returns:
+        The shared ModelRegistry instance.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
+
+
+def shutdown_model_registry() -> None:
+    """Unload all models and discard the process-wide registry."""
+    global _registry
+    if _registry is not None:
+        _registry.clear()
+        _registry = None
+
+
+def set_model_registry(registry: ModelRegistry | None) -> None:
+    """Set the process-wide model registry (for testing).
+
+    Args:
+        registry: The registry to use, or None to reset.
+    """
+    global _registry
+    _registry = registry
@@ -0,0 +1,376 @@
+"""
+Per-Stream Debug Tracing.
+
+Debug output on the fragment hot path (intermediate sizes, per-segment ASR
+text, audio dumps) goes through one tracer instead of unconditional INFO
+logs and disk writes:
+
+- Levels: off < debug (per-fragment events) < verbose (per-segment
+  events) < capture (audio dumps to TRACE_CAPTURE_DIR as .npy).
+- Per-stream settings override the process default (TRACE_LEVEL, off)
+  and can be changed at runtime (the Full STS service exposes them under
+  /debug/trace). Runtime overrides expire after a TTL.
+- Sampling: a stream traces only a fraction of its fragments, chosen
+  deterministically from (stream_id, sequence_number) so the ASR and
+  pipeline traces of a fragment are either both present or both absent.
+- Gating happens before any formatting: for_fragment() returns a shared
+  no-op trace when nothing is enabled, and callers guard expensive fields
+  with trace.enabled(level).
+
+Usage:
+    trace = get_tracer().for_fragment(stream_id, sequence_number)
+    trace.event(TraceLevel.DEBUG, "decoded", pcm_bytes=len(pcm))
+    if trace.enabled(TraceLevel.VERBOSE):
+        for seg in segments:
+            trace.event(TraceLevel.VERBOSE, "raw_segment", text=seg.text)
+    trace.capture("asr_input", audio)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Recent events kept per traced stream for the runtime endpoint
+MAX_RECENT_EVENTS = 200
+# Streams whose recent events are kept (least recently traced dropped first)
+MAX_TRACED_STREAMS = 64
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class TraceLevel(IntEnum):
+    """Trace verbosity; each level includes the ones below it."""
+
+    OFF = 0
+    DEBUG = 1
+    VERBOSE = 2
+    CAPTURE = 3
+
+    @classmethod
+    def parse(cls, value: "str | int | TraceLevel") -> "TraceLevel":
+        """Parse a level name ("debug") or number.
+
+        Raises:
+            ValueError: If the level is unknown
+        """
+        if isinstance(value, str) and not value.isdigit():
+            try:
+                return cls[value.strip().upper()]
+            except KeyError:
+                raise ValueError(f"Unknown trace level: {value!r}") from None
+        return cls(int(value))
+
+
+@dataclass(frozen=True)
+class TraceSettings:
+    """Tracing settings for one stream (or the process default)."""
+
+    level: TraceLevel = TraceLevel.OFF
+    sample_rate: float = 1.0
+    expires_at: float | None = None  # time.monotonic() deadline for runtime overrides
+    max_captures: int = 100
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError(f"Trace sample_rate must be in [0, 1], got {self.sample_rate}")
+        if self.max_captures < 0:
+            raise ValueError(f"Trace max_captures must be >= 0, got {self.max_captures}")
+
+    def samples(self, stream_id: str, sequence_number: int) -> bool:
+        """Whether this fragment is in the traced sample."""
+        if self.sample_rate >= 1.0:
+            return True
+        digest = zlib.crc32(f"{stream_id}:{sequence_number}".encode())
+        return digest < self.sample_rate * 0x100000000
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable view (remaining TTL instead of the deadline)."""
+        ttl = None if self.expires_at is None else max(0.0, self.expires_at - time.monotonic())
+        return {
+            "level": self.level.name.lower(),
+            "sample_rate": self.sample_rate,
+            "ttl_s": None if ttl is None else round(ttl, 1),
+            "max_captures": self.max_captures,
+        }
+
+
+class _NullTrace:
+    """Trace for fragments that are not traced; every call is a no-op."""
+
+    __slots__ = ()
+
+    def enabled(self, level: TraceLevel) -> bool:
+        return False
+
+    def event(self, level: TraceLevel, name: str, **fields: Any) -> None:
+        return None
+
+    def capture(self, name: str, audio: np.ndarray) -> None:
+        return None
+
+
+NULL_TRACE = _NullTrace()
+
+
+@dataclass
+class _StreamState:
+    """Recent events and capture count of a traced stream."""
+
+    events: deque = field(default_factory=lambda: deque(maxlen=MAX_RECENT_EVENTS))
+    captures: int = 0
+
+
+class FragmentTrace:
+    """Trace of one sampled fragment at a fixed level."""
+
+    __slots__ = ("_tracer", "_stream_id", "_sequence_number", "_settings")
+
+    def __init__(
+        self, tracer: "Tracer", stream_id: str, sequence_number: int, settings: TraceSettings
+    ):
+        self._tracer = tracer
+        self._stream_id = stream_id
+        self._sequence_number = sequence_number
+        self._settings = settings
+
+    def enabled(self, level: TraceLevel) -> bool:
+        """Whether events at level are recorded for this fragment."""
+        return self._settings.level >= level
+
+    def event(self, level: TraceLevel, name: str, **fields: Any) -> None:
+        """Record an event if level is enabled.
+
+        Args:
+            level: Event verbosity
+            name: Event name (snake_case)
+            **fields: Event fields (JSON-serializable)
+        """
+        if self._settings.level < level:
+            return
+        self._tracer._record(self._stream_id, self._sequence_number, name, fields)
+
+    def capture(self, name: str, audio: np.ndarray) -> None:
+        """Dump an array as .npy if the capture level is enabled.
+
+        Files go to {TRACE_CAPTURE_DIR}/{stream_id}/{sequence_number:06d}-{name}.npy,
+        at most max_captures per stream.
+
+        Args:
+            name: Capture name (e.g. asr_input)
+            audio: Array to save
+        """
+        if self._settings.level < TraceLevel.CAPTURE:
+            return
+        self._tracer._capture(
+            self._stream_id, self._sequence_number, name, audio, self._settings.max_captures
+        )
+
+
+class Tracer:
+    """Process-wide trace settings and sinks.
+
+    Features:
+    - Default settings plus per-stream runtime overrides with TTL
+    - Deterministic per-fragment sampling
+    - Events to the "sts_service.trace" logger and a per-stream ring buffer
+    - Bounded .npy audio captures
+    """
+
+    def __init__(
+        self,
+        default: TraceSettings | None = None,
+        capture_dir: str | None = None,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            default: Settings for streams without an override
+                (default: TRACE_LEVEL and TRACE_SAMPLE_RATE)
+            capture_dir: Directory for audio captures (default: TRACE_CAPTURE_DIR)
+        """
+        if default is None:
+            default = TraceSettings(
+                level=TraceLevel.parse(os.getenv("TRACE_LEVEL", "off")),
+                sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "1.0")),
+            )
+        self._default = default
+        self._capture_dir = Path(capture_dir or os.getenv("TRACE_CAPTURE_DIR", "/tmp/sts-trace"))
+        self._overrides: dict[str, TraceSettings] = {}
+        self._streams: OrderedDict[str, _StreamState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._sink = logging.getLogger("sts_service.trace")
+
+    @property
+    def default(self) -> TraceSettings:
+        """Settings for streams without an override."""
+        return self._default
+
+    def settings_for(self, stream_id: str) -> TraceSettings:
+        """Effective settings for a stream (override if present and not expired)."""
+        settings = self._overrides.get(stream_id)
+        if settings is None:
+            return self._default
+        if settings.expires_at is not None and time.monotonic() >= settings.expires_at:
+            with self._lock:
+                if self._overrides.get(stream_id) is settings:
+                    del self._overrides[stream_id]
+            return self._default
+        return settings
+
+    def for_fragment(self, stream_id: str, sequence_number: int) -> "FragmentTrace | _NullTrace":
+        """Trace handle for one fragment (NULL_TRACE when not traced).
+
+        Args:
+            stream_id: Stream identifier
+            sequence_number: Fragment sequence number
+
+        Returns:
+            FragmentTrace, or the shared no-op trace
+        """
+        settings = self.settings_for(stream_id)
+        if settings.level == TraceLevel.OFF or not settings.samples(stream_id, sequence_number):
+            return NULL_TRACE
+        return FragmentTrace(self, stream_id, sequence_number, settings)
+
+    def set_stream(
+        self,
+        stream_id: str,
+        level: "str | int | TraceLevel",
+        sample_rate: float = 1.0,
+        ttl_s: float | None = 600.0,
+        max_captures: int = 100,
+    ) -> TraceSettings:
+        """Override tracing for a stream.
+
+        Args:
+            stream_id: Stream identifier
+            level: Trace level name or number
+            sample_rate: Fraction of fragments to trace
+            ttl_s: Seconds until the override expires (None: never)
+            max_captures: Audio captures allowed for the stream
+
+        Returns:
+            The new settings
+
+        Raises:
+            ValueError: If the level or sample rate is invalid
+        """
+        settings = TraceSettings(
+            level=TraceLevel.parse(level),
+            sample_rate=sample_rate,
+            expires_at=None if ttl_s is None else time.monotonic() + ttl_s,
+            max_captures=max_captures,
+        )
+        with self._lock:
+            self._overrides[stream_id] = settings
+            self._streams[stream_id] = _StreamState()
+        logger.info(f"Tracing {stream_id} at {settings.level.name.lower()}")
+        return settings
+
+    def clear_stream(self, stream_id: str) -> bool:
+        """Remove a stream's override and recorded events.
+
+        Returns:
+            True if the stream had an override
+        """
+        with self._lock:
+            self._streams.pop(stream_id, None)
+            return self._overrides.pop(stream_id, None) is not None
+
+    def overrides(self) -> dict[str, TraceSettings]:
+        """Active (unexpired) per-stream overrides."""
+        with self._lock:
+            stream_ids = list(self._overrides)
+        return {
+            stream_id: settings
+            for stream_id in stream_ids
+            if (settings := self.settings_for(stream_id)) is not self._default
+        }
+
+    def recent_events(self, stream_id: str) -> list[dict[str, Any]]:
+        """Events recorded for a stream, oldest first."""
+        with self._lock:
+            state = self._streams.get(stream_id)
+            return list(state.events) if state else []
+
+    def _state(self, stream_id: str) -> _StreamState:
+        state = self._streams.get(stream_id)
+        if state is None:
+            state = self._streams[stream_id] = _StreamState()
+            while len(self._streams) > MAX_TRACED_STREAMS:
+                self._streams.popitem(last=False)
+        else:
+            self._streams.move_to_end(stream_id)
+        return state
+
+    def _record(self, stream_id: str, sequence_number: int, name: str, fields: dict) -> None:
+        record = {
+            "time": time.time(),
+            "stream_id": stream_id,
+            "sequence_number": sequence_number,
+            "event": name,
+            **fields,
+        }
+        with self._lock:
+            self._state(stream_id).events.append(record)
+        self._sink.info("trace %s", json.dumps(record, default=str))
+
+    def _capture(
+        self, stream_id: str, sequence_number: int, name: str, audio: np.ndarray, limit: int
+    ) -> None:
+        with self._lock:
+            state = self._state(stream_id)
+            if state.captures >= limit:
+                return
+            state.captures += 1
+        # Stream ids come from clients; keep them from escaping the capture directory
+        directory = _UNSAFE_PATH_CHARS.sub("_", stream_id).lstrip(".") or "_"
+        path = self._capture_dir / directory / f"{sequence_number:06d}-{name}.npy"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(path, audio)
+        except OSError as e:
+            logger.warning(f"Trace capture failed for {path}: {e}")
+            return
+        self._record(stream_id, sequence_number, "capture", {"name": name, "path": str(path)})
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer, creating it on first use.
+
+    Returns:
+        The shared Tracer instance.
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Set the process-wide tracer (for testing).
+
+    Args:
+        tracer: The tracer to use, or None to reset.
+    """
+    global _tracer
+    _tracer = tracer
@@ -23,6 +23,7 @@ Based on specs/008-tts-module/.
 """
 
 from .encoding import (
+    AACEncoder,
     EncodingError,
     EncodingResult,
     encode_pcm_to_m4a,
@@ -42,6 +43,7 @@ from .models import (
     TTSMetrics,
     VoiceProfile,
 )
+from .time_stretch import TimeStretcher, create_time_stretcher
 
 __all__ = [
     # Interface
@@ -55,11 +57,15 @@ __all__ = [
     "TTSConfig",
     "TTSMetrics",
     # Encoding
+    "AACEncoder",
     "encode_pcm_to_m4a",
     "encode_pcm_to_m4a_with_metadata",
     "get_m4a_duration_ms",
     "EncodingResult",
     "EncodingError",
+    # Duration matching
+    "TimeStretcher",
+    "create_time_stretcher",
     # Errors
     "TTSError",
     "TTSErrorType",
@@ -9,11 +9,12 @@ in specs/sources/TTS.md.
 """
 
 import logging
-import math
-import struct
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
+from sts_service.model_registry import ModelHandle, get_model_registry
 from sts_service.translation.models import TextAsset
 
 from .errors import TTSError, TTSErrorType, classify_error
@@ -25,9 +26,14 @@ from .models import (
     TTSConfig,
     VoiceProfile,
 )
+from .pcm import array_to_pcm_f32le
 
 logger = logging.getLogger(__name__)
 
+# Rough resident sizes for the model registry's memory budget
+XTTS_MODEL_BYTES = 2 * 1024**3
+DEFAULT_MODEL_BYTES = 200 * 1024**2
+
 
 class CoquiTTSComponent(BaseTTSComponent):
     """Coqui TTS component implementing the TTSComponent interface.
@@ -39,8 +45,8 @@ class CoquiTTSComponent(BaseTTSComponent):
     Features:
     - Multilingual synthesis (English, Spanish, French, German, Portuguese)
     - Voice cloning with voice samples (XTTS-v2 only)
-    - Model caching for performance
-    - Duration matching with rubberband time-stretch
+    - Models shared across sessions via the model registry
+    - Duration matching with pitch-preserving time-stretch
     - Text preprocessing for better synthesis quality
 
     Note: This implementation falls back to mock behavior if the TTS library
@@ -63,7 +69,8 @@ class CoquiTTSComponent(BaseTTSComponent):
         self._config = config or TTSConfig()
         self._fast_mode = fast_mode
         self._voices_config_path = voices_config_path
-        self._model_cache: dict[str, Any] = {}
+        # Registry handles acquired by this instance, keyed by _get_model_key()
+        self._model_cache: dict[str, ModelHandle] = {}
         self._tts = None
         self._is_ready = False
 
@@ -233,15 +240,24 @@ class CoquiTTSComponent(BaseTTSComponent):
         """
         from TTS.api import TTS
 
-        # Get model from cache or load
+        # Get model from cache or acquire it from the shared registry
         model_key = self._get_model_key(voice_profile)
         if model_key not in self._model_cache:
-            logger.info(f"Loading TTS model: {model_key}")
             model_name = self._get_model_name(voice_profile)
-            self._model_cache[model_key] = TTS(model_name=model_name, progress_bar=False)
+            self._model_cache[model_key] = get_model_registry().acquire(
+                ("coqui", model_name),
+                lambda: TTS(model_name=model_name, progress_bar=False),
+                replicas=self._config.model_replicas,
+                size_bytes=XTTS_MODEL_BYTES if "xtts" in model_name else DEFAULT_MODEL_BYTES,
+            )
 
-        tts = self._model_cache[model_key]
+        with self._model_cache[model_key].checkout() as tts:
+            return self._synthesize_with_model(tts, text, voice_profile)
 
+    def _synthesize_with_model(
+        self, tts: Any, text: str, voice_profile: VoiceProfile
+    ) -> tuple[bytes, int]:
+        """Run synthesis on a loaded Coqui model."""
         # Synthesize
         if voice_profile.use_voice_cloning and voice_profile.voice_sample_path:
             # Voice cloning mode
@@ -275,7 +291,7 @@ class CoquiTTSComponent(BaseTTSComponent):
 
         # Convert to bytes
         sample_rate = tts.synthesizer.output_sample_rate
-        audio_data = struct.pack(f"<{len(wav)}f", *wav)
+        audio_data = array_to_pcm_f32le(wav)
 
         return audio_data, sample_rate
 
@@ -296,17 +312,13 @@ class CoquiTTSComponent(BaseTTSComponent):
 
         # Generate sine wave
         num_samples = int(sample_rate_hz * duration_ms / 1000)
-        samples = []
         amplitude = 0.5
         frequency = 440.0
 
-        for i in range(num_samples):
-            t = i / sample_rate_hz
-            value = amplitude * math.sin(2 * math.pi * frequency * t)
-            for _ in range(channels):
-                samples.append(value)
+        t = np.arange(num_samples) / sample_rate_hz
+        samples = amplitude * np.sin(2 * np.pi * frequency * t)
 
-        return struct.pack(f"<{len(samples)}f", *samples)
+        return array_to_pcm_f32le(np.repeat(samples, channels))
 
     def _get_model_key(self, voice_profile: VoiceProfile) -> str:
         """Get cache key for model."""
@@ -374,7 +386,10 @@ class CoquiTTSComponent(BaseTTSComponent):
         )
 
     def shutdown(self) -> None:
-        """Release resources."""
+        """Release resources (shared models stay resident for other sessions)."""
+        for handle in self._model_cache.values():
+            if isinstance(handle, ModelHandle):
+                handle.release()
         self._model_cache.clear()
         self._tts = None
         self._is_ready = False
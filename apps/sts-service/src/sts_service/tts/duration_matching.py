@@ -7,19 +7,27 @@ with target duration for A/V synchronization in live streams.
 Features:
 - Speed factor calculation from baseline and target durations
 - Clamping to prevent extreme speed factors (artifacts)
-- Time-stretch via rubberband (falls back to simple method if unavailable)
+- Pitch-preserving time-stretch via a pluggable backend (see time_stretch.py;
+  in-process WSOLA by default, rubberband CLI optional)
 - Sample rate conversion
 - Channel alignment (mono/stereo)
 
+All sample-level work is done on float32 NumPy arrays; the public functions
+keep taking and returning PCM float32 bytes, except pad_audio_with_silence,
+which also accepts (and then returns) an AudioBuffer.
+
 Based on specs/008-tts-module/plan.md Phase 0 research.
 """
 
 import logging
-import struct
-import subprocess
-import tempfile
 from dataclasses import dataclass
-from pathlib import Path
+
+import numpy as np
+
+from sts_service.audio_buffer import AudioBuffer, PCMData
+
+from .pcm import array_to_pcm_f32le, pcm_f32le_to_array
+from .time_stretch import TimeStretcher, get_time_stretcher, interpolate_samples
 
 logger = logging.getLogger(__name__)
 
@@ -97,14 +105,16 @@ def time_stretch_audio(
     sample_rate_hz: int,
     speed_factor: float,
     preserve_pitch: bool = True,
+    stretcher: TimeStretcher | None = None,
 ) -> tuple[bytes, bool]:
-    """Apply time-stretch to audio using rubberband or fallback method.
+    """Apply time-stretch to audio using the configured backend.
 
     Args:
         audio_data: PCM float32 audio bytes
         sample_rate_hz: Sample rate in Hz
         speed_factor: Speed factor to apply (>1.0 = faster, <1.0 = slower)
         preserve_pitch: Whether to preserve pitch (default True)
+        stretcher: Time-stretch backend (default: TTS_TIME_STRETCH_BACKEND)
 
     Returns:
         Tuple of (stretched_audio_data, was_stretched)
@@ -113,115 +123,18 @@ def time_stretch_audio(
     if abs(speed_factor - 1.0) < 0.01:
         return audio_data, False
 
-    # Try rubberband first
+    samples = pcm_f32le_to_array(audio_data)
+    if len(samples) == 0:
+        return audio_data, False
+
+    stretcher = stretcher or get_time_stretcher()
     try:
-        return _time_stretch_rubberband(audio_data, sample_rate_hz, speed_factor)
+        stretched = stretcher.stretch(samples, sample_rate_hz, speed_factor)
     except Exception as e:
-        logger.warning(f"Rubberband time-stretch failed: {e}. Using fallback method.")
+        logger.warning(f"{stretcher.name} time-stretch failed: {e}. Using fallback method.")
         return _time_stretch_simple(audio_data, sample_rate_hz, speed_factor)
 
-
-def _time_stretch_rubberband(
-    audio_data: bytes,
-    sample_rate_hz: int,
-    speed_factor: float,
-) -> tuple[bytes, bool]:
-    """Time-stretch using rubberband CLI tool.
-
-    Args:
-        audio_data: PCM float32 audio bytes
-        sample_rate_hz: Sample rate in Hz
-        speed_factor: Speed factor to apply
-
-    Returns:
-        Tuple of (stretched_audio_data, was_stretched)
-
-    Raises:
-        RuntimeError: If rubberband fails
-    """
-    import wave
-
-    # Check if rubberband is available
-    try:
-        result = subprocess.run(
-            ["rubberband", "--version"],
-            capture_output=True,
-            timeout=5,
-        )
-        if result.returncode != 0:
-            raise RuntimeError("rubberband not available")
-    except FileNotFoundError as err:
-        raise RuntimeError("rubberband not installed") from err
-
-    # Convert float32 PCM to int16 for WAV
-    num_samples = len(audio_data) // 4  # 4 bytes per float32
-    float_samples = struct.unpack(f"<{num_samples}f", audio_data)
-    # Clamp and convert to int16
-    int16_samples = []
-    for s in float_samples:
-        clamped = max(-1.0, min(1.0, s))
-        int16_samples.append(int(clamped * 32767))
-    int16_data = struct.pack(f"<{num_samples}h", *int16_samples)
-
-    # Write input WAV file
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as input_file:
-        input_path = input_file.name
-
-    with wave.open(input_path, "wb") as wav:
-        wav.setnchannels(1)  # Mono
-        wav.setsampwidth(2)  # 16-bit
-        wav.setframerate(sample_rate_hz)
-        wav.writeframes(int16_data)
-
-    output_path = input_path.replace(".wav", "_stretched.wav")
-
-    try:
-        # Run rubberband with tempo ratio
-        # -T is tempo multiplier: >1 speeds up, <1 slows down
-        cmd = [
-            "rubberband",
-            "-T",
-            str(speed_factor),
-            "-q",  # Quiet mode
-            input_path,
-            output_path,
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            timeout=30,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"rubberband failed: {result.stderr.decode()}")
-
-        # Read output WAV and convert back to float32 PCM
-        with wave.open(output_path, "rb") as wav:
-            out_channels = wav.getnchannels()
-            out_sampwidth = wav.getsampwidth()
-            out_frames = wav.readframes(wav.getnframes())
-
-        # Convert to float32
-        if out_sampwidth == 2:
-            out_num_samples = len(out_frames) // (2 * out_channels)
-            if out_channels == 1:
-                int16_out = struct.unpack(f"<{out_num_samples}h", out_frames)
-            else:
-                # Stereo: take left channel only
-                all_samples = struct.unpack(f"<{out_num_samples * out_channels}h", out_frames)
-                int16_out = all_samples[::out_channels]
-            float_out = [s / 32767.0 for s in int16_out]
-            stretched_data = struct.pack(f"<{len(float_out)}f", *float_out)
-        else:
-            raise RuntimeError(f"Unexpected sample width from rubberband: {out_sampwidth}")
-
-        return stretched_data, True
-
-    finally:
-        # Clean up temp files
-        Path(input_path).unlink(missing_ok=True)
-        Path(output_path).unlink(missing_ok=True)
+    return array_to_pcm_f32le(stretched), True
 
 
 def _time_stretch_simple(
@@ -231,7 +144,7 @@ def _time_stretch_simple(
 ) -> tuple[bytes, bool]:
     """Simple time-stretch by resampling (affects pitch).
 
-    This is a fallback method when rubberband is not available.
+    This is the fallback when the configured backend fails.
     Note: This method changes pitch, so it's not ideal for speech.
 
     Args:
@@ -242,33 +155,15 @@ def _time_stretch_simple(
     Returns:
         Tuple of (stretched_audio_data, was_stretched)
     """
-    # Unpack audio
-    num_samples = len(audio_data) // 4  # 4 bytes per float32
-    samples = list(struct.unpack(f"<{num_samples}f", audio_data))
+    samples = pcm_f32le_to_array(audio_data)
 
     # Calculate new number of samples
-    new_num_samples = int(num_samples / speed_factor)
+    new_num_samples = int(len(samples) / speed_factor)
 
     if new_num_samples == 0:
         return audio_data, False
 
-    # Linear interpolation for resampling
-    new_samples = []
-    for i in range(new_num_samples):
-        src_idx = i * speed_factor
-        src_idx_int = int(src_idx)
-        src_idx_frac = src_idx - src_idx_int
-
-        if src_idx_int >= num_samples - 1:
-            new_samples.append(samples[-1])
-        else:
-            # Linear interpolation
-            sample = (
-                samples[src_idx_int] * (1 - src_idx_frac) + samples[src_idx_int + 1] * src_idx_frac
-            )
-            new_samples.append(sample)
-
-    return struct.pack(f"<{len(new_samples)}f", *new_samples), True
+    return array_to_pcm_f32le(interpolate_samples(samples, new_num_samples, speed_factor)), True
 
 
 def resample_audio(
@@ -289,34 +184,16 @@ def resample_audio(
     if input_sample_rate_hz == output_sample_rate_hz:
         return audio_data
 
-    # Unpack audio
-    num_samples = len(audio_data) // 4  # 4 bytes per float32
-    samples = list(struct.unpack(f"<{num_samples}f", audio_data))
+    samples = pcm_f32le_to_array(audio_data)
 
     # Calculate ratio
     ratio = output_sample_rate_hz / input_sample_rate_hz
-    new_num_samples = int(num_samples * ratio)
+    new_num_samples = int(len(samples) * ratio)
 
     if new_num_samples == 0:
         return audio_data
 
-    # Linear interpolation for resampling
-    new_samples = []
-    for i in range(new_num_samples):
-        src_idx = i / ratio
-        src_idx_int = int(src_idx)
-        src_idx_frac = src_idx - src_idx_int
-
-        if src_idx_int >= num_samples - 1:
-            new_samples.append(samples[-1])
-        else:
-            # Linear interpolation
-            sample = (
-                samples[src_idx_int] * (1 - src_idx_frac) + samples[src_idx_int + 1] * src_idx_frac
-            )
-            new_samples.append(sample)
-
-    return struct.pack(f"<{len(new_samples)}f", *new_samples)
+    return array_to_pcm_f32le(interpolate_samples(samples, new_num_samples, 1 / ratio))
 
 
 def align_channels(
@@ -337,24 +214,20 @@ def align_channels(
     if input_channels == output_channels:
         return audio_data
 
-    # Unpack audio
-    num_samples = len(audio_data) // 4  # 4 bytes per float32
-    samples = list(struct.unpack(f"<{num_samples}f", audio_data))
+    samples = pcm_f32le_to_array(audio_data)
 
     if input_channels == 1 and output_channels == 2:
         # Mono to stereo: duplicate each sample
-        new_samples = []
-        for sample in samples:
-            new_samples.extend([sample, sample])
-        return struct.pack(f"<{len(new_samples)}f", *new_samples)
+        return array_to_pcm_f32le(np.repeat(samples, 2))
 
     elif input_channels == 2 and output_channels == 1:
-        # Stereo to mono: average pairs
-        new_samples = []
-        for i in range(0, num_samples, 2):
-            avg = (samples[i] + samples[i + 1]) / 2 if i + 1 < num_samples else samples[i]
-            new_samples.append(avg)
-        return struct.pack(f"<{len(new_samples)}f", *new_samples)
+        # Stereo to mono: average pairs (a trailing unpaired sample is kept as-is)
+        num_pairs = len(samples) // 2
+        left = samples[0 : num_pairs * 2 : 2].astype(np.float64)
+        mono = (left + samples[1 : num_pairs * 2 : 2]) / 2
+        if len(samples) % 2:
+            mono = np.append(mono, samples[-1])
+        return array_to_pcm_f32le(mono)
 
     else:
         logger.warning(f"Unsupported channel conversion: {input_channels} -> {output_channels}")
@@ -372,6 +245,7 @@ def align_audio_to_duration(
     clamp_min: float = 0.5,
     clamp_max: float = 2.0,
     only_speed_up: bool = False,
+    stretcher: TimeStretcher | None = None,
 ) -> AlignmentResult:
     """Complete audio alignment pipeline.
 
@@ -388,6 +262,7 @@ def align_audio_to_duration(
         clamp_min: Minimum speed factor
         clamp_max: Maximum speed factor
         only_speed_up: Only speed up, never slow down
+        stretcher: Time-stretch backend (default: TTS_TIME_STRETCH_BACKEND)
 
     Returns:
         AlignmentResult with processed audio and metadata
@@ -404,7 +279,7 @@ def align_audio_to_duration(
 
     # Apply time-stretch
     stretched_data, was_stretched = time_stretch_audio(
-        audio_data, input_sample_rate_hz, clamped_factor
+        audio_data, input_sample_rate_hz, clamped_factor, stretcher=stretcher
     )
 
     # Resample if needed
@@ -441,20 +316,24 @@ def align_audio_to_duration(
 
 
 def pad_audio_with_silence(
-    audio_data: bytes,
+    audio_data: PCMData,
     current_duration_ms: int,
     target_duration_ms: int,
     sample_rate_hz: int,
     channels: int,
     bytes_per_sample: int = 4,  # float32 = 4 bytes
-) -> tuple[bytes, int]:
+) -> tuple[PCMData, int]:
     """Pad audio with silence to reach target duration.
 
     This is used when TTS audio is shorter than the target segment duration.
     Padding with silence maintains A/V sync without time-stretching artifacts.
 
+    An AudioBuffer is padded into one pooled allocation (see
+    AudioBuffer.padded) and returned as an AudioBuffer; its own sample rate
+    and channel count are used.
+
     Args:
-        audio_data: PCM audio bytes (float32 format)
+        audio_data: PCM audio bytes (float32 format) or AudioBuffer
         current_duration_ms: Current audio duration in milliseconds
         target_duration_ms: Target duration in milliseconds
         sample_rate_hz: Sample rate in Hz
@@ -473,16 +352,16 @@ def pad_audio_with_silence(
     samples_to_add = int((padding_ms / 1000.0) * sample_rate_hz * channels)
     padding_bytes = samples_to_add * bytes_per_sample
 
-    # Create silence (zeros for float32)
-    silence = b"\x00" * padding_bytes
-
-    logger.info(
+    logger.debug(
         f"Padding audio with silence: "
         f"current={current_duration_ms}ms, target={target_duration_ms}ms, "
         f"padding={padding_ms}ms, bytes={padding_bytes}"
     )
 
-    return audio_data + silence, padding_ms
+    if isinstance(audio_data, AudioBuffer):
+        return audio_data.padded(target_duration_ms), padding_ms
+
+    return bytes(audio_data) + _silence_bytes(samples_to_add, bytes_per_sample), padding_ms
 
 
 def generate_silence(
@@ -508,9 +387,14 @@ def generate_silence(
     samples = int((duration_ms / 1000.0) * sample_rate_hz * channels)
     silence_bytes = samples * bytes_per_sample
 
-    logger.info(
+    logger.debug(
         f"Generating silence: duration={duration_ms}ms, "
         f"sample_rate={sample_rate_hz}Hz, channels={channels}, bytes={silence_bytes}"
     )
 
-    return b"\x00" * silence_bytes
+    return _silence_bytes(samples, bytes_per_sample)
+
+
+def _silence_bytes(num_samples: int, bytes_per_sample: int) -> bytes:
+    """Zero-valued PCM (all-zero bytes are 0.0 in float32 and 0 in int16)."""
+    return bytes(num_samples * bytes_per_sample)
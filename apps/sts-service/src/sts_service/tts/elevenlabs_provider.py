@@ -8,7 +8,7 @@ Features:
 - Multiple language support with language-specific default voices
 - ElevenLabs Flash v2.5 model for low latency (default)
 - Voice settings customization (stability, similarity_boost)
-- Duration matching with rubberband time-stretch
+- Duration matching with pitch-preserving time-stretch
 - Automatic audio format conversion (MP3 -> PCM F32LE)
 - Error classification for retry logic
 
@@ -18,7 +18,6 @@ Based on specs/022-elevenlabs-tts-provider/spec.md.
 import io
 import logging
 import os
-import struct
 from datetime import datetime
 
 from pydub import AudioSegment
@@ -35,6 +34,7 @@ from .models import (
     TTSConfig,
     VoiceProfile,
 )
+from .pcm import pcm_s16le_to_f32le
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +83,7 @@ class ElevenLabsTTSComponent(BaseTTSComponent):
     - Multilingual synthesis with language-specific default voices
     - ElevenLabs Flash v2.5 model for real-time dubbing
     - Voice settings customization (stability, similarity_boost)
-    - Duration matching with rubberband time-stretch
+    - Duration matching with pitch-preserving time-stretch
     - MP3 to PCM F32LE format conversion
     - Automatic sample rate and channel conversion
     - Error classification for retry logic
@@ -409,19 +409,8 @@ class ElevenLabsTTSComponent(BaseTTSComponent):
         if audio_segment.channels > 1:
             audio_segment = audio_segment.set_channels(1)
 
-        # Get raw samples as 16-bit PCM
-        raw_samples = audio_segment.raw_data
-
-        # Convert 16-bit PCM to 32-bit float
-        # Assuming 16-bit signed little-endian
-        num_samples = len(raw_samples) // 2
-        samples_16bit = struct.unpack(f"<{num_samples}h", raw_samples)
-
-        # Normalize to float [-1.0, 1.0]
-        samples_float = [s / 32768.0 for s in samples_16bit]
-
-        # Pack as 32-bit float
-        pcm_f32le = struct.pack(f"<{len(samples_float)}f", *samples_float)
+        # Raw samples are 16-bit signed little-endian PCM
+        pcm_f32le = pcm_s16le_to_f32le(audio_segment.raw_data)
 
         return pcm_f32le, sample_rate
 
@@ -4,19 +4,53 @@ Audio Encoding Module for TTS Output.
 Provides functionality to encode PCM audio data to compressed formats (M4A/AAC)
 using ffmpeg. Returns encoded bytes as buffer for downstream consumption.
 
+AACEncoder is the reusable encoder for hot paths: it probes its backend once
+and, when PyAV is installed, encodes in memory without temp files or
+subprocesses. It writes M4A or, for consumers that remux AAC themselves,
+bare ADTS frames. encode_pcm_to_m4a() remains the one-shot ffmpeg CLI path.
+
 Based on specs/008-tts-module requirements for M4A output.
 """
 
+import io
 import logging
+import struct
 import subprocess
 import tempfile
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+from sts_service.audio_buffer import PCMData, as_pcm_bytes
+
 from .models import AudioFormat
 
 logger = logging.getLogger(__name__)
 
+try:
+    import av
+
+    PYAV_AVAILABLE = True
+except ImportError:
+    av = None
+    PYAV_AVAILABLE = False
+
+# Backend names accepted by AACEncoder
+ENCODER_BACKENDS: tuple[str, ...] = ("auto", "pyav", "ffmpeg")
+
+# Containers AACEncoder can write: container -> (libav muxer, file suffix, AudioFormat)
+ENCODER_CONTAINERS: dict[str, tuple[str, str, AudioFormat]] = {
+    "m4a": ("ipod", ".m4a", AudioFormat.M4A_AAC),
+    "adts": ("adts", ".aac", AudioFormat.AAC_ADTS),
+}
+
+# Error details raised when the ffmpeg CLI is missing
+_FFMPEG_HINT: dict[str, str] = {
+    "hint": "Install ffmpeg: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"
+}
+
 
 @dataclass
 class EncodingResult:
@@ -63,7 +97,26 @@ def encode_pcm_to_m4a(
     Raises:
         EncodingError: If ffmpeg is not available or encoding fails
     """
-    # Validate inputs
+    _validate_pcm_input(pcm_data, sample_rate_hz, channels, input_format)
+
+    # Check ffmpeg availability
+    if not _check_ffmpeg_available():
+        raise EncodingError("ffmpeg not available", dict(_FFMPEG_HINT))
+
+    return _encode_with_ffmpeg(pcm_data, sample_rate_hz, channels, input_format, bitrate_kbps)
+
+
+def _validate_pcm_input(
+    pcm_data: bytes,
+    sample_rate_hz: int,
+    channels: int,
+    input_format: AudioFormat,
+) -> None:
+    """Validate PCM encode arguments.
+
+    Raises:
+        EncodingError: If any argument is invalid
+    """
     if not pcm_data:
         raise EncodingError("Empty PCM data provided")
 
@@ -73,27 +126,28 @@ def encode_pcm_to_m4a(
     if channels not in (1, 2):
         raise EncodingError(f"Invalid channel count: {channels}")
 
-    # Check ffmpeg availability
-    if not _check_ffmpeg_available():
-        raise EncodingError(
-            "ffmpeg not available",
-            {"hint": "Install ffmpeg: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"},
-        )
-
-    # Determine ffmpeg input format
-    if input_format == AudioFormat.PCM_F32LE:
-        ffmpeg_format = "f32le"
-    elif input_format == AudioFormat.PCM_S16LE:
-        ffmpeg_format = "s16le"
-    else:
+    if input_format not in (AudioFormat.PCM_F32LE, AudioFormat.PCM_S16LE):
         raise EncodingError(f"Unsupported input format: {input_format}")
 
+
+def _encode_with_ffmpeg(
+    pcm_data: bytes,
+    sample_rate_hz: int,
+    channels: int,
+    input_format: AudioFormat,
+    bitrate_kbps: int,
+    container: str = "m4a",
+) -> bytes:
+    """Encode PCM to M4A (or ADTS) with the ffmpeg CLI (no availability check)."""
+    ffmpeg_format = "f32le" if input_format == AudioFormat.PCM_F32LE else "s16le"
+    muxer, suffix, _ = ENCODER_CONTAINERS[container]
+
     # Use temp files for ffmpeg I/O
     with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as input_file:
         input_file.write(pcm_data)
         input_path = Path(input_file.name)
 
-    output_path = input_path.with_suffix(".m4a")
+    output_path = input_path.with_suffix(suffix)
 
     try:
         # Build ffmpeg command
@@ -112,10 +166,10 @@ def encode_pcm_to_m4a(
             "aac",  # AAC codec
             "-b:a",
             f"{bitrate_kbps}k",  # Bitrate
-            "-movflags",
-            "+faststart",  # Optimize for streaming
-            str(output_path),
         ]
+        if container == "m4a":
+            cmd += ["-movflags", "+faststart"]  # Optimize for streaming
+        cmd += ["-f", muxer, str(output_path)]
 
         # Run ffmpeg
         result = subprocess.run(
@@ -136,7 +190,7 @@ def encode_pcm_to_m4a(
             encoded_data = f.read()
 
         logger.debug(
-            f"Encoded PCM to M4A: {len(pcm_data)} bytes -> {len(encoded_data)} bytes "
+            f"Encoded PCM to {container}: {len(pcm_data)} bytes -> {len(encoded_data)} bytes "
             f"({sample_rate_hz}Hz, {channels}ch, {bitrate_kbps}kbps)"
         )
 
@@ -197,6 +251,215 @@ def encode_pcm_to_m4a_with_metadata(
     )
 
 
+class AACEncoder:
+    """Reusable PCM to M4A/AAC encoder.
+
+    Features:
+    - Backend probed once at construction (not per encode)
+    - pyav: in-memory encode and mux, no temp files or subprocesses
+    - ffmpeg: ffmpeg CLI per encode (used when PyAV is not installed)
+    - Output as M4A or bare ADTS frames (ENCODER_CONTAINERS)
+    - Thread-safe: each encode uses its own codec context
+    """
+
+    def __init__(self, backend: str = "auto", bitrate_kbps: int = 128):
+        """Initialize the encoder and select its backend.
+
+        Args:
+            backend: auto (PyAV if installed, else ffmpeg), pyav, or ffmpeg
+            bitrate_kbps: Default AAC bitrate in kbps
+
+        Raises:
+            ValueError: If the backend name is unknown
+            EncodingError: If the requested backend is not available
+        """
+        backend = backend.lower()
+        if backend not in ENCODER_BACKENDS:
+            raise ValueError(
+                f"Unknown audio encoder backend: {backend} (expected one of {ENCODER_BACKENDS})"
+            )
+
+        if backend == "auto":
+            backend = "pyav" if PYAV_AVAILABLE else "ffmpeg"
+
+        if backend == "pyav" and not PYAV_AVAILABLE:
+            raise EncodingError("PyAV not available", {"hint": "Install PyAV: pip install av"})
+        if backend == "ffmpeg" and not _check_ffmpeg_available():
+            raise EncodingError("ffmpeg not available", dict(_FFMPEG_HINT))
+
+        self.backend = backend
+        self.bitrate_kbps = bitrate_kbps
+        logger.info(f"AAC encoder ready: backend={backend}, bitrate={bitrate_kbps}kbps")
+
+    def encode(
+        self,
+        pcm_data: PCMData,
+        sample_rate_hz: int,
+        channels: int,
+        input_format: AudioFormat = AudioFormat.PCM_F32LE,
+        bitrate_kbps: int | None = None,
+        container: str = "m4a",
+    ) -> EncodingResult:
+        """Encode interleaved PCM to M4A/AAC.
+
+        Args:
+            pcm_data: Raw PCM audio bytes, or an AudioBuffer (read in place; PCM_F32LE)
+            sample_rate_hz: Sample rate in Hz
+            channels: Number of audio channels (1=mono, 2=stereo)
+            input_format: PCM format of input data (PCM_F32LE or PCM_S16LE)
+            bitrate_kbps: Target bitrate in kbps (default: encoder default)
+            container: Output container, "m4a" or "adts"
+
+        Returns:
+            EncodingResult with encoded bytes and encode timing
+
+        Raises:
+            EncodingError: If inputs are invalid or encoding fails
+        """
+        pcm_data = as_pcm_bytes(pcm_data)
+        _validate_pcm_input(pcm_data, sample_rate_hz, channels, input_format)
+        if container not in ENCODER_CONTAINERS:
+            raise EncodingError(f"Unsupported output container: {container}")
+        bitrate_kbps = bitrate_kbps or self.bitrate_kbps
+
+        start_time = time.perf_counter()
+        if self.backend == "pyav":
+            encoded_data = _encode_with_pyav(
+                pcm_data, sample_rate_hz, channels, input_format, bitrate_kbps, container
+            )
+        else:
+            encoded_data = _encode_with_ffmpeg(
+                pcm_data, sample_rate_hz, channels, input_format, bitrate_kbps, container
+            )
+        encoding_time_ms = int((time.perf_counter() - start_time) * 1000)
+
+        bytes_per_sample = 4 if input_format == AudioFormat.PCM_F32LE else 2
+        num_samples = len(pcm_data) // (bytes_per_sample * channels)
+
+        return EncodingResult(
+            audio_data=encoded_data,
+            format=ENCODER_CONTAINERS[container][2],
+            duration_ms=int((num_samples / sample_rate_hz) * 1000),
+            encoding_time_ms=encoding_time_ms,
+            bitrate_kbps=bitrate_kbps,
+        )
+
+
+def _encode_with_pyav(
+    pcm_data: bytes,
+    sample_rate_hz: int,
+    channels: int,
+    input_format: AudioFormat,
+    bitrate_kbps: int,
+    container: str = "m4a",
+) -> bytes:
+    """Encode PCM to M4A (or ADTS) in memory with PyAV."""
+    if input_format == AudioFormat.PCM_F32LE:
+        samples = np.frombuffer(pcm_data, dtype=np.float32)
+        sample_format = "flt"
+    else:
+        samples = np.frombuffer(pcm_data, dtype=np.int16)
+        sample_format = "s16"
+
+    # Drop a trailing partial frame rather than fail on odd byte counts
+    samples = samples[: len(samples) - len(samples) % channels]
+    layout = "mono" if channels == 1 else "stereo"
+
+    muxer = ENCODER_CONTAINERS[container][0]
+
+    buffer = io.BytesIO()
+    try:
+        with av.open(buffer, "w", format=muxer) as output:
+            stream = output.add_stream("aac", rate=sample_rate_hz)
+            stream.layout = layout
+            stream.bit_rate = bitrate_kbps * 1000
+
+            frame = av.AudioFrame.from_ndarray(
+                samples.reshape(1, -1), format=sample_format, layout=layout
+            )
+            frame.sample_rate = sample_rate_hz
+
+            for packet in stream.encode(frame):
+                output.mux(packet)
+            for packet in stream.encode(None):
+                output.mux(packet)
+    except av.error.FFmpegError as e:
+        raise EncodingError(f"PyAV encoding failed: {e}") from e
+
+    if container == "adts":
+        return buffer.getvalue()
+    # libav cannot rewrite a BytesIO for +faststart, so relocate moov here
+    return _move_moov_to_front(buffer.getvalue())
+
+
+# Boxes on the path from moov to the chunk offset tables
+_MP4_CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _move_moov_to_front(mp4_data: bytes) -> bytes:
+    """Move the moov box ahead of mdat (equivalent of -movflags +faststart).
+
+    Chunk offsets in every stco/co64 table are shifted by the size of moov.
+
+    Args:
+        mp4_data: MP4/M4A bytes with moov after mdat
+
+    Returns:
+        MP4/M4A bytes with moov before mdat (input unchanged if already so)
+    """
+    boxes = _iter_boxes(mp4_data, 0, len(mp4_data))
+    names = [name for name, _, _ in boxes]
+    if b"moov" not in names or b"mdat" not in names:
+        return mp4_data
+    if names.index(b"moov") < names.index(b"mdat"):
+        return mp4_data
+
+    moov_start, moov_end = next((s, e) for n, s, e in boxes if n == b"moov")
+    moov = bytearray(mp4_data[moov_start:moov_end])
+    header_size = 16 if struct.unpack(">I", moov[:4])[0] == 1 else 8
+    _shift_chunk_offsets(moov, header_size, len(moov), len(moov))
+
+    out = bytearray()
+    for name, start, end in boxes:
+        if name == b"mdat":
+            out += moov
+        if name != b"moov":
+            out += mp4_data[start:end]
+    return bytes(out)
+
+
+def _iter_boxes(data: bytes | bytearray, start: int, end: int) -> list[tuple[bytes, int, int]]:
+    """List (type, start, end) for the boxes between start and end."""
+    boxes = []
+    pos = start
+    while pos + 8 <= end:
+        size, name = struct.unpack(">I4s", data[pos : pos + 8])
+        if size == 1:
+            size = struct.unpack(">Q", data[pos + 8 : pos + 16])[0]
+        elif size == 0:
+            size = end - pos
+        if size < 8 or pos + size > end:
+            break
+        boxes.append((name, pos, pos + size))
+        pos += size
+    return boxes
+
+
+def _shift_chunk_offsets(data: bytearray, start: int, end: int, delta: int) -> None:
+    """Add delta to every stco/co64 entry inside data[start:end] (in place)."""
+    for name, box_start, box_end in _iter_boxes(data, start, end):
+        if name in _MP4_CONTAINER_BOXES:
+            _shift_chunk_offsets(data, box_start + 8, box_end, delta)
+        elif name in (b"stco", b"co64"):
+            count = struct.unpack(">I", data[box_start + 12 : box_start + 16])[0]
+            width, fmt = (4, ">I") if name == b"stco" else (8, ">Q")
+            pos = box_start + 16
+            for _ in range(count):
+                (offset,) = struct.unpack(fmt, data[pos : pos + width])
+                data[pos : pos + width] = struct.pack(fmt, offset + delta)
+                pos += width
+
+
 def _check_ffmpeg_available() -> bool:
     """Check if ffmpeg is available in PATH."""
     try:
@@ -25,6 +25,7 @@ class AudioFormat(str, Enum):
     PCM_F32LE = "pcm_f32le"  # 32-bit float little-endian (preferred)
     PCM_S16LE = "pcm_s16le"  # 16-bit signed integer little-endian
     M4A_AAC = "m4a_aac"  # M4A container with AAC codec (compressed)
+    AAC_ADTS = "aac_adts"  # Raw AAC frames with ADTS headers (compressed)
 
 
 class AudioStatus(str, Enum):
@@ -165,6 +166,13 @@ class TTSConfig(BaseModel):
         description="Persist intermediate artifacts for debugging",
     )
 
+    # Model sharing
+    model_replicas: int = Field(
+        default=1,
+        ge=1,
+        description="Model replicas shared across sessions for concurrent synthesis",
+    )
+
     # Voice configuration path
     voices_config_path: str | None = Field(
         default=None,
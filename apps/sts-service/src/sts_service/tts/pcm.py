@@ -0,0 +1,59 @@
+"""
+PCM Sample Conversions for TTS Audio.
+
+Array-based conversions between raw PCM bytes and float32 samples, shared by
+the TTS providers and duration matching so audio never round-trips through
+per-sample Python objects.
+
+All PCM is little-endian and interleaved. Float32 samples are nominally in
+[-1.0, 1.0]; int16 is scaled by 1/32768.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sts_service.audio_buffer import PCMData, as_float32
+
+INT16_SCALE = 32768.0
+
+
+def pcm_f32le_to_array(audio_data: PCMData) -> NDArray[np.float32]:
+    """View PCM float32 bytes as a float32 array (read-only, no copy).
+
+    A trailing partial sample is ignored. An AudioBuffer's samples are
+    returned as they are.
+
+    Args:
+        audio_data: PCM F32LE bytes or AudioBuffer
+
+    Returns:
+        Float32 samples
+    """
+    return as_float32(audio_data)
+
+
+def array_to_pcm_f32le(samples: NDArray | Sequence[float]) -> bytes:
+    """Pack samples as PCM float32 bytes.
+
+    Args:
+        samples: NumPy array or sequence of floats (e.g. a TTS model waveform)
+
+    Returns:
+        PCM F32LE bytes
+    """
+    return np.asarray(samples, dtype="<f4").tobytes()
+
+
+def pcm_s16le_to_f32le(audio_data: bytes) -> bytes:
+    """Convert PCM int16 bytes to PCM float32 bytes scaled to [-1.0, 1.0).
+
+    Args:
+        audio_data: PCM S16LE bytes
+
+    Returns:
+        PCM F32LE bytes
+    """
+    int16_samples = np.frombuffer(audio_data, dtype="<i2", count=len(audio_data) // 2)
+    return (int16_samples / INT16_SCALE).astype("<f4").tobytes()
@@ -0,0 +1,336 @@
+"""
+Time-Stretch Backends for Duration Matching.
+
+Pluggable engines that change audio duration by a speed factor. All of them
+take and return mono float32 NumPy arrays.
+
+Backends:
+- wsola: In-process WSOLA (waveform-similarity overlap-add) on NumPy.
+  Pitch-preserving, no subprocess and no temp files (default)
+- rubberband: The rubberband CLI via a WAV temp-file round trip, falling
+  back to simple resampling if the binary is missing or fails
+- simple: Linear-interpolation resampling (fast, but shifts pitch)
+
+Selected with TTS_TIME_STRETCH_BACKEND, or by passing a stretcher to
+duration_matching.time_stretch_audio().
+"""
+
+import logging
+import os
+import subprocess
+import tempfile
+import wave
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+# Backend names accepted by TTS_TIME_STRETCH_BACKEND
+TIME_STRETCH_BACKENDS: tuple[str, ...] = ("wsola", "rubberband", "simple")
+
+DEFAULT_TIME_STRETCH_BACKEND = "wsola"
+
+
+def interpolate_samples(
+    samples: NDArray[np.float32],
+    new_num_samples: int,
+    src_step: float,
+) -> NDArray[np.float32]:
+    """Linearly interpolate samples at positions i * src_step.
+
+    Positions at or past the last sample hold the last sample value.
+
+    Args:
+        samples: Input samples
+        new_num_samples: Number of output samples
+        src_step: Input samples advanced per output sample
+
+    Returns:
+        Interpolated float32 samples
+    """
+    positions = np.arange(new_num_samples, dtype=np.float64) * src_step
+    src = np.arange(len(samples), dtype=np.float64)
+    return np.interp(positions, src, samples).astype(np.float32)
+
+
+class TimeStretcher:
+    """Base class for time-stretch backends."""
+
+    name: str = "base"
+    preserves_pitch: bool = True
+
+    def stretch(
+        self,
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        speed_factor: float,
+    ) -> NDArray[np.float32]:
+        """Change duration by speed_factor.
+
+        Args:
+            samples: Mono float32 samples
+            sample_rate_hz: Sample rate in Hz
+            speed_factor: >1.0 speeds up (shorter), <1.0 slows down (longer)
+
+        Returns:
+            Stretched mono float32 samples (about len(samples) / speed_factor long)
+
+        Raises:
+            RuntimeError: If the backend fails
+        """
+        raise NotImplementedError
+
+
+class ResampleTimeStretcher(TimeStretcher):
+    """Time-stretch by linear-interpolation resampling (changes pitch)."""
+
+    name = "simple"
+    preserves_pitch = False
+
+    def stretch(
+        self,
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        speed_factor: float,
+    ) -> NDArray[np.float32]:
+        new_num_samples = int(len(samples) / speed_factor)
+        if new_num_samples == 0:
+            return samples
+        return interpolate_samples(samples, new_num_samples, speed_factor)
+
+
+class WSOLATimeStretcher(TimeStretcher):
+    """In-process pitch-preserving time-stretch (WSOLA).
+
+    Hann-windowed frames are overlap-added at a fixed synthesis hop of half a
+    frame while the analysis position advances by hop * speed_factor. Each
+    frame is shifted by up to tolerance_ms to the offset whose overlapping
+    half best matches the natural continuation of the previous frame (FFT
+    cross-correlation), which keeps periodic speech aligned without phase
+    smearing.
+    """
+
+    name = "wsola"
+
+    def __init__(self, frame_ms: float = 40.0, tolerance_ms: float = 10.0):
+        """Initialize the WSOLA stretcher.
+
+        Args:
+            frame_ms: Analysis/synthesis frame length in milliseconds
+            tolerance_ms: Maximum frame shift searched for the best overlap
+
+        Raises:
+            ValueError: If frame_ms or tolerance_ms is not positive
+        """
+        if frame_ms <= 0 or tolerance_ms <= 0:
+            raise ValueError(
+                f"frame_ms and tolerance_ms must be positive, got {frame_ms}, {tolerance_ms}"
+            )
+        self.frame_ms = frame_ms
+        self.tolerance_ms = tolerance_ms
+
+    def stretch(
+        self,
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        speed_factor: float,
+    ) -> NDArray[np.float32]:
+        frame = max(4, 2 * int(sample_rate_hz * self.frame_ms / 2000))
+        hop = frame // 2
+        tolerance = max(1, int(sample_rate_hz * self.tolerance_ms / 1000))
+        out_len = int(len(samples) / speed_factor)
+
+        if out_len == 0:
+            return samples
+        if len(samples) < frame:
+            # Too short to overlap-add; resample instead
+            return interpolate_samples(samples, out_len, speed_factor)
+
+        analysis_hop = hop * speed_factor
+        num_frames = out_len // hop + 2
+        positions = tolerance + np.round(np.arange(num_frames) * analysis_hop).astype(np.int64)
+
+        # Pad so every candidate region and continuation stays in bounds
+        padded_len = int(positions[-1]) + 2 * tolerance + 2 * frame
+        x = np.zeros(padded_len, dtype=np.float64)
+        x[tolerance : tolerance + len(samples)] = samples
+
+        window = np.hanning(frame + 1)[:frame]
+        out = np.zeros(num_frames * hop + frame, dtype=np.float64)
+        norm = np.zeros_like(out)
+
+        # Candidates are matched on the half frame that overlaps the previous one
+        search_len = 2 * tolerance + 1
+        fft_size = 1 << int(np.ceil(np.log2(search_len + 2 * hop)))
+
+        # Candidate regions don't depend on earlier choices: transform them in one batch
+        region_starts = positions - tolerance
+        regions = x[region_starts[:, None] + np.arange(hop + 2 * tolerance)]
+        region_spectra = np.fft.rfft(regions, fft_size, axis=1)
+
+        prev = int(positions[0])
+        for k in range(num_frames):
+            pos = int(positions[k])
+            if k > 0:
+                natural = x[prev + hop : prev + frame]
+                corr = np.fft.irfft(
+                    region_spectra[k] * np.conj(np.fft.rfft(natural, fft_size)), fft_size
+                )[:search_len]
+                pos = int(region_starts[k]) + int(np.argmax(corr))
+
+            start = k * hop
+            out[start : start + frame] += window * x[pos : pos + frame]
+            norm[start : start + frame] += window
+            prev = pos
+
+        out = out[:out_len] / np.maximum(norm[:out_len], 1e-3)
+        return out.astype(np.float32)
+
+
+class RubberbandCLITimeStretcher(TimeStretcher):
+    """Time-stretch with the rubberband CLI through WAV temp files.
+
+    Spawns a process and writes two temp files per call; kept for parity with
+    earlier deployments. Falls back to simple resampling on failure.
+    """
+
+    name = "rubberband"
+
+    def __init__(self, fallback: TimeStretcher | None = None):
+        """Initialize the rubberband CLI stretcher.
+
+        Args:
+            fallback: Stretcher to use when rubberband is missing or fails
+        """
+        self._fallback = fallback
+
+    def stretch(
+        self,
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        speed_factor: float,
+    ) -> NDArray[np.float32]:
+        try:
+            return self._stretch_with_cli(samples, sample_rate_hz, speed_factor)
+        except Exception as e:
+            if self._fallback is None:
+                raise RuntimeError(f"Rubberband time-stretch failed: {e}") from e
+            logger.warning(
+                f"Rubberband time-stretch failed: {e}. Using {self._fallback.name} method."
+            )
+            return self._fallback.stretch(samples, sample_rate_hz, speed_factor)
+
+    @staticmethod
+    def _stretch_with_cli(
+        samples: NDArray[np.float32],
+        sample_rate_hz: int,
+        speed_factor: float,
+    ) -> NDArray[np.float32]:
+        # Check if rubberband is available
+        try:
+            result = subprocess.run(
+                ["rubberband", "--version"],
+                capture_output=True,
+                timeout=5,
+            )
+            if result.returncode != 0:
+                raise RuntimeError("rubberband not available")
+        except FileNotFoundError as err:
+            raise RuntimeError("rubberband not installed") from err
+
+        # Clamp float32 PCM and convert to int16 for WAV
+        float_samples = np.clip(samples.astype(np.float64), -1.0, 1.0)
+        int16_data = (float_samples * 32767).astype("<i2").tobytes()
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as input_file:
+            input_path = input_file.name
+
+        with wave.open(input_path, "wb") as wav:
+            wav.setnchannels(1)  # Mono
+            wav.setsampwidth(2)  # 16-bit
+            wav.setframerate(sample_rate_hz)
+            wav.writeframes(int16_data)
+
+        output_path = input_path.replace(".wav", "_stretched.wav")
+
+        try:
+            # -T is tempo multiplier: >1 speeds up, <1 slows down
+            cmd = ["rubberband", "-T", str(speed_factor), "-q", input_path, output_path]
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+
+            if result.returncode != 0:
+                raise RuntimeError(f"rubberband failed: {result.stderr.decode()}")
+
+            with wave.open(output_path, "rb") as wav:
+                out_channels = wav.getnchannels()
+                out_sampwidth = wav.getsampwidth()
+                out_frames = wav.readframes(wav.getnframes())
+
+            if out_sampwidth != 2:
+                raise RuntimeError(f"Unexpected sample width from rubberband: {out_sampwidth}")
+
+            out_num_samples = len(out_frames) // (2 * out_channels)
+            # Multi-channel: take the first (left) channel only
+            int16_out = np.frombuffer(out_frames, dtype="<i2", count=out_num_samples * out_channels)
+            return (int16_out[::out_channels] / 32767.0).astype(np.float32)
+
+        finally:
+            Path(input_path).unlink(missing_ok=True)
+            Path(output_path).unlink(missing_ok=True)
+
+
+def create_time_stretcher(backend: str | None = None) -> TimeStretcher:
+    """Create a time-stretch backend.
+
+    Args:
+        backend: wsola, rubberband or simple (defaults to TTS_TIME_STRETCH_BACKEND,
+            then wsola)
+
+    Returns:
+        TimeStretcher instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = (
+        backend or os.environ.get("TTS_TIME_STRETCH_BACKEND", DEFAULT_TIME_STRETCH_BACKEND)
+    ).lower()
+
+    if backend == "wsola":
+        return WSOLATimeStretcher()
+    if backend == "rubberband":
+        return RubberbandCLITimeStretcher(fallback=ResampleTimeStretcher())
+    if backend == "simple":
+        return ResampleTimeStretcher()
+
+    raise ValueError(
+        f"Unknown time-stretch backend: {backend} (expected one of {TIME_STRETCH_BACKENDS})"
+    )
+
+
+# Process-wide stretcher used when callers don't pass one
+_stretcher: TimeStretcher | None = None
+
+
+def get_time_stretcher() -> TimeStretcher:
+    """Get the process-wide time-stretch backend, creating it on first use.
+
+    Returns:
+        The shared TimeStretcher instance.
+    """
+    global _stretcher
+    if _stretcher is None:
+        _stretcher = create_time_stretcher()
+    return _stretcher
+
+
+def set_time_stretcher(stretcher: TimeStretcher | None) -> None:
+    """Set the process-wide time-stretch backend (for testing).
+
+    Args:
+        stretcher: The stretcher to use, or None to reset.
+    """
+    global _stretcher
+    _stretcher = stretcher
@@ -0,0 +1 @@
+"""Microbenchmarks for sts-service hot paths (run directly, not collected by pytest)."""
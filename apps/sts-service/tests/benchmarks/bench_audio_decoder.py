@@ -0,0 +1,121 @@
+"""Microbenchmark: fragment audio decode, PyAV (in-process) vs ffmpeg CLI.
+
+Decodes each fixture stream to 16 kHz mono float32 the way
+PipelineCoordinator does for ASR, with every available backend.
+
+Fixtures default to tests/fixtures/test-streams/*.m4a|*.mp4 at the repo root.
+Git LFS pointer files (fixtures not pulled) are replaced by a synthesized
+6 s AAC fragment in an MP4 container, so the benchmark always has
+something to run.
+
+Usage:
+    python tests/benchmarks/bench_audio_decoder.py [--iterations N] [FILE ...]
+"""
+
+import argparse
+import io
+import shutil
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sts_service.full.audio_decoder import (
+    PYAV_AVAILABLE,
+    AudioDecoder,
+    FFmpegAudioDecoder,
+    PyAVAudioDecoder,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "test-streams"
+
+TARGET_SAMPLE_RATE = 16000
+TARGET_CHANNELS = 1
+
+
+def synthesize_fragment(container: str, duration_s: float = 6.0, sample_rate: int = 48000) -> bytes:
+    """Encode a sine sweep to AAC in an MP4 or ADTS container with PyAV."""
+    import av
+
+    t = np.arange(int(duration_s * sample_rate)) / sample_rate
+    pcm = (0.3 * np.sin(2 * np.pi * (220 + 110 * t) * t)).astype(np.float32)
+
+    buf = io.BytesIO()
+    with av.open(buf, "w", format=container) as out:
+        stream = out.add_stream("aac", rate=sample_rate)
+        stream.layout = "stereo"
+        frame = av.AudioFrame.from_ndarray(
+            np.repeat(pcm, 2).reshape(1, -1), format="flt", layout="stereo"
+        )
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            out.mux(packet)
+        for packet in stream.encode(None):
+            out.mux(packet)
+    return buf.getvalue()
+
+
+def load_fixtures(paths: list[Path]) -> list[tuple[str, bytes, str]]:
+    """Return (label, bytes, format) for each fixture, synthesizing stand-ins."""
+    fixtures = []
+    for path in paths:
+        data = path.read_bytes()
+        fmt = path.suffix.lstrip(".")
+        if data.startswith(b"version https://git-lfs"):
+            if not PYAV_AVAILABLE:
+                print(f"skip {path.name}: LFS pointer and PyAV unavailable to synthesize")
+                continue
+            data = synthesize_fragment("mp4")
+            label = f"{path.name} (synthesized 6s)"
+        else:
+            label = path.name
+        fixtures.append((label, data, fmt))
+
+    if PYAV_AVAILABLE:
+        fixtures.append(("synthetic.aac (ADTS 6s)", synthesize_fragment("adts"), "aac"))
+    return fixtures
+
+
+def bench(decoder: AudioDecoder, data: bytes, fmt: str, iterations: int) -> tuple[float, int]:
+    """Return (median ms per decode, decoded sample count)."""
+    samples = decoder.decode(data, fmt, TARGET_SAMPLE_RATE, TARGET_CHANNELS)  # warm-up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        decoder.decode(data, fmt, TARGET_SAMPLE_RATE, TARGET_CHANNELS)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = args.files or sorted(
+        p for p in FIXTURE_DIR.glob("*") if p.suffix in (".m4a", ".mp4", ".aac")
+    )
+
+    decoders: list[AudioDecoder] = []
+    if PYAV_AVAILABLE:
+        decoders.append(PyAVAudioDecoder())
+    if shutil.which("ffmpeg"):
+        decoders.append(FFmpegAudioDecoder())
+    if not decoders:
+        print("No decoder backend available (install PyAV or ffmpeg)")
+        return 1
+
+    print(f"{'fixture':<38} {'backend':<8} {'median ms':>10} {'samples':>9}")
+    for label, data, fmt in load_fixtures(paths):
+        for decoder in decoders:
+            median_ms, n_samples = bench(decoder, data, fmt, args.iterations)
+            print(f"{label:<38} {decoder.name:<8} {median_ms:>10.2f} {n_samples:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Microbenchmark: per-call cost of the duration_matching DSP routines.
+
+Runs each routine on a synthesized speech-length fragment (default 6 s at
+48 kHz mono float32, the TTS output shape) and reports the median time per
+call, including the in-process WSOLA time-stretch. The linear-interpolation
+routines are also timed against the original per-sample struct/list loop
+for comparison.
+
+Usage:
+    python tests/benchmarks/bench_duration_matching.py [--iterations N] [--seconds S]
+"""
+
+import argparse
+import statistics
+import struct
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from sts_service.tts.duration_matching import (
+    _time_stretch_simple,
+    align_channels,
+    generate_silence,
+    pad_audio_with_silence,
+    resample_audio,
+)
+from sts_service.tts.time_stretch import WSOLATimeStretcher
+
+SAMPLE_RATE = 48000
+
+
+def loop_interpolate(audio_data: bytes, src_step: float) -> bytes:
+    """Per-sample struct/list linear interpolation (pre-NumPy implementation)."""
+    num_samples = len(audio_data) // 4
+    samples = list(struct.unpack(f"<{num_samples}f", audio_data))
+    new_num_samples = int(num_samples / src_step)
+
+    new_samples = []
+    for i in range(new_num_samples):
+        src_idx = i * src_step
+        src_idx_int = int(src_idx)
+        src_idx_frac = src_idx - src_idx_int
+        if src_idx_int >= num_samples - 1:
+            new_samples.append(samples[-1])
+        else:
+            new_samples.append(
+                samples[src_idx_int] * (1 - src_idx_frac) + samples[src_idx_int + 1] * src_idx_frac
+            )
+    return struct.pack(f"<{len(new_samples)}f", *new_samples)
+
+
+def bench(func: Callable[[], object], iterations: int) -> float:
+    """Return median ms per call."""
+    func()  # warm-up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=6.0)
+    args = parser.parse_args()
+
+    t = np.arange(int(args.seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    mono_samples = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    mono = mono_samples.tobytes()
+    stereo = align_channels(mono, 1, 2)
+    duration_ms = int(args.seconds * 1000)
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object] | None]] = [
+        (
+            "time_stretch_simple x1.25",
+            lambda: _time_stretch_simple(mono, SAMPLE_RATE, 1.25),
+            lambda: loop_interpolate(mono, 1.25),
+        ),
+        (
+            "wsola time-stretch x1.25",
+            lambda: WSOLATimeStretcher().stretch(mono_samples, SAMPLE_RATE, 1.25),
+            None,
+        ),
+        (
+            "resample 48k -> 16k",
+            lambda: resample_audio(mono, SAMPLE_RATE, 16000),
+            lambda: loop_interpolate(mono, 3.0),
+        ),
+        ("align_channels 1 -> 2", lambda: align_channels(mono, 1, 2), None),
+        ("align_channels 2 -> 1", lambda: align_channels(stereo, 2, 1), None),
+        (
+            "pad_audio_with_silence +2s",
+            lambda: pad_audio_with_silence(mono, duration_ms, duration_ms + 2000, SAMPLE_RATE, 1),
+            None,
+        ),
+        ("generate_silence", lambda: generate_silence(duration_ms, SAMPLE_RATE, 2), None),
+    ]
+
+    print(f"fragment: {args.seconds:g}s @ {SAMPLE_RATE} Hz mono float32")
+    print(f"{'routine':<28} {'numpy ms':>10} {'loop ms':>10} {'speedup':>8}")
+    for label, func, reference in cases:
+        numpy_ms = bench(func, args.iterations)
+        if reference is None:
+            print(f"{label:<28} {numpy_ms:>10.3f} {'-':>10} {'-':>8}")
+            continue
+        loop_ms = bench(reference, max(1, args.iterations // 4))
+        print(f"{label:<28} {numpy_ms:>10.3f} {loop_ms:>10.3f} {loop_ms / numpy_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ These tests verify:
 - Time-stretch with pitch preservation
 - Failure handling when rubberband fails or is unavailable
 - Fallback to simple resampling method
+- In-process WSOLA output quality against the rubberband CLI
 
 Requirements:
 - rubberband-cli installed for live tests (marked with @rubberband)
@@ -16,6 +17,7 @@ import math
 import struct
 import subprocess
 
+import numpy as np
 import pytest
 from sts_service.tts.duration_matching import (
     AlignmentResult,
@@ -27,6 +29,7 @@ from sts_service.tts.duration_matching import (
     resample_audio,
     time_stretch_audio,
 )
+from sts_service.tts.time_stretch import RubberbandCLITimeStretcher, WSOLATimeStretcher
 
 from .conftest import skip_without_rubberband
 
@@ -230,7 +233,9 @@ class TestTimeStretchRubberband:
         """Test rubberband time-stretch speeds up audio."""
         audio = generate_test_audio(1000, sample_rate_hz=16000)
 
-        stretched, was_stretched = time_stretch_audio(audio, 16000, 1.5)
+        stretched, was_stretched = time_stretch_audio(
+            audio, 16000, 1.5, stretcher=RubberbandCLITimeStretcher()
+        )
 
         # Note: may fall back to simple method if rubberband fails
         if was_stretched:
@@ -247,7 +252,9 @@ class TestTimeStretchRubberband:
         """
         audio = generate_test_audio(1000, sample_rate_hz=16000, frequency_hz=440.0)
 
-        stretched, was_stretched = time_stretch_audio(audio, 16000, 1.25)
+        stretched, was_stretched = time_stretch_audio(
+            audio, 16000, 1.25, stretcher=RubberbandCLITimeStretcher()
+        )
 
         # Just verify we got valid output
         assert len(stretched) > 0
@@ -258,6 +265,51 @@ class TestTimeStretchRubberband:
         assert all(math.isfinite(s) for s in samples)
 
 
+@pytest.mark.rubberband
+@skip_without_rubberband
+class TestWSOLAAgainstRubberband:
+    """Compare the in-process WSOLA backend with rubberband CLI output."""
+
+    @staticmethod
+    def _stretch_both(audio: bytes, speed_factor: float) -> tuple[np.ndarray, np.ndarray]:
+        samples = np.frombuffer(audio, dtype=np.float32)
+        cli = RubberbandCLITimeStretcher().stretch(samples, 16000, speed_factor)
+        wsola = WSOLATimeStretcher().stretch(samples, 16000, speed_factor)
+        return cli, wsola
+
+    @staticmethod
+    def _spectrum(samples: np.ndarray, size: int = 8192) -> np.ndarray:
+        return np.abs(np.fft.rfft(samples[:size] * np.hanning(min(size, len(samples))), size))
+
+    @pytest.mark.parametrize("speed_factor", [0.8, 1.25, 1.5])
+    def test_duration_matches_cli(self, speed_factor):
+        """WSOLA output length is within 1% of rubberband's."""
+        cli, wsola = self._stretch_both(generate_test_audio(2000), speed_factor)
+
+        assert abs(len(wsola) - len(cli)) <= 0.01 * len(cli)
+
+    @pytest.mark.parametrize("speed_factor", [0.8, 1.25, 1.5])
+    def test_pitch_matches_cli(self, speed_factor):
+        """Both backends keep the tone at the same dominant frequency."""
+        audio = generate_test_audio(2000, frequency_hz=440.0)
+        cli, wsola = self._stretch_both(audio, speed_factor)
+
+        cli_peak = np.argmax(self._spectrum(cli)) * 16000 / 8192
+        wsola_peak = np.argmax(self._spectrum(wsola)) * 16000 / 8192
+        assert abs(cli_peak - wsola_peak) <= 4.0
+
+    @pytest.mark.parametrize("speed_factor", [0.8, 1.25, 1.5])
+    def test_spectrum_and_level_match_cli(self, speed_factor):
+        """Magnitude spectra correlate and RMS levels agree within 1.5 dB."""
+        audio = generate_test_audio(2000, frequency_hz=300.0, amplitude=0.4)
+        cli, wsola = self._stretch_both(audio, speed_factor)
+
+        correlation = np.corrcoef(self._spectrum(cli), self._spectrum(wsola))[0, 1]
+        level_db = 20 * np.log10(np.sqrt(np.mean(wsola**2)) / np.sqrt(np.mean(cli**2)))
+        assert correlation > 0.9
+        assert abs(level_db) < 1.5
+
+
 # =============================================================================
 # Test: Resampling
 # =============================================================================
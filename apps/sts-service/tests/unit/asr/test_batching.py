@@ -0,0 +1,150 @@
+"""
+Unit tests for the cross-stream ASR batch scheduler.
+
+Tests batch formation by size and wait window, grouping by key,
+error propagation and batch events.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from sts_service.asr.batching import BatchScheduler
+
+
+def _echo_runner(batches: list):
+    def runner(items):
+        batches.append(list(items))
+        return [item * 10 for item in items]
+
+    return runner
+
+
+def _submit_concurrently(scheduler, items, runner, key=lambda item: "k", **limits):
+    limits = {"max_batch_size": 8, "max_wait_ms": 200, **limits}
+    with ThreadPoolExecutor(max_workers=len(items)) as pool:
+        futures = [
+            pool.submit(scheduler.submit, key(item), item, runner, **limits) for item in items
+        ]
+        return [future.result(timeout=5) for future in futures]
+
+
+class TestBatchScheduler:
+    """Tests for BatchScheduler.submit()."""
+
+    def test_concurrent_requests_share_one_batch(self):
+        """Requests arriving within the wait window run as one batch."""
+        scheduler = BatchScheduler()
+        batches = []
+
+        results = _submit_concurrently(scheduler, [1, 2, 3, 4], _echo_runner(batches))
+
+        assert results == [10, 20, 30, 40]
+        assert len(batches) == 1
+        assert sorted(batches[0]) == [1, 2, 3, 4]
+
+    def test_full_batch_runs_without_waiting(self):
+        """Reaching max_batch_size starts the batch before the window ends."""
+        scheduler = BatchScheduler()
+        batches = []
+
+        start = time.perf_counter()
+        _submit_concurrently(
+            scheduler, [1, 2], _echo_runner(batches), max_batch_size=2, max_wait_ms=5000
+        )
+
+        assert time.perf_counter() - start < 2
+        assert len(batches) == 1
+
+    def test_batches_bounded_by_size(self):
+        """More requests than max_batch_size are split into several batches."""
+        scheduler = BatchScheduler()
+        batches = []
+
+        results = _submit_concurrently(
+            scheduler, list(range(6)), _echo_runner(batches), max_batch_size=2
+        )
+
+        assert results == [0, 10, 20, 30, 40, 50]
+        assert all(len(batch) <= 2 for batch in batches)
+        assert sorted(item for batch in batches for item in batch) == list(range(6))
+
+    def test_lone_request_runs_after_wait_window(self):
+        """A single request is not held longer than max_wait_ms."""
+        scheduler = BatchScheduler()
+        batches = []
+
+        start = time.perf_counter()
+        result = scheduler.submit("k", 7, _echo_runner(batches), max_batch_size=8, max_wait_ms=20)
+
+        assert result == 70
+        assert batches == [[7]]
+        assert time.perf_counter() - start < 1
+
+    def test_different_keys_never_share_a_batch(self):
+        """Requests with different keys (e.g. languages) are batched separately."""
+        scheduler = BatchScheduler()
+        batches = []
+
+        _submit_concurrently(
+            scheduler, [1, 2, 3, 4], _echo_runner(batches), key=lambda item: item % 2
+        )
+
+        assert sorted(sorted(batch) for batch in batches) == [[1, 3], [2, 4]]
+
+    def test_runner_error_raised_for_every_request(self):
+        """A failing batch fails all of its requests."""
+        scheduler = BatchScheduler()
+        runner = MagicMock(side_effect=RuntimeError("CUDA out of memory"))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(scheduler.submit, "k", i, runner, max_batch_size=2, max_wait_ms=1000)
+                for i in range(2)
+            ]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="out of memory"):
+                    future.result(timeout=5)
+
+        assert runner.call_count == 1
+
+    def test_result_count_mismatch_rejected(self):
+        """A runner returning the wrong number of results is an error."""
+        scheduler = BatchScheduler()
+
+        with pytest.raises(RuntimeError):
+            scheduler.submit("k", 1, lambda items: [], max_batch_size=1, max_wait_ms=0)
+
+    def test_invalid_batch_size_rejected(self):
+        """At least one item per batch is required."""
+        with pytest.raises(ValueError):
+            BatchScheduler().submit("k", 1, _echo_runner([]), max_batch_size=0, max_wait_ms=0)
+
+    def test_batch_events_report_size_and_wait(self):
+        """Listeners see the batch size and each request's queue wait."""
+        scheduler = BatchScheduler()
+        listener = MagicMock()
+        scheduler.add_listener(listener)
+        scheduler.add_listener(listener)  # Duplicate registration is ignored
+        release = threading.Event()
+
+        def runner(items):
+            release.wait(5)
+            return items
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(scheduler.submit, "k", i, runner, max_batch_size=3, max_wait_ms=1000)
+                for i in range(3)
+            ]
+            release.set()
+            for future in futures:
+                future.result(timeout=5)
+
+        event = listener.call_args.args[0]
+        assert listener.call_count == 1
+        assert event.size == 3
+        assert len(event.wait_s) == 3
+        assert all(wait >= 0 for wait in event.wait_s)
@@ -311,3 +311,116 @@ class TestResampleAudio:
         result = resample_audio(audio, orig_sr=16000, target_sr=16000)
 
         np.testing.assert_array_equal(result, audio)
+
+
+class TestAudioPreprocessor:
+    """Tests for the single-pass preprocessing chain."""
+
+    @staticmethod
+    def _tone(sample_rate: int, duration: float = 1.0) -> np.ndarray:
+        t = np.arange(int(sample_rate * duration)) / sample_rate
+        return (0.3 * np.sin(2 * np.pi * 440 * t) + 0.1 * np.sin(2 * np.pi * 2500 * t)).astype(
+            np.float32
+        )
+
+    def test_matches_step_by_step_chain(self):
+        """The fused filter equals a causal high-pass, then pre-emphasis and normalize."""
+        from scipy import signal
+
+        from sts_service.asr.preprocessing import (
+            AudioPreprocessor,
+            apply_preemphasis,
+            highpass_sos,
+            normalize_audio,
+        )
+
+        audio = self._tone(16000)
+        sos = highpass_sos(16000).astype(np.float64)
+        highpassed, _ = signal.sosfilt(sos, audio, zi=signal.sosfilt_zi(sos) * audio[0])
+        expected = normalize_audio(apply_preemphasis(highpassed.astype(np.float32)))
+
+        result = AudioPreprocessor().process(audio.tobytes(), sample_rate=16000)
+
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+
+    def test_no_onset_transient(self):
+        """A DC offset at the start of a fragment does not produce a click."""
+        from sts_service.asr.preprocessing import AudioPreprocessor
+
+        tone = self._tone(16000)
+        tone[:8000] = 0.0
+        audio = tone + np.float32(0.5)
+
+        result = AudioPreprocessor().process(audio.tobytes(), sample_rate=16000)
+
+        # The DC-only first half stays near silent next to the tone
+        assert np.abs(result[:8000]).max() < 0.01
+
+    @pytest.mark.parametrize("orig_sr,target_sr", [(48000, 16000), (44100, 16000), (16000, 24000)])
+    def test_polyphase_resampling_matches_fft_resampling(self, orig_sr, target_sr):
+        """resample_audio stays within tolerance of its previous scipy.signal.resample output."""
+        from scipy import signal
+
+        from sts_service.asr.preprocessing import resample_audio
+
+        audio = self._tone(orig_sr)
+        num_samples = len(audio) * target_sr // orig_sr
+        expected = signal.resample(audio, num_samples)
+
+        result = resample_audio(audio, orig_sr=orig_sr, target_sr=target_sr)
+
+        assert len(result) == num_samples
+        assert result.dtype == np.float32
+        # Edges differ: FFT resampling wraps around, polyphase filtering does not
+        edge = target_sr // 80
+        np.testing.assert_allclose(result[edge:-edge], expected[edge:-edge], atol=1e-3)
+
+    def test_writes_into_provided_buffer(self):
+        """A caller-provided buffer is filled in place and returned as a view."""
+        from sts_service.asr.preprocessing import AudioPreprocessor
+
+        preprocessor = AudioPreprocessor()
+        audio_bytes = self._tone(48000).tobytes()
+        out = np.zeros(preprocessor.output_length(len(audio_bytes), 48000) + 10, np.float32)
+
+        result = preprocessor.process(audio_bytes, sample_rate=48000, out=out)
+
+        assert len(result) == 16000
+        assert np.shares_memory(result, out)
+        assert np.abs(out[:16000]).max() == pytest.approx(1.0, rel=1e-5)
+
+    def test_input_buffer_not_mutated(self):
+        """Normalizing an unfiltered AudioBuffer at the target rate leaves its samples intact."""
+        from sts_service.asr.preprocessing import preprocess_audio
+        from sts_service.audio_buffer import AudioBuffer
+
+        samples = np.array([0.1, 0.2, -0.25], dtype=np.float32)
+        buffer = AudioBuffer.from_array(samples.copy(), 16000)
+
+        result = preprocess_audio(buffer, 16000, apply_filters=False)
+
+        np.testing.assert_array_equal(buffer.samples, samples)
+        np.testing.assert_allclose(result, [0.4, 0.8, -1.0], rtol=1e-6)
+
+    def test_small_buffer_rejected(self):
+        """A buffer shorter than the output raises ValueError."""
+        from sts_service.asr.preprocessing import AudioPreprocessor
+
+        with pytest.raises(ValueError, match="buffer"):
+            AudioPreprocessor().process(
+                self._tone(16000).tobytes(), sample_rate=16000, out=np.zeros(100, np.float32)
+            )
+
+    def test_filter_design_cached_per_sample_rate(self):
+        """The filter design is computed once per sample rate."""
+        from sts_service.asr.preprocessing import AudioPreprocessor, _filter_plan, highpass_sos
+
+        highpass_sos.cache_clear()
+        _filter_plan.cache_clear()
+        preprocessor = AudioPreprocessor()
+        for _ in range(3):
+            preprocessor.process(self._tone(16000).tobytes(), sample_rate=16000)
+
+        assert _filter_plan.cache_info().misses == 1
+        assert _filter_plan.cache_info().hits == 2
+        assert highpass_sos.cache_info().misses == 1
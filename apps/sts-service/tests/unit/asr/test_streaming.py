@@ -0,0 +1,257 @@
+"""
+Unit tests for streaming ASR with local agreement.
+
+Uses a scripted ASR component that "hears" the words of a fixed transcript
+whose timings fall inside the decoded window.
+"""
+
+import numpy as np
+import pytest
+from sts_service.asr.interface import BaseASRComponent
+from sts_service.asr.models import (
+    StreamingASRConfig,
+    TranscriptAsset,
+    TranscriptSegment,
+    TranscriptStatus,
+    WordTiming,
+)
+from sts_service.asr.streaming import StreamingASR
+
+SAMPLE_RATE = 16000
+
+
+class ScriptedASR(BaseASRComponent):
+    """Returns the script's words that end inside the transcribed window.
+
+    unstable_tail: a word still being spoken is returned with a different
+    (wrong) spelling on every call, like Whisper guessing at cut-off audio.
+    """
+
+    def __init__(self, script: list[tuple[str, int, int]], unstable_tail: bool = False):
+        self.script = script
+        self.unstable_tail = unstable_tail
+        self.windows: list[tuple[int, int]] = []
+        self.fail = False
+
+    @property
+    def component_instance(self) -> str:
+        return "scripted-asr"
+
+    @property
+    def is_ready(self) -> bool:
+        return True
+
+    def transcribe(
+        self,
+        audio_data,
+        stream_id,
+        sequence_number,
+        start_time_ms,
+        end_time_ms,
+        sample_rate_hz=16000,
+        domain="general",
+        language="en",
+    ) -> TranscriptAsset:
+        self.windows.append((start_time_ms, end_time_ms))
+        if self.fail:
+            return TranscriptAsset(
+                stream_id=stream_id,
+                sequence_number=sequence_number,
+                component_instance=self.component_instance,
+                language=language,
+                status=TranscriptStatus.FAILED,
+            )
+
+        words = [
+            WordTiming(start_time_ms=s, end_time_ms=e, word=w, confidence=0.9)
+            for w, s, e in self.script
+            if s >= start_time_ms and e <= end_time_ms
+        ]
+        if self.unstable_tail:
+            partial = next((x for x in self.script if x[1] < end_time_ms < x[2]), None)
+            if partial is not None:
+                words.append(
+                    WordTiming(
+                        start_time_ms=partial[1],
+                        end_time_ms=end_time_ms,
+                        word=f"{partial[0][:2]}{len(self.windows)}",
+                        confidence=0.3,
+                    )
+                )
+
+        segments = []
+        if words:
+            segments.append(
+                TranscriptSegment(
+                    start_time_ms=words[0].start_time_ms,
+                    end_time_ms=words[-1].end_time_ms,
+                    text=" ".join(w.word for w in words),
+                    confidence=0.9,
+                    words=words,
+                )
+            )
+        return TranscriptAsset(
+            stream_id=stream_id,
+            sequence_number=sequence_number,
+            component_instance=self.component_instance,
+            language=language,
+            segments=segments,
+            status=TranscriptStatus.SUCCESS,
+        )
+
+
+def _script(text: str, word_ms: int = 400, gap_ms: int = 100, start_ms: int = 0):
+    script = []
+    t = start_ms
+    for word in text.split():
+        script.append((word, t, t + word_ms))
+        t += word_ms + gap_ms
+    return script
+
+
+def _chunk(duration_ms: int) -> bytes:
+    return np.zeros(SAMPLE_RATE * duration_ms // 1000, dtype=np.float32).tobytes()
+
+
+def _stream(streaming: StreamingASR, total_ms: int, chunk_ms: int = 500):
+    committed = []
+    for _ in range(total_ms // chunk_ms):
+        streaming.insert_audio(_chunk(chunk_ms))
+        committed.extend(streaming.process())
+    return committed
+
+
+TEXT = "touchdown chiefs mahomes finds kelce in the end zone again"
+
+
+class TestLocalAgreement:
+    """Tests for the commit policy."""
+
+    def test_words_commit_once_two_hypotheses_agree(self):
+        """The first decode commits nothing; the second commits the agreed prefix."""
+        streaming = StreamingASR(ScriptedASR(_script(TEXT)), "s1")
+
+        streaming.insert_audio(_chunk(1000))
+        assert streaming.process() == []
+        assert streaming.pending_text == "touchdown chiefs"
+
+        streaming.insert_audio(_chunk(1000))
+        segments = streaming.process()
+
+        assert segments[0].text == "touchdown chiefs"
+        assert segments[0].start_time_ms == 0
+        assert [w.word for w in segments[0].words] == ["touchdown", "chiefs"]
+
+    def test_unstable_tail_not_committed(self):
+        """A word that changes between hypotheses waits until it settles."""
+        streaming = StreamingASR(ScriptedASR(_script(TEXT), unstable_tail=True), "s1")
+
+        committed = _stream(streaming, 4000)
+
+        words = " ".join(segment.text for segment in committed).split()
+        assert words == TEXT.split()[: len(words)]
+        assert all(word in TEXT.split() for word in streaming.committed_text.split())
+
+    def test_commits_before_fragment_would_complete(self):
+        """Text is available well before a full 6 s fragment has arrived."""
+        streaming = StreamingASR(ScriptedASR(_script(TEXT)), "s1")
+
+        committed = _stream(streaming, 3000)
+
+        assert committed
+        assert committed[0].end_time_ms < 3000
+
+    def test_finish_commits_remaining_hypothesis(self):
+        """The whole transcript is committed exactly once."""
+        streaming = StreamingASR(ScriptedASR(_script(TEXT)), "s1")
+
+        committed = _stream(streaming, 6000)
+        committed.extend(streaming.finish())
+
+        assert " ".join(segment.text for segment in committed) == TEXT
+        assert streaming.committed_text == TEXT
+        assert streaming.buffer_duration_ms == 0
+
+    def test_higher_agreement_waits_longer(self):
+        """LocalAgreement-3 needs three matching hypotheses."""
+        config = StreamingASRConfig(agreement=3)
+        streaming = StreamingASR(ScriptedASR(_script(TEXT)), "s1", config=config)
+
+        streaming.insert_audio(_chunk(1000))
+        streaming.process()
+        streaming.insert_audio(_chunk(1000))
+
+        assert streaming.process() == []
+
+
+class TestRollingWindow:
+    """Tests for window trimming and overlap handling."""
+
+    def test_window_trimmed_at_commit_point(self):
+        """The decoded window stays bounded on a long stream."""
+        config = StreamingASRConfig(buffer_trim_ms=3000, overlap_ms=500)
+        asr = ScriptedASR(_script(" ".join([TEXT] * 8)))
+        streaming = StreamingASR(asr, "s1", config=config)
+
+        committed = _stream(streaming, 40000, chunk_ms=1000)
+
+        assert max(end - start for start, end in asr.windows) <= 3000 + 1000 + 500
+        assert asr.windows[-1][0] > 30000
+        # No word is committed twice across trims
+        times = [w.start_time_ms for segment in committed for w in segment.words]
+        assert times == sorted(set(times))
+
+    def test_silence_forces_trim_at_max_window(self):
+        """Without speech the window never exceeds max_buffer_ms."""
+        config = StreamingASRConfig(buffer_trim_ms=1000, max_buffer_ms=2000, overlap_ms=0)
+        streaming = StreamingASR(ScriptedASR([]), "s1", config=config)
+
+        _stream(streaming, 10000, chunk_ms=1000)
+
+        assert streaming.buffer_duration_ms <= 2000
+
+    def test_boundary_repeat_dropped(self):
+        """A committed word recognized again in the overlap is not repeated."""
+        asr = ScriptedASR(_script("one two three"))
+        streaming = StreamingASR(asr, "s1")
+        _stream(streaming, 2000, chunk_ms=1000)
+        assert streaming.committed_text == "one two"
+
+        # Re-recognition shifts "two" past the commit point
+        asr.script = [("two", 910, 1300), ("three", 1300, 1400), ("four", 1500, 1900)]
+        streaming.insert_audio(_chunk(1000))
+        streaming.process()
+        streaming.insert_audio(_chunk(1000))
+        streaming.process()
+
+        assert streaming.committed_text == "one two three four"
+
+    def test_failed_decode_keeps_state(self):
+        """A failed decode commits nothing and later decodes continue."""
+        asr = ScriptedASR(_script(TEXT))
+        streaming = StreamingASR(asr, "s1")
+        asr.fail = True
+
+        assert _stream(streaming, 2000, chunk_ms=1000) == []
+
+        asr.fail = False
+        assert _stream(streaming, 2000, chunk_ms=1000)
+
+    def test_absolute_timestamps_from_start_time(self):
+        """Windows are placed on the stream timeline."""
+        asr = ScriptedASR(_script(TEXT, start_ms=60000))
+        streaming = StreamingASR(asr, "s1", start_time_ms=60000)
+
+        committed = _stream(streaming, 2000, chunk_ms=1000)
+
+        assert asr.windows[0] == (60000, 61000)
+        assert committed[0].start_time_ms == 60000
+
+
+class TestStreamingASRConfig:
+    """Tests for StreamingASRConfig validation."""
+
+    def test_agreement_of_one_rejected(self):
+        """A single hypothesis cannot agree with itself."""
+        with pytest.raises(ValueError):
+            StreamingASRConfig(agreement=1)
@@ -181,6 +181,18 @@ class TestFragmentDataPayload:
         )
         assert audio.data_base64 == small_audio
 
+    def test_audio_data_binary(self):
+        """Raw bytes audio is accepted and dumped without data_base64."""
+        audio = AudioData(
+            format="m4a",
+            sample_rate_hz=48000,
+            channels=1,
+            duration_ms=10,
+            data=b"\x00" * 100,
+        )
+        assert audio.audio_bytes() == b"\x00" * 100
+        assert "data_base64" not in audio.model_dump()
+
     def test_fragment_sequence_number_non_negative(self):
         """sequence_number must be non-negative."""
         with pytest.raises(ValidationError):
@@ -0,0 +1,219 @@
+"""Unit tests for the load-adaptive ASR quality ladder.
+
+Tests profile derivation, controller step-down/step-up with hysteresis,
+and that AdaptiveASRComponent routes fragments to the current profile's
+component.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sts_service.asr.models import ASRConfig, ASRModelConfig
+from sts_service.full.asr_ladder import (
+    AdaptiveASRComponent,
+    ASRLadderController,
+    apply_profile,
+    build_profiles,
+)
+from sts_service.full.config import ASRLadderConfig
+
+TIMEOUT_MS = 8000
+PROFILES = ["fast", "balanced", "accurate"]
+
+
+def _config(**overrides) -> ASRLadderConfig:
+    return ASRLadderConfig(**{**ASRLadderConfig().__dict__, **overrides})
+
+
+def _controller(**overrides) -> ASRLadderController:
+    return ASRLadderController(PROFILES, TIMEOUT_MS, _config(**overrides))
+
+
+def _feed(controller: ASRLadderController, latency_ms: float, count: int, queue: int = 0):
+    return [controller.observe(latency_ms, queue) for _ in range(count)]
+
+
+class TestProfiles:
+    """Tests for profile definitions."""
+
+    def test_profiles_ordered_fastest_first(self):
+        """Beam width grows along the ladder."""
+        profiles = build_profiles(_config())
+
+        assert [p.name for p in profiles] == PROFILES
+        assert [p.beam_size for p in profiles] == sorted(p.beam_size for p in profiles)
+
+    def test_apply_profile_overrides_decoding(self):
+        """The fast profile swaps the model and drops word timestamps."""
+        base = ASRConfig(model=ASRModelConfig(model_size="small", device="cuda"))
+        fast = build_profiles(_config(fast_model="tiny"))[0]
+
+        config = apply_profile(base, fast)
+
+        assert config.model.model_size == "tiny"
+        assert config.model.device == "cuda"
+        assert config.transcription.beam_size == 1
+        assert config.transcription.temperature == [0.0]
+        assert config.transcription.word_timestamps is False
+        assert base.transcription.beam_size == 8
+
+    def test_empty_model_keeps_session_model(self):
+        """Profiles without a model use the session's ASR_MODEL_SIZE."""
+        base = ASRConfig(model=ASRModelConfig(model_size="medium"))
+        balanced = build_profiles(_config(balanced_model=""))[1]
+
+        assert apply_profile(base, balanced).model.model_size == "medium"
+
+
+class TestController:
+    """Tests for ASRLadderController switching."""
+
+    def test_starts_on_configured_profile(self):
+        """ASR_LADDER_START_PROFILE selects the first profile."""
+        assert _controller(start_profile="balanced").profile == "balanced"
+
+    def test_steps_down_when_latency_exceeds_budget(self):
+        """Sustained latency above the high watermark drops one profile."""
+        controller = _controller()
+
+        switches = _feed(controller, 0.9 * TIMEOUT_MS, 2)
+
+        assert switches == [None, "balanced"]
+
+    def test_single_spike_does_not_switch(self):
+        """One slow fragment is not enough to step down."""
+        controller = _controller(step_down_fragments=2)
+
+        controller.observe(0.9 * TIMEOUT_MS, 0)
+        controller.observe(0.1 * TIMEOUT_MS, 0)
+
+        assert controller.profile == "accurate"
+
+    def test_steps_down_on_queue_depth(self):
+        """A backed-up ASR queue steps down even if latency looks fine."""
+        controller = _controller(queue_high=3)
+
+        _feed(controller, 0.2 * TIMEOUT_MS, 2, queue=3)
+
+        assert controller.profile == "balanced"
+
+    def test_steps_up_after_dwell(self):
+        """Latency below the low watermark steps up after min_dwell_fragments."""
+        controller = _controller(start_profile="fast", min_dwell_fragments=5)
+
+        switches = _feed(controller, 0.05 * TIMEOUT_MS, 5)
+
+        assert switches == [None] * 4 + ["balanced"]
+
+    def test_no_step_up_with_queued_work(self):
+        """Fast fragments do not step up while others wait for an ASR worker."""
+        controller = _controller(start_profile="fast", min_dwell_fragments=2)
+
+        _feed(controller, 0.05 * TIMEOUT_MS, 10, queue=1)
+
+        assert controller.profile == "fast"
+
+    def test_holds_between_watermarks(self):
+        """Latency between the watermarks keeps the current profile."""
+        controller = _controller(start_profile="balanced", min_dwell_fragments=2)
+
+        assert _feed(controller, 0.3 * TIMEOUT_MS, 20) == [None] * 20
+
+    def test_failed_step_up_backs_off(self):
+        """A step up that is undone right away doubles the dwell before the next."""
+        controller = _controller(start_profile="balanced", min_dwell_fragments=3)
+
+        _feed(controller, 0.05 * TIMEOUT_MS, 3)
+        assert controller.profile == "accurate"
+        _feed(controller, 0.9 * TIMEOUT_MS, 2)
+        assert controller.profile == "balanced"
+
+        _feed(controller, 0.05 * TIMEOUT_MS, 5)
+        assert controller.profile == "balanced"
+        _feed(controller, 0.05 * TIMEOUT_MS, 1)
+        assert controller.profile == "accurate"
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"ASR_LADDER_START_PROFILE": "turbo"},
+            {"ASR_LADDER_LOW_WATERMARK": "0.5", "ASR_LADDER_HIGH_WATERMARK": "0.4"},
+            {"ASR_LADDER_MIN_DWELL_FRAGMENTS": "0"},
+        ],
+    )
+    def test_invalid_config_rejected(self, monkeypatch, env):
+        """Unknown profiles and inconsistent thresholds are rejected."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(ValueError):
+            ASRLadderConfig().validate()
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Operators opt in to the ladder."""
+        monkeypatch.delenv("ASR_LADDER_ENABLED", raising=False)
+
+        assert ASRLadderConfig().enabled is False
+
+
+class TestAdaptiveASRComponent:
+    """Tests for the per-session ladder component."""
+
+    @pytest.fixture
+    def factory(self):
+        def create(config: ASRConfig):
+            component = MagicMock()
+            component.component_instance = f"asr-beam{config.transcription.beam_size}"
+            component.transcribe.return_value = MagicMock(beam=config.transcription.beam_size)
+            return component
+
+        return MagicMock(side_effect=create)
+
+    @staticmethod
+    def _transcribe(asr: AdaptiveASRComponent, sequence_number: int = 0):
+        return asr.transcribe(b"\x00" * 64, "stream-1", sequence_number, 0, 2000)
+
+    def test_all_profiles_created_eagerly(self, factory):
+        """Every profile's component is created at init, so switching never loads a model."""
+        asr = AdaptiveASRComponent(
+            ASRConfig(), TIMEOUT_MS, factory, config=_config(), queue_depth=lambda: 10
+        )
+        assert factory.call_count == 3
+        assert asr.component_instance == "asr-beam8"
+
+        for i in range(4):
+            self._transcribe(asr, i)
+
+        assert asr.profile == "fast"
+        assert factory.call_count == 3
+
+    def test_switches_profile_under_load(self, factory):
+        """Slow fragments move later fragments to a cheaper profile."""
+        asr = AdaptiveASRComponent(
+            ASRConfig(), TIMEOUT_MS, factory, config=_config(), queue_depth=lambda: 0
+        )
+        clock = iter(x for t in range(0, 100000, 8000) for x in (t / 1000, (t + 7000) / 1000))
+
+        with patch("sts_service.full.asr_ladder.time.perf_counter", side_effect=clock):
+            results = [self._transcribe(asr, i) for i in range(3)]
+
+        assert [r.beam for r in results] == [8, 8, 3]
+        assert asr.profile == "balanced"
+
+    def test_shutdown_releases_all_profiles(self, factory):
+        """Every created component is shut down once."""
+        asr = AdaptiveASRComponent(
+            ASRConfig(), TIMEOUT_MS, factory, config=_config(), queue_depth=lambda: 10
+        )
+        for i in range(3):
+            self._transcribe(asr, i)
+        created = list(asr._components.values())
+
+        asr.shutdown()
+        asr.shutdown()
+
+        assert len(created) == 3
+        for component in created:
+            component.shutdown.assert_called_once()
+        assert asr.is_ready is False
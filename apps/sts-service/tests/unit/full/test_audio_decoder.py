@@ -0,0 +1,202 @@
+"""Unit tests for fragment audio decoders.
+
+Tests the in-process PyAV decoder, the ffmpeg CLI decoder (subprocess
+mocked), fallback between them, and backend selection.
+"""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sts_service.full import audio_decoder
+from sts_service.full.audio_decoder import (
+    AudioDecoder,
+    FFmpegAudioDecoder,
+    PyAVAudioDecoder,
+    create_audio_decoder,
+)
+
+
+def _encode_aac(container: str, seconds: float = 1.0, sample_rate: int = 48000) -> bytes:
+    """Encode a 440 Hz stereo tone to AAC in an MP4 or ADTS container."""
+    av = pytest.importorskip("av")
+
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    buf = io.BytesIO()
+    with av.open(buf, "w", format=container) as out:
+        stream = out.add_stream("aac", rate=sample_rate)
+        stream.layout = "stereo"
+        frame = av.AudioFrame.from_ndarray(
+            np.repeat(tone, 2).reshape(1, -1), format="flt", layout="stereo"
+        )
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            out.mux(packet)
+        for packet in stream.encode(None):
+            out.mux(packet)
+    return buf.getvalue()
+
+
+class TestPyAVAudioDecoder:
+    """Tests for in-process decoding with PyAV."""
+
+    @pytest.mark.parametrize(
+        "container,input_format", [("mp4", "m4a"), ("adts", "aac"), ("adts", "m4a")]
+    )
+    def test_decodes_to_16k_mono_float32(self, container: str, input_format: str):
+        """AAC in M4A or ADTS (also when labelled m4a) decodes to 16 kHz mono float32."""
+        data = _encode_aac(container, seconds=1.0)
+        fallback = MagicMock()
+
+        pcm = PyAVAudioDecoder(fallback=fallback).decode(
+            data, input_format, sample_rate=16000, channels=1
+        )
+
+        fallback.decode.assert_not_called()
+
+        assert pcm.dtype == np.float32
+        assert pcm.ndim == 1
+        # One second plus encoder priming/padding
+        assert 16000 <= len(pcm) < 16000 + 2048
+        assert np.abs(pcm[4000:12000]).max() > 0.2
+
+    def test_stereo_output_is_interleaved(self):
+        """Requesting two channels yields interleaved stereo samples."""
+        data = _encode_aac("mp4", seconds=0.5)
+
+        pcm = PyAVAudioDecoder().decode(data, "m4a", sample_rate=16000, channels=2)
+
+        assert len(pcm) % 2 == 0
+        assert 16000 <= len(pcm) < 16000 + 4096
+
+    def test_pcm_passthrough(self):
+        """pcm_f32le input is returned without decoding."""
+        pytest.importorskip("av")
+        samples = np.linspace(-1, 1, 100, dtype=np.float32)
+
+        pcm = PyAVAudioDecoder().decode(samples.tobytes(), "pcm_f32le", 16000, 1)
+
+        np.testing.assert_array_equal(pcm, samples)
+
+    def test_invalid_data_uses_fallback(self):
+        """Undecodable input is handed to the fallback decoder."""
+        pytest.importorskip("av")
+        fallback = MagicMock(spec=AudioDecoder)
+        fallback.name = "ffmpeg"
+        fallback.decode.return_value = np.zeros(10, dtype=np.float32)
+
+        pcm = PyAVAudioDecoder(fallback=fallback).decode(b"not audio", "m4a", 16000, 1)
+
+        fallback.decode.assert_called_once_with(b"not audio", "m4a", 16000, 1)
+        assert len(pcm) == 10
+
+    def test_invalid_data_without_fallback_raises(self):
+        """Undecodable input without a fallback raises RuntimeError."""
+        pytest.importorskip("av")
+
+        with pytest.raises(RuntimeError, match="Failed to decode m4a"):
+            PyAVAudioDecoder().decode(b"not audio", "m4a", 16000, 1)
+
+
+class TestPCMInput:
+    """Tests for raw PCM fragments, which bypass both decode backends."""
+
+    def test_s16le_scaled_to_float(self):
+        """pcm_s16le at the target layout is only rescaled."""
+        samples = np.array([0, 16384, -32768], dtype="<i2")
+
+        with patch("sts_service.full.audio_decoder.subprocess.run") as run:
+            pcm = FFmpegAudioDecoder().decode(samples.tobytes(), "pcm_s16le", 16000, 1)
+
+        run.assert_not_called()
+        assert pcm.dtype == np.float32
+        np.testing.assert_allclose(pcm, [0.0, 0.5, -1.0])
+
+    def test_stereo_48k_downmixed_and_resampled(self):
+        """pcm_s16le stereo at 48 kHz becomes 16 kHz mono."""
+        frames = np.full((4800, 2), 8192, dtype="<i2")
+
+        pcm = FFmpegAudioDecoder().decode(
+            frames.tobytes(),
+            "pcm_s16le",
+            16000,
+            1,
+            source_sample_rate=48000,
+            source_channels=2,
+        )
+
+        assert len(pcm) == 1600
+        np.testing.assert_allclose(pcm[200:-200], 0.25, atol=1e-3)
+
+    def test_pcm_formats_are_input_formats(self):
+        """Raw PCM formats are advertised alongside the container formats."""
+        assert {"m4a", "aac", "pcm_s16le", "pcm_f32le"} <= set(audio_decoder.INPUT_FORMATS)
+
+
+class TestFFmpegAudioDecoder:
+    """Tests for the ffmpeg CLI decoder."""
+
+    def test_returns_stdout_as_float32(self):
+        """ffmpeg stdout is interpreted as f32le samples."""
+        samples = np.array([0.0, 0.5, -0.5], dtype=np.float32)
+        completed = MagicMock(returncode=0, stdout=samples.tobytes(), stderr=b"")
+
+        with patch("sts_service.full.audio_decoder.subprocess.run", return_value=completed) as run:
+            pcm = FFmpegAudioDecoder().decode(b"m4a-bytes", "m4a", 16000, 1)
+
+        np.testing.assert_array_equal(pcm, samples)
+        cmd = run.call_args.args[0]
+        assert cmd[0] == "ffmpeg"
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+
+    def test_failure_raises_and_removes_temp_file(self):
+        """A non-zero exit raises RuntimeError and the temp file is deleted."""
+        completed = MagicMock(returncode=1, stdout=b"", stderr=b"moov atom not found")
+
+        with (
+            patch("sts_service.full.audio_decoder.subprocess.run", return_value=completed) as run,
+            pytest.raises(RuntimeError, match="moov atom not found"),
+        ):
+            FFmpegAudioDecoder().decode(b"m4a-bytes", "m4a", 16000, 1)
+
+        input_path = run.call_args.args[0][3]
+        assert not os.path.exists(input_path)
+
+
+class TestCreateAudioDecoder:
+    """Tests for backend selection."""
+
+    def test_ffmpeg_backend(self):
+        """ffmpeg backend returns the CLI decoder."""
+        assert isinstance(create_audio_decoder("ffmpeg"), FFmpegAudioDecoder)
+
+    def test_auto_prefers_pyav_with_ffmpeg_fallback(self):
+        """auto picks PyAV when installed, keeping ffmpeg as fallback."""
+        pytest.importorskip("av")
+
+        decoder = create_audio_decoder("auto")
+
+        assert isinstance(decoder, PyAVAudioDecoder)
+        assert isinstance(decoder._fallback, FFmpegAudioDecoder)
+
+    def test_auto_without_pyav_uses_ffmpeg(self):
+        """auto falls back to ffmpeg when PyAV is not installed."""
+        with patch.object(audio_decoder, "PYAV_AVAILABLE", False):
+            assert isinstance(create_audio_decoder("auto"), FFmpegAudioDecoder)
+
+    def test_backend_from_env(self, monkeypatch):
+        """AUDIO_DECODER_BACKEND selects the backend when none is passed."""
+        monkeypatch.setenv("AUDIO_DECODER_BACKEND", "ffmpeg")
+
+        assert isinstance(create_audio_decoder(), FFmpegAudioDecoder)
+
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown audio decoder backend"):
+            create_audio_decoder("gstreamer")
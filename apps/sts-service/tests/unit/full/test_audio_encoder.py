@@ -0,0 +1,90 @@
+"""Unit tests for the shared AAC encoder.
+
+Tests that one encoder instance is shared, that encode latency is recorded
+per backend, and that ArtifactLogger uses the same encoder.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sts_service.full import audio_encoder
+from sts_service.full.audio_encoder import encode_to_m4a, get_audio_encoder, set_audio_encoder
+from sts_service.full.observability.artifact_logger import ArtifactLogger
+from sts_service.tts.encoding import EncodingResult
+from sts_service.tts.models import AudioFormat
+
+
+@pytest.fixture
+def fake_encoder():
+    encoder = MagicMock()
+    encoder.backend = "pyav"
+    encoder.encode.return_value = EncodingResult(
+        audio_data=b"m4a-bytes",
+        format=AudioFormat.M4A_AAC,
+        duration_ms=100,
+        encoding_time_ms=1,
+        bitrate_kbps=128,
+    )
+    set_audio_encoder(encoder)
+    yield encoder
+    set_audio_encoder(None)
+
+
+class TestSharedEncoder:
+    """Tests for get_audio_encoder() and encode_to_m4a()."""
+
+    def test_encoder_created_once(self, monkeypatch):
+        """Repeated lookups return the same instance built from config."""
+        set_audio_encoder(None)
+        monkeypatch.setenv("AUDIO_ENCODER_BITRATE_KBPS", "96")
+        with patch.object(audio_encoder, "AACEncoder") as mock_cls:
+            first = get_audio_encoder()
+            second = get_audio_encoder()
+        set_audio_encoder(None)
+
+        assert first is second
+        mock_cls.assert_called_once_with(backend="auto", bitrate_kbps=96)
+
+    def test_encode_records_latency(self, fake_encoder):
+        """Each encode records its latency against the backend label."""
+        pcm = np.zeros(160, dtype=np.float32).tobytes()
+
+        with patch("sts_service.full.audio_encoder.record_audio_encode") as mock_record:
+            data = encode_to_m4a(pcm, sample_rate_hz=16000, channels=1)
+
+        assert data == b"m4a-bytes"
+        backend, duration_ms = mock_record.call_args.args
+        assert backend == "pyav"
+        assert duration_ms >= 0
+
+
+class TestArtifactLoggerEncoding:
+    """Tests for ArtifactLogger._pcm_to_m4a() using the shared encoder."""
+
+    def test_float32_pcm_encoded_as_f32le(self, fake_encoder, tmp_path):
+        """Float32 PCM goes to the shared encoder without int16 conversion."""
+        pcm = (0.5 * np.ones(1600, dtype=np.float32)).tobytes()
+
+        result = ArtifactLogger(artifacts_path=str(tmp_path))._pcm_to_m4a(pcm, 16000, 1)
+
+        assert result == b"m4a-bytes"
+        assert fake_encoder.encode.call_args.kwargs["input_format"] == AudioFormat.PCM_F32LE
+
+    def test_int16_pcm_encoded_as_s16le(self, fake_encoder, tmp_path):
+        """Int16 PCM is passed through as s16le."""
+        pcm = np.full(1600, 20000, dtype=np.int16).tobytes()
+
+        ArtifactLogger(artifacts_path=str(tmp_path))._pcm_to_m4a(pcm, 16000, 1)
+
+        assert fake_encoder.encode.call_args.kwargs["input_format"] == AudioFormat.PCM_S16LE
+
+    def test_encode_failure_returns_raw_pcm(self, fake_encoder, tmp_path):
+        """Encoding errors degrade to saving the raw PCM."""
+        fake_encoder.encode.side_effect = RuntimeError("encoder down")
+        pcm = np.zeros(1600, dtype=np.int16).tobytes()
+
+        result = ArtifactLogger(artifacts_path=str(tmp_path))._pcm_to_m4a(pcm, 16000, 1)
+
+        assert result == pcm
@@ -144,6 +144,52 @@ class TestHandleFragmentData:
         assert fragment_data.fragment_id == "frag-001"
 
 
+class TestStagedSubmitFailure:
+    """fragment:data when the staged pipeline rejects the fragment."""
+
+    @pytest.mark.asyncio
+    async def test_submit_failure_emits_failed_result_and_releases_inflight(
+        self, mock_sio, sample_audio_data
+    ):
+        """A raising submit must not leave the sequence number or in-flight count dangling."""
+        from sts_service.full.handlers.fragment import handle_fragment_data
+        from sts_service.full.models.stream import StreamState
+        from sts_service.full.session import SessionStore
+
+        mock_sio.sleep = AsyncMock()
+        store = SessionStore()
+        session = await store.create("sid-1", "stream-1", "worker-1")
+        session.state = StreamState.READY
+        session.fragment_pipeline = MagicMock()
+        session.fragment_pipeline.submit = AsyncMock(
+            side_effect=RuntimeError("Staged pipeline is closed")
+        )
+
+        payload = {
+            "fragment_id": "frag-000",
+            "stream_id": "stream-1",
+            "sequence_number": 0,
+            "timestamp": 1704067200000,
+            "audio": {
+                "format": "pcm_s16le",
+                "sample_rate_hz": 48000,
+                "channels": 1,
+                "duration_ms": 6000,
+                "data_base64": sample_audio_data,
+            },
+        }
+
+        await handle_fragment_data(mock_sio, "sid-1", payload, store, None)
+
+        processed = [c for c in mock_sio.emit.call_args_list if c[0][0] == "fragment:processed"]
+        assert len(processed) == 1
+        assert processed[0][0][1]["status"] == "failed"
+        assert processed[0][0][1]["sequence_number"] == 0
+        assert session.inflight_count == 0
+        assert session.next_sequence_to_emit == 1
+        assert session.pending_fragments == {}
+
+
 class TestEmitFragmentProcessed:
     """Tests for fragment:processed emission (T097-T098)."""
 
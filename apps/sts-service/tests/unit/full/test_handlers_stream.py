@@ -109,6 +109,37 @@ class TestHandleStreamInit:
         assert "capabilities" in ready_payload
         assert ready_payload["capabilities"]["async_delivery"] is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "formats", [{"format": "opus"}, {"format": "aac", "output_format": "wav"}]
+    )
+    async def test_stream_init_rejects_unsupported_formats(
+        self, mock_sio, mock_voices_config, formats
+    ):
+        """Audio formats the server cannot decode or produce emit INVALID_CONFIG."""
+        from sts_service.full.handlers.stream import handle_stream_init
+        from sts_service.full.session import SessionStore
+
+        store = SessionStore()
+        payload = {
+            "stream_id": "stream-123",
+            "worker_id": "worker-456",
+            "config": {"voice_profile": "default", **formats},
+        }
+
+        with patch(
+            "sts_service.full.handlers.stream.load_voices_config", return_value=mock_voices_config
+        ):
+            await handle_stream_init(
+                sio=mock_sio, sid="socket-123", data=payload, session_store=store
+            )
+
+        event, error = mock_sio.emit.call_args[0][:2]
+        assert event == "error"
+        assert error["code"] == "INVALID_CONFIG"
+        assert "Unsupported" in error["message"]
+        assert await store.get_by_sid("socket-123") is None
+
     @pytest.mark.asyncio
     async def test_stream_init_validates_voice_profile(
         self, mock_sio, session_store, mock_voices_config
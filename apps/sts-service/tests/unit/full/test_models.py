@@ -69,6 +69,49 @@ class TestAudioData:
                 data_base64="AQIDBAU=",
             )
 
+    def test_binary_audio_data(self) -> None:
+        """Test raw bytes audio omits data_base64 when dumped."""
+        audio = AudioData.from_bytes(
+            b"\x01\x02\x03",
+            binary=True,
+            format="m4a",
+            sample_rate_hz=48000,
+            channels=1,
+            duration_ms=6000,
+        )
+        dumped = audio.model_dump()
+        assert dumped["data"] == b"\x01\x02\x03"
+        assert "data_base64" not in dumped
+        assert audio.audio_bytes() == b"\x01\x02\x03"
+
+    def test_base64_audio_data_dump_unchanged(self) -> None:
+        """Test base64 audio dumps without a data key for old clients."""
+        audio = AudioData.from_bytes(
+            b"\x01\x02\x03",
+            format="m4a",
+            sample_rate_hz=48000,
+            channels=1,
+            duration_ms=6000,
+        )
+        dumped = audio.model_dump()
+        assert dumped["data_base64"] == "AQID"
+        assert "data" not in dumped
+        assert audio.audio_bytes() == b"\x01\x02\x03"
+
+    def test_requires_exactly_one_encoding(self) -> None:
+        """Test that audio must be sent as data or data_base64, not both or neither."""
+        with pytest.raises(ValidationError):
+            AudioData(format="m4a", sample_rate_hz=48000, channels=1, duration_ms=6000)
+        with pytest.raises(ValidationError):
+            AudioData(
+                format="m4a",
+                sample_rate_hz=48000,
+                channels=1,
+                duration_ms=6000,
+                data=b"\x01",
+                data_base64="AQ==",
+            )
+
 
 class TestFragmentDataPayload:
     """Test FragmentDataPayload model."""
@@ -0,0 +1,261 @@
+"""Unit tests for the encoded silence cache.
+
+Tests LRU bounds, hit/miss accounting, and that silent fragments reuse the
+encoded payload instead of re-encoding.
+"""
+
+import asyncio
+import base64
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sts_service.audio_buffer import BufferPool, set_buffer_pool
+from sts_service.full.models.asset import AssetStatus
+from sts_service.full.models.fragment import (
+    AudioData,
+    FragmentData,
+    FragmentMetadata,
+    ProcessingStatus,
+)
+from sts_service.full.models.stream import StreamState
+from sts_service.full.pipeline import PipelineCoordinator
+from sts_service.full.session import StreamSession
+from sts_service.full.silence_cache import EncodedSilence, SilenceCache, SilenceKey
+
+
+def _key(duration_ms: int = 6000) -> SilenceKey:
+    return SilenceKey(duration_ms=duration_ms, sample_rate_hz=48000, channels=1, bitrate_kbps=128)
+
+
+def _payload(tag: str = "a") -> EncodedSilence:
+    return EncodedSilence(format="m4a", data=tag.encode())
+
+
+class TestSilenceCache:
+    """Tests for SilenceCache."""
+
+    def test_get_returns_stored_payload(self):
+        """A stored payload is returned for the same key only."""
+        cache = SilenceCache(max_entries=4)
+        cache.put(_key(6000), _payload("six"))
+
+        assert cache.get(_key(6000)) == _payload("six")
+        assert cache.get(_key(5000)) is None
+
+    def test_bitrate_is_part_of_key(self):
+        """Payloads encoded at another bitrate are not reused."""
+        cache = SilenceCache(max_entries=4)
+        cache.put(_key(), _payload())
+
+        assert cache.get(_key()._replace(bitrate_kbps=64)) is None
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        cache = SilenceCache(max_entries=2)
+        cache.put(_key(1000), _payload("1"))
+        cache.put(_key(2000), _payload("2"))
+        cache.get(_key(1000))  # 2000 is now least recently used
+        cache.put(_key(3000), _payload("3"))
+
+        assert len(cache) == 2
+        assert cache.get(_key(2000)) is None
+        assert cache.get(_key(1000)) is not None
+
+    def test_records_hits_and_misses(self):
+        """Each lookup records a hit or miss."""
+        cache = SilenceCache(max_entries=2)
+        cache.put(_key(), _payload())
+
+        with patch("sts_service.full.silence_cache.record_silence_cache_lookup") as mock_record:
+            cache.get(_key())
+            cache.get(_key(1))
+
+        assert [c.kwargs["hit"] for c in mock_record.call_args_list] == [True, False]
+
+    def test_base64_is_encoded_once_per_entry(self):
+        """Repeated non-binary AudioData builds reuse the cached base64 string."""
+        entry = _payload("silence")
+
+        with patch(
+            "sts_service.full.silence_cache.base64.b64encode", wraps=base64.b64encode
+        ) as mock_b64:
+            first = entry.to_audio_data(sample_rate_hz=48000, channels=1, duration_ms=6000)
+            second = entry.to_audio_data(sample_rate_hz=48000, channels=1, duration_ms=6000)
+            binary = entry.to_audio_data(
+                binary=True, sample_rate_hz=48000, channels=1, duration_ms=6000
+            )
+
+        assert mock_b64.call_count == 1
+        assert first.data_base64 == second.data_base64 == base64.b64encode(b"silence").decode()
+        assert binary.data == b"silence"
+
+    def test_rejects_zero_size(self):
+        """A cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            SilenceCache(max_entries=0)
+
+
+class TestPipelineSilenceCache:
+    """Tests for silent fragments in PipelineCoordinator."""
+
+    @pytest.fixture
+    def silent_asr(self):
+        asr = MagicMock()
+        asr.transcribe.return_value = MagicMock(
+            status=AssetStatus.SUCCESS,
+            total_text="",
+            segments=[],
+            error_message=None,
+        )
+        return asr
+
+    @staticmethod
+    def _fragment(seq: int) -> FragmentData:
+        return FragmentData(
+            fragment_id=f"frag-{seq}",
+            stream_id="stream-1",
+            sequence_number=seq,
+            timestamp=1704067200000,
+            audio=AudioData(
+                format="pcm_f32le",
+                sample_rate_hz=16000,
+                channels=1,
+                duration_ms=6000,
+                data_base64=base64.b64encode(b"\x00" * 64).decode("utf-8"),
+            ),
+            metadata=FragmentMetadata(pts_ns=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_silent_fragments_encode_once(self, silent_asr):
+        """Only the first silent fragment of a given shape is encoded."""
+        session = StreamSession(
+            sid="sid-1", stream_id="stream-1", worker_id="w-1", state=StreamState.READY
+        )
+        coordinator = PipelineCoordinator(
+            asr=silent_asr,
+            translation=MagicMock(),
+            tts=MagicMock(),
+            enable_artifact_logging=False,
+            silence_cache=SilenceCache(max_entries=4),
+        )
+
+        with patch(
+            "sts_service.full.pipeline.encode_to_m4a", return_value=b"silent-m4a"
+        ) as mock_encode:
+            results = [
+                await coordinator.process_fragment(self._fragment(seq), session)
+                for seq in range(3)
+            ]
+
+        assert mock_encode.call_count == 1
+        expected = base64.b64encode(b"silent-m4a").decode("utf-8")
+        for result in results:
+            assert result.status == ProcessingStatus.SUCCESS
+            assert result.dubbed_audio.format == "m4a"
+            assert result.dubbed_audio.data_base64 == expected
+
+    @pytest.mark.asyncio
+    async def test_adts_output_format(self, silent_asr):
+        """Streams that negotiated ADTS get ADTS silence, cached separately from M4A."""
+        session = StreamSession(
+            sid="sid-1", stream_id="stream-1", worker_id="w-1", state=StreamState.READY
+        )
+        session.output_format = "adts"
+        cache = SilenceCache(max_entries=4)
+        coordinator = PipelineCoordinator(
+            asr=silent_asr,
+            translation=MagicMock(),
+            tts=MagicMock(),
+            enable_artifact_logging=False,
+            silence_cache=cache,
+        )
+
+        with patch(
+            "sts_service.full.pipeline.encode_to_m4a", return_value=b"silent-adts"
+        ) as mock_encode:
+            result = await coordinator.process_fragment(self._fragment(0), session)
+
+        assert mock_encode.call_args.kwargs["container"] == "adts"
+        assert result.dubbed_audio.format == "adts"
+        assert cache.get(
+            SilenceKey(
+                duration_ms=6000,
+                sample_rate_hz=session.sample_rate_hz,
+                channels=session.channels,
+                bitrate_kbps=coordinator._silence_bitrate_kbps,
+                output_format="adts",
+            )
+        ) is not None
+
+    @pytest.mark.asyncio
+    async def test_encode_failure_is_not_cached(self, silent_asr):
+        """A failed encode falls back to PCM and is retried next time."""
+        session = StreamSession(
+            sid="sid-1", stream_id="stream-1", worker_id="w-1", state=StreamState.READY
+        )
+        cache = SilenceCache(max_entries=4)
+        coordinator = PipelineCoordinator(
+            asr=silent_asr,
+            translation=MagicMock(),
+            tts=MagicMock(),
+            enable_artifact_logging=False,
+            silence_cache=cache,
+        )
+
+        with patch(
+            "sts_service.full.pipeline.encode_to_m4a", side_effect=RuntimeError("no encoder")
+        ) as mock_encode:
+            first = await coordinator.process_fragment(self._fragment(0), session)
+            await coordinator.process_fragment(self._fragment(1), session)
+
+        assert first.dubbed_audio.format == "pcm_f32le"
+        assert mock_encode.call_count == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_keeps_buffer_until_encode_finishes(self, silent_asr):
+        """A cancelled fragment returns its silence buffer only after the worker is done with it."""
+        session = StreamSession(
+            sid="sid-1", stream_id="stream-1", worker_id="w-1", state=StreamState.READY
+        )
+        coordinator = PipelineCoordinator(
+            asr=silent_asr,
+            translation=MagicMock(),
+            tts=MagicMock(),
+            enable_artifact_logging=False,
+            silence_cache=SilenceCache(max_entries=4),
+        )
+        pool = BufferPool(max_bytes=64 * 1024 * 1024)
+        started = threading.Event()
+        finish = threading.Event()
+
+        def slow_encode(**kwargs):
+            started.set()
+            finish.wait(5)
+            return b"silent-m4a"
+
+        set_buffer_pool(pool)
+        try:
+            with patch("sts_service.full.pipeline.encode_to_m4a", side_effect=slow_encode):
+                task = asyncio.ensure_future(
+                    coordinator.process_fragment(self._fragment(0), session)
+                )
+                await asyncio.to_thread(started.wait, 5)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+                assert pool.idle_bytes == 0
+
+                finish.set()
+                for _ in range(100):
+                    if pool.idle_bytes:
+                        break
+                    await asyncio.sleep(0.01)
+        finally:
+            set_buffer_pool(None)
+
+        assert pool.idle_bytes > 0
@@ -0,0 +1,207 @@
+"""Unit tests for the speech pre-gate.
+
+Tests energy/flatness classification of silence, noise and voiced audio,
+fail-open behavior, ASR time estimates, and that PipelineCoordinator routes
+non-speech fragments to the silence path without calling ASR.
+"""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sts_service.full.config import SpeechGateConfig
+from sts_service.full.models.asset import AssetStatus
+from sts_service.full.models.fragment import (
+    AudioData,
+    FragmentData,
+    FragmentMetadata,
+    ProcessingStatus,
+)
+from sts_service.full.models.stream import StreamState
+from sts_service.full.pipeline import PipelineCoordinator
+from sts_service.full.session import StreamSession
+from sts_service.full.silence_cache import SilenceCache
+from sts_service.full.speech_gate import SpeechGate, create_speech_gate
+
+SAMPLE_RATE = 16000
+
+
+def _voiced(duration_ms: int = 2000, amplitude: float = 0.2) -> np.ndarray:
+    """Harmonic stack at a speaking pitch, like a sustained vowel."""
+    t = np.arange(SAMPLE_RATE * duration_ms // 1000) / SAMPLE_RATE
+    f0 = 140.0
+    audio = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 12))
+    return (amplitude * audio / np.max(np.abs(audio))).astype(np.float32)
+
+
+def _noise(duration_ms: int = 2000, amplitude: float = 0.1) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (amplitude * rng.standard_normal(SAMPLE_RATE * duration_ms // 1000)).astype(np.float32)
+
+
+def _silence(duration_ms: int = 2000) -> np.ndarray:
+    return np.zeros(SAMPLE_RATE * duration_ms // 1000, dtype=np.float32)
+
+
+def _gate(**overrides) -> SpeechGate:
+    config = SpeechGateConfig()
+    return SpeechGate(SpeechGateConfig(**{**config.__dict__, "backend": "energy", **overrides}))
+
+
+class TestEnergyDetector:
+    """Tests for the RMS + spectral flatness heuristic."""
+
+    def test_silence_is_not_speech(self):
+        """Digital silence has no speech frames."""
+        decision = _gate().classify(_silence().tobytes(), SAMPLE_RATE)
+
+        assert decision.is_speech is False
+        assert decision.speech_ms == 0
+
+    def test_broadband_noise_is_not_speech(self):
+        """Crowd-like broadband noise is loud but spectrally flat."""
+        assert _gate().classify(_noise().tobytes(), SAMPLE_RATE).is_speech is False
+
+    def test_voiced_audio_is_speech(self):
+        """Loud, harmonic audio is classified as speech."""
+        decision = _gate().classify(_voiced().tobytes(), SAMPLE_RATE)
+
+        assert decision.is_speech is True
+        assert decision.speech_ms >= 1900
+
+    def test_voice_over_noise_is_speech(self):
+        """Speech over a noise bed still passes the gate."""
+        audio = _voiced(amplitude=0.3) + _noise(amplitude=0.02)
+
+        assert _gate().classify(audio.tobytes(), SAMPLE_RATE).is_speech is True
+
+    def test_short_blip_below_min_speech(self):
+        """Less voiced audio than min_speech_ms is treated as non-speech."""
+        audio = np.concatenate([_silence(1900), _voiced(100)])
+
+        assert _gate(min_speech_ms=250).classify(audio.tobytes(), SAMPLE_RATE).is_speech is False
+
+    def test_quiet_audio_below_level_threshold(self):
+        """Voiced audio below the level threshold is ignored."""
+        audio = _voiced(amplitude=0.001)
+
+        assert _gate(min_rms_dbfs=-40).classify(audio.tobytes(), SAMPLE_RATE).is_speech is False
+
+
+class TestSpeechGate:
+    """Tests for gate behavior around the detectors."""
+
+    def test_detector_errors_fail_open(self):
+        """A failing detector lets the fragment through to ASR."""
+        gate = _gate()
+        with patch.object(gate._detector, "speech_ms", side_effect=RuntimeError("boom")):
+            assert gate.classify(_silence().tobytes(), SAMPLE_RATE).is_speech is True
+
+    def test_silero_falls_back_to_energy_without_faster_whisper(self):
+        """The silero backend degrades to energy when faster-whisper is missing."""
+        with patch.dict("sys.modules", {"faster_whisper": None, "faster_whisper.vad": None}):
+            gate = _gate(backend="silero")
+
+        assert gate.backend == "energy"
+
+    def test_avoided_asr_time_estimated_from_recent_asr_cost(self):
+        """Skipped fragments are credited with the recent ASR cost per second."""
+        gate = _gate()
+        assert gate.estimate_asr_ms(6000) == 0
+
+        gate.observe_asr(audio_ms=6000, asr_ms=1200)
+        with patch("sts_service.full.speech_gate.record_speech_gate_decision") as mock_record:
+            gate.classify(_silence(6000).tobytes(), SAMPLE_RATE)
+
+        assert mock_record.call_args.kwargs["avoided_asr_ms"] == 1200
+        assert mock_record.call_args.kwargs["audio_ms"] == 6000
+
+    def test_disabled_gate_not_created(self, monkeypatch):
+        """SPEECH_GATE_ENABLED=false disables the gate."""
+        monkeypatch.setenv("SPEECH_GATE_ENABLED", "false")
+
+        assert create_speech_gate() is None
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"SPEECH_GATE_BACKEND": "webrtc"},
+            {"SPEECH_GATE_MAX_FLATNESS": "0"},
+            {"SPEECH_GATE_MIN_RMS_DBFS": "3"},
+        ],
+    )
+    def test_invalid_config_rejected(self, monkeypatch, env):
+        """Unknown backends and out-of-range thresholds are rejected."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(ValueError):
+            SpeechGateConfig().validate()
+
+
+class TestPipelineSpeechGate:
+    """Tests for the gate inside PipelineCoordinator."""
+
+    @pytest.fixture
+    def asr(self):
+        asr = MagicMock()
+        asr.transcribe.return_value = MagicMock(
+            status=AssetStatus.SUCCESS, total_text="", segments=[], error_message=None
+        )
+        return asr
+
+    @staticmethod
+    def _fragment(audio: np.ndarray) -> FragmentData:
+        return FragmentData(
+            fragment_id="frag-0",
+            stream_id="stream-1",
+            sequence_number=0,
+            timestamp=1704067200000,
+            audio=AudioData(
+                format="pcm_f32le",
+                sample_rate_hz=16000,
+                channels=1,
+                duration_ms=len(audio) * 1000 // SAMPLE_RATE,
+                data_base64=base64.b64encode(audio.tobytes()).decode("utf-8"),
+            ),
+            metadata=FragmentMetadata(pts_ns=0),
+        )
+
+    def _coordinator(self, asr) -> PipelineCoordinator:
+        return PipelineCoordinator(
+            asr=asr,
+            translation=MagicMock(),
+            tts=MagicMock(),
+            enable_artifact_logging=False,
+            silence_cache=SilenceCache(max_entries=4),
+            speech_gate=_gate(),
+        )
+
+    @pytest.fixture
+    def session(self):
+        return StreamSession(
+            sid="sid-1", stream_id="stream-1", worker_id="w-1", state=StreamState.READY
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_speech_skips_asr(self, asr, session):
+        """Noise goes straight to the silence path."""
+        with patch("sts_service.full.pipeline.encode_to_m4a", return_value=b"silent-m4a"):
+            result = await self._coordinator(asr).process_fragment(
+                self._fragment(_noise()), session
+            )
+
+        asr.transcribe.assert_not_called()
+        assert result.status == ProcessingStatus.SUCCESS
+        assert result.transcript == ""
+        assert result.stage_timings.asr_ms == 0
+
+    @pytest.mark.asyncio
+    async def test_speech_reaches_asr(self, asr, session):
+        """Voiced fragments are transcribed as before."""
+        with patch("sts_service.full.pipeline.encode_to_m4a", return_value=b"silent-m4a"):
+            await self._coordinator(asr).process_fragment(self._fragment(_voiced()), session)
+
+        asr.transcribe.assert_called_once()
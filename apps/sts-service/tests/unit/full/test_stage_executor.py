@@ -0,0 +1,205 @@
+"""Unit tests for StageExecutor.
+
+Tests that blocking stage calls run on bounded per-stage thread pools,
+keep the event loop responsive, and report queue depth / wait metrics.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from sts_service.full.config import StageExecutorConfig
+from sts_service.full.stage_executor import StageExecutor
+
+
+def _config(**overrides: int) -> StageExecutorConfig:
+    sizes = {
+        "decode_workers": 1,
+        "asr_workers": 1,
+        "translation_workers": 1,
+        "tts_workers": 1,
+        "encode_workers": 1,
+        "artifact_workers": 1,
+    }
+    sizes.update(overrides)
+    return StageExecutorConfig(**sizes)
+
+
+@pytest.fixture
+def executor():
+    stage_executor = StageExecutor(_config(asr_workers=2))
+    yield stage_executor
+    stage_executor.shutdown()
+
+
+class TestStageExecutorRun:
+    """Tests for StageExecutor.run()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_call_on_stage_thread(self, executor: StageExecutor):
+        """Calls run on the stage's named worker thread, not the loop thread."""
+        thread_name = await executor.run("asr", lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("sts-asr")
+        assert thread_name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_passes_args_and_kwargs(self, executor: StageExecutor):
+        """Positional and keyword arguments are forwarded to the callable."""
+
+        def combine(a: int, b: int, *, scale: int) -> int:
+            return (a + b) * scale
+
+        assert await executor.run("translation", combine, 1, 2, scale=10) == 30
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self, executor: StageExecutor):
+        """Exceptions raised by the callable propagate unchanged."""
+
+        def fail() -> None:
+            raise RuntimeError("model exploded")
+
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await executor.run("tts", fail)
+
+        assert executor.queue_depth("tts") == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_stage_raises(self, executor: StageExecutor):
+        """Unknown stage names are rejected."""
+        with pytest.raises(ValueError, match="Unknown pipeline stage"):
+            await executor.run("vocoder", lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_run_after_shutdown_raises(self):
+        """run() fails fast once the executor is shut down."""
+        stage_executor = StageExecutor(_config())
+        stage_executor.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            await stage_executor.run("asr", lambda: None)
+
+
+class TestStageExecutorConcurrency:
+    """Tests for pool bounds and event loop responsiveness."""
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked_by_stage_call(self, executor: StageExecutor):
+        """Other coroutines keep running while a stage call blocks."""
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await executor.run("asr", time.sleep, 0.2)
+        heartbeat_task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_pool_size_bounds_concurrency(self, executor: StageExecutor):
+        """No more than the configured number of calls run at once per stage."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(executor.run("asr", work) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stages_do_not_share_workers(self, executor: StageExecutor):
+        """A saturated stage does not delay calls to another stage."""
+        release = threading.Event()
+
+        blocked = asyncio.ensure_future(executor.run("tts", release.wait))
+        await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await executor.run("translation", lambda: None)
+        elapsed = time.perf_counter() - start
+
+        release.set()
+        await blocked
+        assert elapsed < 0.5
+
+
+class TestStageExecutorMetrics:
+    """Tests for queue depth and wait time metrics."""
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_waiting_calls(self, executor: StageExecutor):
+        """Calls waiting for a busy pool are counted, then drained to zero."""
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run("tts", release.wait))
+        waiting = [asyncio.ensure_future(executor.run("tts", lambda: None)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        assert executor.queue_depth("tts") == 3
+
+        release.set()
+        await asyncio.gather(running, *waiting)
+        assert executor.queue_depth("tts") == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiting_call_leaves_queue(self, executor: StageExecutor):
+        """Cancelling a call that never started removes it from the queue count."""
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run("encode", release.wait))
+        waiting = asyncio.ensure_future(executor.run("encode", lambda: None))
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+        await asyncio.sleep(0)
+
+        assert executor.queue_depth("encode") == 0
+
+        release.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_records_wait_time_per_stage(self, executor: StageExecutor):
+        """Each call records its queue wait against its stage label."""
+        with patch("sts_service.full.stage_executor.record_stage_wait") as mock_record:
+            await executor.run("decode", lambda: None)
+
+        mock_record.assert_called_once()
+        stage, wait_ms = mock_record.call_args.args
+        assert stage == "decode"
+        assert wait_ms >= 0
+
+
+class TestStageExecutorConfig:
+    """Tests for StageExecutorConfig."""
+
+    def test_workers_from_env(self, monkeypatch):
+        """Pool sizes are read from environment variables."""
+        monkeypatch.setenv("STAGE_ASR_WORKERS", "3")
+        monkeypatch.setenv("STAGE_TTS_WORKERS", "5")
+
+        config = StageExecutorConfig()
+
+        assert config.workers_for("asr") == 3
+        assert config.workers_for("tts") == 5
+
+    def test_validate_rejects_zero_workers(self):
+        """A pool size below 1 is a configuration error."""
+        with pytest.raises(ValueError, match="asr"):
+            _config(asr_workers=0).validate()
@@ -0,0 +1,250 @@
+"""Unit tests for StagedFragmentPipeline.
+
+Tests that consecutive fragments overlap across stages, that fragments
+finishing early skip the remaining stages, and that results are emitted
+in sequence order through the session.
+"""
+
+import asyncio
+import base64
+import time
+from typing import Optional
+
+import pytest
+
+from sts_service.full.config import StagedPipelineConfig
+from sts_service.full.models.error import ErrorStage
+from sts_service.full.models.fragment import (
+    AudioData,
+    FragmentData,
+    FragmentMetadata,
+    FragmentResult,
+    ProcessingError,
+    ProcessingStatus,
+)
+from sts_service.full.models.stream import StreamState
+from sts_service.full.pipeline import PIPELINE_STAGES, FragmentContext
+from sts_service.full.session import StreamSession
+from sts_service.full.staged_pipeline import StagedFragmentPipeline
+
+
+def _fragment(sequence_number: int) -> FragmentData:
+    return FragmentData(
+        fragment_id=f"frag-{sequence_number:03d}",
+        stream_id="stream-1",
+        sequence_number=sequence_number,
+        timestamp=1704067200000,
+        audio=AudioData(
+            format="pcm_f32le",
+            sample_rate_hz=16000,
+            channels=1,
+            duration_ms=1000,
+            data_base64=base64.b64encode(b"\x00" * 64).decode("utf-8"),
+        ),
+        metadata=FragmentMetadata(pts_ns=0),
+    )
+
+
+class FakeCoordinator:
+    """Stands in for PipelineCoordinator with fixed per-stage delays."""
+
+    def __init__(
+        self,
+        stage_delay_s: float = 0.05,
+        finish_early: Optional[dict[int, str]] = None,
+        raise_in: Optional[dict[int, str]] = None,
+    ):
+        self.stage_delay_s = stage_delay_s
+        self.finish_early = finish_early or {}
+        self.raise_in = raise_in or {}
+        self.calls: list[tuple[str, int]] = []
+        self.active: dict[str, int] = dict.fromkeys(PIPELINE_STAGES, 0)
+        self.max_concurrent_stages = 0
+
+    def start_fragment(
+        self, fragment_data: FragmentData, session: StreamSession
+    ) -> FragmentContext:
+        return FragmentContext(
+            fragment_data=fragment_data,
+            session=session,
+            logger=None,
+            start_time=time.perf_counter(),
+        )
+
+    async def run_stage(self, stage: str, ctx: FragmentContext) -> None:
+        seq = ctx.fragment_data.sequence_number
+        self.calls.append((stage, seq))
+        self.active[stage] += 1
+        self.max_concurrent_stages = max(
+            self.max_concurrent_stages, sum(1 for n in self.active.values() if n)
+        )
+        try:
+            await asyncio.sleep(self.stage_delay_s)
+            if self.raise_in.get(seq) == stage:
+                raise RuntimeError("stage exploded")
+            if self.finish_early.get(seq) == stage or stage == PIPELINE_STAGES[-1]:
+                ctx.result = self._result(ctx, ProcessingStatus.SUCCESS)
+        finally:
+            self.active[stage] -= 1
+
+    def fail_stage(self, stage: str, ctx: FragmentContext, error: Exception) -> None:
+        ctx.result = self._result(ctx, ProcessingStatus.FAILED, error=str(error))
+
+    @staticmethod
+    def _result(
+        ctx: FragmentContext, status: ProcessingStatus, error: Optional[str] = None
+    ) -> FragmentResult:
+        return FragmentResult(
+            fragment_id=ctx.fragment_data.fragment_id,
+            stream_id=ctx.fragment_data.stream_id,
+            sequence_number=ctx.fragment_data.sequence_number,
+            status=status,
+            processing_time_ms=0,
+            error=(
+                ProcessingError(
+                    stage=ErrorStage.ASR, code="PROCESSING_ERROR", message=error, retryable=True
+                )
+                if error
+                else None
+            ),
+        )
+
+
+@pytest.fixture
+def session() -> StreamSession:
+    return StreamSession(
+        sid="sid-1",
+        stream_id="stream-1",
+        worker_id="worker-1",
+        state=StreamState.READY,
+    )
+
+
+def _make_pipeline(
+    coordinator: FakeCoordinator,
+    session: StreamSession,
+    emitted: list[FragmentResult],
+    queue_size: int = 4,
+) -> StagedFragmentPipeline:
+    async def on_result(fragment_data: FragmentData, result: FragmentResult) -> None:
+        session.add_pending_fragment(fragment_data.sequence_number, result)
+        emitted.extend(session.get_fragments_to_emit())
+
+    return StagedFragmentPipeline(
+        coordinator=coordinator,
+        session=session,
+        on_result=on_result,
+        config=StagedPipelineConfig(enabled=True, queue_size=queue_size, workers_per_stage=1),
+    )
+
+
+class TestStagedPipelineOverlap:
+    """Tests for stage overlap between consecutive fragments."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_fragments_overlap_stages(self, session: StreamSession):
+        """Different fragments occupy different stages at the same time."""
+        coordinator = FakeCoordinator(stage_delay_s=0.05)
+        emitted: list[FragmentResult] = []
+        pipeline = _make_pipeline(coordinator, session, emitted)
+
+        start = time.perf_counter()
+        for seq in range(4):
+            await pipeline.submit(_fragment(seq))
+        await pipeline.drain()
+        elapsed = time.perf_counter() - start
+        await pipeline.close()
+
+        # Serial would be 4 fragments * 4 stages * 50ms = 800ms
+        assert elapsed < 0.6
+        assert coordinator.max_concurrent_stages >= 3
+        assert [r.sequence_number for r in emitted] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_each_stage_runs_fragments_in_submit_order(self, session: StreamSession):
+        """With one worker per stage, every stage sees fragments in order."""
+        coordinator = FakeCoordinator(stage_delay_s=0.01)
+        pipeline = _make_pipeline(coordinator, session, [])
+
+        for seq in range(3):
+            await pipeline.submit(_fragment(seq))
+        await pipeline.drain()
+        await pipeline.close()
+
+        for stage in PIPELINE_STAGES:
+            assert [seq for s, seq in coordinator.calls if s == stage] == [0, 1, 2]
+
+
+class TestStagedPipelineEarlyExit:
+    """Tests for fragments that finish before the last stage."""
+
+    @pytest.mark.asyncio
+    async def test_finished_fragment_skips_remaining_stages(self, session: StreamSession):
+        """A fragment with a result after ASR (e.g. silence) is not translated."""
+        coordinator = FakeCoordinator(stage_delay_s=0.01, finish_early={1: "asr"})
+        emitted: list[FragmentResult] = []
+        pipeline = _make_pipeline(coordinator, session, emitted)
+
+        for seq in range(3):
+            await pipeline.submit(_fragment(seq))
+        await pipeline.drain()
+        await pipeline.close()
+
+        assert ("translation", 1) not in coordinator.calls
+        assert [r.sequence_number for r in emitted] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stage_exception_becomes_failed_result(self, session: StreamSession):
+        """An exception escaping a stage yields a failed result, not a stall."""
+        coordinator = FakeCoordinator(stage_delay_s=0.01, raise_in={0: "tts"})
+        emitted: list[FragmentResult] = []
+        pipeline = _make_pipeline(coordinator, session, emitted)
+
+        await pipeline.submit(_fragment(0))
+        await pipeline.submit(_fragment(1))
+        await pipeline.drain()
+        await pipeline.close()
+
+        assert [r.status for r in emitted] == [ProcessingStatus.FAILED, ProcessingStatus.SUCCESS]
+        assert ("encode", 0) not in coordinator.calls
+
+
+class TestStagedPipelineLifecycle:
+    """Tests for lazy start, drain and close."""
+
+    @pytest.mark.asyncio
+    async def test_workers_start_on_first_submit(self, session: StreamSession):
+        """No worker tasks exist until a fragment is submitted."""
+        pipeline = _make_pipeline(FakeCoordinator(stage_delay_s=0), session, [])
+        assert not pipeline.is_running
+
+        await pipeline.submit(_fragment(0))
+        assert pipeline.is_running
+
+        await pipeline.drain()
+        await pipeline.close()
+        assert not pipeline.is_running
+
+    @pytest.mark.asyncio
+    async def test_submit_after_close_raises(self, session: StreamSession):
+        """A closed pipeline rejects new fragments."""
+        pipeline = _make_pipeline(FakeCoordinator(), session, [])
+        await pipeline.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await pipeline.submit(_fragment(0))
+
+    @pytest.mark.asyncio
+    async def test_submit_blocks_when_first_stage_full(self, session: StreamSession):
+        """Bounded queues push back on the submitter."""
+        coordinator = FakeCoordinator(stage_delay_s=0.2)
+        pipeline = _make_pipeline(coordinator, session, [], queue_size=1)
+
+        await pipeline.submit(_fragment(0))  # picked up by ASR worker
+        await asyncio.sleep(0.01)
+        await pipeline.submit(_fragment(1))  # fills the ASR queue
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pipeline.submit(_fragment(2)), timeout=0.05)
+
+        await pipeline.close()
@@ -0,0 +1,223 @@
+"""Unit tests for the translation result cache.
+
+Tests key normalization, the memory LRU and SQLite tiers, TTL expiry,
+hit/miss accounting, and the CachedTranslationComponent wrapper.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sts_service.full.config import TranslationCacheConfig
+from sts_service.full.translation_cache import (
+    CachedTranslation,
+    CachedTranslationComponent,
+    TranslationCache,
+    make_cache_key,
+)
+from sts_service.translation.mock import MockIdentityTranslator
+from sts_service.translation.models import (
+    NormalizationPolicy,
+    TextAsset,
+    TranslationStatus,
+)
+
+
+def _entry(text: str = "qué parada", created_at: float = 1000.0) -> CachedTranslation:
+    return CachedTranslation(
+        translated_text=text,
+        normalized_source_text=None,
+        speaker_id="default",
+        created_at=created_at,
+    )
+
+
+def _translate(component, text: str = "what a save", seq: int = 0, target: str = "es"):
+    return component.translate(
+        source_text=text,
+        stream_id="stream-1",
+        sequence_number=seq,
+        source_language="en",
+        target_language=target,
+        parent_asset_ids=[f"transcript-{seq}"],
+    )
+
+
+class TestCacheKey:
+    """Tests for make_cache_key()."""
+
+    def test_whitespace_is_normalized(self):
+        """Spacing differences map to the same key."""
+        assert make_cache_key("what  a save ", "en", "es", "deepl-v1") == make_cache_key(
+            "what a save", "en", "es", "deepl-v1"
+        )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"source_text": "What a save"},
+            {"target_language": "fr"},
+            {"provider": "mock-identity-v1"},
+            {"normalization_policy": NormalizationPolicy(expand_abbreviations=False)},
+        ],
+    )
+    def test_key_distinguishes_requests(self, changes):
+        """Case, language pair, provider and policy are part of the key."""
+        base = {
+            "source_text": "what a save",
+            "source_language": "en",
+            "target_language": "es",
+            "provider": "deepl-v1",
+        }
+        assert make_cache_key(**base) != make_cache_key(**{**base, **changes})
+
+
+class TestTranslationCache:
+    """Tests for TranslationCache tiers and expiry."""
+
+    def test_memory_lru_eviction(self):
+        """The least recently used entry is evicted from memory."""
+        cache = TranslationCache(max_entries=2, ttl_seconds=0, db_path="")
+        cache.put("a", _entry("A"))
+        cache.put("b", _entry("B"))
+        cache.get("a")  # b is now least recently used
+        cache.put("c", _entry("C"))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a").translated_text == "A"
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL are treated as misses."""
+        cache = TranslationCache(max_entries=4, ttl_seconds=60, db_path="")
+        cache.put("a", _entry(created_at=1000.0))
+
+        with patch("sts_service.full.translation_cache.time.time", return_value=1030.0):
+            assert cache.get("a") is not None
+        with patch("sts_service.full.translation_cache.time.time", return_value=1061.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """A new cache on the same SQLite file serves earlier translations."""
+        db_path = str(tmp_path / "cache" / "translations.db")
+        first = TranslationCache(max_entries=4, ttl_seconds=0, db_path=db_path)
+        first.put("a", _entry("A"))
+        first.close()
+
+        second = TranslationCache(max_entries=4, ttl_seconds=0, db_path=db_path)
+        with patch(
+            "sts_service.full.translation_cache.record_translation_cache_lookup"
+        ) as mock_record:
+            assert second.get("a").translated_text == "A"
+            assert second.get("a").translated_text == "A"
+        second.close()
+
+        results = [c.args[0] for c in mock_record.call_args_list]
+        assert results == ["hit_disk", "hit_memory"]
+
+    def test_expired_disk_entries_pruned_on_open(self, tmp_path):
+        """Opening the store drops rows older than the TTL."""
+        db_path = str(tmp_path / "translations.db")
+        first = TranslationCache(max_entries=4, ttl_seconds=0, db_path=db_path)
+        first.put("old", _entry(created_at=0.0))
+        first.close()
+
+        second = TranslationCache(max_entries=4, ttl_seconds=60, db_path=db_path)
+        assert second.get("old") is None
+        second.close()
+
+    def test_rejects_invalid_sizes(self):
+        """Size must be positive and TTL non-negative."""
+        with pytest.raises(ValueError):
+            TranslationCache(max_entries=0, db_path="")
+        with pytest.raises(ValueError):
+            TranslationCache(max_entries=1, ttl_seconds=-1, db_path="")
+
+
+class TestCachedTranslationComponent:
+    """Tests for the caching translation wrapper."""
+
+    @pytest.fixture
+    def inner(self):
+        translator = MockIdentityTranslator()
+        translator.translate = MagicMock(wraps=translator.translate)
+        return translator
+
+    @pytest.fixture
+    def cache(self):
+        return TranslationCache(max_entries=16, ttl_seconds=0, db_path="")
+
+    def test_repeated_phrase_translated_once(self, inner, cache):
+        """The provider is only called for the first occurrence of a phrase."""
+        component = CachedTranslationComponent(inner, cache=cache)
+
+        first = _translate(component, seq=1)
+        second = _translate(component, text="what a  save", seq=2)
+
+        assert inner.translate.call_count == 1
+        assert second.status == TranslationStatus.SUCCESS
+        assert second.translated_text == first.translated_text
+        assert second.sequence_number == 2
+        assert second.parent_asset_ids == ["transcript-2"]
+        assert second.asset_id != first.asset_id
+
+    def test_language_pair_not_shared(self, inner, cache):
+        """A different target language is a separate translation."""
+        component = CachedTranslationComponent(inner, cache=cache)
+
+        _translate(component, target="es")
+        _translate(component, target="fr")
+
+        assert inner.translate.call_count == 2
+
+    def test_failures_not_cached(self, cache):
+        """Failed translations are retried on the next occurrence."""
+        inner = MagicMock()
+        inner.component_instance = "deepl-v1"
+        inner.translate.return_value = TextAsset(
+            stream_id="stream-1",
+            sequence_number=0,
+            component_instance="deepl-v1",
+            source_language="en",
+            target_language="es",
+            translated_text="",
+            status=TranslationStatus.FAILED,
+        )
+        component = CachedTranslationComponent(inner, cache=cache)
+
+        _translate(component)
+        _translate(component)
+
+        assert inner.translate.call_count == 2
+        assert len(cache) == 0
+
+    def test_delegates_readiness_and_shutdown(self, cache):
+        """Identity, readiness and shutdown come from the wrapped component."""
+        inner = MagicMock(component_instance="deepl-v1", is_ready=True)
+        component = CachedTranslationComponent(inner, cache=cache)
+
+        assert component.component_instance == "deepl-v1"
+        assert component.is_ready is True
+        component.shutdown()
+        inner.shutdown.assert_called_once()
+
+
+class TestTranslationCacheConfig:
+    """Tests for TranslationCacheConfig."""
+
+    def test_defaults_from_env(self, monkeypatch):
+        """Environment variables configure the cache."""
+        monkeypatch.setenv("TRANSLATION_CACHE_MAX_ENTRIES", "10")
+        monkeypatch.setenv("TRANSLATION_CACHE_TTL_SECONDS", "0")
+        monkeypatch.setenv("TRANSLATION_CACHE_DB_PATH", "/tmp/t.db")
+
+        config = TranslationCacheConfig()
+
+        assert (config.max_entries, config.ttl_seconds, config.db_path) == (10, 0, "/tmp/t.db")
+
+    def test_validate_rejects_zero_size(self, monkeypatch):
+        """A zero-size cache is rejected."""
+        monkeypatch.setenv("TRANSLATION_CACHE_MAX_ENTRIES", "0")
+        with pytest.raises(ValueError):
+            TranslationCacheConfig().validate()
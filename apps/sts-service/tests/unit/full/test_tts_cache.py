@@ -0,0 +1,257 @@
+"""Unit tests for the synthesized audio cache.
+
+Tests cache keys, byte-budget LRU eviction, persistence across restarts,
+and the CachedTTSComponent wrapper's duration matching of cached PCM.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sts_service.full.config import TTSCacheConfig
+from sts_service.full.tts_cache import CachedTTSComponent, TTSAudioCache, make_tts_cache_key
+from sts_service.translation.models import TextAsset, TranslationStatus
+from sts_service.tts.models import AudioAsset, AudioFormat, AudioStatus, VoiceProfile
+
+SAMPLE_RATE = 16000
+
+
+def _pcm(duration_ms: int = 1000) -> bytes:
+    t = np.arange(SAMPLE_RATE * duration_ms // 1000) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype("<f4").tobytes()
+
+
+def _text_asset(text: str = "qué parada", seq: int = 0, target: str = "es") -> TextAsset:
+    return TextAsset(
+        stream_id="stream-1",
+        sequence_number=seq,
+        parent_asset_ids=[f"transcript-{seq}"],
+        component_instance="mock-identity-v1",
+        source_language="en",
+        target_language=target,
+        translated_text=text,
+        status=TranslationStatus.SUCCESS,
+    )
+
+
+def _audio_asset(text_asset: TextAsset, status: AudioStatus = AudioStatus.SUCCESS) -> AudioAsset:
+    audio = _pcm() if status == AudioStatus.SUCCESS else b""
+    return AudioAsset(
+        stream_id=text_asset.stream_id,
+        sequence_number=text_asset.sequence_number,
+        parent_asset_ids=[text_asset.asset_id],
+        component_instance="elevenlabs-eleven_flash_v2_5",
+        audio_format=AudioFormat.PCM_F32LE,
+        sample_rate_hz=SAMPLE_RATE,
+        channels=1,
+        duration_ms=1000 if audio else 0,
+        payload_ref="mem://fragments/stream-1/0",
+        audio_bytes=audio,
+        language=text_asset.target_language,
+        status=status,
+    )
+
+
+def _synthesize(component, text_asset, target_duration_ms=None, channels=1, voice_profile=None):
+    return component.synthesize(
+        text_asset=text_asset,
+        target_duration_ms=target_duration_ms,
+        output_sample_rate_hz=SAMPLE_RATE,
+        output_channels=channels,
+        voice_profile=voice_profile,
+    )
+
+
+class TestTTSCacheKey:
+    """Tests for make_tts_cache_key()."""
+
+    def test_whitespace_is_normalized(self):
+        """Spacing differences map to the same key."""
+        assert make_tts_cache_key(" qué  parada", "es", "p", "v", 16000) == make_tts_cache_key(
+            "qué parada", "es", "p", "v", 16000
+        )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"text": "Qué parada"},
+            {"language": "pt"},
+            {"provider": "coqui-vits-live"},
+            {"voice": {"language": "es", "voice_id": "abc"}},
+            {"sample_rate_hz": 48000},
+        ],
+    )
+    def test_key_distinguishes_requests(self, changes):
+        """Text, language, provider, voice and sample rate are part of the key."""
+        base = {
+            "text": "qué parada",
+            "language": "es",
+            "provider": "elevenlabs-eleven_flash_v2_5",
+            "voice": "spanish_male_1",
+            "sample_rate_hz": 16000,
+        }
+        assert make_tts_cache_key(**base) != make_tts_cache_key(**{**base, **changes})
+
+
+class TestTTSAudioCache:
+    """Tests for the on-disk PCM cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored PCM is returned byte for byte."""
+        cache = TTSAudioCache(cache_dir=str(tmp_path), max_bytes=1_000_000)
+        cache.put("ab12", _pcm())
+
+        assert cache.get("ab12") == _pcm()
+        assert cache.total_bytes == len(_pcm())
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        """The least recently used entries are evicted to fit the byte budget."""
+        entry = b"\x00" * 400
+        cache = TTSAudioCache(cache_dir=str(tmp_path), max_bytes=1000)
+        cache.put("aa", entry)
+        cache.put("bb", entry)
+        cache.get("aa")  # bb is now least recently used
+        cache.put("cc", entry)
+
+        assert len(cache) == 2
+        assert cache.total_bytes == 800
+        assert cache.get("bb") is None
+        assert cache.get("aa") == entry
+        assert not (tmp_path / "bb" / "bb.pcm").exists()
+
+    def test_oversized_entry_not_cached(self, tmp_path):
+        """Entries larger than the whole budget are skipped."""
+        cache = TTSAudioCache(cache_dir=str(tmp_path), max_bytes=100)
+        cache.put("aa", b"\x00" * 101)
+
+        assert len(cache) == 0
+
+    def test_index_survives_restart(self, tmp_path):
+        """A new cache on the same directory serves earlier entries."""
+        TTSAudioCache(cache_dir=str(tmp_path), max_bytes=1000).put("aa", b"\x01" * 8)
+
+        second = TTSAudioCache(cache_dir=str(tmp_path), max_bytes=1000)
+        with patch("sts_service.full.tts_cache.record_tts_cache_lookup") as mock_record:
+            assert second.get("aa") == b"\x01" * 8
+            assert second.get("zz") is None
+
+        assert [c.args[0] for c in mock_record.call_args_list] == [True, False]
+        assert second.total_bytes == 8
+
+    def test_rejects_invalid_size(self, tmp_path):
+        """The byte budget must be positive."""
+        with pytest.raises(ValueError):
+            TTSAudioCache(cache_dir=str(tmp_path), max_bytes=0)
+
+
+class TestCachedTTSComponent:
+    """Tests for the caching TTS wrapper."""
+
+    @pytest.fixture
+    def inner(self):
+        tts = MagicMock(component_instance="elevenlabs-eleven_flash_v2_5", is_ready=True)
+        tts.synthesize.side_effect = lambda text_asset, **kwargs: _audio_asset(text_asset)
+        return tts
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return TTSAudioCache(cache_dir=str(tmp_path), max_bytes=10_000_000)
+
+    def test_repeated_text_synthesized_once(self, inner, cache):
+        """The provider is only called for the first occurrence of a phrase."""
+        component = CachedTTSComponent(inner, cache=cache, voice_name="spanish_male_1")
+
+        first = _synthesize(component, _text_asset(seq=1))
+        second_input = _text_asset(seq=2)
+        second = _synthesize(component, second_input)
+
+        assert inner.synthesize.call_count == 1
+        assert second.audio_bytes == first.audio_bytes == _pcm()
+        assert second.sequence_number == 2
+        assert second.parent_asset_ids == [second_input.asset_id]
+
+    def test_provider_called_without_duration_target(self, inner, cache):
+        """Misses request raw mono synthesis so the cached PCM is reusable."""
+        component = CachedTTSComponent(inner, cache=cache)
+
+        _synthesize(component, _text_asset(), target_duration_ms=800, channels=2)
+
+        kwargs = inner.synthesize.call_args.kwargs
+        assert kwargs["target_duration_ms"] is None
+        assert kwargs["output_channels"] == 1
+
+    def test_cached_audio_is_duration_matched(self, inner, cache):
+        """Each request gets its own target duration and channel layout."""
+        component = CachedTTSComponent(inner, cache=cache)
+
+        faster = _synthesize(component, _text_asset(seq=1), target_duration_ms=800)
+        stereo = _synthesize(component, _text_asset(seq=2), target_duration_ms=500, channels=2)
+
+        assert inner.synthesize.call_count == 1
+        assert faster.duration_ms == 800
+        assert faster.status == AudioStatus.SUCCESS
+        assert stereo.channels == 2
+        assert len(stereo.audio_bytes) == 2 * 4 * SAMPLE_RATE // 2
+
+    def test_clamped_speed_is_partial(self, inner, cache):
+        """Speed factors beyond the voice profile clamp mark the asset partial."""
+        component = CachedTTSComponent(inner, cache=cache)
+        profile = VoiceProfile(language="es", speed_clamp_max=1.5)
+
+        result = _synthesize(
+            component, _text_asset(), target_duration_ms=250, voice_profile=profile
+        )
+
+        assert result.status == AudioStatus.PARTIAL
+        assert "clamped" in result.errors[0].message
+
+    def test_failures_not_cached(self, cache):
+        """Failed syntheses are returned as-is and retried next time."""
+        inner = MagicMock(component_instance="elevenlabs-eleven_flash_v2_5")
+        inner.synthesize.side_effect = lambda text_asset, **kwargs: _audio_asset(
+            text_asset, AudioStatus.FAILED
+        )
+        component = CachedTTSComponent(inner, cache=cache)
+
+        _synthesize(component, _text_asset())
+        result = _synthesize(component, _text_asset())
+
+        assert result.status == AudioStatus.FAILED
+        assert inner.synthesize.call_count == 2
+        assert len(cache) == 0
+
+    def test_voices_not_shared(self, inner, cache):
+        """Sessions configured with different voices do not share audio."""
+        _synthesize(CachedTTSComponent(inner, cache=cache, voice_name="a"), _text_asset())
+        _synthesize(CachedTTSComponent(inner, cache=cache, voice_name="b"), _text_asset())
+
+        assert inner.synthesize.call_count == 2
+
+    def test_delegates_readiness_and_shutdown(self, inner, cache):
+        """Identity, readiness and shutdown come from the wrapped component."""
+        component = CachedTTSComponent(inner, cache=cache)
+
+        assert component.component_instance == "elevenlabs-eleven_flash_v2_5"
+        assert component.is_ready is True
+        component.shutdown()
+        inner.shutdown.assert_called_once()
+
+
+class TestTTSCacheConfig:
+    """Tests for TTSCacheConfig."""
+
+    def test_defaults_from_env(self, monkeypatch):
+        """Environment variables configure the cache."""
+        monkeypatch.setenv("TTS_CACHE_DIR", "/tmp/tts")
+        monkeypatch.setenv("TTS_CACHE_MAX_BYTES", "1024")
+
+        config = TTSCacheConfig()
+
+        assert (config.cache_dir, config.max_bytes) == ("/tmp/tts", 1024)
+
+    def test_validate_rejects_zero_budget(self, monkeypatch):
+        """A zero byte budget is rejected."""
+        monkeypatch.setenv("TTS_CACHE_MAX_BYTES", "0")
+        with pytest.raises(ValueError):
+            TTSCacheConfig().validate()
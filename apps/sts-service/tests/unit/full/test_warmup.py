@@ -0,0 +1,170 @@
+"""Unit tests for startup model warm-up and the readiness endpoint.
+
+Tests that configured models are loaded and exercised once, that failures
+do not block readiness, and that /ready reflects warm-up progress.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sts_service.full.config import WarmupConfig
+from sts_service.full.warmup import WarmupState, run_warmup, set_warmup_state
+
+
+@pytest.fixture
+def state():
+    state = WarmupState()
+    set_warmup_state(state)
+    yield state
+    set_warmup_state(None)
+
+
+@pytest.fixture
+def mock_asr():
+    asr = MagicMock(component_instance="faster-whisper-small-int8")
+    with patch("sts_service.full.warmup.create_asr_component", return_value=asr) as factory:
+        yield asr, factory
+
+
+@pytest.fixture
+def mock_tts():
+    tts = MagicMock(component_instance="coqui-vits-live")
+    with patch("sts_service.full.warmup.create_tts_component", return_value=tts) as factory:
+        yield tts, factory
+
+
+def _config(monkeypatch, asr="small", voices="", pairs="en-es,en-fr") -> WarmupConfig:
+    monkeypatch.setenv("WARMUP_ASR_MODELS", asr)
+    monkeypatch.setenv("WARMUP_TTS_VOICES", voices)
+    monkeypatch.setenv("WARMUP_LANGUAGE_PAIRS", pairs)
+    return WarmupConfig()
+
+
+class TestRunWarmup:
+    """Tests for run_warmup()."""
+
+    def test_asr_models_loaded_and_exercised(self, monkeypatch, state, mock_asr):
+        """Each configured Whisper size runs one transcription, then releases the model."""
+        asr, factory = mock_asr
+
+        results = run_warmup(_config(monkeypatch, asr="small,medium"), state)
+
+        sizes = [call.kwargs["config"].model.model_size for call in factory.call_args_list]
+        assert sizes == ["small", "medium"]
+        assert asr.transcribe.call_count == 2
+        assert asr.transcribe.call_args.kwargs["language"] == "en"
+        assert asr.shutdown.call_count == 2
+        assert [r.component for r in results] == ["asr", "asr"]
+        assert state.ready is True
+        assert state.duration_s is not None
+
+    def test_tts_voices_warmed_per_target_language(self, monkeypatch, state, mock_asr, mock_tts):
+        """Each voice is synthesized once per distinct target language."""
+        tts, _ = mock_tts
+        voices = {"spanish_male_1": {"model": "tts_models/es/css10/vits"}}
+
+        with patch("sts_service.full.warmup.load_voices_config", return_value=voices):
+            results = run_warmup(
+                _config(monkeypatch, voices="spanish_male_1,missing", pairs="en-es,pt-es,en-fr"),
+                state,
+            )
+
+        languages = [c.kwargs["text_asset"].target_language for c in tts.synthesize.call_args_list]
+        assert languages == ["es", "fr"]
+        assert [r.model for r in results if r.component == "tts"] == [
+            "coqui-vits-live/spanish_male_1/es",
+            "coqui-vits-live/spanish_male_1/fr",
+        ]
+
+    def test_failures_reported_without_blocking_readiness(self, monkeypatch, state):
+        """A model that fails to load is reported and the service still becomes ready."""
+        with patch(
+            "sts_service.full.warmup.create_asr_component",
+            side_effect=ImportError("No module named 'faster_whisper'"),
+        ):
+            results = run_warmup(_config(monkeypatch), state)
+
+        assert "faster_whisper" in results[0].error
+        assert state.ready is True
+
+    def test_durations_recorded_per_model(self, monkeypatch, state, mock_asr):
+        """Per-model and total durations are exported as metrics."""
+        with (
+            patch("sts_service.full.warmup.set_warmup_duration") as mock_model,
+            patch("sts_service.full.warmup.set_startup_duration") as mock_total,
+        ):
+            run_warmup(_config(monkeypatch), state)
+
+        assert mock_model.call_args.args[:2] == ("asr", "faster-whisper-small-int8")
+        mock_total.assert_called_once()
+
+
+class TestWarmupConfig:
+    """Tests for WarmupConfig parsing."""
+
+    def test_lists_parsed(self, monkeypatch):
+        """Comma-separated lists and language pairs are parsed."""
+        config = _config(monkeypatch, asr=" small, medium ", voices="a,b", pairs="en-es, de-fr")
+
+        assert config.asr_model_sizes == ["small", "medium"]
+        assert config.tts_voice_profiles == ["a", "b"]
+        assert config.language_pair_list == [("en", "es"), ("de", "fr")]
+
+    def test_asr_models_default_to_session_model(self, monkeypatch):
+        """Without WARMUP_ASR_MODELS the model used by stream:init is warmed."""
+        monkeypatch.delenv("WARMUP_ASR_MODELS", raising=False)
+        monkeypatch.setenv("ASR_MODEL_SIZE", "medium")
+        monkeypatch.setenv("ASR_LADDER_ENABLED", "false")
+
+        assert WarmupConfig().asr_model_sizes == ["medium"]
+
+    def test_asr_models_default_includes_ladder_models(self, monkeypatch):
+        """With the ASR ladder enabled its profile models are warmed too."""
+        monkeypatch.delenv("WARMUP_ASR_MODELS", raising=False)
+        monkeypatch.setenv("ASR_MODEL_SIZE", "medium")
+        monkeypatch.setenv("ASR_LADDER_ENABLED", "true")
+        monkeypatch.setenv("ASR_LADDER_FAST_MODEL", "tiny")
+        monkeypatch.setenv("ASR_LADDER_BALANCED_MODEL", "")
+        monkeypatch.setenv("ASR_LADDER_ACCURATE_MODEL", "medium")
+
+        assert WarmupConfig().asr_model_sizes == ["medium", "tiny"]
+
+    def test_invalid_pair_rejected(self, monkeypatch):
+        """Language pairs must be source-target."""
+        with pytest.raises(ValueError):
+            _config(monkeypatch, pairs="en").validate()
+
+
+class TestReadinessEndpoint:
+    """Tests for /ready and /health."""
+
+    @pytest.fixture
+    def client(self):
+        from sts_service.full.server import create_app
+
+        return TestClient(create_app())
+
+    def test_not_ready_during_warmup(self, monkeypatch, state, client):
+        """/ready returns 503 until warm-up finishes; /health stays 200."""
+        response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert client.get("/health").json()["ready"] is False
+
+        state.mark_ready(1.5)
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["warmup_seconds"] == 1.5
+
+    def test_ready_immediately_when_disabled(self, monkeypatch, state):
+        """With warm-up disabled the service is ready at creation."""
+        from sts_service.full.server import create_app
+
+        monkeypatch.setenv("WARMUP_ENABLED", "false")
+        client = TestClient(create_app())
+
+        assert client.get("/ready").status_code == 200
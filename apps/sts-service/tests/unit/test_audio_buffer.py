@@ -0,0 +1,157 @@
+"""Unit tests for the shared AudioBuffer and BufferPool.
+
+Tests zero-copy wrapping and export, padding and silence allocation from
+the pool, pool size classes and byte cap, and that the padding and encoding
+helpers accept AudioBuffers.
+"""
+
+import numpy as np
+import pytest
+
+from sts_service.audio_buffer import (
+    AudioBuffer,
+    BufferPool,
+    as_float32,
+    set_buffer_pool,
+)
+from sts_service.tts.duration_matching import pad_audio_with_silence
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def pool():
+    pool = BufferPool(max_bytes=16 * 1024 * 1024)
+    set_buffer_pool(pool)
+    yield pool
+    set_buffer_pool(None)
+
+
+def _tone(frames: int, channels: int = 1) -> np.ndarray:
+    return np.sin(np.arange(frames * channels, dtype=np.float32) / 10).astype(np.float32)
+
+
+class TestAudioBuffer:
+    """Tests for wrapping, export and padding."""
+
+    def test_from_pcm_is_a_view(self):
+        """Wrapping PCM bytes does not copy them."""
+        data = bytearray(_tone(800).tobytes())
+
+        buffer = AudioBuffer.from_pcm(data, SAMPLE_RATE)
+        data[0:4] = np.float32(0.5).tobytes()
+
+        assert buffer.samples[0] == 0.5
+        assert buffer.frames == 800
+        assert buffer.duration_ms == 50
+
+    def test_memoryview_exports_pcm_bytes(self):
+        """memoryview() is the PCM f32le byte layout of the samples."""
+        samples = _tone(400, channels=2)
+        buffer = AudioBuffer.from_array(samples, SAMPLE_RATE, channels=2)
+
+        view = buffer.memoryview()
+
+        assert view.nbytes == len(view) == samples.nbytes
+        assert bytes(view) == samples.tobytes()
+        assert buffer.frames == 400
+
+    def test_as_float32_accepts_bytes_and_buffers(self):
+        """Consumers read bytes and AudioBuffers the same way."""
+        samples = _tone(100)
+        buffer = AudioBuffer.from_array(samples, SAMPLE_RATE)
+
+        np.testing.assert_array_equal(as_float32(samples.tobytes()), samples)
+        assert as_float32(buffer) is buffer.samples
+
+    def test_padded_appends_silence(self, pool):
+        """Padding copies the audio once into a pooled buffer and zeroes the tail."""
+        buffer = AudioBuffer.from_array(_tone(800, channels=2), SAMPLE_RATE, channels=2)
+
+        padded = buffer.padded(100)
+
+        assert padded.frames == 1600
+        np.testing.assert_array_equal(padded.samples[:1600], buffer.samples)
+        assert not padded.samples[1600:].any()
+        assert buffer.padded(50) is buffer
+
+    def test_silence_is_zeroed_after_reuse(self, pool):
+        """Silence from a recycled block does not leak the previous fragment."""
+        noisy = AudioBuffer.allocate(16000, SAMPLE_RATE, pool=pool)
+        noisy.samples[:] = 1.0
+        noisy.release()
+
+        silence = AudioBuffer.silence(1000, SAMPLE_RATE)
+
+        assert pool.hits == 1
+        assert silence.frames == 16000
+        assert not silence.samples.any()
+
+    def test_release_is_idempotent(self, pool):
+        """A buffer goes back to the pool once, however often it is released."""
+        buffer = AudioBuffer.allocate(10000, SAMPLE_RATE, pool=pool)
+
+        buffer.release()
+        buffer.release()
+
+        assert pool.idle_bytes == pool.size_class(10000) * 4
+        assert len(buffer.samples) == 0
+
+    @pytest.mark.parametrize("kwargs", [{"sample_rate_hz": 0}, {"channels": 6}])
+    def test_invalid_format_rejected(self, kwargs):
+        """Sample rate and channel count are validated."""
+        with pytest.raises(ValueError):
+            AudioBuffer(np.zeros(4, np.float32), **{"sample_rate_hz": SAMPLE_RATE, **kwargs})
+
+
+class TestBufferPool:
+    """Tests for pool size classes and limits."""
+
+    def test_nearby_sizes_share_a_block(self):
+        """Fragments a few samples apart reuse the same size class."""
+        pool = BufferPool(max_bytes=1 << 20)
+
+        block = pool.acquire(96000)
+        pool.release(block)
+        again = pool.acquire(95500)
+
+        assert again is block
+        assert pool.size_class(96000) - 96000 <= 96000 // 8
+
+    def test_idle_bytes_capped(self):
+        """Releases beyond max_bytes are dropped."""
+        pool = BufferPool(max_bytes=100_000)
+        blocks = [pool.acquire(16000) for _ in range(3)]
+
+        for block in blocks:
+            pool.release(block)
+
+        assert pool.idle_bytes <= 100_000
+        assert pool.idle_bytes == pool.size_class(16000) * 4
+
+
+class TestBoundaries:
+    """Tests for stage helpers taking AudioBuffers."""
+
+    def test_pad_audio_with_silence_returns_buffer(self, pool):
+        """Duration matching pads an AudioBuffer without a bytes round trip."""
+        buffer = AudioBuffer.from_array(_tone(8000), SAMPLE_RATE)
+
+        padded, padding_ms = pad_audio_with_silence(buffer, 500, 2000, SAMPLE_RATE, 1)
+
+        assert isinstance(padded, AudioBuffer)
+        assert padding_ms == 1500
+        assert padded.duration_ms == 2000
+
+    def test_encoder_accepts_buffer(self):
+        """The AAC encoder reads an AudioBuffer in place."""
+        pytest.importorskip("av")
+        from sts_service.tts.encoding import AACEncoder
+
+        buffer = AudioBuffer.from_array(_tone(16000) * 0.1, SAMPLE_RATE)
+        encoder = AACEncoder(backend="pyav")
+
+        result = encoder.encode(buffer, SAMPLE_RATE, 1)
+
+        assert result.audio_data[4:8] == b"ftyp"
+        assert result.duration_ms == 1000
@@ -0,0 +1,178 @@
+"""
+Unit tests for the shared model registry.
+
+Tests reference counting, replica pools, budgeted eviction of idle models,
+and load/evict events.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sts_service.model_registry import ModelRegistry
+
+WHISPER = ("faster-whisper", "small", "cpu", "int8")
+COQUI = ("coqui", "tts_models/es/css10/vits")
+
+
+def _loader():
+    return MagicMock(side_effect=lambda: object())
+
+
+class TestReferenceCounting:
+    """Tests for acquire/release semantics."""
+
+    def test_model_loaded_once_and_shared(self):
+        """A second acquire returns the resident model without loading."""
+        registry = ModelRegistry(max_bytes=0)
+        loader = _loader()
+
+        first = registry.acquire(WHISPER, loader)
+        second = registry.acquire(WHISPER, loader)
+
+        assert loader.call_count == 1
+        assert first.model is second.model
+        assert registry.refcount(WHISPER) == 2
+
+    def test_release_keeps_model_for_other_sessions(self):
+        """Releasing one reference neither unloads nor reloads the model."""
+        registry = ModelRegistry(max_bytes=0)
+        loader = _loader()
+
+        first = registry.acquire(WHISPER, loader)
+        second = registry.acquire(WHISPER, loader)
+        first.release()
+        second.release()
+        registry.acquire(WHISPER, loader)
+
+        assert loader.call_count == 1
+        assert WHISPER in registry
+
+    def test_unbalanced_release_is_ignored(self):
+        """Releasing an unknown or idle model does not raise."""
+        registry = ModelRegistry(max_bytes=0)
+        registry.release(WHISPER)
+        registry.acquire(WHISPER, _loader()).release()
+        registry.release(WHISPER)
+
+        assert registry.refcount(WHISPER) == 0
+
+    def test_concurrent_acquires_load_once(self):
+        """Sessions starting at the same time share one load."""
+        registry = ModelRegistry(max_bytes=0)
+        loads = []
+
+        def slow_loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return object()
+
+        handles = []
+        threads = [
+            threading.Thread(target=lambda: handles.append(registry.acquire(WHISPER, slow_loader)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert registry.refcount(WHISPER) == 4
+        assert len({id(handle.model) for handle in handles}) == 1
+
+
+class TestReplicaPool:
+    """Tests for replica checkout."""
+
+    def test_replicas_loaded_and_lent_exclusively(self):
+        """Concurrent checkouts get distinct replicas."""
+        registry = ModelRegistry(max_bytes=0)
+        loader = _loader()
+        handle = registry.acquire(WHISPER, loader, replicas=2)
+
+        with handle.checkout() as first, handle.checkout() as second:
+            assert first is not second
+
+        assert loader.call_count == 2
+        assert handle.replicas == 2
+
+    def test_single_replica_shared(self):
+        """A single replica is lent to concurrent callers without blocking."""
+        handle = ModelRegistry(max_bytes=0).acquire(WHISPER, _loader())
+
+        with handle.checkout() as first, handle.checkout() as second:
+            assert first is second
+
+    def test_invalid_replicas_rejected(self):
+        """At least one replica is required."""
+        with pytest.raises(ValueError):
+            ModelRegistry(max_bytes=0).acquire(WHISPER, _loader(), replicas=0)
+
+
+class TestEviction:
+    """Tests for the memory budget."""
+
+    def test_idle_models_evicted_lru_over_budget(self):
+        """The least recently released idle model is evicted first."""
+        registry = ModelRegistry(max_bytes=250)
+        registry.acquire(WHISPER, _loader(), size_bytes=100).release()
+        registry.acquire(COQUI, _loader(), size_bytes=100).release()
+
+        registry.acquire(("coqui", "xtts_v2"), _loader(), size_bytes=100)
+
+        assert WHISPER not in registry
+        assert COQUI in registry
+        assert registry.resident_bytes == 200
+
+    def test_models_in_use_never_evicted(self):
+        """Referenced models stay resident even over budget."""
+        registry = ModelRegistry(max_bytes=100)
+        registry.acquire(WHISPER, _loader(), size_bytes=100)
+        registry.acquire(COQUI, _loader(), size_bytes=100)
+
+        assert WHISPER in registry and COQUI in registry
+
+    def test_unlimited_budget_keeps_idle_models(self):
+        """With no budget, idle models stay warm indefinitely."""
+        registry = ModelRegistry(max_bytes=0)
+        registry.acquire(WHISPER, _loader(), size_bytes=10**12).release()
+
+        assert WHISPER in registry
+
+    def test_budget_from_env(self, monkeypatch):
+        """MODEL_REGISTRY_MAX_BYTES configures the budget."""
+        monkeypatch.setenv("MODEL_REGISTRY_MAX_BYTES", "-1")
+        with pytest.raises(ValueError):
+            ModelRegistry()
+
+
+class TestEvents:
+    """Tests for load/evict listeners."""
+
+    def test_load_and_evict_events(self):
+        """Listeners see loads with timing and evictions with resident totals."""
+        registry = ModelRegistry(max_bytes=100)
+        listener = MagicMock()
+        registry.add_listener(listener)
+        registry.add_listener(listener)  # Duplicate registration is ignored
+
+        registry.acquire(WHISPER, _loader(), size_bytes=100).release()
+        registry.acquire(COQUI, _loader(), size_bytes=100)
+
+        events = [call.args[0] for call in listener.call_args_list]
+        assert [(e.event, e.family) for e in events] == [
+            ("load", "faster-whisper"),
+            ("load", "coqui"),
+            ("evict", "faster-whisper"),
+        ]
+        assert events[-1].resident_models == 1
+        assert events[-1].resident_bytes == 100
+
+    def test_listener_errors_do_not_break_loads(self):
+        """A failing listener is logged, not raised."""
+        registry = ModelRegistry(max_bytes=0)
+        registry.add_listener(MagicMock(side_effect=RuntimeError("boom")))
+
+        assert registry.acquire(WHISPER, _loader()).model is not None
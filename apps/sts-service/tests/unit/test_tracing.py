@@ -0,0 +1,143 @@
+"""Unit tests for per-stream debug tracing.
+
+Tests level gating, deterministic sampling, runtime overrides with TTL,
+bounded audio captures, and the /debug/trace endpoints of the Full STS
+service.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from sts_service.tracing import (
+    NULL_TRACE,
+    TraceLevel,
+    Tracer,
+    TraceSettings,
+    get_tracer,
+    set_tracer,
+)
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    tracer = Tracer(default=TraceSettings(), capture_dir=str(tmp_path))
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+class TestGating:
+    """Tests for level gating and sampling."""
+
+    def test_off_returns_null_trace(self, tracer):
+        """Untraced fragments get the shared no-op trace."""
+        assert tracer.for_fragment("stream-1", 0) is NULL_TRACE
+
+    def test_level_includes_lower_levels(self, tracer):
+        """A verbose trace records debug events but not captures."""
+        tracer.set_stream("stream-1", "verbose")
+        trace = tracer.for_fragment("stream-1", 3)
+
+        trace.event(TraceLevel.DEBUG, "decoded", samples=10)
+        trace.event(TraceLevel.VERBOSE, "segment", text="hola")
+        trace.event(TraceLevel.CAPTURE, "too_much")
+
+        events = tracer.recent_events("stream-1")
+        assert [e["event"] for e in events] == ["decoded", "segment"]
+        assert events[0]["sequence_number"] == 3
+        assert trace.enabled(TraceLevel.CAPTURE) is False
+
+    def test_override_is_per_stream(self, tracer):
+        """Tracing one stream leaves the others untraced."""
+        tracer.set_stream("stream-1", "debug")
+
+        assert tracer.for_fragment("stream-2", 0) is NULL_TRACE
+
+    def test_sampling_is_deterministic(self, tracer):
+        """The same fragments are sampled on every call, at about the configured rate."""
+        tracer.set_stream("stream-1", "debug", sample_rate=0.25)
+
+        first = [tracer.for_fragment("stream-1", i) is not NULL_TRACE for i in range(400)]
+        second = [tracer.for_fragment("stream-1", i) is not NULL_TRACE for i in range(400)]
+
+        assert first == second
+        assert 60 < sum(first) < 140
+
+    def test_override_expires(self, tracer):
+        """Runtime overrides fall back to the default after their TTL."""
+        with patch("sts_service.tracing.time.monotonic", return_value=1000.0):
+            tracer.set_stream("stream-1", "debug", ttl_s=60)
+        with patch("sts_service.tracing.time.monotonic", return_value=1061.0):
+            assert tracer.for_fragment("stream-1", 0) is NULL_TRACE
+            assert tracer.overrides() == {}
+
+    @pytest.mark.parametrize("kwargs", [{"level": "loud"}, {"level": "debug", "sample_rate": 2}])
+    def test_invalid_settings_rejected(self, tracer, kwargs):
+        """Unknown levels and out-of-range sample rates are rejected."""
+        with pytest.raises(ValueError):
+            tracer.set_stream("stream-1", **kwargs)
+
+
+class TestCapture:
+    """Tests for audio captures."""
+
+    def test_capture_writes_npy(self, tracer, tmp_path):
+        """Captures are saved under the stream's directory and recorded as events."""
+        tracer.set_stream("stream-1", "capture")
+        audio = np.arange(16, dtype=np.float32)
+
+        tracer.for_fragment("stream-1", 7).capture("asr_input", audio)
+
+        path = tmp_path / "stream-1" / "000007-asr_input.npy"
+        np.testing.assert_array_equal(np.load(path), audio)
+        assert tracer.recent_events("stream-1")[-1]["path"] == str(path)
+
+    def test_capture_limit(self, tracer, tmp_path):
+        """At most max_captures files are written per stream."""
+        tracer.set_stream("stream-1", "capture", max_captures=2)
+
+        for i in range(5):
+            tracer.for_fragment("stream-1", i).capture("asr_input", np.zeros(4, np.float32))
+
+        assert len(list((tmp_path / "stream-1").iterdir())) == 2
+
+    def test_capture_path_sanitized(self, tracer, tmp_path):
+        """Client-supplied stream ids cannot escape the capture directory."""
+        tracer.set_stream("../../etc", "capture")
+
+        tracer.for_fragment("../../etc", 0).capture("asr_input", np.zeros(4, np.float32))
+
+        (saved,) = list(tmp_path.rglob("*.npy"))
+        assert saved.parent.parent == tmp_path
+
+
+class TestTraceEndpoints:
+    """Tests for the /debug/trace endpoints."""
+
+    @pytest.fixture
+    def client(self, tracer):
+        from sts_service.full.server import create_app
+
+        return TestClient(create_app())
+
+    def test_enable_list_and_clear(self, client, tracer):
+        """A stream can be traced, inspected and reset at runtime."""
+        response = client.put("/debug/trace/stream-1", json={"level": "debug", "ttl_s": 30})
+        assert response.status_code == 200
+        assert response.json()["level"] == "debug"
+
+        get_tracer().for_fragment("stream-1", 0).event(TraceLevel.DEBUG, "decoded")
+        assert client.get("/debug/trace").json()["streams"]["stream-1"]["level"] == "debug"
+        events = client.get("/debug/trace/stream-1/events").json()["events"]
+        assert [e["event"] for e in events] == ["decoded"]
+
+        assert client.delete("/debug/trace/stream-1").status_code == 200
+        assert client.delete("/debug/trace/stream-1").status_code == 404
+        assert tracer.for_fragment("stream-1", 0) is NULL_TRACE
+
+    def test_invalid_level_is_bad_request(self, client):
+        """Unknown levels are rejected with 400."""
+        assert client.put("/debug/trace/stream-1", json={"level": "loud"}).status_code == 400
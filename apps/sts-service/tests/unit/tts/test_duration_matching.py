@@ -313,3 +313,63 @@ class TestAlignAudioToDuration:
         assert result.audio_data is not None
         # Output should have more samples due to higher sample rate
         assert len(result.audio_data) > len(sample_audio)
+
+
+class TestSampleValues:
+    """Value-level tests for the array-based DSP routines."""
+
+    @staticmethod
+    def _pcm(values):
+        import numpy as np
+
+        return np.asarray(values, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def _samples(data):
+        import numpy as np
+
+        return np.frombuffer(data, dtype=np.float32).tolist()
+
+    def test_simple_stretch_interpolates_linearly(self):
+        """Slowing down by 0.5x interpolates midpoints and holds the last sample."""
+        from sts_service.tts.duration_matching import _time_stretch_simple
+
+        result, was_stretched = _time_stretch_simple(self._pcm([0.0, 1.0, 0.0]), 16000, 0.5)
+
+        assert was_stretched is True
+        assert self._samples(result) == [0.0, 0.5, 1.0, 0.5, 0.0, 0.0]
+
+    def test_resample_upsamples_with_linear_interpolation(self):
+        """Doubling the rate inserts interpolated samples between originals."""
+        result = resample_audio(self._pcm([0.0, 0.5, 1.0]), 8000, 16000)
+
+        assert self._samples(result) == [0.0, 0.25, 0.5, 0.75, 1.0, 1.0]
+
+    def test_mono_to_stereo_duplicates_samples(self):
+        """Each mono sample becomes an L/R pair."""
+        result = align_channels(self._pcm([0.25, -0.5]), 1, 2)
+
+        assert self._samples(result) == [0.25, 0.25, -0.5, -0.5]
+
+    def test_stereo_to_mono_averages_pairs(self):
+        """L/R pairs are averaged; an unpaired trailing sample is kept."""
+        result = align_channels(self._pcm([1.0, 0.0, -0.5, -0.25, 0.75]), 2, 1)
+
+        assert self._samples(result) == [0.5, -0.375, 0.75]
+
+    def test_silence_is_float32_zeros(self):
+        """Generated and padded silence decode as float32 zeros of the right length."""
+        from sts_service.tts.duration_matching import generate_silence, pad_audio_with_silence
+
+        silence = generate_silence(duration_ms=10, sample_rate_hz=16000, channels=2)
+        padded, padding_ms = pad_audio_with_silence(
+            self._pcm([0.5]),
+            current_duration_ms=0,
+            target_duration_ms=1,
+            sample_rate_hz=16000,
+            channels=1,
+        )
+
+        assert self._samples(silence) == [0.0] * 320
+        assert padding_ms == 1
+        assert self._samples(padded) == [0.5] + [0.0] * 16
@@ -4,6 +4,7 @@ Unit tests for TTS Audio Encoding Module.
 Tests PCM to M4A/AAC encoding functionality.
 """
 
+import io
 import math
 import struct
 import subprocess
@@ -11,9 +12,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from sts_service.tts.encoding import (
+    PYAV_AVAILABLE,
+    AACEncoder,
     EncodingError,
     EncodingResult,
     _check_ffmpeg_available,
+    _move_moov_to_front,
     encode_pcm_to_m4a,
     encode_pcm_to_m4a_with_metadata,
     get_m4a_duration_ms,
@@ -299,6 +303,94 @@ class TestGetM4aDurationMs:
         assert duration is None
 
 
+class TestAACEncoder:
+    """Tests for the reusable AACEncoder."""
+
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown audio encoder backend"):
+            AACEncoder(backend="lame")
+
+    def test_ffmpeg_probed_once(self):
+        """The ffmpeg backend checks availability at construction only."""
+        with patch(
+            "sts_service.tts.encoding._check_ffmpeg_available", return_value=True
+        ) as mock_check, patch("sts_service.tts.encoding._encode_with_ffmpeg", return_value=b"m4a"):
+            encoder = AACEncoder(backend="ffmpeg")
+            for _ in range(3):
+                encoder.encode(generate_sine_wave_pcm(100), sample_rate_hz=16000, channels=1)
+
+        assert mock_check.call_count == 1
+
+    def test_ffmpeg_backend_unavailable_raises(self):
+        """Requesting ffmpeg without ffmpeg installed fails at construction."""
+        with (
+            patch("sts_service.tts.encoding._check_ffmpeg_available", return_value=False),
+            pytest.raises(EncodingError, match="ffmpeg not available"),
+        ):
+            AACEncoder(backend="ffmpeg")
+
+    def test_encode_validates_input(self):
+        """Input validation matches encode_pcm_to_m4a."""
+        with patch("sts_service.tts.encoding._check_ffmpeg_available", return_value=True):
+            encoder = AACEncoder(backend="ffmpeg")
+
+        with pytest.raises(EncodingError, match="Empty PCM data"):
+            encoder.encode(b"", sample_rate_hz=16000, channels=1)
+        with pytest.raises(EncodingError, match="Invalid channel count"):
+            encoder.encode(generate_sine_wave_pcm(100), sample_rate_hz=16000, channels=3)
+
+    @pytest.mark.skipif(not PYAV_AVAILABLE, reason="PyAV not installed")
+    @pytest.mark.parametrize("input_format", [AudioFormat.PCM_F32LE, AudioFormat.PCM_S16LE])
+    def test_pyav_encodes_m4a_in_memory(self, input_format):
+        """PyAV backend produces an M4A with moov ahead of mdat."""
+        import av
+
+        pcm_data = generate_sine_wave_pcm(
+            duration_ms=1000, sample_rate_hz=24000, channels=2, format=input_format
+        )
+
+        with patch("subprocess.run") as mock_run:
+            result = AACEncoder(backend="pyav").encode(
+                pcm_data, sample_rate_hz=24000, channels=2, input_format=input_format
+            )
+        mock_run.assert_not_called()
+
+        data = result.audio_data
+        assert data[4:8] == b"ftyp"
+        assert result.format == AudioFormat.M4A_AAC
+        assert result.duration_ms == 1000
+        assert data.find(b"moov") < data.find(b"mdat")
+
+        with av.open(io.BytesIO(data)) as container:
+            stream = container.streams.audio[0]
+            assert stream.rate == 24000
+            assert stream.channels == 2
+            decoded = sum(frame.samples for frame in container.decode(stream))
+        assert 24000 <= decoded < 24000 + 2048
+
+    def test_move_moov_to_front_shifts_chunk_offsets(self):
+        """Relocating moov adds its size to every stco entry."""
+
+        def box(name: bytes, payload: bytes) -> bytes:
+            return struct.pack(">I4s", 8 + len(payload), name) + payload
+
+        stco = box(b"stco", struct.pack(">III", 0, 1, 28))
+        moov = box(b"moov", box(b"trak", box(b"mdia", box(b"minf", box(b"stbl", stco)))))
+        ftyp = box(b"ftyp", b"M4A \x00\x00\x00\x00")
+        mdat = box(b"mdat", b"audio")
+        original = ftyp + mdat + moov
+
+        relocated = _move_moov_to_front(original)
+
+        assert relocated.index(b"moov") < relocated.index(b"mdat")
+        assert len(relocated) == len(original)
+        entry = relocated.index(b"stco") + 12
+        (offset,) = struct.unpack(">I", relocated[entry : entry + 4])
+        assert offset == 28 + len(moov)
+        assert _move_moov_to_front(relocated) == relocated
+
+
 class TestEncodingError:
     """Tests for EncodingError exception."""
 
@@ -0,0 +1,97 @@
+"""
+Unit tests for PCM sample conversions.
+
+Verifies the array-based conversions produce exactly the bytes of the
+per-sample struct packing they replaced, in the helpers and in the providers.
+"""
+
+import struct
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from sts_service.model_registry import ModelRegistry
+from sts_service.tts.coqui_provider import CoquiTTSComponent
+from sts_service.tts.elevenlabs_provider import ElevenLabsTTSComponent
+from sts_service.tts.models import VoiceProfile
+from sts_service.tts.pcm import array_to_pcm_f32le, pcm_f32le_to_array, pcm_s16le_to_f32le
+
+
+def _struct_s16le_to_f32le(raw: bytes) -> bytes:
+    """Reference: the per-sample conversion previously used by ElevenLabs."""
+    samples = struct.unpack(f"<{len(raw) // 2}h", raw)
+    return struct.pack(f"<{len(samples)}f", *[s / 32768.0 for s in samples])
+
+
+@pytest.fixture
+def int16_pcm() -> bytes:
+    """Every int16 value, including the extremes."""
+    return np.arange(-32768, 32768, dtype="<i2").tobytes()
+
+
+class TestPcmConversions:
+    """Tests for the shared conversion helpers."""
+
+    def test_s16le_to_f32le_matches_struct(self, int16_pcm):
+        """Int16 -> float32 bytes are identical to the struct implementation."""
+        assert pcm_s16le_to_f32le(int16_pcm) == _struct_s16le_to_f32le(int16_pcm)
+
+    def test_array_to_pcm_matches_struct(self):
+        """Float sequences pack to the same bytes as struct.pack."""
+        rng = np.random.default_rng(0)
+        wav = (rng.standard_normal(4096) * 0.3).tolist()  # Python floats, as Coqui returns
+
+        assert array_to_pcm_f32le(wav) == struct.pack(f"<{len(wav)}f", *wav)
+
+    def test_round_trip_is_lossless(self):
+        """Bytes -> array -> bytes is the identity."""
+        data = np.linspace(-1.0, 1.0, 1001, dtype=np.float32).tobytes()
+
+        assert array_to_pcm_f32le(pcm_f32le_to_array(data)) == data
+
+    def test_partial_trailing_sample_ignored(self):
+        """A trailing partial sample is dropped rather than raising."""
+        data = np.ones(3, dtype=np.float32).tobytes() + b"\x00\x00"
+
+        assert len(pcm_f32le_to_array(data)) == 3
+        assert len(pcm_s16le_to_f32le(b"\x01\x00\x02")) == 4
+
+
+class TestProviderConversions:
+    """Provider output bytes are unchanged by the array-based conversions."""
+
+    def test_elevenlabs_convert_audio_format(self, int16_pcm):
+        """ElevenLabs MP3 decode output matches the struct conversion."""
+        segment = MagicMock(frame_rate=22050, channels=1, raw_data=int16_pcm)
+
+        with patch("sts_service.tts.elevenlabs_provider.AudioSegment") as mock_segment_class:
+            mock_segment_class.from_mp3.return_value = segment
+            pcm, sample_rate = ElevenLabsTTSComponent(api_key="x" * 32)._convert_audio_format(
+                b"mp3"
+            )
+
+        assert sample_rate == 22050
+        assert pcm == _struct_s16le_to_f32le(int16_pcm)
+
+    def test_coqui_synthesis_output(self):
+        """Coqui model waveforms pack to the same bytes as struct.pack."""
+        wav = [0.0, 0.25, -0.5, 1.0, -1.0, 0.123456789]
+        model = MagicMock(speakers=None, synthesizer=SimpleNamespace(output_sample_rate=24000))
+        model.tts.return_value = wav
+        fake_api = SimpleNamespace(TTS=MagicMock(return_value=model))
+
+        registry = ModelRegistry()
+
+        with (
+            patch.dict(sys.modules, {"TTS": MagicMock(), "TTS.api": fake_api}),
+            patch("sts_service.tts.coqui_provider.get_model_registry", return_value=registry),
+        ):
+            component = CoquiTTSComponent(fast_mode=True)
+            audio, sample_rate = component._synthesize_with_coqui(
+                "hola", VoiceProfile(language="es")
+            )
+
+        assert sample_rate == 24000
+        assert audio == struct.pack(f"<{len(wav)}f", *wav)
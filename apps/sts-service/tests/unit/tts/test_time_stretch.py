@@ -0,0 +1,165 @@
+"""
+Unit tests for time-stretch backends.
+
+Tests backend selection, WSOLA pitch/level preservation, and fallbacks.
+"""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from sts_service.tts.duration_matching import time_stretch_audio
+from sts_service.tts.time_stretch import (
+    ResampleTimeStretcher,
+    RubberbandCLITimeStretcher,
+    WSOLATimeStretcher,
+    create_time_stretcher,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _tone(frequency_hz: float = 440.0, duration_s: float = 1.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * duration_s)) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * frequency_hz * t)).astype(np.float32)
+
+
+def _dominant_frequency(samples: np.ndarray) -> float:
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return float(np.argmax(spectrum)) * SAMPLE_RATE / len(samples)
+
+
+def _rms(samples: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+
+
+class TestCreateTimeStretcher:
+    """Tests for backend selection."""
+
+    def test_default_is_wsola(self, monkeypatch):
+        """In-process WSOLA is the default backend."""
+        monkeypatch.delenv("TTS_TIME_STRETCH_BACKEND", raising=False)
+        assert isinstance(create_time_stretcher(), WSOLATimeStretcher)
+
+    @pytest.mark.parametrize(
+        "backend,expected",
+        [("rubberband", RubberbandCLITimeStretcher), ("simple", ResampleTimeStretcher)],
+    )
+    def test_backend_from_env(self, monkeypatch, backend, expected):
+        """TTS_TIME_STRETCH_BACKEND selects the backend."""
+        monkeypatch.setenv("TTS_TIME_STRETCH_BACKEND", backend)
+        assert isinstance(create_time_stretcher(), expected)
+
+    def test_unknown_backend_raises(self):
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown time-stretch backend"):
+            create_time_stretcher("sox")
+
+
+class TestWSOLATimeStretcher:
+    """Tests for the in-process WSOLA backend."""
+
+    @pytest.mark.parametrize("speed_factor", [0.5, 0.8, 1.25, 2.0])
+    def test_length_matches_speed_factor(self, speed_factor):
+        """Output has len(input) / speed_factor samples, like the other backends."""
+        samples = _tone()
+
+        result = WSOLATimeStretcher().stretch(samples, SAMPLE_RATE, speed_factor)
+
+        assert result.dtype == np.float32
+        assert len(result) == int(len(samples) / speed_factor)
+
+    @pytest.mark.parametrize("speed_factor", [0.8, 1.25])
+    def test_preserves_pitch(self, speed_factor):
+        """The dominant frequency is unchanged, unlike plain resampling."""
+        samples = _tone(440.0)
+
+        wsola = WSOLATimeStretcher().stretch(samples, SAMPLE_RATE, speed_factor)
+        simple = ResampleTimeStretcher().stretch(samples, SAMPLE_RATE, speed_factor)
+
+        assert _dominant_frequency(wsola) == pytest.approx(440.0, abs=5.0)
+        assert _dominant_frequency(simple) == pytest.approx(440.0 * speed_factor, abs=5.0)
+
+    def test_preserves_level(self):
+        """Overlap-add normalization keeps the signal level."""
+        samples = _tone()
+
+        result = WSOLATimeStretcher().stretch(samples, SAMPLE_RATE, 1.25)
+
+        assert _rms(result) == pytest.approx(_rms(samples), rel=0.05)
+        assert np.all(np.isfinite(result))
+
+    def test_short_input_is_resampled(self):
+        """Input shorter than one frame falls back to interpolation."""
+        samples = _tone(duration_s=0.01)
+
+        result = WSOLATimeStretcher().stretch(samples, SAMPLE_RATE, 2.0)
+
+        assert len(result) == len(samples) // 2
+
+    def test_invalid_parameters_raise(self):
+        """Frame length and tolerance must be positive."""
+        with pytest.raises(ValueError):
+            WSOLATimeStretcher(frame_ms=0)
+
+
+class TestRubberbandCLITimeStretcher:
+    """Tests for the rubberband CLI backend without the binary."""
+
+    def test_falls_back_when_not_installed(self):
+        """A missing binary uses the fallback without spawning rubberband."""
+        samples = _tone()
+
+        with patch(
+            "sts_service.tts.time_stretch.subprocess.run", side_effect=FileNotFoundError
+        ) as mock_run:
+            result = RubberbandCLITimeStretcher(fallback=ResampleTimeStretcher()).stretch(
+                samples, SAMPLE_RATE, 1.25
+            )
+
+        assert mock_run.call_count == 1  # only the --version probe
+        np.testing.assert_array_equal(
+            result, ResampleTimeStretcher().stretch(samples, SAMPLE_RATE, 1.25)
+        )
+
+    def test_raises_without_fallback(self):
+        """Without a fallback the failure is surfaced."""
+        with (
+            patch(
+                "sts_service.tts.time_stretch.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=[], returncode=1),
+            ),
+            pytest.raises(RuntimeError, match="Rubberband time-stretch failed"),
+        ):
+            RubberbandCLITimeStretcher().stretch(_tone(), SAMPLE_RATE, 1.25)
+
+
+class TestTimeStretchAudioBackend:
+    """Tests for time_stretch_audio() with explicit backends."""
+
+    def test_uses_given_stretcher(self):
+        """An explicit stretcher is used instead of the process-wide default."""
+        stretcher = MagicMock()
+        stretcher.stretch.return_value = np.zeros(10, dtype=np.float32)
+
+        result, was_stretched = time_stretch_audio(
+            _tone().tobytes(), SAMPLE_RATE, 1.5, stretcher=stretcher
+        )
+
+        assert was_stretched is True
+        assert result == np.zeros(10, dtype=np.float32).tobytes()
+
+    def test_backend_failure_falls_back_to_simple(self):
+        """A failing backend degrades to simple resampling."""
+        stretcher = MagicMock()
+        stretcher.name = "broken"
+        stretcher.stretch.side_effect = RuntimeError("boom")
+        samples = _tone()
+
+        result, was_stretched = time_stretch_audio(
+            samples.tobytes(), SAMPLE_RATE, 1.5, stretcher=stretcher
+        )
+
+        assert was_stretched is True
+        assert result == ResampleTimeStretcher().stretch(samples, SAMPLE_RATE, 1.5).tobytes()